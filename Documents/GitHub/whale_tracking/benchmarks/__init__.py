@@ -0,0 +1,2 @@
+# benchmarks/__init__.py
+# 오프라인 벤치마크 (합성 데이터 기반, 네트워크/API 키 불필요)
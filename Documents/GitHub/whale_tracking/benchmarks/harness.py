@@ -0,0 +1,176 @@
+# benchmarks/harness.py
+"""
+벤치마크 실행/기록/비교 도구
+
+- 처리량: 워밍업 후 repeats회 실행, 최솟값/중앙값 소요 시간과 초당 처리 항목 수
+- 메모리: 별도 1회 실행을 tracemalloc으로 추적한 최대 할당량 (시간 측정에는 영향 없음)
+- 기준선: 결과 JSON을 저장해 두고 다음 실행에서 중앙값 소요 시간/최대 메모리 증가율로 회귀 판정
+"""
+import gc
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+
+@dataclass
+class BenchmarkResult:
+    """벤치마크 1건 결과"""
+    name: str
+    items: int                    # 1회 실행에서 처리한 항목 수 (심볼, 기사, 행 등)
+    repeats: int
+    best_seconds: float
+    median_seconds: float
+    items_per_second: float       # 중앙값 기준
+    peak_memory_bytes: int        # tracemalloc 최대 할당량
+
+
+@dataclass
+class Regression:
+    """기준선 대비 회귀"""
+    name: str
+    metric: str                   # 'median_seconds' 또는 'peak_memory_bytes'
+    baseline: float
+    current: float
+    change: float                 # 증가율 (0.3 = 30% 증가)
+
+
+def run_case(name: str, func: Callable[[], Any], items: int,
+             repeats: int = 5, warmup: int = 1) -> BenchmarkResult:
+    """
+    벤치마크 1건 실행
+
+    Parameters:
+    -----------
+    name : str
+        벤치마크 이름 (예: 'explorer.parse_transactions')
+    func : Callable
+        측정할 함수 (인자 없음, 입력 데이터는 미리 생성해서 클로저로 전달)
+    items : int
+        1회 실행에서 처리하는 항목 수
+    repeats : int
+        측정 반복 횟수
+    warmup : int
+        측정 전 워밍업 횟수
+
+    Returns:
+    --------
+    BenchmarkResult
+    """
+    for _ in range(warmup):
+        func()
+
+    timings = []
+    gc_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeats):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    median = statistics.median(timings)
+    return BenchmarkResult(
+        name=name,
+        items=items,
+        repeats=repeats,
+        best_seconds=min(timings),
+        median_seconds=median,
+        items_per_second=items / median if median > 0 else float('inf'),
+        peak_memory_bytes=peak,
+    )
+
+
+def results_to_json(results: List[BenchmarkResult], params: Dict[str, Any]) -> Dict[str, Any]:
+    """결과를 저장용 dict로 변환 (실행 환경/입력 크기 포함)"""
+    return {
+        'created_at': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'params': params,
+        'results': {r.name: asdict(r) for r in results},
+    }
+
+
+def save_results(path: str, payload: Dict[str, Any]):
+    """결과 JSON 저장"""
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding='utf-8')
+
+
+def load_results(path: str) -> Optional[Dict[str, Any]]:
+    """결과 JSON 로드 (없으면 None)"""
+    target = Path(path)
+    if not target.exists():
+        return None
+    return json.loads(target.read_text(encoding='utf-8'))
+
+
+def compare_to_baseline(results: List[BenchmarkResult], baseline: Dict[str, Any],
+                        time_tolerance: float = 0.25,
+                        memory_tolerance: float = 0.25) -> List[Regression]:
+    """
+    기준선 대비 회귀 판정
+
+    입력 크기(params)가 다른 기준선과의 비교는 의미가 없으므로 호출 측에서 확인
+
+    Parameters:
+    -----------
+    results : List[BenchmarkResult]
+        이번 실행 결과
+    baseline : Dict
+        load_results()로 읽은 기준선
+    time_tolerance : float
+        허용 소요 시간 증가율
+    memory_tolerance : float
+        허용 최대 메모리 증가율
+
+    Returns:
+    --------
+    List[Regression] : 회귀 리스트
+    """
+    regressions = []
+    baseline_results = baseline.get('results', {})
+    for result in results:
+        before = baseline_results.get(result.name)
+        if not before:
+            continue
+        for metric, tolerance in (('median_seconds', time_tolerance), ('peak_memory_bytes', memory_tolerance)):
+            old, new = before[metric], getattr(result, metric)
+            if old > 0 and (new - old) / old > tolerance:
+                regressions.append(Regression(result.name, metric, old, new, (new - old) / old))
+    return regressions
+
+
+def format_table(results: List[BenchmarkResult], baseline: Optional[Dict[str, Any]] = None) -> str:
+    """결과 표 (기준선이 있으면 중앙값 변화율 포함)"""
+    baseline_results = (baseline or {}).get('results', {})
+    lines = [f"{'benchmark':<40} {'items':>7} {'median(ms)':>11} {'best(ms)':>10} "
+             f"{'items/s':>12} {'peak(KiB)':>10} {'vs base':>8}"]
+    for r in results:
+        before = baseline_results.get(r.name)
+        if before and before['median_seconds'] > 0:
+            change = f"{(r.median_seconds - before['median_seconds']) / before['median_seconds'] * 100:+7.1f}%"
+        else:
+            change = '       -'
+        lines.append(f"{r.name:<40} {r.items:>7} {r.median_seconds * 1000:>11.2f} {r.best_seconds * 1000:>10.2f} "
+                     f"{r.items_per_second:>12,.0f} {r.peak_memory_bytes / 1024:>10,.0f} {change}")
+    return '\n'.join(lines)
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+BlockExplorerCollector 파서 벤치마크
+합성 txlist / tokentx / txlistinternal 응답(기본 10,000행)으로 파싱 처리량과 메모리를
+오프라인 측정하고 저장된 기준선과 비교
+
+- 가격은 공유 가격 캐시에 미리 넣어 두고 거래 시점 가격 조회는 끔 (네트워크 호출 없음)
+- 함수 시그니처 디코딩(4byte.directory)은 네트워크 조회이므로 측정에서 제외
+"""
+
+import argparse
+import os
+import sys
+import logging
+from pathlib import Path
+
+# 프로젝트 루트 경로 설정
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# 오프라인 실행 설정 (실제 키/스냅샷 불필요)
+os.environ.setdefault('ETHERSCAN_API_KEY', 'benchmark')
+os.environ['USE_HISTORICAL_PRICES'] = 'false'
+os.environ['PRICE_CACHE_SNAPSHOT_PATH'] = ''
+
+from src.utils.logger import logger
+from src.utils.price_cache import get_price_cache
+from src.utils.columnar_parser import ColumnarPage
+import src.collectors.block_explorer_collector as block_explorer
+from benchmarks import synthetic_txlist
+from benchmarks.harness import (
+    run_case, results_to_json, save_results, load_results, compare_to_baseline, format_table
+)
+
+DEFAULT_BASELINE = str(Path(__file__).parent / 'baseline.json')
+
+
+def parse_arguments():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description='BlockExplorerCollector 파서 벤치마크')
+    parser.add_argument('--rows', type=int, default=10_000, help='응답 행 수 (기본값: 10000)')
+    parser.add_argument('--repeats', type=int, default=5, help='측정 반복 횟수 (기본값: 5)')
+    parser.add_argument('--seed', type=int, default=42, help='합성 데이터 시드 (기본값: 42)')
+    parser.add_argument('--quick', action='store_true', help='작은 입력으로 빠르게 실행 (스모크 테스트용)')
+    parser.add_argument('--filter', type=str, help='이름에 이 문자열이 포함된 벤치마크만 실행')
+    parser.add_argument('--baseline', type=str, default=DEFAULT_BASELINE, help='기준선 JSON 경로')
+    parser.add_argument('--save-baseline', action='store_true', help='이번 결과를 기준선으로 저장')
+    parser.add_argument('--output', type=str, help='이번 결과를 저장할 JSON 경로')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='허용 소요 시간/메모리 증가율 (기본값: 0.25)')
+    parser.add_argument('--fail-on-regression', action='store_true', help='회귀가 있으면 종료 코드 1')
+
+    args = parser.parse_args()
+    if args.quick:
+        args.rows, args.repeats = 1_000, 2
+    return args
+
+
+def build_collector(chain: str = 'ethereum'):
+    """네트워크 없이 동작하도록 설정한 수집기 (가격은 캐시에 고정)"""
+    block_explorer.FUNCTION_DECODER_AVAILABLE = False
+
+    cache = get_price_cache()
+    cache.set(chain, 'ETH', 3000.0, ttl=10**9)
+    for contract, _, symbol, _ in synthetic_txlist.TOKENS:
+        cache.set(chain, contract, 1.0 if symbol in ('USDT', 'USDC', 'DAI') else 50.0, ttl=10**9)
+
+    return block_explorer.BlockExplorerCollector(chain)
+
+
+def build_cases(args):
+    """(이름, 측정 함수, 항목 수) 리스트 - 입력 데이터는 여기서 한 번만 생성"""
+    collector = build_collector()
+    txlist = synthetic_txlist.generate_txlist(args.rows, args.seed)
+    tokentx = synthetic_txlist.generate_tokentx(args.rows, args.seed)
+    internal = synthetic_txlist.generate_txlistinternal(args.rows, args.seed)
+
+    def columnar_page():
+        page = ColumnarPage(txlist)
+        valid = page.present(['hash', 'blockNumber', 'timeStamp', 'from', 'value', 'gasUsed', 'gasPrice'])
+        page.numeric('value')
+        page.numeric('gasUsed')
+        page.integer('timeStamp', valid)
+
+    return [
+        ('explorer.columnar_page', columnar_page, len(txlist)),
+        ('explorer.parse_transactions', lambda: collector._parse_transactions(txlist), len(txlist)),
+        ('explorer.parse_token_transactions', lambda: collector._parse_token_transactions(tokentx), len(tokentx)),
+        ('explorer.parse_internal_transactions',
+         lambda: collector._parse_internal_transactions(internal), len(internal)),
+    ]
+
+
+def main():
+    """메인 실행 함수"""
+    args = parse_arguments()
+    params = {'rows': args.rows, 'seed': args.seed}
+
+    # 파서의 페이지 단위 로그(형식 오류 스킵 등)는 측정 중 출력하지 않음
+    logger.setLevel(logging.ERROR)
+
+    results = []
+    for name, func, items in build_cases(args):
+        if args.filter and args.filter not in name:
+            continue
+        results.append(run_case(name, func, items, repeats=args.repeats))
+        print(f"  ✓ {name}")
+
+    baseline = load_results(args.baseline)
+    if baseline is not None and baseline.get('params') != params:
+        print(f"⚠️ 기준선 입력 크기가 다름 ({baseline.get('params')}), 비교하지 않음")
+        baseline = None
+
+    print()
+    print(format_table(results, baseline))
+
+    payload = results_to_json(results, params)
+    if args.output:
+        save_results(args.output, payload)
+    if args.save_baseline:
+        save_results(args.baseline, payload)
+        print(f"\n💾 기준선 저장: {args.baseline}")
+        return
+
+    if baseline is None:
+        print(f"\nℹ️ 기준선 없음 ({args.baseline}) - --save-baseline으로 생성")
+        return
+
+    regressions = compare_to_baseline(results, baseline, args.tolerance, args.tolerance)
+    if not regressions:
+        print("\n✅ 기준선 대비 회귀 없음")
+        return
+
+    print(f"\n⚠️ 회귀 {len(regressions)}건")
+    for r in regressions:
+        print(f"  - {r.name} {r.metric}: {r.baseline:.6g} → {r.current:.6g} ({r.change * 100:+.1f}%)")
+    if args.fail_on_regression:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
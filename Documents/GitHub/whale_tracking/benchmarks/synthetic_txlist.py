@@ -0,0 +1,169 @@
+# benchmarks/synthetic_txlist.py
+"""
+결정적 합성 Etherscan 응답 생성기 (같은 seed → 같은 데이터)
+
+Etherscan txlist / tokentx / txlistinternal 응답의 result 배열과 같은 형태(모든 값이 문자열)로
+고래 거래 비율, 입력 데이터 유무, 형식 오류 행 비율을 실제 응답과 비슷하게 섞어서 생성
+"""
+
+import random
+from typing import Dict, List
+
+GENESIS_TIMESTAMP = 1_700_000_000
+START_BLOCK = 18_500_000
+
+# (contractAddress, tokenName, tokenSymbol, tokenDecimal)
+TOKENS = [
+    ('0xdac17f958d2ee523a2206206994597c13d831ec7', 'Tether USD', 'USDT', 6),
+    ('0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48', 'USD Coin', 'USDC', 6),
+    ('0x2260fac5e5542a773aa44fbcfedf7c193bc2c599', 'Wrapped BTC', 'WBTC', 8),
+    ('0x514910771af9ca656af840dff83e8264ecf986ca', 'ChainLink Token', 'LINK', 18),
+    ('0x1f9840a85d5af5bf1d1762f925bdddc4201f984', 'Uniswap', 'UNI', 18),
+    ('0x6b175474e89094c44da98b954eedeac495271d0f', 'Dai Stablecoin', 'DAI', 18),
+]
+
+# 자주 보이는 함수 셀렉터 (transfer, approve, swapExactTokensForTokens, multicall)
+_SELECTORS = ['0xa9059cbb', '0x095ea7b3', '0x38ed1739', '0x5ae401dc']
+
+
+def _address(rng: random.Random) -> str:
+    return '0x' + ''.join(rng.choices('0123456789abcdef', k=40))
+
+
+def _hash(rng: random.Random) -> str:
+    return '0x' + ''.join(rng.choices('0123456789abcdef', k=64))
+
+
+def _wei(rng: random.Random, whale_ratio: float) -> int:
+    """ETH 금액 (wei) - whale_ratio 비율로 10 ETH 이상"""
+    if rng.random() < whale_ratio:
+        eth = rng.uniform(10, 5_000)
+    else:
+        eth = rng.lognormvariate(-1, 2) if rng.random() < 0.8 else 0.0
+    return int(eth * 10**18)
+
+
+def _corrupt(rng: random.Random, row: Dict[str, str], error_ratio: float, fields: List[str]):
+    """error_ratio 비율로 필수 필드 누락 또는 숫자 형식 오류 주입"""
+    if rng.random() >= error_ratio:
+        return
+    field = rng.choice(fields)
+    if rng.random() < 0.5:
+        row.pop(field, None)
+    else:
+        row[field] = 'N/A'
+
+
+def generate_txlist(n_rows: int, seed: int = 42, whale_ratio: float = 0.05,
+                    error_ratio: float = 0.005) -> List[Dict[str, str]]:
+    """
+    txlist (일반 거래) 응답
+
+    Parameters:
+    -----------
+    n_rows : int
+        행 수
+    seed : int
+        난수 시드
+    whale_ratio : float
+        고래 거래 (10 ETH 이상) 비율
+    error_ratio : float
+        형식 오류 행 비율
+
+    Returns:
+    --------
+    List[Dict[str, str]] : Etherscan result 배열
+    """
+    rng = random.Random(seed)
+    wallet = _address(rng)
+    rows = []
+    for i in range(n_rows):
+        block = START_BLOCK + i // 3
+        has_input = rng.random() < 0.4
+        gas_used = rng.randint(21_000, 400_000) if has_input else 21_000
+        row = {
+            'blockNumber': str(block),
+            'timeStamp': str(GENESIS_TIMESTAMP + (block - START_BLOCK) * 12),
+            'hash': _hash(rng),
+            'nonce': str(i),
+            'blockHash': _hash(rng),
+            'transactionIndex': str(rng.randint(0, 300)),
+            'from': wallet if rng.random() < 0.5 else _address(rng),
+            'to': _address(rng),
+            'value': str(_wei(rng, whale_ratio)),
+            'gas': str(gas_used + rng.randint(0, 50_000)),
+            'gasPrice': str(rng.randint(5, 80) * 10**9),
+            'isError': '0' if rng.random() < 0.98 else '1',
+            'txreceipt_status': '1' if rng.random() < 0.98 else '0',
+            'input': (rng.choice(_SELECTORS) + '0' * 128) if has_input else '0x',
+            'contractAddress': '',
+            'cumulativeGasUsed': str(gas_used * rng.randint(1, 50)),
+            'gasUsed': str(gas_used),
+            'confirmations': str(rng.randint(1, 100_000)),
+        }
+        _corrupt(rng, row, error_ratio, ['hash', 'timeStamp', 'value', 'gasUsed', 'gasPrice'])
+        rows.append(row)
+    return rows
+
+
+def generate_tokentx(n_rows: int, seed: int = 42, error_ratio: float = 0.005) -> List[Dict[str, str]]:
+    """tokentx (ERC-20 전송) 응답"""
+    rng = random.Random(seed)
+    wallet = _address(rng)
+    rows = []
+    for i in range(n_rows):
+        block = START_BLOCK + i // 3
+        contract, name, symbol, decimals = rng.choice(TOKENS)
+        amount = rng.lognormvariate(6, 3)
+        row = {
+            'blockNumber': str(block),
+            'timeStamp': str(GENESIS_TIMESTAMP + (block - START_BLOCK) * 12),
+            'hash': _hash(rng),
+            'nonce': str(i),
+            'blockHash': _hash(rng),
+            'from': wallet if rng.random() < 0.5 else _address(rng),
+            'contractAddress': contract,
+            'to': _address(rng),
+            'value': str(int(amount * 10**decimals)),
+            'tokenName': name,
+            'tokenSymbol': symbol,
+            'tokenDecimal': str(decimals),
+            'transactionIndex': str(rng.randint(0, 300)),
+            'gas': str(rng.randint(60_000, 300_000)),
+            'gasPrice': str(rng.randint(5, 80) * 10**9),
+            'gasUsed': str(rng.randint(40_000, 200_000)),
+            'cumulativeGasUsed': str(rng.randint(1_000_000, 20_000_000)),
+            'input': 'deprecated',
+            'confirmations': str(rng.randint(1, 100_000)),
+        }
+        _corrupt(rng, row, error_ratio, ['hash', 'value', 'tokenDecimal', 'gasUsed'])
+        rows.append(row)
+    return rows
+
+
+def generate_txlistinternal(n_rows: int, seed: int = 42, whale_ratio: float = 0.05,
+                            error_ratio: float = 0.005) -> List[Dict[str, str]]:
+    """txlistinternal (내부 거래) 응답"""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n_rows):
+        block = START_BLOCK + i // 3
+        row = {
+            'blockNumber': str(block),
+            'timeStamp': str(GENESIS_TIMESTAMP + (block - START_BLOCK) * 12),
+            'hash': _hash(rng),
+            'from': _address(rng),
+            'to': _address(rng),
+            'value': str(_wei(rng, whale_ratio)),
+            'contractAddress': '',
+            'input': '',
+            'type': 'call' if rng.random() < 0.85 else rng.choice(['create', 'delegatecall', 'staticcall']),
+            'gas': str(rng.randint(2_300, 500_000)),
+            'gasUsed': str(rng.randint(0, 200_000)),
+            'traceId': f'{rng.randint(0, 5)}_{rng.randint(0, 3)}',
+            'isError': '0' if rng.random() < 0.97 else '1',
+            'errCode': '',
+        }
+        _corrupt(rng, row, error_ratio, ['hash', 'value', 'timeStamp'])
+        rows.append(row)
+    return rows
@@ -16,8 +16,14 @@ load_dotenv(PROJECT_ROOT / 'config' / '.env')
 # 모듈 import
 from src.utils.logger import logger
 from src.collectors.block_explorer_collector import BlockExplorerCollector
+from src.collectors.transfer_log_scanner import TransferLogScanner
 from src.database.supabase_client import get_supabase_client
-from src.utils.label_manager import load_labels, get_label
+from src.utils.label_manager import load_label_index, label_many
+from src.utils.price_cache import get_price_cache
+from src.utils.retry_handler import deadline_scope
+
+# 체인별 수집 단계 제한 시간 (초, 지나면 API 재시도 중단)
+STAGE_DEADLINE_SECONDS = float(os.getenv('COLLECTION_STAGE_DEADLINE_SECONDS', 600))
 
 def main():
     """
@@ -56,7 +62,7 @@ def main():
         # Step 0: 지갑 라벨 데이터 로드
         # ============================================
         logger.info("\n📝 Step 0: 지갑 라벨 데이터 로드")
-        wallet_labels = load_labels()
+        wallet_labels = load_label_index()
         
         # ============================================
         # Step 1: 블록 탐색기 수집기 초기화 (멀티체인)
@@ -92,67 +98,81 @@ def main():
         # ============================================
         # Step 3: 이더리움 데이터 수집 (에러 처리 강화)
         # ============================================
-        eth_transactions = []
-        eth_token_transactions = []
-        eth_internal_transactions = []
-        
-        logger.info("\n📝 Step 3-1: Ethereum - 네이티브 코인(ETH) 거래 데이터 수집")
-        try:
-            eth_transactions = eth_collector.collect_from_addresses(whale_addresses)
-            logger.info(f"✅ Ethereum ETH 거래 {len(eth_transactions)}건 수집 완료")
-        except Exception as e:
-            logger.error(f"❌ Ethereum ETH 거래 수집 실패: {e}")
-            logger.warning("   다음 단계 계속 진행...")
-        
-        logger.info("\n📝 Step 3-2: Ethereum - ERC-20 토큰 거래 데이터 수집")
-        try:
-            eth_token_transactions = eth_collector.collect_token_transactions_from_addresses(whale_addresses)
-            logger.info(f"✅ Ethereum 토큰 거래 {len(eth_token_transactions)}건 수집 완료")
-        except Exception as e:
-            logger.error(f"❌ Ethereum 토큰 거래 수집 실패: {e}")
-            logger.warning("   다음 단계 계속 진행...")
-        
-        logger.info("\n📝 Step 3-3: Ethereum - 내부 거래 데이터 수집")
-        try:
-            eth_internal_transactions = eth_collector.collect_internal_transactions_from_addresses(whale_addresses)
-            logger.info(f"✅ Ethereum 내부 거래 {len(eth_internal_transactions)}건 수집 완료")
-        except Exception as e:
-            logger.error(f"❌ Ethereum 내부 거래 수집 실패: {e}")
-            logger.warning("   다음 단계 계속 진행...")
+        with deadline_scope(STAGE_DEADLINE_SECONDS):
+            eth_transactions = []
+            eth_token_transactions = []
+            eth_internal_transactions = []
+            
+            logger.info("\n📝 Step 3-1: Ethereum - 네이티브 코인(ETH) 거래 데이터 수집")
+            try:
+                eth_transactions = eth_collector.collect_from_addresses(whale_addresses)
+                logger.info(f"✅ Ethereum ETH 거래 {len(eth_transactions)}건 수집 완료")
+            except Exception as e:
+                logger.error(f"❌ Ethereum ETH 거래 수집 실패: {e}")
+                logger.warning("   다음 단계 계속 진행...")
+            
+            logger.info("\n📝 Step 3-2: Ethereum - ERC-20 토큰 거래 데이터 수집")
+            try:
+                eth_token_transactions = eth_collector.collect_token_transactions_from_addresses(whale_addresses)
+                logger.info(f"✅ Ethereum 토큰 거래 {len(eth_token_transactions)}건 수집 완료")
+            except Exception as e:
+                logger.error(f"❌ Ethereum 토큰 거래 수집 실패: {e}")
+                logger.warning("   다음 단계 계속 진행...")
+            
+            logger.info("\n📝 Step 3-3: Ethereum - 내부 거래 데이터 수집")
+            try:
+                eth_internal_transactions = eth_collector.collect_internal_transactions_from_addresses(whale_addresses)
+                logger.info(f"✅ Ethereum 내부 거래 {len(eth_internal_transactions)}건 수집 완료")
+            except Exception as e:
+                logger.error(f"❌ Ethereum 내부 거래 수집 실패: {e}")
+                logger.warning("   다음 단계 계속 진행...")
+            
+            # 지갑 목록과 무관하게 체인 전체의 토큰 Transfer 로그에서 고래 탐지 (선택)
+            eth_log_transactions = []
+            if os.getenv('USE_TRANSFER_LOG_SCANNER', 'false').lower() == 'true':
+                logger.info("\n📝 Step 3-4: Ethereum - Transfer 로그 스캔 (eth_getLogs)")
+                try:
+                    eth_log_transactions = TransferLogScanner(chain='ethereum').scan_recent()
+                    logger.info(f"✅ Ethereum Transfer 로그 고래 거래 {len(eth_log_transactions)}건 수집 완료")
+                except Exception as e:
+                    logger.error(f"❌ Ethereum Transfer 로그 스캔 실패: {e}")
+                    logger.warning("   다음 단계 계속 진행...")
         
         # ============================================
         # Step 4: Polygon 데이터 수집 (에러 처리 강화)
         # ============================================
-        polygon_transactions = []
-        polygon_token_transactions = []
-        polygon_internal_transactions = []
-        
-        logger.info("\n📝 Step 4-1: Polygon - 네이티브 코인(MATIC) 거래 데이터 수집")
-        try:
-            polygon_transactions = polygon_collector.collect_from_addresses(whale_addresses)
-            logger.info(f"✅ Polygon MATIC 거래 {len(polygon_transactions)}건 수집 완료")
-        except Exception as e:
-            logger.error(f"❌ Polygon MATIC 거래 수집 실패: {e}")
-            logger.warning("   다음 단계 계속 진행...")
-        
-        logger.info("\n📝 Step 4-2: Polygon - ERC-20 토큰 거래 데이터 수집")
-        try:
-            polygon_token_transactions = polygon_collector.collect_token_transactions_from_addresses(whale_addresses)
-            logger.info(f"✅ Polygon 토큰 거래 {len(polygon_token_transactions)}건 수집 완료")
-        except Exception as e:
-            logger.error(f"❌ Polygon 토큰 거래 수집 실패: {e}")
-            logger.warning("   다음 단계 계속 진행...")
-        
-        logger.info("\n📝 Step 4-3: Polygon - 내부 거래 데이터 수집")
-        try:
-            polygon_internal_transactions = polygon_collector.collect_internal_transactions_from_addresses(whale_addresses)
-            logger.info(f"✅ Polygon 내부 거래 {len(polygon_internal_transactions)}건 수집 완료")
-        except Exception as e:
-            logger.error(f"❌ Polygon 내부 거래 수집 실패: {e}")
-            logger.warning("   다음 단계 계속 진행...")
+        with deadline_scope(STAGE_DEADLINE_SECONDS):
+            polygon_transactions = []
+            polygon_token_transactions = []
+            polygon_internal_transactions = []
+            
+            logger.info("\n📝 Step 4-1: Polygon - 네이티브 코인(MATIC) 거래 데이터 수집")
+            try:
+                polygon_transactions = polygon_collector.collect_from_addresses(whale_addresses)
+                logger.info(f"✅ Polygon MATIC 거래 {len(polygon_transactions)}건 수집 완료")
+            except Exception as e:
+                logger.error(f"❌ Polygon MATIC 거래 수집 실패: {e}")
+                logger.warning("   다음 단계 계속 진행...")
+            
+            logger.info("\n📝 Step 4-2: Polygon - ERC-20 토큰 거래 데이터 수집")
+            try:
+                polygon_token_transactions = polygon_collector.collect_token_transactions_from_addresses(whale_addresses)
+                logger.info(f"✅ Polygon 토큰 거래 {len(polygon_token_transactions)}건 수집 완료")
+            except Exception as e:
+                logger.error(f"❌ Polygon 토큰 거래 수집 실패: {e}")
+                logger.warning("   다음 단계 계속 진행...")
+            
+            logger.info("\n📝 Step 4-3: Polygon - 내부 거래 데이터 수집")
+            try:
+                polygon_internal_transactions = polygon_collector.collect_internal_transactions_from_addresses(whale_addresses)
+                logger.info(f"✅ Polygon 내부 거래 {len(polygon_internal_transactions)}건 수집 완료")
+            except Exception as e:
+                logger.error(f"❌ Polygon 내부 거래 수집 실패: {e}")
+                logger.warning("   다음 단계 계속 진행...")
         
         # 모든 거래 합치기 (이더리움 + 폴리곤)
-        all_transactions = eth_transactions + eth_token_transactions + polygon_transactions + polygon_token_transactions
+        all_transactions = (eth_transactions + eth_token_transactions + eth_log_transactions
+                            + polygon_transactions + polygon_token_transactions)
         all_internal_transactions = eth_internal_transactions + polygon_internal_transactions
         
         if not all_transactions:
@@ -160,7 +180,7 @@ def main():
             return
         
         logger.info(f"✅ 총 {len(all_transactions)}건 수집 완료")
-        logger.info(f"   - Ethereum: {len(eth_transactions) + len(eth_token_transactions)}건")
+        logger.info(f"   - Ethereum: {len(eth_transactions) + len(eth_token_transactions) + len(eth_log_transactions)}건")
         logger.info(f"   - Polygon: {len(polygon_transactions) + len(polygon_token_transactions)}건")
         
         # ============================================
@@ -226,24 +246,16 @@ def main():
         # ============================================
         logger.info("\n📝 Step 6: 거래 데이터에 지갑 라벨 추가")
         
-        # 일반 거래에 라벨 추가
-        for tx in filtered_transactions:
-            from_addr = tx.get('from_address', '')
-            to_addr = tx.get('to_address', '')
-            
-            if from_addr:
-                from_label = get_label(from_addr, wallet_labels)
-                if from_label:
-                    tx['from_label'] = from_label
-                else:
-                    tx['from_label'] = None
+        # 일반 거래에 라벨 추가 (주소 배치를 한 번에 조회)
+        from_labels = label_many([tx.get('from_address') for tx in filtered_transactions], wallet_labels)
+        to_labels = label_many([tx.get('to_address') for tx in filtered_transactions], wallet_labels)
+        
+        for tx, from_label, to_label in zip(filtered_transactions, from_labels, to_labels):
+            if tx.get('from_address'):
+                tx['from_label'] = from_label or None
             
-            if to_addr:
-                to_label = get_label(to_addr, wallet_labels)
-                if to_label:
-                    tx['to_label'] = to_label
-                else:
-                    tx['to_label'] = None
+            if tx.get('to_address'):
+                tx['to_label'] = to_label or None
         
         # 라벨이 추가된 거래 수 집계
         labeled_count = sum(1 for tx in filtered_transactions 
@@ -300,6 +312,11 @@ def main():
             else:
                 logger.warning("⚠️ 표시할 컬럼이 없습니다")
         
+        # 가격 캐시 통계 (TTL 튜닝용)
+        cache_stats = get_price_cache().get_stats()
+        logger.info(f"\n💾 가격 캐시: 히트 {cache_stats['hits']}건 / 미스 {cache_stats['misses']}건 "
+                    f"(히트율 {cache_stats['hit_rate']:.0%}, 백그라운드 갱신 {cache_stats['refresh_ahead']}건)")
+        
         # ============================================
         # 완료
         # ============================================
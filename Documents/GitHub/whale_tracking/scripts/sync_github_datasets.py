@@ -19,8 +19,8 @@ def main():
     try:
         logger.info("🚀 GitHub 데이터셋 동기화 시작")
         
-        # 데이터셋 동기화 (CSV 파일 자동 업데이트)
-        labels = sync_github_datasets(update_csv=True)
+        # 데이터셋 동기화 (CSV 파일 자동 업데이트, --force: ETag 무시하고 전체 재다운로드)
+        labels = sync_github_datasets(update_csv=True, force='--force' in sys.argv)
         
         logger.info("\n✅ 동기화 완료!")
         logger.info(f"   총 {len(labels)}개의 라벨이 wallet_labels.csv에 저장되었습니다.")
@@ -19,6 +19,7 @@ load_dotenv(PROJECT_ROOT / 'config' / '.env')
 from src.utils.logger import logger
 from src.database.supabase_client import get_supabase_client
 from src.utils.price_updater import PriceUpdater
+from src.utils.price_cache import get_price_cache
 
 def main():
     """메인 실행 함수"""
@@ -81,6 +82,9 @@ def main():
         logger.info(f"   ❌ 실패: {total_stats['failed']}건")
         logger.info(f"   ⏭️ 건너뛰기: {total_stats['skipped']}건")
         
+        cache_stats = get_price_cache().get_stats()
+        logger.info(f"   💾 가격 캐시: 히트 {cache_stats['hits']}건 / 미스 {cache_stats['misses']}건 (히트율 {cache_stats['hit_rate']:.0%})")
+        
         if total_stats['success'] > 0:
             logger.info(f"\n💡 {total_stats['success']}건의 거래 가격이 업데이트되었습니다!")
         
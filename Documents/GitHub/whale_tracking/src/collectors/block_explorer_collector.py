@@ -4,10 +4,10 @@ import requests
 import os
 import time
 from dotenv import load_dotenv
-from datetime import datetime
 from typing import List, Dict, Any, Optional
+import numpy as np
 import pandas as pd
-from src.utils.logger import logger
+from src.utils.logger import logger, SAMPLED
 
 # Chainlink Price Feed (무료 온체인 가격)
 try:
@@ -41,9 +41,23 @@ except ImportError:
     FUNCTION_DECODER_AVAILABLE = False
     logger.debug("⚠️ Function Decoder 모듈을 로드할 수 없습니다 (선택적 기능).")
 
+# 블록 시간 기준 과거 가격 인덱스 (Binance 캔들)
+try:
+    from src.collectors.historical_price_index import get_historical_price_index
+    HISTORICAL_PRICE_AVAILABLE = True
+except ImportError:
+    HISTORICAL_PRICE_AVAILABLE = False
+    logger.debug("⚠️ 과거 가격 인덱스 모듈을 로드할 수 없습니다 (현재 가격 사용).")
+
+# 프로세스 공유 가격 캐시
+from src.utils.price_cache import get_price_cache
+
+# 컬럼 단위 응답 파싱
+from src.utils.columnar_parser import ColumnarPage, scale_by_decimals, to_iso_timestamps
+
 # 재시도 로직 유틸리티
 try:
-    from src.utils.retry_handler import retry_on_http_error, retry_with_backoff
+    from src.utils.retry_handler import retry_on_http_error, retry_with_backoff, request_timeout
     RETRY_HANDLER_AVAILABLE = True
 except ImportError:
     RETRY_HANDLER_AVAILABLE = False
@@ -52,6 +66,9 @@ except ImportError:
 # 환경변수 로드
 load_dotenv('config/.env')
 
+# Etherscan V2 API URL (목 서버 등으로 변경 가능)
+ETHERSCAN_API_URL = os.getenv('ETHERSCAN_API_URL', 'https://api.etherscan.io/v2/api')
+
 class BlockExplorerCollector:
     """멀티체인 블록 탐색기 API를 통한 거래 데이터 수집"""
     
@@ -61,21 +78,21 @@ class BlockExplorerCollector:
     CHAIN_CONFIG = {
         'ethereum': {
             'base_url': 'https://api.etherscan.io/api',
-            'base_url_v2': 'https://api.etherscan.io/v2/api',
+            'base_url_v2': ETHERSCAN_API_URL,
             'chainid': 1,
             'native_coin': 'ETH',
             'api_key_env': 'ETHERSCAN_API_KEY'  # 모든 체인에서 동일한 키 사용
         },
         'polygon': {
-            'base_url': 'https://api.etherscan.io/v2/api',  # Etherscan API V2 사용
-            'base_url_v2': 'https://api.etherscan.io/v2/api',  # Etherscan API V2 사용
+            'base_url': ETHERSCAN_API_URL,  # Etherscan API V2 사용
+            'base_url_v2': ETHERSCAN_API_URL,  # Etherscan API V2 사용
             'chainid': 137,  # Polygon ChainID
             'native_coin': 'MATIC',
             'api_key_env': 'ETHERSCAN_API_KEY'  # Etherscan API 키 사용 (별도 Polygonscan 키 불필요)
         }
     }
     
-    def __init__(self, chain: str = 'ethereum'):
+    def __init__(self, chain: str = 'ethereum', base_url: Optional[str] = None):
         """
         블록 탐색기 수집기 초기화
         
@@ -83,6 +100,8 @@ class BlockExplorerCollector:
         -----------
         chain : str
             체인 이름 ('ethereum' 또는 'polygon', 기본값: 'ethereum')
+        base_url : str, optional
+            Etherscan V2 API URL (기본값: ETHERSCAN_API_URL 환경변수, 목 서버 테스트용)
         """
         self.chain = chain.lower()
         
@@ -99,7 +118,7 @@ class BlockExplorerCollector:
         # URL 설정
         self.base_url = config['base_url']
         self.base_url_v1 = config['base_url']
-        self.base_url_v2 = config['base_url_v2']
+        self.base_url_v2 = base_url or config['base_url_v2']
         
         # ChainID 설정
         self.chainid = config['chainid']
@@ -112,18 +131,22 @@ class BlockExplorerCollector:
         self.min_whale_usd = float(os.getenv('MIN_WHALE_AMOUNT_USD', 50000))
         self.api_delay = float(os.getenv('API_DELAY_SECONDS', 0.5))  # Rate limit 방지
         
-        # 가격 캐시 (API 호출 최소화)
-        self._eth_price_cache = None
-        self._token_price_cache = {}
-        self._last_price_fetch_time = 0
-        self._last_token_price_fetch_time = 0
-        self._price_cache_duration = 300  # 5분 캐시 유지 (무료 API rate limit 방지)
+        # 가격 캐시 (API 호출 최소화) - 모든 수집기 인스턴스가 (chain, asset) 키로 공유
+        self._price_cache = get_price_cache()
+        self._price_cache_duration = float(os.getenv('PRICE_CACHE_TTL_SECONDS', 300))  # 5분 캐시 유지 (무료 API rate limit 방지)
+        
+        # 거래 시점 가격 사용 여부 (실패 시 현재 가격으로 대체)
+        self.use_historical_prices = (
+            HISTORICAL_PRICE_AVAILABLE and
+            os.getenv('USE_HISTORICAL_PRICES', 'true').lower() == 'true'
+        )
         
         logger.info(f"✅ {self.chain.upper()} 수집기 초기화 완료 (ChainID: {self.chainid})")
         logger.info(f"   - 네이티브 코인: {self.native_coin}")
         logger.info(f"   - 고래 기준 ({self.native_coin}): {self.min_whale_eth}")
         logger.info(f"   - 고래 기준 (USD): ${self.min_whale_usd:,.0f}")
-        logger.info(f"   - 가격 캐시: {self._price_cache_duration}초")
+        logger.info(f"   - 가격 캐시: {self._price_cache_duration:.0f}초 (인스턴스 공유)")
+        logger.info(f"   - 거래 시점 가격: {'✅' if self.use_historical_prices else '❌'}")
     
     def _make_api_request(self, params: Dict[str, Any], description: str = "API 요청") -> Optional[Dict]:
         """
@@ -152,7 +175,8 @@ class BlockExplorerCollector:
                 retry_status_codes=(500, 502, 503, 504)
             )
             def _request():
-                response = requests.get(self.base_url_v2, params=params, timeout=30)
+                # 현재 단계 데드라인을 넘기지 않도록 타임아웃 제한
+                response = requests.get(self.base_url_v2, params=params, timeout=request_timeout(30))
                 response.raise_for_status()
                 return response.json()
             
@@ -236,7 +260,7 @@ class BlockExplorerCollector:
         }
         
         try:
-            logger.info(f"🔍 {address[:10]}... 거래 조회 중... (ChainID: {self.chainid})")
+            logger.info("🔍 %s... 거래 조회 중... (ChainID: %s)", address[:10], self.chainid, extra=SAMPLED)
             
             # 재시도 로직 포함 API 요청
             data = self._make_api_request(params, f"{self.chain.upper()} 거래 조회")
@@ -249,7 +273,7 @@ class BlockExplorerCollector:
                 if not isinstance(transactions, list):
                     transactions = []
                     
-                logger.info(f"✅ {len(transactions)}건 조회 완료")
+                logger.info("✅ %d건 조회 완료", len(transactions), extra=SAMPLED)
                 
                 # 거래 파싱
                 parsed_transactions = self._parse_transactions(transactions)
@@ -271,7 +295,7 @@ class BlockExplorerCollector:
                     elif 'invalid api key' in result_msg.lower() or 'api key' in result_msg.lower():
                         logger.error("❌ API 키가 유효하지 않습니다. config/.env 파일을 확인하세요.")
                     elif 'no transactions found' in result_msg.lower() or result_msg == '[]':
-                        logger.info("ℹ️ 해당 주소에 거래 내역이 없습니다.")
+                        logger.info("ℹ️ 해당 주소에 거래 내역이 없습니다.", extra=SAMPLED)
                 
                 return []
             
@@ -286,7 +310,10 @@ class BlockExplorerCollector:
     
     def _parse_transactions(self, transactions: List[Dict]) -> List[Dict[str, Any]]:
         """
-        Etherscan 거래 데이터 파싱 및 정제
+        Etherscan 거래 데이터 파싱 및 정제 (컬럼 단위 일괄 처리)
+        
+        금액/가스/타임스탬프 컬럼만 타입 배열로 변환하여 고래 판정을 하나의 벡터 마스크로
+        처리하고, 고래 거래만 dict로 생성
         
         Parameters:
         -----------
@@ -297,88 +324,72 @@ class BlockExplorerCollector:
         --------
         List[Dict] : 정제된 거래 데이터
         """
-        parsed = []
-        # ETH 가격은 한 번만 조회 (성능 최적화)
+        if not transactions:
+            return []
+        
+        page = ColumnarPage(transactions)
+        
+        # 필수 필드 존재 확인 (벡터 마스크)
+        valid = page.present(['hash', 'blockNumber', 'timeStamp', 'from', 'value',
+                              'gasUsed', 'gasPrice', 'txreceipt_status'])
+        
+        # Wei를 ETH로 변환 (1 ETH = 10^18 Wei)
+        amount_eth = scale_by_decimals(page.numeric('value'), 18)
+        
+        # 가스비 계산
+        gas_used = page.numeric('gasUsed')
+        gas_price = page.numeric('gasPrice')
+        gas_fee_eth = (gas_used * gas_price) / 10**18
+        timestamps = page.integer('timeStamp', valid)
+        valid &= np.isfinite(amount_eth) & np.isfinite(gas_used) & np.isfinite(gas_price)
+        
+        # USD 가치 계산 (ETH 가격은 한 번만 조회, 거래 시점 가격 우선)
         eth_to_usd_rate = self._get_eth_to_usd_rate()
+        rates = self._get_historical_native_rates(np.where(valid, timestamps, np.nan))
+        rates = np.where(np.isfinite(rates), rates, eth_to_usd_rate) if rates is not None else np.full(len(page), eth_to_usd_rate)
+        amount_usd = amount_eth * rates
+        gas_fee_usd = gas_fee_eth * rates
+        
+        # 고래 판정 (벡터 마스크) - 고래가 아니면 스킵
+        keep = np.flatnonzero(valid & ((amount_eth >= self.min_whale_eth) | (amount_usd >= self.min_whale_usd)))
+        self._log_skipped(int(len(page) - valid.sum()), "거래")
+        
+        # 살아남은 행의 값만 Python 스칼라로 변환
+        block_timestamps = to_iso_timestamps(timestamps[keep])
+        amounts = amount_eth[keep].tolist()
+        amounts_usd = amount_usd[keep].tolist()
+        gas_used_list = gas_used[keep].astype(np.int64).tolist()
+        gas_price_list = gas_price[keep].astype(np.int64).tolist()
+        gas_fees_eth = gas_fee_eth[keep].tolist()
+        gas_fees_usd = gas_fee_usd[keep].tolist()
         
-        for tx in transactions:
+        parsed = []
+        
+        # 살아남은 행만 dict로 생성
+        for j, i in enumerate(keep.tolist()):
+            tx = transactions[i]
             try:
-                # 필수 필드 존재 확인
-                required_fields = ['value', 'gasUsed', 'gasPrice', 'hash', 'blockNumber', 
-                                 'timeStamp', 'from', 'txreceipt_status']
-                missing_fields = [field for field in required_fields if field not in tx or tx[field] is None]
-                
-                if missing_fields:
-                    logger.warning(f"⚠️ 필수 필드 누락: {missing_fields}, 거래 스킵")
-                    continue
-                
-                # Wei를 ETH로 변환 (1 ETH = 10^18 Wei)
-                amount_eth = float(tx['value']) / 10**18
-                
-                # 가스비 계산
-                gas_used = float(tx['gasUsed'])
-                gas_price = float(tx['gasPrice'])
-                gas_fee_eth = (gas_used * gas_price) / 10**18
-                
-                # USD 가치 계산
-                amount_usd = amount_eth * eth_to_usd_rate
-                gas_fee_usd = gas_fee_eth * eth_to_usd_rate
-                
-                # 고래 판정
-                is_whale = amount_eth >= self.min_whale_eth or amount_usd >= self.min_whale_usd
-                
-                if not is_whale:
-                    continue  # 고래가 아니면 스킵
-                
-                # 고래 분류
-                whale_category = self._classify_whale(amount_usd)
-                
-                # 타임스탬프 처리 (문자열 또는 숫자 모두 지원)
-                try:
-                    timestamp = int(tx['timeStamp'])
-                    block_timestamp = datetime.fromtimestamp(timestamp)
-                except (ValueError, TypeError, OSError) as e:
-                    logger.warning(f"⚠️ 타임스탬프 파싱 실패: {tx.get('timeStamp')}, {e}")
-                    continue
-                
-                # datetime을 ISO 형식 문자열로 변환 (Supabase JSON 직렬화 호환)
-                block_timestamp_str = block_timestamp.isoformat()
-                
                 # input_data 처리 및 함수 시그니처 디코딩 (선택적)
                 input_data_str = str(tx.get('input', ''))
-                method_id = None
-                function_name = None
-                
-                if FUNCTION_DECODER_AVAILABLE and input_data_str and len(input_data_str) > 10:
-                    try:
-                        method_id = extract_method_id(input_data_str)
-                        if method_id:
-                            # 함수 시그니처 디코딩 (선택적, 느릴 수 있으므로 로깅만)
-                            decoded = decode_input_data(input_data_str)
-                            if decoded:
-                                function_name = decoded.get('function_name')
-                                if function_name:
-                                    logger.debug(f"🔍 {tx['hash'][:10]}... 함수: {function_name}")
-                    except Exception as e:
-                        logger.debug(f"⚠️ 함수 시그니처 디코딩 실패: {e}")
+                method_id, function_name = self._decode_function(input_data_str, str(tx['hash']))
                 
-                parsed_tx = {
+                parsed.append({
                     'tx_hash': str(tx['hash']),
                     'block_number': int(tx['blockNumber']),
-                    'block_timestamp': block_timestamp_str,  # ISO 형식 문자열로 저장
+                    'block_timestamp': block_timestamps[j],  # ISO 형식 문자열로 저장
                     'from_address': str(tx['from']).lower(),
                     'to_address': str(tx['to']).lower() if tx.get('to') else None,
                     'coin_symbol': self.native_coin,  # ETH 또는 MATIC
                     'chain': self.chain,  # 체인 정보 추가
-                    'amount': amount_eth,
-                    'amount_usd': amount_usd,
-                    'gas_used': int(gas_used),
-                    'gas_price': int(gas_price),
-                    'gas_fee_eth': gas_fee_eth,
-                    'gas_fee_usd': gas_fee_usd,
+                    'amount': amounts[j],
+                    'amount_usd': amounts_usd[j],
+                    'gas_used': gas_used_list[j],
+                    'gas_price': gas_price_list[j],
+                    'gas_fee_eth': gas_fees_eth[j],
+                    'gas_fee_usd': gas_fees_usd[j],
                     'transaction_status': 'SUCCESS' if str(tx['txreceipt_status']) == '1' else 'FAILED',
-                    'is_whale': is_whale,
-                    'whale_category': whale_category,
+                    'is_whale': True,
+                    'whale_category': self._classify_whale(amounts_usd[j]),
                     'contract_address': str(tx['contractAddress']).lower() if tx.get('contractAddress') else None,
                     'input_data': input_data_str,
                     'is_contract_to_contract': bool(str(tx.get('isError', '1')) == '0' and input_data_str not in [None, '', '0x']),
@@ -386,9 +397,7 @@ class BlockExplorerCollector:
                     # 함수 디코딩 정보 (선택적, 나중에 배치 작업으로도 처리 가능)
                     'method_id': method_id,
                     'function_name': function_name,
-                }
-                
-                parsed.append(parsed_tx)
+                })
             
             except Exception as e:
                 logger.warning(f"⚠️ 거래 파싱 오류: {e}")
@@ -396,13 +405,45 @@ class BlockExplorerCollector:
         
         return parsed
     
+    @staticmethod
+    def _log_skipped(skipped: int, kind: str):
+        """필수 필드 누락/형식 오류로 제외된 행 수를 페이지당 한 번만 로깅"""
+        if skipped:
+            logger.warning(f"⚠️ 필수 필드 누락/형식 오류: {kind} {skipped}건 스킵")
+    
+    def _decode_function(self, input_data_str: str, tx_hash: str):
+        """
+        input_data에서 함수 시그니처 디코딩 (선택적 기능)
+        
+        Returns:
+        --------
+        Tuple[Optional[str], Optional[str]] : (method_id, function_name)
+        """
+        method_id = None
+        function_name = None
+        
+        if FUNCTION_DECODER_AVAILABLE and input_data_str and len(input_data_str) > 10:
+            try:
+                method_id = extract_method_id(input_data_str)
+                if method_id:
+                    # 함수 시그니처 디코딩 (선택적, 느릴 수 있으므로 로깅만)
+                    decoded = decode_input_data(input_data_str)
+                    if decoded:
+                        function_name = decoded.get('function_name')
+                        if function_name:
+                            logger.debug(f"🔍 {tx_hash[:10]}... 함수: {function_name}")
+            except Exception as e:
+                logger.debug(f"⚠️ 함수 시그니처 디코딩 실패: {e}")
+        
+        return method_id, function_name
+    
     def _get_eth_to_usd_rate(self, use_cache: bool = True) -> float:
         """
         현재 ETH/USD 환율 조회
         
         우선순위:
-        1. Chainlink Price Feed (무료, Rate Limit 없음, 정확)
-        2. 캐시된 가격 (5분 유효)
+        1. 공유 가격 캐시 (5분 유효, 만료 전 백그라운드 갱신)
+        2. Chainlink Price Feed (무료, Rate Limit 없음, 정확)
         3. 기본값 ($3500)
         
         Parameters:
@@ -414,37 +455,74 @@ class BlockExplorerCollector:
         --------
         float : ETH/USD 환율
         """
-        current_time = time.time()
+        price = self._price_cache.get_or_load(
+            self.chain, 'ETH',
+            self._fetch_eth_to_usd_rate,
+            ttl=self._price_cache_duration,
+            force_refresh=not use_cache
+        )
         
-        # 캐시 확인 (5분 유효)
-        if use_cache and self._eth_price_cache is not None:
-            if current_time - self._last_price_fetch_time < self._price_cache_duration:
-                logger.debug(f"💹 ETH 가격 (캐시): ${self._eth_price_cache:,.2f}")
-                return self._eth_price_cache
-        
-        # Chainlink Price Feed 시도 (무료 온체인 가격)
-        if CHAINLINK_AVAILABLE:
-            try:
-                chainlink_price = get_chainlink_eth_price(chain=self.chain)
-                if chainlink_price and chainlink_price > 0:
-                    # 캐시 저장
-                    self._eth_price_cache = chainlink_price
-                    self._last_price_fetch_time = time.time()
-                    logger.info(f"💹 ETH 가격 (Chainlink): ${chainlink_price:,.2f}")
-                    return chainlink_price
-            except Exception as e:
-                logger.debug(f"⚠️ Chainlink 가격 조회 실패 (무시하고 기본값 사용): {e}")
+        if price and price > 0:
+            return price
         
         # 기본값 사용 (Chainlink 실패 또는 사용 불가 시)
         default_rate = 3500.0
-        
-        # 캐시 저장
-        self._eth_price_cache = default_rate
-        self._last_price_fetch_time = time.time()
-        
         logger.debug(f"💹 ETH 가격 (기본값): ${default_rate:,.2f}")
         return default_rate
     
+    def _fetch_eth_to_usd_rate(self) -> Optional[float]:
+        """Chainlink Price Feed에서 ETH/USD 가격 조회 (캐시 미스 시 호출)"""
+        if not CHAINLINK_AVAILABLE:
+            return None
+        
+        try:
+            chainlink_price = get_chainlink_eth_price(chain=self.chain)
+            if chainlink_price and chainlink_price > 0:
+                logger.info(f"💹 ETH 가격 (Chainlink): ${chainlink_price:,.2f}")
+                return chainlink_price
+        except Exception as e:
+            logger.debug(f"⚠️ Chainlink 가격 조회 실패 (무시하고 기본값 사용): {e}")
+        
+        return None
+    
+    def _get_historical_rates(self, asset: str, timestamps: np.ndarray) -> Optional[np.ndarray]:
+        """
+        거래 배치의 거래 시점 가격을 과거 가격 인덱스에서 일괄 조회
+        
+        Parameters:
+        -----------
+        asset : str
+            자산 심볼 (예: ETH, MATIC)
+        timestamps : np.ndarray
+            거래별 epoch 초 (조회하지 않을 항목은 NaN)
+        
+        Returns:
+        --------
+        Optional[np.ndarray] : 거래별 가격 (조회 불가 항목은 NaN), 사용 불가 시 None
+        """
+        if not self.use_historical_prices or len(timestamps) == 0:
+            return None
+        
+        try:
+            timestamps = np.asarray(timestamps, dtype=np.float64)
+            valid = np.isfinite(timestamps)
+            rates = np.full(len(timestamps), np.nan, dtype=np.float64)
+            
+            if valid.any():
+                rates[valid] = get_historical_price_index().prices_at(
+                    asset, timestamps[valid].astype(np.int64)
+                )
+            
+            logger.debug(f"💹 {asset} 거래 시점 가격: {int(np.isfinite(rates).sum())}/{len(rates)}건 조회")
+            return rates
+        except Exception as e:
+            logger.debug(f"⚠️ 과거 가격 조회 실패 (현재 가격 사용): {e}")
+            return None
+    
+    def _get_historical_native_rates(self, timestamps: np.ndarray) -> Optional[np.ndarray]:
+        """네이티브 코인(ETH/MATIC)의 거래 시점 가격 일괄 조회"""
+        return self._get_historical_rates(self.native_coin, timestamps)
+    
     def _get_token_prices_batch(self, token_addresses: List[str]) -> Dict[str, float]:
         """
         여러 토큰의 가격을 배치로 조회 (현재는 제거됨)
@@ -470,6 +548,7 @@ class BlockExplorerCollector:
         ERC-20 토큰의 USD 가격 조회
         
         Fallback 전략 패턴 (우선순위):
+        0. 공유 가격 캐시 (실패 결과도 짧게 캐시)
         1. Uniswap V3 Pool (무료, Rate Limit 없음, 가장 빠름)
         2. 1inch Price API (무료, Rate Limit 있음, DEX 집계 가격)
         3. None 반환 (나중에 배치 업데이트 예정)
@@ -485,6 +564,14 @@ class BlockExplorerCollector:
         --------
         Optional[float] : 토큰의 USD 가격, 실패 시 None
         """
+        return self._price_cache.get_or_load(
+            self.chain, token_address.lower(),
+            lambda: self._fetch_token_price_usd(token_address, token_symbol),
+            ttl=self._price_cache_duration
+        )
+    
+    def _fetch_token_price_usd(self, token_address: str, token_symbol: str) -> Optional[float]:
+        """Uniswap → 1inch 순으로 토큰 USD 가격 조회 (캐시 미스 시 호출)"""
         # 1순위: Uniswap V3 Pool 시도
         if UNISWAP_AVAILABLE:
             try:
@@ -566,7 +653,7 @@ class BlockExplorerCollector:
         }
         
         try:
-            logger.info(f"🔍 {address[:10]}... ERC-20 토큰 거래 조회 중... (ChainID: {self.chainid})")
+            logger.info("🔍 %s... ERC-20 토큰 거래 조회 중... (ChainID: %s)", address[:10], self.chainid, extra=SAMPLED)
             
             # 재시도 로직 포함 API 요청
             data = self._make_api_request(params, f"{self.chain.upper()} 토큰 거래 조회")
@@ -579,7 +666,7 @@ class BlockExplorerCollector:
                 if not isinstance(transactions, list):
                     transactions = []
                     
-                logger.info(f"✅ {len(transactions)}건의 토큰 거래 조회 완료")
+                logger.info("✅ %d건의 토큰 거래 조회 완료", len(transactions), extra=SAMPLED)
                 
                 # 토큰 거래 파싱
                 parsed_transactions = self._parse_token_transactions(transactions)
@@ -592,7 +679,7 @@ class BlockExplorerCollector:
                 # 에러 메시지 분석
                 if isinstance(result_msg, str):
                     if 'no transactions found' in result_msg.lower() or result_msg == '[]':
-                        logger.info(f"ℹ️ {address[:10]}...에 토큰 거래 내역이 없습니다.")
+                        logger.info("ℹ️ %s...에 토큰 거래 내역이 없습니다.", address[:10], extra=SAMPLED)
                 
                 return []
             
@@ -607,7 +694,7 @@ class BlockExplorerCollector:
     
     def _parse_token_transactions(self, transactions: List[Dict]) -> List[Dict[str, Any]]:
         """
-        Etherscan ERC-20 토큰 거래 데이터 파싱 및 정제
+        Etherscan ERC-20 토큰 거래 데이터 파싱 및 정제 (컬럼 단위 일괄 처리)
         
         Parameters:
         -----------
@@ -618,19 +705,38 @@ class BlockExplorerCollector:
         --------
         List[Dict] : 정제된 토큰 거래 데이터
         """
-        parsed = []
-        
         if not transactions:
-            return parsed
+            return []
         
-        # ETH 가격은 한 번만 조회 (전체 거래에서 재사용)
-        eth_to_usd_rate = self._get_eth_to_usd_rate()
+        page = ColumnarPage(transactions)
+        
+        # 필수 필드 존재 확인 (벡터 마스크)
+        valid = page.present(['hash', 'blockNumber', 'timeStamp', 'from', 'to', 'value',
+                              'tokenName', 'tokenSymbol', 'tokenDecimal', 'contractAddress',
+                              'gasUsed', 'gasPrice'])
+        
+        # 토큰 수량 계산 (tokenDecimal 사용)
+        # value는 이미 정수 형태의 토큰 수량 (decimal 적용 전)
+        token_decimals = page.integer('tokenDecimal', valid)
+        token_amounts = scale_by_decimals(page.numeric('value'), token_decimals)
+        
+        # 가스비 계산 (ETH 기준)
+        gas_used = page.numeric('gasUsed')
+        gas_price = page.numeric('gasPrice')
+        gas_fee_eth = (gas_used * gas_price) / 10**18
+        timestamps = page.integer('timeStamp', valid)
+        valid &= np.isfinite(token_amounts) & np.isfinite(gas_used) & np.isfinite(gas_price)
+        
+        keep = np.flatnonzero(valid)
+        self._log_skipped(len(page) - len(keep), "토큰 거래")
+        
+        if len(keep) == 0:
+            return []
+        
+        contract_addresses = [str(a).lower() for a in page.column('contractAddress')[keep].tolist()]
         
         # 1단계: 모든 고유 토큰 주소 수집
-        unique_token_addresses = set()
-        for tx in transactions:
-            if 'contractAddress' in tx and tx['contractAddress']:
-                unique_token_addresses.add(str(tx['contractAddress']).lower())
+        unique_token_addresses = set(contract_addresses)
         
         # 2단계: 토큰 가격 조회
         # Uniswap V3 Pool을 통한 실시간 가격 조회 (무료)
@@ -647,7 +753,7 @@ class BlockExplorerCollector:
                     token_symbol='UNKNOWN'  # 심볼은 나중에 알 수 있음
                 )
                 if token_price and token_price > 0:
-                    token_prices[token_address.lower()] = token_price
+                    token_prices[token_address] = token_price
             
             # 가격 조회 성공률 로깅
             success_count = len(token_prices)
@@ -656,98 +762,73 @@ class BlockExplorerCollector:
             else:
                 logger.info(f"⚠️ 토큰 가격 조회 실패 (나중에 배치 업데이트 예정)")
         
-        # 3단계: 거래 파싱 (가격은 이미 조회됨)
-        for tx in transactions:
+        # 3단계: USD 가치 계산 (거래 시점 가격 → 현재 가격, 모두 없으면 NULL)
+        kept_timestamps = timestamps[keep].astype(np.float64)
+        unit_prices = np.array([token_prices.get(a, np.nan) for a in contract_addresses], dtype=np.float64)
+        if self.use_historical_prices:
             try:
-                # 필수 필드 존재 확인
-                required_fields = ['value', 'gasUsed', 'gasPrice', 'hash', 'blockNumber', 
-                                 'timeStamp', 'from', 'to', 'tokenName', 'tokenSymbol', 
-                                 'tokenDecimal', 'contractAddress']
-                missing_fields = [field for field in required_fields if field not in tx or tx[field] is None]
-                
-                if missing_fields:
-                    logger.warning(f"⚠️ 필수 필드 누락: {missing_fields}, 토큰 거래 스킵")
-                    continue
-                
-                # 토큰 정보 추출
-                token_name = str(tx['tokenName'])
-                token_symbol = str(tx['tokenSymbol']).upper()
-                token_decimal = int(tx['tokenDecimal'])
-                contract_address = str(tx['contractAddress']).lower()
-                
-                # 토큰 수량 계산 (tokenDecimal 사용)
-                # value는 이미 정수 형태의 토큰 수량 (decimal 적용 전)
-                token_amount = float(tx['value']) / (10 ** token_decimal)
-                
-                # 토큰 USD 가격 조회 (Uniswap에서 조회한 가격 사용, 없으면 None)
-                token_price_usd = token_prices.get(contract_address)
-                
-                # USD 가치 계산 (가격이 0이면 NULL로 저장)
-                amount_usd = token_amount * token_price_usd if token_price_usd > 0 else None
-                
-                # 가스비 계산 (ETH 기준)
-                gas_used = float(tx['gasUsed'])
-                gas_price = float(tx['gasPrice'])
-                gas_fee_eth = (gas_used * gas_price) / 10**18
-                
-                # ETH 가격은 이미 조회됨
-                gas_fee_usd = gas_fee_eth * eth_to_usd_rate
+                historical_token_prices = get_historical_price_index().prices_for_tokens(
+                    self.chain, contract_addresses, kept_timestamps
+                )
+                unit_prices = np.where(np.isfinite(historical_token_prices), historical_token_prices, unit_prices)
+            except Exception as e:
+                logger.debug(f"⚠️ 토큰 과거 가격 조회 실패 (현재 가격 사용): {e}")
+        
+        amounts = token_amounts[keep]
+        priced = np.isfinite(unit_prices) & (unit_prices > 0)
+        amounts_usd = amounts * np.where(priced, unit_prices, 0.0)
+        
+        # 가스비 USD (ETH 가격은 한 번만 조회, 거래 시점 가격 우선)
+        eth_to_usd_rate = self._get_eth_to_usd_rate()
+        rates = self._get_historical_native_rates(kept_timestamps)
+        rates = np.where(np.isfinite(rates), rates, eth_to_usd_rate) if rates is not None else np.full(len(keep), eth_to_usd_rate)
+        gas_fees_usd = (gas_fee_eth[keep] * rates).tolist()
+        
+        # 살아남은 행의 값만 Python 스칼라로 변환
+        block_timestamps = to_iso_timestamps(timestamps[keep])
+        amounts_usd = np.where(priced, amounts_usd, np.nan).tolist()
+        amounts = amounts.tolist()
+        priced = priced.tolist()
+        gas_used_list = gas_used[keep].astype(np.int64).tolist()
+        gas_price_list = gas_price[keep].astype(np.int64).tolist()
+        gas_fees_eth = gas_fee_eth[keep].tolist()
+        
+        # 4단계: 살아남은 행만 dict로 생성
+        parsed = []
+        for j, i in enumerate(keep.tolist()):
+            tx = transactions[i]
+            try:
+                amount_usd = amounts_usd[j] if priced[j] else None
                 
                 # 고래 판정: 가격이 없어도 토큰 수량 정보는 저장
-                # amount_usd가 None이거나 0이면 일단 저장하고 나중에 가격 업데이트
-                # 현재는 amount_usd가 None이거나 0이면 whale_category를 NULL로 설정
-                is_whale = True  # 가격 조회 실패해도 일단 저장
-                
-                # 고래 분류 (가격이 있을 때만)
+                # amount_usd가 None이거나 0이면 whale_category를 NULL로 설정 (나중에 가격 업데이트)
                 if amount_usd and amount_usd > 0:
                     whale_category = self._classify_whale(amount_usd)
                 else:
                     whale_category = None  # 가격 없음, 나중에 업데이트 예정
                 
-                # 타임스탬프 처리
-                try:
-                    timestamp = int(tx['timeStamp'])
-                    block_timestamp = datetime.fromtimestamp(timestamp)
-                except (ValueError, TypeError, OSError) as e:
-                    logger.warning(f"⚠️ 타임스탬프 파싱 실패: {tx.get('timeStamp')}, {e}")
-                    continue
-                
-                # datetime을 ISO 형식 문자열로 변환 (Supabase JSON 직렬화 호환)
-                block_timestamp_str = block_timestamp.isoformat()
-                
                 # input_data 처리 및 함수 시그니처 디코딩 (선택적)
                 input_data_str = str(tx.get('input', ''))
-                method_id = None
-                function_name = None
+                method_id, function_name = self._decode_function(input_data_str, str(tx['hash']))
                 
-                if FUNCTION_DECODER_AVAILABLE and input_data_str and len(input_data_str) > 10:
-                    try:
-                        method_id = extract_method_id(input_data_str)
-                        if method_id:
-                            decoded = decode_input_data(input_data_str)
-                            if decoded:
-                                function_name = decoded.get('function_name')
-                    except Exception as e:
-                        logger.debug(f"⚠️ 함수 시그니처 디코딩 실패: {e}")
-                
-                parsed_tx = {
+                parsed.append({
                     'tx_hash': str(tx['hash']),
                     'block_number': int(tx['blockNumber']),
-                    'block_timestamp': block_timestamp_str,
+                    'block_timestamp': block_timestamps[j],
                     'from_address': str(tx['from']).lower(),
                     'to_address': str(tx['to']).lower() if tx.get('to') else None,
-                    'coin_symbol': token_symbol,  # 토큰 심볼 저장
+                    'coin_symbol': str(tx['tokenSymbol']).upper(),  # 토큰 심볼 저장
                     'chain': self.chain,  # 체인 정보 추가
-                    'token_name': token_name,
-                    'contract_address': contract_address,
-                    'amount': token_amount,  # 토큰 수량 (decimal 적용됨)
+                    'token_name': str(tx['tokenName']),
+                    'contract_address': contract_addresses[j],
+                    'amount': amounts[j],  # 토큰 수량 (decimal 적용됨)
                     'amount_usd': amount_usd,
-                    'gas_used': int(gas_used),
-                    'gas_price': int(gas_price),
-                    'gas_fee_eth': gas_fee_eth,
-                    'gas_fee_usd': gas_fee_usd,
+                    'gas_used': gas_used_list[j],
+                    'gas_price': gas_price_list[j],
+                    'gas_fee_eth': gas_fees_eth[j],
+                    'gas_fee_usd': gas_fees_usd[j],
                     'transaction_status': 'SUCCESS' if str(tx.get('txreceipt_status', '1')) == '1' else 'FAILED',
-                    'is_whale': is_whale,
+                    'is_whale': True,  # 가격 조회 실패해도 일단 저장
                     'whale_category': whale_category,
                     'input_data': input_data_str,
                     'is_contract_to_contract': bool(str(tx.get('isError', '0')) == '0' and input_data_str not in [None, '', '0x']),
@@ -755,9 +836,7 @@ class BlockExplorerCollector:
                     # 함수 디코딩 정보 (선택적)
                     'method_id': method_id,
                     'function_name': function_name,
-                }
-                
-                parsed.append(parsed_tx)
+                })
             
             except Exception as e:
                 logger.warning(f"⚠️ 토큰 거래 파싱 오류: {e}")
@@ -781,7 +860,7 @@ class BlockExplorerCollector:
         all_transactions = []
         
         for i, address in enumerate(addresses, 1):
-            logger.info(f"\n📋 [{i}/{len(addresses)}] {address[:10]}... 처리 중...")
+            logger.info("\n📋 [%d/%d] %s... 처리 중...", i, len(addresses), address[:10], extra=SAMPLED)
             
             transactions = self.get_wallet_transactions(address)
             all_transactions.extend(transactions)
@@ -809,7 +888,7 @@ class BlockExplorerCollector:
         all_transactions = []
         
         for i, address in enumerate(addresses, 1):
-            logger.info(f"\n📋 [{i}/{len(addresses)}] {address[:10]}... 토큰 거래 처리 중...")
+            logger.info("\n📋 [%d/%d] %s... 토큰 거래 처리 중...", i, len(addresses), address[:10], extra=SAMPLED)
             
             transactions = self.get_wallet_token_transactions(address)
             all_transactions.extend(transactions)
@@ -857,7 +936,7 @@ class BlockExplorerCollector:
         }
         
         try:
-            logger.info(f"🔍 {address[:10]}... 내부 거래 조회 중... (ChainID: {self.chainid})")
+            logger.info("🔍 %s... 내부 거래 조회 중... (ChainID: %s)", address[:10], self.chainid, extra=SAMPLED)
             
             # 재시도 로직 포함 API 요청
             data = self._make_api_request(params, f"{self.chain.upper()} 내부 거래 조회")
@@ -870,7 +949,7 @@ class BlockExplorerCollector:
                 if not isinstance(transactions, list):
                     transactions = []
                     
-                logger.info(f"✅ {len(transactions)}건의 내부 거래 조회 완료")
+                logger.info("✅ %d건의 내부 거래 조회 완료", len(transactions), extra=SAMPLED)
                 
                 # 내부 거래 파싱
                 parsed_transactions = self._parse_internal_transactions(transactions)
@@ -883,7 +962,7 @@ class BlockExplorerCollector:
                 # 에러 메시지 분석
                 if isinstance(result_msg, str):
                     if 'no transactions found' in result_msg.lower() or result_msg == '[]':
-                        logger.info(f"ℹ️ {address[:10]}...에 내부 거래 내역이 없습니다.")
+                        logger.info("ℹ️ %s...에 내부 거래 내역이 없습니다.", address[:10], extra=SAMPLED)
                 
                 return []
             
@@ -898,7 +977,7 @@ class BlockExplorerCollector:
     
     def _parse_internal_transactions(self, transactions: List[Dict]) -> List[Dict[str, Any]]:
         """
-        Etherscan 내부 거래 데이터 파싱 및 정제
+        Etherscan 내부 거래 데이터 파싱 및 정제 (컬럼 단위 일괄 처리)
         type=call이고 isError=0인 성공적인 거래만 필터링
         
         Parameters:
@@ -910,68 +989,54 @@ class BlockExplorerCollector:
         --------
         List[Dict] : 정제된 내부 거래 데이터
         """
-        parsed = []
-        
         if not transactions:
-            return parsed
+            return []
+        
+        page = ColumnarPage(transactions)
         
-        # ETH 가격 조회 (USD 계산용)
+        # 필수 필드 존재 확인 (벡터 마스크)
+        valid = page.present(['hash', 'blockNumber', 'timeStamp', 'from', 'to', 'value', 'type', 'isError'])
+        
+        # Wei를 ETH로 변환 (1 ETH = 10^18 Wei)
+        values_eth = scale_by_decimals(page.numeric('value'), 18)
+        timestamps = page.integer('timeStamp', valid)
+        valid &= np.isfinite(values_eth)
+        self._log_skipped(int(len(page) - valid.sum()), "내부 거래")
+        
+        # type=call이고 isError=0인 거래만 필터링 (벡터 마스크)
+        keep = np.flatnonzero(valid & page.lower_equals('type', 'call') & page.str_equals('isError', '0'))
+        
+        # USD 가치 계산 (ETH 가격은 한 번만 조회, 거래 시점 가격 우선)
         eth_to_usd_rate = self._get_eth_to_usd_rate()
+        rates = self._get_historical_native_rates(timestamps[keep].astype(np.float64))
+        rates = np.where(np.isfinite(rates), rates, eth_to_usd_rate) if rates is not None else np.full(len(keep), eth_to_usd_rate)
         
-        for tx in transactions:
+        # 살아남은 행의 값만 Python 스칼라로 변환
+        block_timestamps = to_iso_timestamps(timestamps[keep])
+        values_usd = (values_eth[keep] * rates).tolist()
+        values_eth = values_eth[keep].tolist()
+        
+        parsed = []
+        for j, i in enumerate(keep.tolist()):
+            tx = transactions[i]
             try:
-                # 필수 필드 존재 확인
-                required_fields = ['value', 'from', 'to', 'hash', 'blockNumber', 
-                                 'timeStamp', 'type', 'isError']
-                missing_fields = [field for field in required_fields if field not in tx or tx[field] is None]
-                
-                if missing_fields:
-                    logger.warning(f"⚠️ 필수 필드 누락: {missing_fields}, 내부 거래 스킵")
-                    continue
-                
-                # type=call이고 isError=0인 거래만 필터링
-                tx_type = str(tx.get('type', '')).lower()
-                is_error = str(tx.get('isError', '1'))
-                
-                if tx_type != 'call' or is_error != '0':
-                    continue  # call 타입이 아니거나 에러가 있는 거래는 스킵
-                
-                # Wei를 ETH로 변환 (1 ETH = 10^18 Wei)
-                value_eth = float(tx['value']) / 10**18
-                
-                # USD 가치 계산
-                value_usd = value_eth * eth_to_usd_rate
-                
-                # 타임스탬프 처리
-                try:
-                    timestamp = int(tx['timeStamp'])
-                    block_timestamp = datetime.fromtimestamp(timestamp)
-                except (ValueError, TypeError, OSError) as e:
-                    logger.warning(f"⚠️ 타임스탬프 파싱 실패: {tx.get('timeStamp')}, {e}")
-                    continue
-                
-                # datetime을 ISO 형식 문자열로 변환
-                block_timestamp_str = block_timestamp.isoformat()
-                
-                parsed_tx = {
+                parsed.append({
                     'tx_hash': str(tx['hash']),
                     'block_number': int(tx['blockNumber']),
-                    'block_timestamp': block_timestamp_str,
+                    'block_timestamp': block_timestamps[j],
                     'from_address': str(tx['from']).lower(),
                     'to_address': str(tx['to']).lower() if tx.get('to') else None,
                     'contract_address': str(tx['contractAddress']).lower() if tx.get('contractAddress') else None,
                     'chain': self.chain,  # 체인 정보 추가
-                    'value_eth': value_eth,
-                    'value_usd': value_usd,
-                    'transaction_type': tx_type.upper(),  # CALL, CREATE, SUICIDE 등
-                    'is_error': is_error == '0',
+                    'value_eth': values_eth[j],
+                    'value_usd': values_usd[j],
+                    'transaction_type': 'CALL',  # type=call만 남음
+                    'is_error': True,  # isError=0인 거래만 남음
                     'trace_id': str(tx.get('traceId', '')),  # 내부 거래 추적 ID
                     'input_data': str(tx.get('input', '')),
                     'gas': int(tx['gas']) if tx.get('gas') else None,
                     'gas_used': int(tx['gasUsed']) if tx.get('gasUsed') else None,
-                }
-                
-                parsed.append(parsed_tx)
+                })
             
             except Exception as e:
                 logger.warning(f"⚠️ 내부 거래 파싱 오류: {e}")
@@ -995,7 +1060,7 @@ class BlockExplorerCollector:
         all_transactions = []
         
         for i, address in enumerate(addresses, 1):
-            logger.info(f"\n📋 [{i}/{len(addresses)}] {address[:10]}... 내부 거래 처리 중...")
+            logger.info("\n📋 [%d/%d] %s... 내부 거래 처리 중...", i, len(addresses), address[:10], extra=SAMPLED)
             
             transactions = self.get_wallet_internal_transactions(address)
             all_transactions.extend(transactions)
@@ -0,0 +1,480 @@
+"""
+블록 시간 기준 과거 가격 인덱스
+Binance 캔들(kline) 시계열을 자산별로 일괄 로드하여 정렬된 NumPy 배열로 보관하고,
+거래 배치 전체를 block_timestamp 기준 벡터화 searchsorted로 한 번에 가격 매김
+
+- 실시간 수집: 현재 가격 대신 거래 시점의 가격 사용
+- 백필(PriceUpdater): 수천 건도 자산당 API 몇 번 + searchsorted 한 번으로 처리
+"""
+
+import os
+import time
+import requests
+import numpy as np
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+from src.utils.logger import logger
+
+# Binance 공개 klines 엔드포인트 (API 키 불필요)
+BINANCE_KLINES_URL = os.getenv('BINANCE_KLINES_URL', 'https://api.binance.com/api/v3/klines')
+
+# 자산 → Binance USDT 페어 매핑
+# 래핑 토큰은 원자산 시세를 그대로 사용
+ASSET_TO_BINANCE_SYMBOL = {
+    'ETH': 'ETHUSDT',
+    'WETH': 'ETHUSDT',
+    'BTC': 'BTCUSDT',
+    'WBTC': 'BTCUSDT',
+    'MATIC': 'MATICUSDT',
+    'WMATIC': 'MATICUSDT',
+    'POL': 'POLUSDT',
+    'LINK': 'LINKUSDT',
+    'UNI': 'UNIUSDT',
+}
+
+# 스테이블코인은 1달러 고정 (API 호출 없음)
+STABLECOIN_ASSETS = {'USDT', 'USDC', 'DAI', 'BUSD', 'TUSD', 'FDUSD'}
+
+# 컨트랙트 주소 → 자산 매핑 (심볼 위조 토큰 방지를 위해 주소 기준으로만 토큰 가격 적용)
+TOKEN_ADDRESS_TO_ASSET = {
+    'ethereum': {
+        '0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2': 'WETH',
+        '0x2260fac5e5542a773aa44fbcfedf7c193bc2c599': 'WBTC',
+        '0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48': 'USDC',
+        '0xdac17f958d2ee523a2206206994597c13d831ec7': 'USDT',
+        '0x6b175474e89094c44da98b954eedeac495271d0f': 'DAI',
+        '0x514910771af9ca656af840dff83e8264ecf986ca': 'LINK',
+        '0x1f9840a85d5af5bf1d1762f925bdaddc4201f984': 'UNI',
+        '0x7d1afa7b718fb893db30a3abc0cfc608aacfebb0': 'MATIC',
+    },
+    'polygon': {
+        '0x0d500b1d8e8ef31e21c99d1db9a6444d3adf1270': 'WMATIC',
+        '0x7ceb23fd6bc0add59e62ac25578270cff1b9f619': 'WETH',
+        '0x1bfd67037b42cf73acf2047067bd4f2c47d9bfd6': 'WBTC',
+        '0x2791bca1f2de4661ed88a30c99a7a9449aa84174': 'USDC',
+        '0x3c499c542cef5e3811e1192ce70d8cc03d5c3359': 'USDC',
+        '0xc2132d05d31c914a87c6611c10748aeb04b58e8f': 'USDT',
+        '0x8f3cf7ad23cd3cadbd9735aff958023239c6a063': 'DAI',
+    }
+}
+
+# 캔들 간격 (초)
+INTERVAL_SECONDS = {
+    '1m': 60,
+    '5m': 300,
+    '15m': 900,
+    '1h': 3600,
+    '4h': 14400,
+    '1d': 86400,
+}
+
+# Binance klines 요청당 최대 캔들 수
+KLINES_LIMIT = 1000
+
+
+class HistoricalPriceIndex:
+    """자산별 과거 가격 시계열 인덱스 (정렬된 NumPy 배열 + 디스크 캐시)"""
+
+    def __init__(self,
+                 interval: Optional[str] = None,
+                 cache_dir: Optional[str] = None,
+                 request_delay: float = 0.2):
+        """
+        과거 가격 인덱스 초기화
+
+        Parameters:
+        -----------
+        interval : str, optional
+            캔들 간격 (기본값: 환경변수 HISTORICAL_PRICE_INTERVAL 또는 '1h')
+        cache_dir : str, optional
+            디스크 캐시 디렉토리 (기본값: cache/price_index)
+        request_delay : float
+            Binance 연속 요청 간 대기 시간 (초)
+        """
+        self.interval = interval or os.getenv('HISTORICAL_PRICE_INTERVAL', '1h')
+
+        if self.interval not in INTERVAL_SECONDS:
+            raise ValueError(f"❌ 지원하지 않는 캔들 간격: {self.interval}. 지원 간격: {list(INTERVAL_SECONDS.keys())}")
+
+        self.interval_seconds = INTERVAL_SECONDS[self.interval]
+        self.request_delay = request_delay
+
+        if cache_dir is None:
+            project_root = Path(__file__).parent.parent.parent
+            cache_dir = os.getenv('HISTORICAL_PRICE_CACHE_DIR', str(project_root / 'cache' / 'price_index'))
+        self.cache_dir = Path(cache_dir)
+
+        # {binance_symbol: (open_times[int64, 초], close_prices[float64])}
+        self._series: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        # 이미 요청한 가장 이른 시각 (상장 이전 구간 반복 요청 방지)
+        self._requested_start: Dict[str, int] = {}
+
+    # ------------------------------------------------------------------
+    # 시계열 로드
+    # ------------------------------------------------------------------
+
+    def _cache_path(self, binance_symbol: str) -> Path:
+        """심볼별 캐시 파일 경로"""
+        return self.cache_dir / f"{binance_symbol}_{self.interval}.npz"
+
+    def _load_from_disk(self, binance_symbol: str) -> Tuple[np.ndarray, np.ndarray]:
+        """디스크 캐시에서 시계열 로드 (없으면 빈 배열)"""
+        path = self._cache_path(binance_symbol)
+
+        if path.exists():
+            try:
+                with np.load(path) as data:
+                    return data['times'].astype(np.int64), data['prices'].astype(np.float64)
+            except Exception as e:
+                logger.warning(f"⚠️ 가격 캐시 로드 실패 ({path.name}): {e}")
+
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+    def _save_to_disk(self, binance_symbol: str, times: np.ndarray, prices: np.ndarray):
+        """시계열을 디스크 캐시에 저장 (임시 파일 후 교체)"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self._cache_path(binance_symbol)
+            tmp_path = path.with_name(path.stem + '.tmp.npz')
+            np.savez(tmp_path, times=times, prices=prices)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"⚠️ 가격 캐시 저장 실패 ({binance_symbol}): {e}")
+
+    def _get_series(self, binance_symbol: str) -> Tuple[np.ndarray, np.ndarray]:
+        """메모리 → 디스크 순으로 시계열 조회"""
+        if binance_symbol not in self._series:
+            self._series[binance_symbol] = self._load_from_disk(binance_symbol)
+        return self._series[binance_symbol]
+
+    def _fetch_klines(self, binance_symbol: str, start_ts: int, end_ts: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Binance klines를 페이지 단위로 일괄 조회
+
+        Parameters:
+        -----------
+        binance_symbol : str
+            Binance 심볼 (예: ETHUSDT)
+        start_ts : int
+            시작 시각 (epoch 초)
+        end_ts : int
+            종료 시각 (epoch 초)
+
+        Returns:
+        --------
+        Tuple[np.ndarray, np.ndarray] : (캔들 시작 시각[초], 종가)
+        """
+        times_chunks = []
+        prices_chunks = []
+        cursor_ms = start_ts * 1000
+        end_ms = end_ts * 1000
+
+        while cursor_ms <= end_ms:
+            params = {
+                'symbol': binance_symbol,
+                'interval': self.interval,
+                'startTime': cursor_ms,
+                'endTime': end_ms,
+                'limit': KLINES_LIMIT
+            }
+
+            try:
+                response = requests.get(BINANCE_KLINES_URL, params=params, timeout=30)
+                response.raise_for_status()
+                klines = response.json()
+            except Exception as e:
+                logger.warning(f"⚠️ Binance 캔들 조회 실패 ({binance_symbol}): {e}")
+                break
+
+            if not klines:
+                break
+
+            # [open_time, open, high, low, close, ...] → 필요한 두 열만 배열로 변환
+            chunk = np.array([(k[0], k[4]) for k in klines], dtype=np.float64)
+            times_chunks.append((chunk[:, 0] // 1000).astype(np.int64))
+            prices_chunks.append(chunk[:, 1])
+
+            last_open_ms = int(klines[-1][0])
+            if len(klines) < KLINES_LIMIT:
+                break
+
+            cursor_ms = last_open_ms + self.interval_seconds * 1000
+            time.sleep(self.request_delay)
+
+        if not times_chunks:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+        return np.concatenate(times_chunks), np.concatenate(prices_chunks)
+
+    def _merge(self, binance_symbol: str, new_times: np.ndarray, new_prices: np.ndarray):
+        """새 캔들을 기존 시계열에 병합 (정렬 + 중복 제거)"""
+        times, prices = self._get_series(binance_symbol)
+
+        all_times = np.concatenate([times, new_times])
+        all_prices = np.concatenate([prices, new_prices])
+
+        # 같은 시각이면 새로 받은 값 우선 (뒤쪽 값 유지)
+        order = np.argsort(all_times, kind='stable')
+        all_times = all_times[order]
+        all_prices = all_prices[order]
+        keep = np.ones(len(all_times), dtype=bool)
+        keep[:-1] = all_times[:-1] != all_times[1:]
+
+        merged = (all_times[keep], all_prices[keep])
+        self._series[binance_symbol] = merged
+        self._save_to_disk(binance_symbol, *merged)
+
+    def ensure_range(self, asset: str, start_ts: int, end_ts: int) -> bool:
+        """
+        자산의 시계열이 [start_ts, end_ts] 구간을 포함하도록 부족한 부분만 로드
+
+        Parameters:
+        -----------
+        asset : str
+            자산 심볼 (예: ETH, WBTC)
+        start_ts : int
+            시작 시각 (epoch 초)
+        end_ts : int
+            종료 시각 (epoch 초)
+
+        Returns:
+        --------
+        bool : 시계열 사용 가능 여부
+        """
+        asset = asset.upper()
+
+        if asset in STABLECOIN_ASSETS:
+            return True
+
+        binance_symbol = ASSET_TO_BINANCE_SYMBOL.get(asset)
+        if not binance_symbol:
+            return False
+
+        # 아직 완결되지 않은 캔들 이후는 조회할 필요 없음
+        end_ts = min(int(end_ts), int(time.time()))
+        start_ts = int(start_ts) - self.interval_seconds
+
+        times, _ = self._get_series(binance_symbol)
+
+        missing_ranges = []
+        if len(times) == 0:
+            missing_ranges.append((start_ts, end_ts))
+        else:
+            already_requested = self._requested_start.get(binance_symbol)
+            if start_ts < times[0] and (already_requested is None or start_ts < already_requested):
+                missing_ranges.append((start_ts, int(times[0]) - 1))
+            # 마지막 캔들이 끝난 이후 구간
+            last_covered = int(times[-1]) + self.interval_seconds
+            if end_ts >= last_covered:
+                missing_ranges.append((int(times[-1]), end_ts))
+
+        self._requested_start[binance_symbol] = min(start_ts, self._requested_start.get(binance_symbol, start_ts))
+
+        for range_start, range_end in missing_ranges:
+            if range_end < range_start:
+                continue
+            logger.debug(f"💹 {binance_symbol} 캔들 로드: {datetime.fromtimestamp(range_start)} ~ {datetime.fromtimestamp(range_end)}")
+            new_times, new_prices = self._fetch_klines(binance_symbol, range_start, range_end)
+            if len(new_times) > 0:
+                self._merge(binance_symbol, new_times, new_prices)
+
+        return len(self._get_series(binance_symbol)[0]) > 0
+
+    # ------------------------------------------------------------------
+    # 가격 조회
+    # ------------------------------------------------------------------
+
+    def prices_at(self, asset: str, timestamps: Sequence[int], fetch: bool = True) -> np.ndarray:
+        """
+        여러 시각의 가격을 한 번에 조회 (벡터화 searchsorted)
+
+        Parameters:
+        -----------
+        asset : str
+            자산 심볼
+        timestamps : Sequence[int]
+            epoch 초 배열
+        fetch : bool
+            부족한 구간을 Binance에서 로드할지 여부
+
+        Returns:
+        --------
+        np.ndarray : 시각별 가격 (조회 불가 시 NaN)
+        """
+        ts = np.asarray(timestamps, dtype=np.int64)
+        asset = asset.upper()
+
+        if asset in STABLECOIN_ASSETS:
+            return np.ones(len(ts), dtype=np.float64)
+
+        binance_symbol = ASSET_TO_BINANCE_SYMBOL.get(asset)
+        result = np.full(len(ts), np.nan, dtype=np.float64)
+
+        if not binance_symbol or len(ts) == 0:
+            return result
+
+        if fetch:
+            self.ensure_range(asset, int(ts.min()), int(ts.max()))
+
+        times, prices = self._get_series(binance_symbol)
+        if len(times) == 0:
+            return result
+
+        # 각 시각이 속한 캔들 = 시작 시각이 ts 이하인 마지막 캔들
+        idx = np.searchsorted(times, ts, side='right') - 1
+        valid = (idx >= 0) & (ts < times[np.clip(idx, 0, None)] + self.interval_seconds)
+        result[valid] = prices[idx[valid]]
+        return result
+
+    def price_at(self, asset: str, timestamp: int, fetch: bool = True) -> Optional[float]:
+        """단일 시각의 가격 조회 (조회 불가 시 None)"""
+        price = self.prices_at(asset, [timestamp], fetch=fetch)[0]
+        return None if np.isnan(price) else float(price)
+
+    def resolve_asset(self, chain: str, coin_symbol: str, contract_address: Optional[str] = None) -> Optional[str]:
+        """
+        거래 정보로부터 가격 인덱스 자산 결정
+
+        토큰 거래는 심볼 위조 가능성이 있으므로 알려진 컨트랙트 주소만 인정
+
+        Parameters:
+        -----------
+        chain : str
+            체인 이름
+        coin_symbol : str
+            코인/토큰 심볼
+        contract_address : str, optional
+            토큰 컨트랙트 주소 (네이티브 코인이면 None)
+
+        Returns:
+        --------
+        Optional[str] : 자산 심볼, 지원하지 않으면 None
+        """
+        if contract_address:
+            return TOKEN_ADDRESS_TO_ASSET.get((chain or '').lower(), {}).get(contract_address.lower())
+
+        asset = (coin_symbol or '').upper()
+        if asset in ASSET_TO_BINANCE_SYMBOL or asset in STABLECOIN_ASSETS:
+            return asset
+        return None
+
+    def price_transactions(self,
+                           transactions: List[Dict],
+                           chain: Optional[str] = None,
+                           fetch: bool = True) -> np.ndarray:
+        """
+        거래 배치 전체의 거래 시점 단가를 자산별로 묶어 일괄 조회
+
+        Parameters:
+        -----------
+        transactions : List[Dict]
+            거래 리스트 (coin_symbol, contract_address, block_timestamp 필요)
+            block_timestamp는 epoch 초 또는 ISO 문자열
+        chain : str, optional
+            체인 이름 (없으면 각 거래의 chain 필드 사용)
+        fetch : bool
+            부족한 구간을 Binance에서 로드할지 여부
+
+        Returns:
+        --------
+        np.ndarray : 거래별 USD 단가 (조회 불가 시 NaN)
+        """
+        unit_prices = np.full(len(transactions), np.nan, dtype=np.float64)
+        groups: Dict[str, List[int]] = {}
+        timestamps = np.zeros(len(transactions), dtype=np.int64)
+
+        for i, tx in enumerate(transactions):
+            ts = _to_epoch_seconds(tx.get('block_timestamp'))
+            if ts is None:
+                continue
+
+            asset = self.resolve_asset(
+                chain or tx.get('chain', 'ethereum'),
+                tx.get('coin_symbol', ''),
+                tx.get('contract_address') if _is_token_tx(tx) else None
+            )
+            if asset is None:
+                continue
+
+            timestamps[i] = ts
+            groups.setdefault(asset, []).append(i)
+
+        for asset, indices in groups.items():
+            idx = np.asarray(indices, dtype=np.int64)
+            unit_prices[idx] = self.prices_at(asset, timestamps[idx], fetch=fetch)
+
+        return unit_prices
+
+    def prices_for_tokens(self,
+                          chain: str,
+                          contract_addresses: Sequence[Optional[str]],
+                          timestamps: Sequence[float],
+                          fetch: bool = True) -> np.ndarray:
+        """
+        토큰 거래 컬럼(컨트랙트 주소, 시각)에 대한 거래 시점 단가 일괄 조회
+
+        Parameters:
+        -----------
+        chain : str
+            체인 이름
+        contract_addresses : Sequence[Optional[str]]
+            거래별 토큰 컨트랙트 주소
+        timestamps : Sequence[float]
+            거래별 epoch 초 (NaN은 조회 불가)
+        fetch : bool
+            부족한 구간을 Binance에서 로드할지 여부
+
+        Returns:
+        --------
+        np.ndarray : 거래별 USD 단가 (조회 불가 시 NaN)
+        """
+        ts = np.asarray(timestamps, dtype=np.float64)
+        unit_prices = np.full(len(ts), np.nan, dtype=np.float64)
+        address_map = TOKEN_ADDRESS_TO_ASSET.get((chain or '').lower(), {})
+
+        # 주소 → 자산 매핑은 고유 주소에 대해서만 수행
+        addresses = np.array([str(a).lower() if a else '' for a in contract_addresses], dtype=object)
+        for address in set(addresses.tolist()) & set(address_map):
+            mask = (addresses == address) & np.isfinite(ts)
+            if mask.any():
+                unit_prices[mask] = self.prices_at(address_map[address], ts[mask].astype(np.int64), fetch=fetch)
+
+        return unit_prices
+
+
+def _is_token_tx(tx: Dict) -> bool:
+    """네이티브 코인이 아닌 토큰 거래인지 판정 (token_name은 ERC-20 거래에만 존재)"""
+    if tx.get('token_name'):
+        return True
+    return (tx.get('coin_symbol') or '').upper() not in ('ETH', 'MATIC', 'POL')
+
+
+def _to_epoch_seconds(value) -> Optional[int]:
+    """block_timestamp 값(epoch 초, ISO 문자열, datetime)을 epoch 초로 변환"""
+    if value is None:
+        return None
+
+    try:
+        if isinstance(value, (int, float, np.integer)):
+            return int(value)
+        if isinstance(value, datetime):
+            return int(value.timestamp())
+
+        value = str(value)
+        if value.isdigit():
+            return int(value)
+        return int(datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp())
+    except (ValueError, TypeError, OSError):
+        return None
+
+
+# 글로벌 인덱스 인스턴스 (프로세스 내 모든 수집기가 공유)
+_price_index = None
+
+def get_historical_price_index() -> HistoricalPriceIndex:
+    """싱글톤 패턴으로 과거 가격 인덱스 반환"""
+    global _price_index
+    if _price_index is None:
+        _price_index = HistoricalPriceIndex()
+    return _price_index
@@ -0,0 +1,485 @@
+"""
+ERC-20 Transfer 로그 스캐너
+지갑별 tokentx 조회 대신 eth_getLogs로 블록 구간의 Transfer(address,address,uint256) 이벤트를
+토큰 집합 단위로 한 번에 수집하여 체인 전체의 고래 거래를 탐지
+
+- 노드가 응답 크기/블록 범위를 제한하면 구간을 절반으로 줄여 재시도하고,
+  결과가 적으면 다시 늘림 (적응형 블록 범위)
+- 429/rate limit/타임아웃 같은 일시적 오류는 블록 범위를 바꾸지 않고
+  Retry-After 또는 공유 재시도 정책(decorrelated jitter) 대기 후 같은 구간을 재시도
+- 로그 디코딩(주소, uint256 수량)과 USD 고래 판정은 구간 단위 배열 연산으로 처리
+- 결과는 BlockExplorerCollector 토큰 거래와 같은 형식 → SupabaseClient.insert_transactions로 저장
+"""
+
+import os
+import time
+import requests
+import numpy as np
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Tuple
+from src.utils.logger import logger
+from src.utils.price_cache import get_price_cache
+from src.utils.retry_handler import get_retry_policy
+from src.collectors.historical_price_index import TOKEN_ADDRESS_TO_ASSET, get_historical_price_index
+
+# keccak256("Transfer(address,address,uint256)")
+TRANSFER_TOPIC = '0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef'
+
+# ERC-20 decimals() 함수 셀렉터
+DECIMALS_SELECTOR = '0x313ce567'
+
+# RPC 엔드포인트 (chainlink_price_feed.py와 동일)
+RPC_ENDPOINTS = {
+    'ethereum': os.getenv('ETHEREUM_RPC_URL', 'https://eth.llamarpc.com'),
+    'polygon': os.getenv('POLYGON_RPC_URL', 'https://polygon-rpc.com'),
+}
+
+# 기본 스캔 대상 토큰 decimals (TOKEN_ADDRESS_TO_ASSET과 동일한 주소)
+TOKEN_DECIMALS = {
+    'ethereum': {
+        '0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2': 18,  # WETH
+        '0x2260fac5e5542a773aa44fbcfedf7c193bc2c599': 8,   # WBTC
+        '0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48': 6,   # USDC
+        '0xdac17f958d2ee523a2206206994597c13d831ec7': 6,   # USDT
+        '0x6b175474e89094c44da98b954eedeac495271d0f': 18,  # DAI
+        '0x514910771af9ca656af840dff83e8264ecf986ca': 18,  # LINK
+        '0x1f9840a85d5af5bf1d1762f925bdaddc4201f984': 18,  # UNI
+        '0x7d1afa7b718fb893db30a3abc0cfc608aacfebb0': 18,  # MATIC
+    },
+    'polygon': {
+        '0x0d500b1d8e8ef31e21c99d1db9a6444d3adf1270': 18,  # WMATIC
+        '0x7ceb23fd6bc0add59e62ac25578270cff1b9f619': 18,  # WETH
+        '0x1bfd67037b42cf73acf2047067bd4f2c47d9bfd6': 8,   # WBTC
+        '0x2791bca1f2de4661ed88a30c99a7a9449aa84174': 6,   # USDC.e
+        '0x3c499c542cef5e3811e1192ce70d8cc03d5c3359': 6,   # USDC
+        '0xc2132d05d31c914a87c6611c10748aeb04b58e8f': 6,   # USDT
+        '0x8f3cf7ad23cd3cadbd9735aff958023239c6a063': 18,  # DAI
+    }
+}
+
+# 블록 범위/결과 수 제한을 나타내는 노드 오류 메시지 (Geth, Erigon, Alchemy, Infura 등)
+# (rate limit/타임아웃 메시지와 겹치지 않도록 범위나 결과 크기를 직접 언급하는 문구만)
+RANGE_ERROR_HINTS = (
+    'query returned more than',
+    'block range',
+    'range is too large',
+    'response size',
+)
+
+# 요청 빈도 제한 오류 메시지 (HTTP 429 외에 JSON-RPC 오류로 오는 경우, 예: Infura -32005)
+RATE_LIMIT_HINTS = (
+    'rate limit',
+    'too many requests',
+    'request rate',
+)
+
+
+class RpcError(Exception):
+    """JSON-RPC 오류 응답"""
+
+    def __init__(self, code: Optional[int], message: str):
+        super().__init__(f"RPC 오류 {code}: {message}")
+        self.code = code
+        self.message = message
+
+
+class TransferLogScanner:
+    """eth_getLogs 기반 ERC-20 Transfer 고래 거래 스캐너"""
+
+    def __init__(self,
+                 chain: str = 'ethereum',
+                 rpc_url: Optional[str] = None,
+                 tokens: Optional[Dict[str, str]] = None,
+                 min_whale_usd: Optional[float] = None,
+                 block_range: Optional[int] = None,
+                 max_block_range: Optional[int] = None,
+                 request_timeout: float = 30.0):
+        """
+        스캐너 초기화
+
+        Parameters:
+        -----------
+        chain : str
+            체인 이름 ('ethereum' 또는 'polygon')
+        rpc_url : str, optional
+            JSON-RPC 엔드포인트 (기본값: ETHEREUM_RPC_URL / POLYGON_RPC_URL)
+        tokens : Dict[str, str], optional
+            스캔할 토큰 {컨트랙트 주소: 심볼}
+            (기본값: 환경변수 TRANSFER_SCAN_TOKENS 또는 가격 인덱스가 지원하는 토큰)
+        min_whale_usd : float, optional
+            고래 판정 최소 USD 금액 (기본값: MIN_WHALE_AMOUNT_USD)
+        block_range : int, optional
+            eth_getLogs 1회 요청 시작 블록 범위 (기본값: TRANSFER_SCAN_BLOCK_RANGE 또는 2000)
+        max_block_range : int, optional
+            적응형 블록 범위 상한 (기본값: TRANSFER_SCAN_MAX_BLOCK_RANGE 또는 10000)
+        request_timeout : float
+            RPC 요청 타임아웃 (초)
+        """
+        self.chain = chain.lower()
+
+        if rpc_url is None:
+            if self.chain not in RPC_ENDPOINTS:
+                raise ValueError(f"❌ 지원하지 않는 체인: {chain}. 지원 체인: {list(RPC_ENDPOINTS.keys())}")
+            rpc_url = RPC_ENDPOINTS[self.chain]
+        self.rpc_url = rpc_url
+
+        self.tokens = {addr.lower(): symbol for addr, symbol in (tokens or self._default_tokens()).items()}
+        self.token_decimals: Dict[str, Optional[int]] = dict(TOKEN_DECIMALS.get(self.chain, {}))
+
+        self.min_whale_usd = min_whale_usd if min_whale_usd is not None else float(os.getenv('MIN_WHALE_AMOUNT_USD', 50000))
+        self.block_range = block_range or int(os.getenv('TRANSFER_SCAN_BLOCK_RANGE', 2000))
+        self.max_block_range = max_block_range or int(os.getenv('TRANSFER_SCAN_MAX_BLOCK_RANGE', 10000))
+        self.block_range = min(self.block_range, self.max_block_range)
+        # 노드 제한에 걸린 범위 (이후 이 범위 이상으로는 늘리지 않음)
+        self._range_ceiling = self.max_block_range
+        # 한 요청의 로그 수가 이 값보다 적으면 다음 구간 범위를 늘림
+        self.target_logs_per_request = int(os.getenv('TRANSFER_SCAN_TARGET_LOGS', 5000))
+        self.request_timeout = request_timeout
+        # 일시적 오류(429/rate limit/타임아웃) 재시도 설정
+        self.max_retries = int(os.getenv('TRANSFER_SCAN_MAX_RETRIES', 5))
+        self.retry_base_delay = float(os.getenv('TRANSFER_SCAN_RETRY_BASE_DELAY', 1.0))
+        self.retry_max_delay = float(os.getenv('TRANSFER_SCAN_RETRY_MAX_DELAY', 60.0))
+
+        self.session = requests.Session()
+        self._request_id = 0
+        self._block_timestamps: Dict[int, int] = {}
+        self._price_cache = get_price_cache()
+
+        logger.info(f"✅ {self.chain.upper()} Transfer 로그 스캐너 초기화 완료")
+        logger.info(f"   토큰: {len(self.tokens)}개, 시작 블록 범위: {self.block_range}, 고래 기준: ${self.min_whale_usd:,.0f}")
+
+    def _default_tokens(self) -> Dict[str, str]:
+        """환경변수 또는 가격 인덱스 지원 토큰으로 기본 토큰 집합 구성"""
+        known = TOKEN_ADDRESS_TO_ASSET.get(self.chain, {})
+        configured = os.getenv('TRANSFER_SCAN_TOKENS', '')
+
+        if configured.strip():
+            addresses = [a.strip().lower() for a in configured.split(',') if a.strip()]
+            return {addr: known.get(addr, 'UNKNOWN') for addr in addresses}
+
+        return dict(known)
+
+    # ============================================
+    # JSON-RPC
+    # ============================================
+
+    def _rpc(self, method: str, params: List[Any]) -> Any:
+        """JSON-RPC 단일 호출 (오류 응답은 RpcError)"""
+        self._request_id += 1
+        payload = {'jsonrpc': '2.0', 'id': self._request_id, 'method': method, 'params': params}
+
+        response = self.session.post(self.rpc_url, json=payload, timeout=self.request_timeout)
+        if response.status_code == 413:
+            raise RpcError(413, 'response size exceeded')
+        response.raise_for_status()
+
+        data = response.json()
+        if data.get('error'):
+            error = data['error']
+            raise RpcError(error.get('code'), str(error.get('message', '')))
+        return data.get('result')
+
+    def _rpc_batch(self, calls: List[Tuple[str, List[Any]]]) -> List[Any]:
+        """JSON-RPC 배치 호출 (요청 순서대로 결과 반환, 실패 항목은 None)"""
+        if not calls:
+            return []
+
+        payload = []
+        for method, params in calls:
+            self._request_id += 1
+            payload.append({'jsonrpc': '2.0', 'id': self._request_id, 'method': method, 'params': params})
+
+        response = self.session.post(self.rpc_url, json=payload, timeout=self.request_timeout)
+        response.raise_for_status()
+        data = response.json()
+
+        # 배치를 지원하지 않는 노드는 단일 오류 객체를 반환
+        if not isinstance(data, list):
+            return [self._rpc(method, params) for method, params in calls]
+
+        results = {item.get('id'): item.get('result') for item in data}
+        return [results.get(item['id']) for item in payload]
+
+    def get_latest_block(self) -> int:
+        """최신 블록 번호 조회"""
+        return int(self._rpc('eth_blockNumber', []), 16)
+
+    def _get_logs(self, from_block: int, to_block: int) -> List[Dict]:
+        """블록 구간의 Transfer 로그 조회 (토큰 집합 전체를 한 번에)"""
+        return self._rpc('eth_getLogs', [{
+            'fromBlock': hex(from_block),
+            'toBlock': hex(to_block),
+            'address': list(self.tokens.keys()),
+            'topics': [TRANSFER_TOPIC],
+        }]) or []
+
+    @staticmethod
+    def _is_rate_limit_error(error: Exception) -> bool:
+        """요청 빈도 제한 오류인지 판정 (HTTP 429 또는 rate limit 메시지)"""
+        response = getattr(error, 'response', None)
+        if response is not None and response.status_code == 429:
+            return True
+        if isinstance(error, RpcError) and error.code == 429:
+            return True
+        message = str(error).lower()
+        return any(hint in message for hint in RATE_LIMIT_HINTS)
+
+    @classmethod
+    def _is_transient_error(cls, error: Exception) -> bool:
+        """블록 범위와 무관한 일시적 오류인지 판정 (rate limit, 타임아웃, 연결 오류)"""
+        if isinstance(error, (requests.exceptions.Timeout, requests.exceptions.ConnectionError)):
+            return True
+        return cls._is_rate_limit_error(error)
+
+    @staticmethod
+    def _is_range_error(error: Exception) -> bool:
+        """노드의 블록 범위/응답 크기 제한 오류인지 판정 (일시적 오류는 먼저 걸러야 함)"""
+        if isinstance(error, RpcError) and error.code == 413:
+            return True
+        message = str(error).lower()
+        return any(hint in message for hint in RANGE_ERROR_HINTS)
+
+    @staticmethod
+    def _retry_after(error: Exception) -> float:
+        """429 응답의 Retry-After (초, 없거나 날짜 형식이면 0)"""
+        response = getattr(error, 'response', None)
+        if response is None:
+            return 0.0
+        try:
+            return max(0.0, float(response.headers.get('Retry-After', 0)))
+        except (TypeError, ValueError):
+            return 0.0
+
+    def _get_block_timestamps(self, block_numbers: List[int]) -> Dict[int, int]:
+        """블록 타임스탬프 조회 (캐시 + 배치 호출)"""
+        missing = [b for b in set(block_numbers) if b not in self._block_timestamps]
+        if missing:
+            results = self._rpc_batch([('eth_getBlockByNumber', [hex(b), False]) for b in missing])
+            for block_number, block in zip(missing, results):
+                if block and block.get('timestamp'):
+                    self._block_timestamps[block_number] = int(block['timestamp'], 16)
+
+        return {b: self._block_timestamps[b] for b in block_numbers if b in self._block_timestamps}
+
+    def _get_token_decimals(self, token_address: str) -> Optional[int]:
+        """토큰 decimals 조회 (기본 목록에 없으면 decimals() 호출)"""
+        if token_address not in self.token_decimals:
+            try:
+                result = self._rpc('eth_call', [{'to': token_address, 'data': DECIMALS_SELECTOR}, 'latest'])
+                self.token_decimals[token_address] = _hex_to_int(result) if result and result != '0x' else None
+            except Exception as e:
+                logger.debug(f"⚠️ {token_address[:10]}... decimals 조회 실패: {e}")
+                self.token_decimals[token_address] = None
+        return self.token_decimals[token_address]
+
+    # ============================================
+    # 스캔
+    # ============================================
+
+    def scan(self, from_block: int, to_block: int) -> List[Dict[str, Any]]:
+        """
+        블록 구간의 고래 토큰 거래 스캔
+
+        Parameters:
+        -----------
+        from_block : int
+            시작 블록 (포함)
+        to_block : int
+            종료 블록 (포함)
+
+        Returns:
+        --------
+        List[Dict] : 고래 토큰 거래 (insert_transactions 형식, amount_usd 내림차순)
+        """
+        if not self.tokens:
+            logger.warning("⚠️ 스캔할 토큰이 없습니다")
+            return []
+
+        logger.info(f"🔎 {self.chain.upper()} Transfer 로그 스캔: 블록 {from_block:,} ~ {to_block:,}")
+
+        whales = []
+        total_logs = 0
+        requests_made = 0
+        start = from_block
+        retry = None  # 현재 구간의 일시적 오류 재시도 상태
+
+        while start <= to_block:
+            end = min(start + self.block_range - 1, to_block)
+
+            try:
+                logs = self._get_logs(start, end)
+                requests_made += 1
+            except Exception as e:
+                if self._is_transient_error(e):
+                    # 일시적 오류 → 블록 범위는 유지하고 대기 후 같은 구간 재시도
+                    if retry is None:
+                        retry = get_retry_policy().start(self.max_retries, self.retry_base_delay,
+                                                         self.retry_max_delay)
+                    delay = retry.next_delay()
+                    if delay is None:
+                        logger.error(f"❌ 블록 {start:,} ~ {end:,} 로그 조회 재시도 중단 ({retry.stop_reason}): {e}")
+                        break
+                    delay = max(delay, min(self._retry_after(e), self.retry_max_delay))
+                    logger.warning(f"⚠️ 블록 {start:,} ~ {end:,} 로그 조회 일시적 오류, {delay:.1f}초 후 재시도: {e}")
+                    time.sleep(delay)
+                    continue
+
+                if self._is_range_error(e) and end > start:
+                    # 노드 제한 초과 → 구간을 절반으로 줄여 같은 시작 블록부터 재시도
+                    self.block_range = max(1, (end - start + 1) // 2)
+                    self._range_ceiling = self.block_range
+                    logger.debug(f"   ↘️ 블록 범위 축소: {self.block_range} ({e})")
+                    continue
+
+                logger.error(f"❌ 블록 {start:,} ~ {end:,} 로그 조회 실패: {e}")
+                break
+
+            retry = None
+            total_logs += len(logs)
+            try:
+                whales.extend(self._parse_logs(logs))
+            except Exception as e:
+                # 한 구간의 디코딩 실패로 전체 스캔을 버리지 않음 (해당 구간만 건너뜀)
+                logger.error(f"❌ 블록 {start:,} ~ {end:,} 로그 파싱 실패, 구간 건너뜀: {e}")
+
+            # 결과가 적으면 다음 구간 범위를 늘림
+            if len(logs) < self.target_logs_per_request // 2 and self.block_range < self._range_ceiling:
+                self.block_range = min(self._range_ceiling, self.block_range * 2)
+
+            start = end + 1
+
+        # 같은 트랜잭션의 여러 Transfer 중 insert_transactions 중복 제거(tx_hash)에서 가장 큰 금액이 남도록 정렬
+        whales.sort(key=lambda tx: tx['amount_usd'], reverse=True)
+
+        logger.info(f"✅ Transfer 로그 {total_logs:,}건 ({requests_made}회 요청) → 고래 거래 {len(whales)}건")
+        return whales
+
+    def scan_recent(self, blocks: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        최신 블록 기준 최근 N개 블록 스캔
+
+        Parameters:
+        -----------
+        blocks : int, optional
+            스캔할 블록 수 (기본값: TRANSFER_SCAN_RECENT_BLOCKS 또는 1000)
+        """
+        blocks = blocks or int(os.getenv('TRANSFER_SCAN_RECENT_BLOCKS', 1000))
+        latest = self.get_latest_block()
+        return self.scan(max(0, latest - blocks + 1), latest)
+
+    def _parse_logs(self, logs: List[Dict]) -> List[Dict[str, Any]]:
+        """
+        Transfer 로그 일괄 디코딩 및 USD 고래 판정
+
+        topics[1]/topics[2]는 from/to 주소(32바이트 패딩), data는 uint256 수량
+        (topics가 4개인 ERC-721 Transfer와 제거된(reorg) 로그는 제외)
+        """
+        logs = [
+            log for log in logs
+            if len(log.get('topics') or []) == 3
+            and str(log['topics'][0]).lower() == TRANSFER_TOPIC
+            and not log.get('removed')
+            and str(log.get('address', '')).lower() in self.tokens
+        ]
+        if not logs:
+            return []
+
+        contract_addresses = [str(log['address']).lower() for log in logs]
+        decimals_by_token = {addr: self._get_token_decimals(addr) for addr in set(contract_addresses)}
+
+        # uint256은 float64로 변환해도 오버플로 없음 (최대 약 1.2e77)
+        raw_amounts = np.array([_hex_to_int(log.get('data')) for log in logs], dtype=np.float64)
+        decimals = np.array([decimals_by_token[a] if decimals_by_token[a] is not None else np.nan
+                             for a in contract_addresses], dtype=np.float64)
+        amounts = raw_amounts / np.power(10.0, decimals)
+        block_numbers = np.array([int(log['blockNumber'], 16) for log in logs], dtype=np.int64)
+
+        timestamps = self._log_timestamps(logs, block_numbers)
+        unit_prices = self._unit_prices(contract_addresses, timestamps)
+
+        # 고래 판정 (벡터 마스크, 블록 타임스탬프를 못 얻은 로그는 가격 캐시로 금액이 나와도 제외)
+        amounts_usd = amounts * unit_prices
+        has_timestamp = np.isfinite(timestamps)
+        keep = np.flatnonzero(has_timestamp & np.isfinite(amounts_usd) & (amounts_usd >= self.min_whale_usd))
+        if not has_timestamp.all():
+            logger.warning(f"⚠️ 블록 타임스탬프 없는 로그 {int((~has_timestamp).sum())}건 제외")
+
+        parsed = []
+        for i in keep.tolist():
+            log = logs[i]
+            amount_usd = float(amounts_usd[i])
+            parsed.append({
+                'tx_hash': str(log['transactionHash']),
+                'block_number': int(block_numbers[i]),
+                'block_timestamp': datetime.fromtimestamp(int(timestamps[i])).isoformat(),
+                'from_address': '0x' + str(log['topics'][1])[-40:].lower(),
+                'to_address': '0x' + str(log['topics'][2])[-40:].lower(),
+                'coin_symbol': self.tokens[contract_addresses[i]].upper(),
+                'chain': self.chain,
+                'token_name': self.tokens[contract_addresses[i]],
+                'contract_address': contract_addresses[i],
+                'amount': float(amounts[i]),
+                'amount_usd': amount_usd,
+                # 로그에는 가스 정보가 없음 (필요 시 배치 작업으로 보강)
+                'gas_used': None,
+                'gas_price': None,
+                'gas_fee_eth': None,
+                'gas_fee_usd': None,
+                'transaction_status': 'SUCCESS',  # 로그는 성공한 트랜잭션에서만 생성됨
+                'is_whale': True,
+                'whale_category': self._classify_whale(amount_usd),
+                'input_data': None,
+                'is_contract_to_contract': None,
+                'has_method_id': None,
+                'method_id': None,
+                'function_name': None,
+            })
+
+        return parsed
+
+    def _log_timestamps(self, logs: List[Dict], block_numbers: np.ndarray) -> np.ndarray:
+        """
+        로그별 블록 타임스탬프 (epoch 초)
+
+        일부 노드는 로그에 blockTimestamp를 포함하므로 그대로 사용하고,
+        없으면 고유 블록에 대해서만 배치 조회
+        """
+        if all(log.get('blockTimestamp') for log in logs):
+            return np.array([int(log['blockTimestamp'], 16) for log in logs], dtype=np.float64)
+
+        block_timestamps = self._get_block_timestamps(np.unique(block_numbers).tolist())
+        return np.array([block_timestamps.get(b, np.nan) for b in block_numbers.tolist()], dtype=np.float64)
+
+    def _unit_prices(self, contract_addresses: List[str], timestamps: np.ndarray) -> np.ndarray:
+        """거래 시점 토큰 단가 (과거 가격 인덱스 → 공유 가격 캐시, 모두 없으면 NaN)"""
+        try:
+            unit_prices = get_historical_price_index().prices_for_tokens(self.chain, contract_addresses, timestamps)
+        except Exception as e:
+            logger.debug(f"⚠️ 토큰 과거 가격 조회 실패 (가격 캐시 사용): {e}")
+            unit_prices = np.full(len(contract_addresses), np.nan, dtype=np.float64)
+
+        missing = ~np.isfinite(unit_prices)
+        if missing.any():
+            addresses = np.array(contract_addresses, dtype=object)
+            for address in set(addresses[missing].tolist()):
+                cached = self._price_cache.get(self.chain, address)
+                if cached:
+                    unit_prices[missing & (addresses == address)] = cached
+
+        return unit_prices
+
+    def _classify_whale(self, amount_usd: float) -> str:
+        """고래 규모 분류 (BlockExplorerCollector와 동일 기준)"""
+        if amount_usd >= 10_000_000:
+            return 'MEGA_WHALE'  # $10M 이상
+        elif amount_usd >= 5_000_000:
+            return 'LARGE_WHALE'  # $5M-10M
+        else:
+            return 'WHALE'  # $1M-5M
+
+
+def _hex_to_int(value: Optional[str]) -> int:
+    """16진수 문자열(0x 접두사)을 정수로 변환 (빈 값은 0)"""
+    if not value or value == '0x':
+        return 0
+    return int(value, 16)
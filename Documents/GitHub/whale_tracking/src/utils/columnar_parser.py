@@ -0,0 +1,124 @@
+"""
+블록 탐색기 응답 컬럼 단위 파싱 유틸리티
+페이지(최대 10,000건)를 dict 단위로 반복 처리하는 대신 판정에 필요한 필드만 타입 배열로
+한 번에 변환하고, 필수 필드 검사와 고래 필터링을 벡터 마스크로 처리한 뒤
+살아남은 행만 dict로 만듦
+
+- 정수 컬럼(블록 번호, 타임스탬프): int64
+- 금액(wei, 토큰 최소 단위): float64 (uint256 문자열도 오버플로 없이 변환)
+- 변환 실패 값은 NaN → 해당 행은 마스크에서 제외
+"""
+
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from operator import itemgetter
+from typing import Any, Dict, List, Sequence
+
+
+class ColumnarPage:
+    """탐색기 API 한 페이지를 필요한 컬럼만 배열로 변환하여 보관"""
+
+    def __init__(self, transactions: List[Dict[str, Any]]):
+        """
+        Parameters:
+        -----------
+        transactions : List[Dict]
+            Etherscan API 응답 (result)
+        """
+        self.transactions = transactions
+        self._columns: Dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.transactions)
+
+    def column(self, name: str) -> np.ndarray:
+        """컬럼 원본 값(object 배열, 누락 시 None) - 한 번만 추출"""
+        if name not in self._columns:
+            self._columns[name] = np.array([tx.get(name) for tx in self.transactions], dtype=object)
+        return self._columns[name]
+
+    def load(self, fields: Sequence[str]):
+        """
+        여러 컬럼을 한 번에 추출
+
+        모든 행에 키가 있으면 itemgetter로 한 번에 가져오고(C 레벨 반복),
+        누락된 키가 있는 페이지만 컬럼별 dict.get으로 처리
+        """
+        fields = [f for f in dict.fromkeys(fields) if f not in self._columns]
+        if not fields or not self.transactions:
+            for field in fields:
+                self.column(field)
+            return
+
+        try:
+            getter = itemgetter(*fields)
+            rows = list(map(getter, self.transactions))
+        except KeyError:
+            for field in fields:
+                self.column(field)
+            return
+
+        if len(fields) == 1:
+            self._columns[fields[0]] = np.array(rows, dtype=object)
+            return
+
+        table = np.empty((len(rows), len(fields)), dtype=object)
+        table[:] = rows
+        for j, field in enumerate(fields):
+            self._columns[field] = table[:, j]
+
+    def present(self, fields: Sequence[str]) -> np.ndarray:
+        """지정한 필드가 모두 존재(None/누락 아님)하는 행 마스크"""
+        self.load(fields)
+        mask = np.ones(len(self), dtype=bool)
+        for field in fields:
+            mask &= np.not_equal(self.column(field), None)
+        return mask
+
+    def numeric(self, name: str) -> np.ndarray:
+        """숫자 컬럼을 float64 배열로 변환 (변환 실패 시 NaN)"""
+        values = self.column(name)
+        try:
+            # 대부분의 페이지는 모두 숫자 문자열이므로 NumPy 일괄 변환이 가장 빠름
+            return values.astype(np.float64)
+        except (ValueError, TypeError):
+            return pd.to_numeric(pd.Series(values), errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+
+    def integer(self, name: str, valid: np.ndarray) -> np.ndarray:
+        """
+        정수 컬럼을 int64 배열로 변환
+
+        Parameters:
+        -----------
+        name : str
+            컬럼 이름
+        valid : np.ndarray
+            갱신할 마스크 (정수로 변환할 수 없는 행은 False로 바뀜)
+
+        Returns:
+        --------
+        np.ndarray : int64 배열 (무효 행은 0)
+        """
+        values = self.numeric(name)
+        ok = np.isfinite(values) & (values == np.floor(values))
+        valid &= ok
+        return np.where(ok, values, 0).astype(np.int64)
+
+    def lower_equals(self, name: str, expected: str) -> np.ndarray:
+        """문자열 컬럼의 소문자 값이 expected와 같은 행 마스크"""
+        return np.array([str(v).lower() == expected for v in self.column(name).tolist()], dtype=bool)
+
+    def str_equals(self, name: str, expected: str) -> np.ndarray:
+        """문자열 컬럼 값이 expected와 같은 행 마스크 (숫자도 문자열로 비교)"""
+        return np.array([str(v) == expected for v in self.column(name).tolist()], dtype=bool)
+
+
+def scale_by_decimals(raw_amounts: np.ndarray, decimals) -> np.ndarray:
+    """최소 단위 금액을 10^decimals로 나눠 실제 수량으로 변환 (decimals는 스칼라 또는 배열)"""
+    return raw_amounts / np.power(10.0, decimals)
+
+
+def to_iso_timestamps(epochs: np.ndarray) -> List[str]:
+    """epoch 초 배열을 ISO 문자열 리스트로 변환 (살아남은 행에만 호출)"""
+    return [datetime.fromtimestamp(ts).isoformat() for ts in epochs.tolist()]
@@ -1,6 +1,9 @@
 """
 GitHub 오픈소스 데이터셋 로더
 거래소 주소, 컨트랙트 주소, 토큰 정보 등을 자동으로 수집하여 wallet_labels.csv 업데이트
+
+동기화(sync_github_datasets)는 ETag(If-None-Match)로 변경되지 않은 파일을 건너뛰고,
+파일을 병렬로 받아 대용량 토큰 목록은 스트리밍 파싱하며, 새 라벨만 CSV에 추가
 """
 
 import os
@@ -8,10 +11,19 @@ import csv
 import requests
 import json
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional, Set
+from typing import Any, Iterable, List, Dict, Optional, Set, Tuple
 from src.utils.logger import logger
 
+# 대용량 JSON 배열 스트리밍 파싱 (선택적)
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 # GitHub API 엔드포인트 (무료, 인증 없이도 사용 가능하지만 Rate Limit 낮음)
 GITHUB_API_BASE = 'https://api.github.com'
 
@@ -53,22 +65,39 @@ DATASET_REPOSITORIES = {
     }
 }
 
-# Rate Limit 관리
+# 동기화 대상 파일 (병합 시 앞쪽 소스의 라벨 우선)
+SYNC_SOURCES = [
+    {'name': 'cex-list', 'repo': '0xVishesh/cex-list', 'path': 'addresses.json',
+     'branch': 'main', 'type': 'addresses'},
+    {'name': 'ethereum-lists', 'repo': 'MyEtherWallet/ethereum-lists', 'path': 'src/addresses/addresses.json',
+     'branch': 'master', 'type': 'addresses'},
+    {'name': 'tokens-eth', 'repo': 'MyEtherWallet/ethereum-lists', 'path': 'src/tokens/eth/tokens-eth.json',
+     'branch': 'master', 'type': 'tokens', 'chain': 'ethereum'},
+    {'name': 'tokens-polygon', 'repo': 'MyEtherWallet/ethereum-lists', 'path': 'src/tokens/polygon/tokens-polygon.json',
+     'branch': 'master', 'type': 'tokens', 'chain': 'polygon'},
+]
+
+# 동시 다운로드 수 (GitHub raw 콘텐츠 보조 Rate Limit 고려)
+SYNC_MAX_WORKERS = int(os.getenv('GITHUB_SYNC_MAX_WORKERS', 4))
+
+# Rate Limit 관리 (요청 시작 간격, 스레드 간 공유)
 _last_request_time = 0
-_min_request_interval = 1.0  # 최소 1초 간격 (GitHub API 무료 플랜: 초당 60회)
+_min_request_interval = float(os.getenv('GITHUB_MIN_REQUEST_INTERVAL', 0.1))
+_rate_limit_lock = threading.Lock()
 
 
 def _wait_for_rate_limit():
     """Rate Limit을 위해 대기"""
     global _last_request_time
-    current_time = time.time()
-    elapsed = current_time - _last_request_time
-    
-    if elapsed < _min_request_interval:
-        sleep_time = _min_request_interval - elapsed
-        time.sleep(sleep_time)
-    
-    _last_request_time = time.time()
+    with _rate_limit_lock:
+        current_time = time.time()
+        elapsed = current_time - _last_request_time
+        
+        if elapsed < _min_request_interval:
+            sleep_time = _min_request_interval - elapsed
+            time.sleep(sleep_time)
+        
+        _last_request_time = time.time()
 
 
 def fetch_github_file(repo: str, file_path: str, branch: str = 'master') -> Optional[Dict]:
@@ -121,6 +150,62 @@ def fetch_github_file(repo: str, file_path: str, branch: str = 'master') -> Opti
         return None
 
 
+def fetch_github_labels(source: Dict[str, str], etag: Optional[str] = None) -> Tuple[str, List[Dict[str, str]], Optional[str]]:
+    """
+    동기화 소스 파일을 조건부 요청으로 가져와 라벨로 파싱
+    
+    Parameters:
+    -----------
+    source : Dict
+        SYNC_SOURCES 항목 (repo, path, branch, type, chain)
+    etag : str, optional
+        이전 동기화 시 받은 ETag (있으면 If-None-Match 전송)
+    
+    Returns:
+    --------
+    Tuple[str, List[Dict], Optional[str]] : (상태, 라벨 목록, 새 ETag)
+        상태는 'changed' / 'unchanged'(304) / 'failed'
+    """
+    url = f"https://raw.githubusercontent.com/{source['repo']}/{source['branch']}/{source['path']}"
+    headers = {'If-None-Match': etag} if etag else {}
+    
+    try:
+        _wait_for_rate_limit()
+        
+        with requests.get(url, headers=headers, timeout=30, stream=True) as response:
+            if response.status_code == 304:
+                return 'unchanged', [], etag
+            
+            if response.status_code != 200:
+                if response.status_code in (403, 429):
+                    logger.warning(f"⚠️ GitHub Rate Limit 초과 또는 접근 제한: {url}")
+                else:
+                    logger.debug(f"⚠️ GitHub 파일 요청 실패: {response.status_code}, {url}")
+                return 'failed', [], None
+            
+            new_etag = response.headers.get('ETag')
+            
+            if source['type'] == 'tokens' and IJSON_AVAILABLE:
+                # 토큰 목록(수십 MB JSON 배열)은 전체를 메모리에 올리지 않고 항목 단위로 파싱
+                response.raw.decode_content = True
+                labels = list(_iter_token_labels(ijson.items(response.raw, 'item')))
+            else:
+                data = json.loads(response.content)
+                if source['type'] == 'tokens':
+                    labels = parse_token_contracts(data, chain=source.get('chain', 'ethereum'))
+                else:
+                    labels = parse_exchange_addresses(data)
+        
+        return 'changed', labels, new_etag
+    
+    except requests.exceptions.RequestException as e:
+        logger.debug(f"⚠️ GitHub 요청 실패: {e}")
+    except Exception as e:
+        logger.warning(f"⚠️ GitHub 파일 파싱 실패 ({url}): {e}")
+    
+    return 'failed', [], None
+
+
 def parse_exchange_addresses(data: Dict) -> List[Dict[str, str]]:
     """
     거래소 주소 데이터 파싱
@@ -192,23 +277,28 @@ def parse_token_contracts(data: Dict, chain: str = 'ethereum') -> List[Dict[str,
     results = []
     
     if isinstance(data, list):
-        for token in data:
-            if isinstance(token, dict):
-                address = token.get('address', '')
-                if address and address.startswith('0x'):
-                    symbol = token.get('symbol', '')
-                    name = token.get('name', '')
-                    label = f"{symbol} ({name})" if symbol and name else (symbol or name or 'Unknown Token')
-                    
-                    results.append({
-                        'address': address.lower(),
-                        'label': label,
-                        'category': 'Token'
-                    })
+        results.extend(_iter_token_labels(data))
     
     return results
 
 
+def _iter_token_labels(tokens: Iterable[Any]):
+    """토큰 항목 이터러블(리스트 또는 스트리밍 파서)에서 라벨 생성"""
+    for token in tokens:
+        if isinstance(token, dict):
+            address = token.get('address', '')
+            if address and address.startswith('0x'):
+                symbol = token.get('symbol', '')
+                name = token.get('name', '')
+                label = f"{symbol} ({name})" if symbol and name else (symbol or name or 'Unknown Token')
+                
+                yield {
+                    'address': address.lower(),
+                    'label': label,
+                    'category': 'Token'
+                }
+
+
 def load_exchange_addresses() -> List[Dict[str, str]]:
     """
     거래소 주소 목록을 GitHub에서 로드
@@ -387,46 +477,189 @@ def update_wallet_labels_csv(labels: Dict[str, Dict[str, str]],
         return False
 
 
-def sync_github_datasets(update_csv: bool = True) -> Dict[str, Dict[str, str]]:
+def append_wallet_labels_csv(new_labels: List[Dict[str, str]],
+                             csv_path: Optional[str] = None) -> bool:
+    """
+    wallet_labels.csv 끝에 새 라벨만 추가 (전체 파일을 다시 쓰지 않음)
+    
+    Parameters:
+    -----------
+    new_labels : List[Dict]
+        추가할 라벨 목록 ({'address', 'label', 'category'})
+    csv_path : Optional[str]
+        CSV 파일 경로 (기본값: config/wallet_labels.csv)
+    
+    Returns:
+    --------
+    bool : 성공 여부
+    """
+    csv_path = Path(csv_path) if csv_path else _default_csv_path()
+    csv_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    try:
+        is_new_file = not csv_path.exists() or csv_path.stat().st_size == 0
+        
+        # 마지막 줄에 줄바꿈이 없으면 추가 후 이어 쓰기
+        needs_newline = False
+        if not is_new_file:
+            with open(csv_path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                needs_newline = f.read(1) not in (b'\n', b'\r')
+        
+        with open(csv_path, 'a', newline='', encoding='utf-8') as f:
+            if needs_newline:
+                f.write('\n')
+            writer = csv.DictWriter(f, fieldnames=['address', 'label', 'category'])
+            if is_new_file:
+                writer.writeheader()
+            
+            for info in new_labels:
+                writer.writerow({
+                    'address': info['address'],
+                    'label': info.get('label', ''),
+                    'category': info.get('category', '')
+                })
+        
+        logger.info(f"✅ wallet_labels.csv에 {len(new_labels)}개의 새 라벨 추가: {csv_path}")
+        return True
+        
+    except Exception as e:
+        logger.error(f"❌ CSV 파일 추가 실패: {e}")
+        return False
+
+
+def _default_csv_path() -> Path:
+    project_root = Path(__file__).parent.parent.parent
+    return project_root / 'config' / 'wallet_labels.csv'
+
+
+def _sync_state_path() -> Path:
+    project_root = Path(__file__).parent.parent.parent
+    cache_dir = os.getenv('GITHUB_SYNC_CACHE_DIR', str(project_root / 'cache' / 'github_datasets'))
+    return Path(cache_dir) / 'sync_state.json'
+
+
+def _load_sync_state() -> Dict[str, Any]:
+    """이전 동기화 상태 로드 (파일별 ETag, 동기화 직후 CSV 크기/수정 시각)"""
+    path = _sync_state_path()
+    try:
+        if path.exists():
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+    except Exception as e:
+        logger.debug(f"⚠️ 동기화 상태 로드 실패: {e}")
+    return {}
+
+
+def _save_sync_state(state: Dict[str, Any]):
+    """동기화 상태 저장 (임시 파일 작성 후 교체)"""
+    path = _sync_state_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.warning(f"⚠️ 동기화 상태 저장 실패: {e}")
+
+
+def _csv_signature(csv_path: Path) -> Optional[List[int]]:
+    if not csv_path.exists():
+        return None
+    stat = csv_path.stat()
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def sync_github_datasets(update_csv: bool = True, force: bool = False):
     """
     GitHub 데이터셋을 동기화하여 라벨 정보 업데이트
     
+    - 이전 동기화의 ETag로 조건부 요청 → 변경되지 않은 파일(304)은 다운로드/파싱 생략
+    - 소스 파일을 병렬로 다운로드 (GITHUB_SYNC_MAX_WORKERS)
+    - 기존 CSV에 없는 라벨만 파일 끝에 추가
+    - CSV가 마지막 동기화 이후 수정(삭제/재생성 포함)되었으면 ETag를 무시하고 전체 재확인
+    
     Parameters:
     -----------
     update_csv : bool
         CSV 파일 업데이트 여부 (기본값: True)
+    force : bool
+        ETag를 무시하고 모든 파일을 다시 받을지 여부 (기본값: False)
     
     Returns:
     --------
-    Dict : 업데이트된 라벨 딕셔너리
+    Labels : 업데이트된 라벨 (update_csv=True면 라벨 인덱스, False면 병합된 라벨 딕셔너리)
     """
+    from src.utils.label_manager import load_label_index
+    
     logger.info("=" * 60)
     logger.info("🔄 GitHub 오픈소스 데이터셋 동기화")
     logger.info("=" * 60)
     
+    start_time = time.time()
+    csv_path = _default_csv_path()
+    state = _load_sync_state()
+    previous_etags = state.get('etags', {})
+    
+    # CSV가 마지막 동기화 이후 바뀌었으면 변경 없는 파일의 라벨도 다시 병합해야 함
+    use_etags = update_csv and not force and state.get('csv_signature') == _csv_signature(csv_path)
+    
+    # 1. 소스 파일 병렬 다운로드 (변경된 파일만)
+    def fetch(source):
+        etag = previous_etags.get(source['name']) if use_etags else None
+        return fetch_github_labels(source, etag)
+    
+    with ThreadPoolExecutor(max_workers=max(1, SYNC_MAX_WORKERS)) as executor:
+        results = list(executor.map(fetch, SYNC_SOURCES))
+    
     all_labels = []
+    etags = {}
+    for source, (status, labels, etag) in zip(SYNC_SOURCES, results):
+        if status == 'changed':
+            logger.info(f"📥 {source['name']}: {len(labels)}개 라벨 (변경됨)")
+            all_labels.extend(labels)
+        elif status == 'unchanged':
+            logger.info(f"⏭️ {source['name']}: 변경 없음 (건너뜀)")
+        else:
+            logger.warning(f"⚠️ {source['name']}: 가져오기 실패 (다음 동기화 때 다시 시도)")
+        
+        if etag and status != 'failed':
+            etags[source['name']] = etag
+    
+    # CSV를 쓰지 않는 경우 기존 방식대로 병합 결과 반환
+    if not update_csv:
+        merged_labels = merge_with_existing_labels(all_labels)
+        logger.info(f"✅ 동기화 완료: 총 {len(merged_labels)}개의 라벨 ({time.time() - start_time:.2f}초)")
+        return merged_labels
+    
+    # 2. 기존 라벨에 없는 주소만 추가 (기존 라벨 및 앞쪽 소스 우선)
+    existing = load_label_index(str(csv_path))
+    seen: Set[str] = set()
+    candidates = []
+    for info in all_labels:
+        if info['address'] not in seen:
+            seen.add(info['address'])
+            candidates.append(info)
     
-    # 1. 거래소 주소 로드
-    exchange_addresses = load_exchange_addresses()
-    all_labels.extend(exchange_addresses)
+    found = existing.lookup_many([info['address'] for info in candidates])
+    new_labels = [info for info, entry in zip(candidates, found) if entry is None]
+    existing.close()
     
-    # 2. 토큰 컨트랙트 로드 (Ethereum)
-    eth_tokens = load_token_contracts(chain='ethereum')
-    all_labels.extend(eth_tokens)
+    if new_labels:
+        if not append_wallet_labels_csv(new_labels, str(csv_path)):
+            # 저장 실패 시 다음 동기화에서 다시 받도록 ETag 저장 안 함
+            etags = {}
     
-    # 3. 토큰 컨트랙트 로드 (Polygon)
-    polygon_tokens = load_token_contracts(chain='polygon')
-    all_labels.extend(polygon_tokens)
+    logger.info(f"✅ {len(new_labels)}개의 새로운 라벨 추가됨")
     
-    # 4. 기존 라벨과 병합
-    merged_labels = merge_with_existing_labels(all_labels)
+    # 3. 동기화 상태 저장
+    _save_sync_state({'etags': etags, 'csv_signature': _csv_signature(csv_path)})
     
-    # 5. CSV 파일 업데이트 (선택적)
-    if update_csv:
-        update_wallet_labels_csv(merged_labels)
+    labels = load_label_index(str(csv_path))
     
     logger.info("\n" + "=" * 60)
-    logger.info(f"✅ 동기화 완료: 총 {len(merged_labels)}개의 라벨")
+    logger.info(f"✅ 동기화 완료: 총 {len(labels)}개의 라벨 ({time.time() - start_time:.2f}초)")
     logger.info("=" * 60)
     
-    return merged_labels
+    return labels
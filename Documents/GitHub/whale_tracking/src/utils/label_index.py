@@ -0,0 +1,301 @@
+"""
+컴파일된 지갑 라벨 인덱스
+wallet_labels.csv를 매 실행마다 dict로 파싱하는 대신, 정렬된 20바이트 바이너리 주소 +
+문자열 테이블 오프셋으로 구성된 인덱스 파일을 만들어 mmap으로 열고 이진 탐색으로 조회
+
+- CSV 크기/수정 시각이 인덱스 헤더와 다를 때만 다시 빌드
+- 인덱스가 최신이면 시작 비용은 파일 열기 + 헤더 읽기뿐 (페이지는 조회 시 필요한 만큼만 로드)
+- label_many()로 주소 배치를 한 번의 searchsorted로 조회
+
+파일 구조 (리틀 엔디언):
+    헤더 | 주소[count × 20바이트, 정렬] | 오프셋[(count + 1) × uint64] | 문자열 테이블 | 기타 주소(JSON)
+    문자열 테이블 항목: "label\\x1fcategory" (UTF-8)
+    기타 주소: 0x + 40자리 16진수가 아닌 주소 {address: [label, category]}
+"""
+
+import os
+import csv
+import json
+import mmap
+import struct
+import numpy as np
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+from src.utils.logger import logger
+
+INDEX_MAGIC = b'WLIX'
+INDEX_VERSION = 1
+
+# magic, version, count, csv_size, csv_mtime_ns, strings_len, extra_len
+HEADER_FORMAT = '<4sIQQQQQ'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+ADDRESS_BYTES = 20
+FIELD_SEPARATOR = '\x1f'
+
+
+def _address_to_bytes(address: str) -> Optional[bytes]:
+    """0x + 40자리 16진수 주소를 20바이트로 변환 (형식이 다르면 None)"""
+    if len(address) != 42 or not address.startswith('0x'):
+        return None
+    try:
+        return bytes.fromhex(address[2:])
+    except ValueError:
+        return None
+
+
+class LabelIndex:
+    """mmap 기반 읽기 전용 라벨 인덱스 (get()은 load_labels() dict와 같은 형태로 반환)"""
+
+    def __init__(self, index_path: Optional[Path] = None):
+        """
+        Parameters:
+        -----------
+        index_path : Path, optional
+            인덱스 파일 경로 (None이면 빈 인덱스)
+        """
+        self.index_path = index_path
+        self._file = None
+        self._mm = None
+        self.count = 0
+        self.csv_size = -1
+        self.csv_mtime_ns = -1
+        self._keys = np.empty(0, dtype=f'S{ADDRESS_BYTES}')
+        self._offsets = np.zeros(1, dtype='<u8')
+        self._strings_start = 0
+        self._extra: Dict[str, Tuple[str, str]] = {}
+
+        if index_path is not None:
+            self._open(index_path)
+
+    def _open(self, index_path: Path):
+        """인덱스 파일을 mmap으로 열고 배열 뷰 생성 (데이터 복사 없음)"""
+        self._file = open(index_path, 'rb')
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # 빈 파일은 mmap 불가
+            self.close()
+            raise ValueError(f"손상된 라벨 인덱스: {index_path}")
+
+        magic, version, count, csv_size, csv_mtime_ns, strings_len, extra_len = struct.unpack_from(
+            HEADER_FORMAT, self._mm, 0
+        )
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            self.close()
+            raise ValueError(f"지원하지 않는 라벨 인덱스 형식: {index_path}")
+
+        self.count = count
+        self.csv_size = csv_size
+        self.csv_mtime_ns = csv_mtime_ns
+
+        keys_start = HEADER_SIZE
+        offsets_start = keys_start + count * ADDRESS_BYTES
+        self._strings_start = offsets_start + (count + 1) * 8
+        extra_start = self._strings_start + strings_len
+
+        self._keys = np.frombuffer(self._mm, dtype=f'S{ADDRESS_BYTES}', count=count, offset=keys_start)
+        self._offsets = np.frombuffer(self._mm, dtype='<u8', count=count + 1, offset=offsets_start)
+
+        if extra_len:
+            extra = json.loads(self._mm[extra_start:extra_start + extra_len].decode('utf-8'))
+            self._extra = {address: (label, category) for address, (label, category) in extra.items()}
+
+    def close(self):
+        """mmap 및 파일 닫기"""
+        self._keys = np.empty(0, dtype=f'S{ADDRESS_BYTES}')
+        self._offsets = np.zeros(1, dtype='<u8')
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __len__(self) -> int:
+        return self.count + len(self._extra)
+
+    def __contains__(self, address: str) -> bool:
+        return self.get(address) is not None
+
+    def _entry(self, position: int) -> Tuple[str, str]:
+        """문자열 테이블에서 (label, category) 읽기"""
+        start = self._strings_start + int(self._offsets[position])
+        end = self._strings_start + int(self._offsets[position + 1])
+        label, _, category = self._mm[start:end].decode('utf-8').partition(FIELD_SEPARATOR)
+        return label, category
+
+    def _positions(self, keys: np.ndarray) -> np.ndarray:
+        """정렬된 주소 배열에서 각 키의 위치 (없으면 -1)"""
+        if self.count == 0 or len(keys) == 0:
+            return np.full(len(keys), -1, dtype=np.int64)
+
+        positions = np.searchsorted(self._keys, keys)
+        clipped = np.minimum(positions, self.count - 1)
+        found = self._keys[clipped] == keys
+        return np.where(found, clipped, -1)
+
+    def lookup(self, address: str) -> Optional[Tuple[str, str]]:
+        """주소의 (label, category) 조회 (없으면 None)"""
+        if not address:
+            return None
+
+        address = address.strip().lower()
+        key = _address_to_bytes(address)
+        if key is None:
+            return self._extra.get(address)
+
+        position = int(self._positions(np.array([key], dtype=f'S{ADDRESS_BYTES}'))[0])
+        return self._entry(position) if position >= 0 else None
+
+    def get(self, address: str, default=None) -> Optional[Dict[str, str]]:
+        """load_labels() dict와 같은 형태로 조회: {'label': ..., 'category': ...}"""
+        entry = self.lookup(address)
+        if entry is None:
+            return default
+        return {'label': entry[0], 'category': entry[1]}
+
+    def lookup_many(self, addresses: Sequence[Optional[str]]) -> List[Optional[Tuple[str, str]]]:
+        """
+        주소 배치를 한 번의 이진 탐색으로 조회
+
+        Parameters:
+        -----------
+        addresses : Sequence[Optional[str]]
+            지갑 주소 리스트 (None/빈 문자열 허용)
+
+        Returns:
+        --------
+        List[Optional[Tuple[str, str]]] : 주소별 (label, category), 없으면 None
+        """
+        results: List[Optional[Tuple[str, str]]] = [None] * len(addresses)
+        batch_keys = []
+        batch_slots = []
+
+        for slot, address in enumerate(addresses):
+            if not address:
+                continue
+            address = address.strip().lower()
+            key = _address_to_bytes(address)
+            if key is None:
+                results[slot] = self._extra.get(address)
+            else:
+                batch_keys.append(key)
+                batch_slots.append(slot)
+
+        if batch_keys:
+            positions = self._positions(np.array(batch_keys, dtype=f'S{ADDRESS_BYTES}'))
+            # 같은 주소가 여러 번 나와도 문자열 디코딩은 한 번만
+            decoded: Dict[int, Tuple[str, str]] = {}
+            for slot, position in zip(batch_slots, positions.tolist()):
+                if position >= 0:
+                    if position not in decoded:
+                        decoded[position] = self._entry(position)
+                    results[slot] = decoded[position]
+
+        return results
+
+    def label_many(self, addresses: Sequence[Optional[str]]) -> List[Optional[str]]:
+        """주소 배치의 라벨 조회 (없으면 None)"""
+        return [entry[0] if entry else None for entry in self.lookup_many(addresses)]
+
+    def is_stale(self, csv_path: Path) -> bool:
+        """CSV가 인덱스 빌드 이후 변경되었는지 확인"""
+        try:
+            stat = csv_path.stat()
+        except FileNotFoundError:
+            return False
+        return stat.st_size != self.csv_size or stat.st_mtime_ns != self.csv_mtime_ns
+
+
+def build_label_index(csv_path: Path, index_path: Path) -> int:
+    """
+    wallet_labels.csv로 인덱스 파일 빌드 (임시 파일 작성 후 교체)
+
+    Parameters:
+    -----------
+    csv_path : Path
+        라벨 CSV 경로
+    index_path : Path
+        생성할 인덱스 경로
+
+    Returns:
+    --------
+    int : 인덱스에 저장된 라벨 수
+    """
+    stat = csv_path.stat()
+
+    # load_labels()와 동일한 규칙: 소문자 정규화, 중복 주소는 마지막 값 사용
+    labels: Dict[str, Tuple[str, str]] = {}
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            address = str(row.get('address', '')).strip().lower()
+            if not address:
+                continue
+            labels[address] = (str(row.get('label', '')).strip(), str(row.get('category', '')).strip())
+
+    binary = {}
+    extra = {}
+    for address, entry in labels.items():
+        key = _address_to_bytes(address)
+        if key is None:
+            extra[address] = list(entry)
+        else:
+            binary[key] = entry
+
+    keys = sorted(binary)
+    strings = bytearray()
+    offsets = np.zeros(len(keys) + 1, dtype='<u8')
+    for i, key in enumerate(keys):
+        label, category = binary[key]
+        strings += f"{label}{FIELD_SEPARATOR}{category}".encode('utf-8')
+        offsets[i + 1] = len(strings)
+
+    extra_bytes = json.dumps(extra, ensure_ascii=False).encode('utf-8') if extra else b''
+    header = struct.pack(HEADER_FORMAT, INDEX_MAGIC, INDEX_VERSION, len(keys),
+                         stat.st_size, stat.st_mtime_ns, len(strings), len(extra_bytes))
+
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = index_path.with_suffix(index_path.suffix + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(header)
+        f.write(b''.join(keys))
+        f.write(offsets.tobytes())
+        f.write(bytes(strings))
+        f.write(extra_bytes)
+    os.replace(tmp_path, index_path)
+
+    return len(keys) + len(extra)
+
+
+def open_label_index(csv_path: Path, index_path: Path) -> LabelIndex:
+    """
+    라벨 인덱스 열기 (없거나 CSV가 변경되었으면 다시 빌드)
+
+    Parameters:
+    -----------
+    csv_path : Path
+        라벨 CSV 경로
+    index_path : Path
+        인덱스 파일 경로
+
+    Returns:
+    --------
+    LabelIndex : 라벨 인덱스 (CSV가 없으면 빈 인덱스)
+    """
+    if not csv_path.exists():
+        logger.warning(f"⚠️ 라벨 파일을 찾을 수 없습니다: {csv_path}")
+        return LabelIndex()
+
+    if index_path.exists():
+        try:
+            index = LabelIndex(index_path)
+            if not index.is_stale(csv_path):
+                return index
+            index.close()
+        except Exception as e:
+            logger.debug(f"⚠️ 라벨 인덱스 열기 실패 (다시 빌드): {e}")
+
+    count = build_label_index(csv_path, index_path)
+    logger.info(f"🔨 라벨 인덱스 빌드 완료: {count}개 → {index_path}")
+    return LabelIndex(index_path)
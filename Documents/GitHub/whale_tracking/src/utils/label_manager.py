@@ -3,8 +3,12 @@
 import os
 import csv
 from pathlib import Path
-from typing import Dict, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Sequence, Union
 from src.utils.logger import logger
+from src.utils.label_index import LabelIndex, open_label_index
+
+# load_labels() dict 또는 load_label_index() 인덱스 (둘 다 .get(address) 지원)
+Labels = Union[Dict[str, Dict[str, str]], LabelIndex]
 
 def load_labels(csv_path: Optional[str] = None) -> Dict[str, Dict[str, str]]:
     """
@@ -66,7 +70,57 @@ def load_labels(csv_path: Optional[str] = None) -> Dict[str, Dict[str, str]]:
     
     return labels
 
-def get_label(address: str, labels: Dict[str, Dict[str, str]]) -> Optional[str]:
+def load_label_index(csv_path: Optional[str] = None, index_path: Optional[str] = None) -> LabelIndex:
+    """
+    wallet_labels.csv의 컴파일된 인덱스를 mmap으로 로드 (CSV가 변경된 경우에만 다시 빌드)
+    
+    라벨이 수십만 개로 늘어나도 시작 시 CSV 파싱/dict 생성 없이 바로 조회 가능
+    
+    Parameters:
+    -----------
+    csv_path : str, optional
+        CSV 파일 경로 (기본값: config/wallet_labels.csv)
+    index_path : str, optional
+        인덱스 파일 경로 (기본값: 환경변수 WALLET_LABEL_INDEX_PATH 또는 cache/wallet_labels.idx)
+    
+    Returns:
+    --------
+    LabelIndex : get_label/get_category/label_many에 그대로 사용 가능한 라벨 인덱스
+    """
+    project_root = Path(__file__).parent.parent.parent
+    csv_path = Path(csv_path) if csv_path else project_root / 'config' / 'wallet_labels.csv'
+    index_path = Path(index_path or os.getenv('WALLET_LABEL_INDEX_PATH', project_root / 'cache' / 'wallet_labels.idx'))
+    
+    try:
+        index = open_label_index(csv_path, index_path)
+    except Exception as e:
+        logger.error(f"❌ 라벨 인덱스 로드 실패: {e}")
+        return LabelIndex()
+    
+    logger.info(f"✅ {len(index)}개의 지갑 라벨 인덱스 로드 완료")
+    return index
+
+def label_many(addresses: Sequence[Optional[str]], labels: Labels) -> List[Optional[str]]:
+    """
+    주소 배치의 라벨 일괄 조회
+    
+    Parameters:
+    -----------
+    addresses : Sequence[Optional[str]]
+        지갑 주소 리스트 (None/빈 문자열 허용)
+    labels : Labels
+        load_labels() 딕셔너리 또는 load_label_index() 인덱스
+    
+    Returns:
+    --------
+    List[Optional[str]] : 주소별 라벨, 없으면 None
+    """
+    if isinstance(labels, LabelIndex):
+        return labels.label_many(addresses)
+    
+    return [get_label(address, labels) for address in addresses]
+
+def get_label(address: str, labels: Labels) -> Optional[str]:
     """
     주소에 대한 라벨 반환
     
@@ -74,8 +128,8 @@ def get_label(address: str, labels: Dict[str, Dict[str, str]]) -> Optional[str]:
     -----------
     address : str
         지갑 주소
-    labels : Dict
-        load_labels()로 로드한 라벨 딕셔너리
+    labels : Labels
+        load_labels() 딕셔너리 또는 load_label_index() 인덱스
     
     Returns:
     --------
@@ -92,7 +146,7 @@ def get_label(address: str, labels: Dict[str, Dict[str, str]]) -> Optional[str]:
     
     return None
 
-def get_category(address: str, labels: Dict[str, Dict[str, str]]) -> Optional[str]:
+def get_category(address: str, labels: Labels) -> Optional[str]:
     """
     주소에 대한 카테고리 반환
     
@@ -100,8 +154,8 @@ def get_category(address: str, labels: Dict[str, Dict[str, str]]) -> Optional[st
     -----------
     address : str
         지갑 주소
-    labels : Dict
-        load_labels()로 로드한 라벨 딕셔너리
+    labels : Labels
+        load_labels() 딕셔너리 또는 load_label_index() 인덱스
     
     Returns:
     --------
@@ -1,8 +1,14 @@
 # src/utils/logger.py
 
+import atexit
+import copy
+import json
 import logging
 import logging.handlers
 import os
+import queue
+import random
+from datetime import datetime, timezone
 from pathlib import Path
 from dotenv import load_dotenv
 import colorlog
@@ -10,53 +16,162 @@ import colorlog
 # 환경변수 로드
 load_dotenv('config/.env')
 
+# LOG_FORMAT=json 이면 콘솔/파일 모두 한 줄 JSON (지연 시간 분석 등 기계 파싱용)
+LOG_FORMAT = os.getenv('LOG_FORMAT', 'text').lower()
+
+# 요청/주소/페이지 단위 로그(extra=SAMPLED) 샘플링 비율 (0.0 ~ 1.0)
+LOG_SAMPLE_RATE = float(os.getenv('LOG_SAMPLE_RATE', 1.0))
+
+# 로그 큐 크기 (가득 차면 버림 - 수집 스레드는 로그 I/O를 기다리지 않음)
+LOG_QUEUE_SIZE = int(os.getenv('LOG_QUEUE_SIZE', 10000))
+
+# 샘플링 대상 로그 표시: logger.info("...", arg, extra=SAMPLED)
+SAMPLED = {'sampled': True}
+
+# LogRecord 기본 속성 (JSON 출력 시 extra 필드만 골라내기 위함)
+_RECORD_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'asctime', 'sampled'}
+_EXC_FORMATTER = logging.Formatter()
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄 JSON 포매터 (extra로 전달한 필드 포함)"""
+
+    def format(self, record):
+        payload = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'thread': record.threadName,
+            'message': record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith('_'):
+                payload[key] = value
+        if record.exc_info:
+            payload['exc'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload['exc'] = record.exc_text
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """extra=SAMPLED 로그를 LOG_SAMPLE_RATE 비율로만 통과 (경고 이상은 항상 통과)"""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record):
+        if self.rate >= 1.0 or record.levelno >= logging.WARNING or not getattr(record, 'sampled', False):
+            return True
+        return random.random() < self.rate
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """큐가 가득 차면 기다리지 않고 버리는 QueueHandler (버린 수는 dropped)"""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record):
+        # 메시지는 호출 스레드에서 확정하고, 예외는 exc_text로 따로 보존 (JSON에서 별도 필드)
+        record = copy.copy(record)
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _EXC_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def _stop_listener(listener):
+    """리스너 종료 (남은 로그 기록, 이미 종료되었으면 무시)"""
+    if getattr(listener, '_thread', None) is None:
+        return
+    try:
+        listener.stop()
+    except queue.Full:
+        pass
+
+
+def _build_handlers(log_file):
+    """실제 I/O 핸들러 (리스너 스레드에서 실행)"""
+    if LOG_FORMAT == 'json':
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(JsonFormatter())
+    else:
+        # 콘솔 핸들러 (컬러)
+        console_handler = colorlog.StreamHandler()
+        console_handler.setFormatter(colorlog.ColoredFormatter(
+            '%(log_color)s%(asctime)s%(reset)s - '
+            '%(log_color)s%(name)s%(reset)s - '
+            '%(log_color)s%(levelname)s%(reset)s - '
+            '%(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S',
+            log_colors={
+                'DEBUG': 'cyan',
+                'INFO': 'green',
+                'WARNING': 'yellow',
+                'ERROR': 'red',
+                'CRITICAL': 'red,bg_white',
+            }
+        ))
+
+    # 파일 핸들러
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file,
+        maxBytes=10*1024*1024,  # 10MB
+        backupCount=5
+    )
+    file_handler.setFormatter(JsonFormatter() if LOG_FORMAT == 'json' else logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    ))
+
+    return console_handler, file_handler
+
+
 def setup_logger(name, log_file='logs/whale_tracking.log', level=logging.INFO):
     """
     로거 설정
-    
-    - 콘솔에 컬러 출력
-    - 파일에 기록
+
+    - 로거에는 QueueHandler만 붙이고, 콘솔(컬러)/파일 출력은 QueueListener 스레드에서 처리
+    - LOG_FORMAT=json 이면 JSON 한 줄 출력
+    - extra=SAMPLED 로그는 LOG_SAMPLE_RATE 비율로 샘플링
     """
-    
+
     # 로그 디렉토리 생성
     Path('logs').mkdir(exist_ok=True)
-    
+
     # 로거 생성
     logger = logging.getLogger(name)
     logger.setLevel(level)
-    
-    # 포매터
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-    
-    # 콘솔 핸들러 (컬러)
-    console_handler = colorlog.StreamHandler()
-    console_handler.setFormatter(colorlog.ColoredFormatter(
-        '%(log_color)s%(asctime)s%(reset)s - '
-        '%(log_color)s%(name)s%(reset)s - '
-        '%(log_color)s%(levelname)s%(reset)s - '
-        '%(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S',
-        log_colors={
-            'DEBUG': 'cyan',
-            'INFO': 'green',
-            'WARNING': 'yellow',
-            'ERROR': 'red',
-            'CRITICAL': 'red,bg_white',
-        }
-    ))
-    logger.addHandler(console_handler)
-    
-    # 파일 핸들러
-    file_handler = logging.handlers.RotatingFileHandler(
-        log_file,
-        maxBytes=10*1024*1024,  # 10MB
-        backupCount=5
-    )
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
-    
+
+    # 기존 핸들러/리스너 정리 (중복 방지)
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+    previous = getattr(logger, '_queue_listener', None)
+    if previous is not None:
+        _stop_listener(previous)
+
+    log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    queue_handler = DroppingQueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter(LOG_SAMPLE_RATE))
+    logger.addHandler(queue_handler)
+
+    listener = logging.handlers.QueueListener(log_queue, *_build_handlers(log_file), respect_handler_level=True)
+    listener.start()
+    logger._queue_listener = listener
+
+    # 종료 시 큐에 남은 로그 기록
+    atexit.register(_stop_listener, listener)
+
     return logger
 
 # 기본 로거
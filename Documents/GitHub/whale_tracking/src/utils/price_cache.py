@@ -0,0 +1,289 @@
+"""
+프로세스 공유 가격 캐시
+(chain, asset) 키로 가격을 보관하여 여러 BlockExplorerCollector / PriceUpdater 인스턴스가
+같은 ETH/USD, 토큰 가격을 중복 조회하지 않도록 함
+
+- TTL 기반 만료 + 실패 결과는 짧은 TTL로 음성 캐시
+- TTL이 일정 비율 지나면 백그라운드에서 미리 갱신 (refresh-ahead) → 요청은 대기하지 않음
+- 선택적 디스크 스냅샷으로 재시작 시 워밍업
+- 히트/미스 카운터 제공 (get_stats)
+"""
+
+import os
+import json
+import time
+import atexit
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+from src.utils.logger import logger
+
+CacheKey = Tuple[str, str]
+
+
+class _CacheEntry:
+    """캐시 항목 (가격 + 조회 시각)"""
+
+    __slots__ = ('price', 'fetched_at', 'ttl', 'refreshing')
+
+    def __init__(self, price: Optional[float], fetched_at: float, ttl: float):
+        self.price = price
+        self.fetched_at = fetched_at
+        self.ttl = ttl
+        self.refreshing = False
+
+    def age(self, now: float) -> float:
+        return now - self.fetched_at
+
+
+class PriceCache:
+    """(chain, asset) 키 기반 프로세스 공유 가격 캐시"""
+
+    def __init__(self,
+                 default_ttl: float = 300.0,
+                 negative_ttl: float = 60.0,
+                 refresh_ahead_ratio: float = 0.8,
+                 snapshot_path: Optional[str] = None):
+        """
+        가격 캐시 초기화
+
+        Parameters:
+        -----------
+        default_ttl : float
+            가격 유효 시간 (초, 기본값: 300)
+        negative_ttl : float
+            조회 실패 결과 유효 시간 (초, 기본값: 60)
+        refresh_ahead_ratio : float
+            TTL 대비 이 비율이 지나면 백그라운드 갱신 시작 (0~1, 기본값: 0.8)
+        snapshot_path : str, optional
+            디스크 스냅샷 경로 (None이면 스냅샷 사용 안 함)
+        """
+        self.default_ttl = default_ttl
+        self.negative_ttl = negative_ttl
+        self.refresh_ahead_ratio = refresh_ahead_ratio
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+
+        self._entries: Dict[CacheKey, _CacheEntry] = {}
+        self._lock = threading.Lock()
+
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'stale_hits': 0,
+            'refresh_ahead': 0,
+            'load_failures': 0,
+        }
+
+        if self.snapshot_path:
+            self.load_snapshot()
+
+    @staticmethod
+    def _key(chain: str, asset: str) -> CacheKey:
+        return ((chain or '').lower(), (asset or '').lower())
+
+    def get(self, chain: str, asset: str) -> Optional[float]:
+        """
+        유효한 캐시 가격만 조회 (로더 호출 없음)
+
+        Returns:
+        --------
+        Optional[float] : 캐시된 가격, 없거나 만료되었으면 None
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(self._key(chain, asset))
+            if entry is not None and entry.age(now) < entry.ttl:
+                self._stats['hits'] += 1
+                return entry.price
+            self._stats['misses'] += 1
+            return None
+
+    def set(self, chain: str, asset: str, price: Optional[float], ttl: Optional[float] = None):
+        """가격 저장 (None이면 실패 결과로 짧게 저장)"""
+        if ttl is None:
+            ttl = self.default_ttl if price is not None else self.negative_ttl
+
+        with self._lock:
+            self._entries[self._key(chain, asset)] = _CacheEntry(price, time.time(), ttl)
+
+    def get_or_load(self,
+                    chain: str,
+                    asset: str,
+                    loader: Callable[[], Optional[float]],
+                    ttl: Optional[float] = None,
+                    force_refresh: bool = False) -> Optional[float]:
+        """
+        캐시 조회 후 없으면 로더로 조회하여 저장
+
+        Parameters:
+        -----------
+        chain : str
+            체인 이름
+        asset : str
+            자산 식별자 (심볼 또는 토큰 컨트랙트 주소)
+        loader : Callable[[], Optional[float]]
+            가격 조회 함수 (실패 시 None 반환)
+        ttl : float, optional
+            유효 시간 (초, 기본값: default_ttl)
+        force_refresh : bool
+            캐시를 무시하고 다시 조회할지 여부
+
+        Returns:
+        --------
+        Optional[float] : 가격, 조회 실패 시 None (만료된 이전 가격이 있으면 그 값)
+        """
+        key = self._key(chain, asset)
+        ttl = ttl or self.default_ttl
+        now = time.time()
+        stale_price = None
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and not force_refresh:
+                age = entry.age(now)
+
+                if age < entry.ttl:
+                    self._stats['hits'] += 1
+
+                    # 만료가 가까우면 백그라운드 갱신 (현재 요청은 캐시 값으로 즉시 응답)
+                    if (entry.price is not None and not entry.refreshing
+                            and age >= entry.ttl * self.refresh_ahead_ratio):
+                        entry.refreshing = True
+                        self._stats['refresh_ahead'] += 1
+                        threading.Thread(
+                            target=self._refresh, args=(key, loader, ttl), daemon=True
+                        ).start()
+
+                    return entry.price
+
+            if entry is not None:
+                stale_price = entry.price
+
+            self._stats['misses'] += 1
+
+        price = self._call_loader(key, loader)
+
+        if price is None and stale_price is not None:
+            # 조회 실패 시 만료된 이전 가격이라도 사용 (다음 조회까지는 음성 TTL 적용)
+            with self._lock:
+                self._stats['stale_hits'] += 1
+                self._entries[key] = _CacheEntry(stale_price, now - ttl + self.negative_ttl, ttl)
+            return stale_price
+
+        self.set(key[0], key[1], price, ttl if price is not None else None)
+        return price
+
+    def _call_loader(self, key: CacheKey, loader: Callable[[], Optional[float]]) -> Optional[float]:
+        """로더 호출 (예외는 실패로 처리)"""
+        try:
+            price = loader()
+            if price is not None and price > 0:
+                return float(price)
+        except Exception as e:
+            logger.debug(f"⚠️ 가격 로드 실패 {key}: {e}")
+
+        with self._lock:
+            self._stats['load_failures'] += 1
+        return None
+
+    def _refresh(self, key: CacheKey, loader: Callable[[], Optional[float]], ttl: float):
+        """백그라운드 갱신 (실패하면 기존 값 유지)"""
+        price = self._call_loader(key, loader)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if price is not None:
+                self._entries[key] = _CacheEntry(price, time.time(), ttl)
+            elif entry is not None:
+                entry.refreshing = False
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        캐시 통계 조회 (튜닝용)
+
+        Returns:
+        --------
+        Dict : hits, misses, stale_hits, refresh_ahead, load_failures, entries, hit_rate
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+
+        total = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / total if total > 0 else 0.0
+        return stats
+
+    def clear(self):
+        """모든 캐시 항목 삭제"""
+        with self._lock:
+            self._entries.clear()
+
+    def save_snapshot(self):
+        """유효한 가격만 디스크 스냅샷으로 저장"""
+        if not self.snapshot_path:
+            return
+
+        with self._lock:
+            data = {
+                f"{chain}|{asset}": {'price': entry.price, 'fetched_at': entry.fetched_at, 'ttl': entry.ttl}
+                for (chain, asset), entry in self._entries.items()
+                if entry.price is not None
+            }
+
+        try:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.snapshot_path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.snapshot_path)
+            logger.debug(f"💾 가격 캐시 스냅샷 저장: {len(data)}개")
+        except Exception as e:
+            logger.warning(f"⚠️ 가격 캐시 스냅샷 저장 실패: {e}")
+
+    def load_snapshot(self):
+        """디스크 스냅샷 로드 (원래 조회 시각 기준으로 TTL 유지)"""
+        if not self.snapshot_path or not self.snapshot_path.exists():
+            return
+
+        try:
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            now = time.time()
+            loaded = 0
+            with self._lock:
+                for key_str, item in data.items():
+                    chain, _, asset = key_str.partition('|')
+                    entry = _CacheEntry(float(item['price']), float(item['fetched_at']),
+                                        float(item.get('ttl', self.default_ttl)))
+                    if entry.age(now) < entry.ttl:
+                        self._entries[(chain, asset)] = entry
+                        loaded += 1
+
+            logger.debug(f"💾 가격 캐시 스냅샷 로드: {loaded}개")
+        except Exception as e:
+            logger.warning(f"⚠️ 가격 캐시 스냅샷 로드 실패: {e}")
+
+
+# 글로벌 캐시 인스턴스
+_price_cache = None
+
+def get_price_cache() -> PriceCache:
+    """싱글톤 패턴으로 프로세스 공유 가격 캐시 반환"""
+    global _price_cache
+    if _price_cache is None:
+        snapshot_path = os.getenv('PRICE_CACHE_SNAPSHOT_PATH')
+        if snapshot_path is None:
+            project_root = Path(__file__).parent.parent.parent
+            snapshot_path = str(project_root / 'cache' / 'price_cache.json')
+
+        _price_cache = PriceCache(
+            default_ttl=float(os.getenv('PRICE_CACHE_TTL_SECONDS', 300)),
+            negative_ttl=float(os.getenv('PRICE_CACHE_NEGATIVE_TTL_SECONDS', 60)),
+            refresh_ahead_ratio=float(os.getenv('PRICE_CACHE_REFRESH_AHEAD_RATIO', 0.8)),
+            snapshot_path=snapshot_path or None
+        )
+        # 종료 시 스냅샷 저장 (다음 실행 워밍업)
+        atexit.register(_price_cache.save_snapshot)
+    return _price_cache
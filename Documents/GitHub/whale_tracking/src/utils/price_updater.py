@@ -4,6 +4,7 @@
 """
 
 import time
+import numpy as np
 from typing import List, Dict, Optional
 from src.utils.logger import logger
 from src.collectors.block_explorer_collector import BlockExplorerCollector
@@ -23,7 +24,32 @@ class PriceUpdater:
         self.chain = chain
         self.collector = BlockExplorerCollector(chain=chain)
     
-    def calculate_price_for_transaction(self, tx: Dict) -> Optional[float]:
+    def get_historical_unit_prices(self, transactions: List[Dict]) -> Optional[np.ndarray]:
+        """
+        거래 배치 전체의 거래 시점 단가를 과거 가격 인덱스에서 일괄 조회
+        
+        Parameters:
+        -----------
+        transactions : List[Dict]
+            거래 데이터 리스트 (block_timestamp 필요)
+        
+        Returns:
+        --------
+        Optional[np.ndarray] : 거래별 USD 단가 (조회 불가 항목은 NaN), 사용 불가 시 None
+        """
+        if not self.collector.use_historical_prices or not transactions:
+            return None
+        
+        try:
+            from src.collectors.historical_price_index import get_historical_price_index
+            unit_prices = get_historical_price_index().price_transactions(transactions, chain=self.chain)
+            logger.info(f"💹 거래 시점 가격 {int(np.isfinite(unit_prices).sum())}/{len(transactions)}건 일괄 조회")
+            return unit_prices
+        except Exception as e:
+            logger.warning(f"⚠️ 과거 가격 일괄 조회 실패 (현재 가격 사용): {e}")
+            return None
+    
+    def calculate_price_for_transaction(self, tx: Dict, unit_price: Optional[float] = None) -> Optional[float]:
         """
         거래의 USD 가격 계산
         
@@ -31,6 +57,8 @@ class PriceUpdater:
         -----------
         tx : Dict
             거래 데이터 (Supabase에서 조회한 데이터)
+        unit_price : Optional[float]
+            거래 시점 단가 (get_historical_unit_prices 결과, 없으면 현재 가격 조회)
         
         Returns:
         --------
@@ -44,6 +72,10 @@ class PriceUpdater:
             if amount <= 0:
                 return None
             
+            # 거래 시점 가격이 있으면 우선 사용
+            if unit_price is not None and np.isfinite(unit_price) and unit_price > 0:
+                return amount * float(unit_price)
+            
             # 네이티브 코인 (ETH, MATIC)인 경우
             if coin_symbol in ['ETH', 'MATIC']:
                 # Chainlink로 가격 조회
@@ -150,10 +182,16 @@ class PriceUpdater:
         
         logger.info(f"\n📊 배치 가격 업데이트 시작: {stats['total']}건")
         
+        # 거래 시점 단가를 배치 전체에 대해 한 번에 조회
+        unit_prices = self.get_historical_unit_prices(transactions)
+        
         for i, tx in enumerate(transactions, 1):
             try:
                 # 가격 계산
-                amount_usd = self.calculate_price_for_transaction(tx)
+                amount_usd = self.calculate_price_for_transaction(
+                    tx,
+                    unit_price=unit_prices[i - 1] if unit_prices is not None else None
+                )
                 
                 if amount_usd and amount_usd > 0:
                     # 가격 업데이트
@@ -1,13 +1,213 @@
 """
 재시도 로직 유틸리티
-지수 백오프를 사용한 재시도 데코레이터 및 함수
+공유 재시도 정책(decorrelated jitter 백오프 + 재시도 예산 + 데드라인)을 사용한 재시도 데코레이터
+
+- Decorrelated jitter: 대기 시간 = min(max_delay, uniform(base_delay, 직전 대기 × 3))
+  → 공통 장애 이후 여러 워커가 같은 시점에 일제히 재시도하지 않음
+- 재시도 예산: 최근 구간 요청 수 대비 재시도 비율 제한 (장애 시 재시도가 트래픽을 증폭하지 않도록)
+- 데드라인: deadline_scope()로 설정한 실행/단계 마감 시각을 넘기는 재시도는 하지 않음
 """
 
+import os
 import time
+import random
+import threading
 import functools
-from typing import Callable, Any, Type, Tuple
+import contextvars
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Any, Type, Tuple, Optional, Dict
 from src.utils.logger import logger
 
+
+class Deadline:
+    """단조 시계 기준 마감 시각"""
+
+    def __init__(self, seconds: float):
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """남은 시간 (초, 음수 없음)"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def timeout(self, default: float) -> float:
+        """요청 타임아웃을 남은 시간으로 제한"""
+        return max(0.001, min(default, self.remaining()))
+
+
+_current_deadline: contextvars.ContextVar[Optional[Deadline]] = contextvars.ContextVar(
+    'retry_deadline', default=None
+)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """현재 컨텍스트의 데드라인 (없으면 None)"""
+    return _current_deadline.get()
+
+
+def request_timeout(default: float) -> float:
+    """현재 데드라인을 반영한 요청 타임아웃"""
+    deadline = _current_deadline.get()
+    return deadline.timeout(default) if deadline is not None else default
+
+
+@contextmanager
+def deadline_scope(seconds: Optional[float]):
+    """
+    실행/단계 데드라인 설정 (바깥 데드라인보다 늦어지지 않음)
+
+    Parameters:
+    -----------
+    seconds : float, optional
+        허용 시간 (초), None 또는 0 이하면 바깥 데드라인 유지
+    """
+    outer = _current_deadline.get()
+    deadline = outer
+    if seconds is not None and seconds > 0:
+        deadline = Deadline(seconds)
+        if outer is not None and outer.expires_at < deadline.expires_at:
+            deadline = outer
+
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+class RetryBudget:
+    """슬라이딩 윈도우 재시도 예산 (스레드 안전)"""
+
+    def __init__(self, ratio: float, min_retries: int, window_seconds: float):
+        """
+        Parameters:
+        -----------
+        ratio : float
+            구간 내 요청 대비 허용 재시도 비율
+        min_retries : int
+            요청이 적을 때도 허용할 최소 재시도 수
+        window_seconds : float
+            집계 구간 (초)
+        """
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window_seconds = window_seconds
+        self._requests = deque()
+        self._retries = deque()
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    def _trim(self, now: float):
+        cutoff = now - self.window_seconds
+        while self._requests and self._requests[0] < cutoff:
+            self._requests.popleft()
+        while self._retries and self._retries[0] < cutoff:
+            self._retries.popleft()
+
+    def record_request(self):
+        """첫 요청 기록"""
+        now = time.monotonic()
+        with self._lock:
+            self._trim(now)
+            self._requests.append(now)
+
+    def try_acquire(self) -> bool:
+        """재시도 1회 사용 (예산이 없으면 False)"""
+        now = time.monotonic()
+        with self._lock:
+            self._trim(now)
+            if len(self._retries) >= self.min_retries + self.ratio * len(self._requests):
+                self._rejected += 1
+                return False
+            self._retries.append(now)
+            return True
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            self._trim(time.monotonic())
+            return {
+                'requests_in_window': len(self._requests),
+                'retries_in_window': len(self._retries),
+                'rejected_retries': self._rejected,
+            }
+
+
+class RetryState:
+    """호출 1건의 재시도 진행 상태"""
+
+    def __init__(self, budget: RetryBudget, max_attempts: int, base_delay: float,
+                 max_delay: float, deadline: Optional[Deadline]):
+        self.budget = budget
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.attempt = 1
+        self._last_delay = base_delay
+        self.stop_reason: Optional[str] = None
+
+    def next_delay(self) -> Optional[float]:
+        """
+        다음 재시도까지 대기 시간 (decorrelated jitter)
+
+        Returns:
+        --------
+        Optional[float] : 대기 시간(초), 재시도하지 않아야 하면 None (stop_reason에 사유 기록)
+        """
+        if self.attempt >= self.max_attempts:
+            self.stop_reason = '최대 시도 횟수'
+            return None
+
+        delay = min(self.max_delay, random.uniform(self.base_delay, self._last_delay * 3))
+
+        if self.deadline is not None and delay >= self.deadline.remaining():
+            self.stop_reason = '데드라인'
+            return None
+
+        if not self.budget.try_acquire():
+            self.stop_reason = '재시도 예산'
+            return None
+
+        self._last_delay = max(delay, self.base_delay)
+        self.attempt += 1
+        return delay
+
+
+class RetryPolicy:
+    """모든 수집기가 공유하는 재시도 정책"""
+
+    def __init__(self,
+                 budget_ratio: float = 0.2,
+                 budget_min_retries: int = 10,
+                 budget_window_seconds: float = 10.0):
+        self.budget = RetryBudget(budget_ratio, budget_min_retries, budget_window_seconds)
+
+    def start(self, max_attempts: int, base_delay: float, max_delay: float) -> RetryState:
+        """호출 1건의 재시도 상태 생성 (첫 요청을 예산에 기록, 현재 데드라인 적용)"""
+        self.budget.record_request()
+        return RetryState(self.budget, max_attempts, base_delay, max_delay, current_deadline())
+
+
+# 프로세스 공유 재시도 정책
+_retry_policy: Optional[RetryPolicy] = None
+
+
+def get_retry_policy() -> RetryPolicy:
+    """공유 재시도 정책 반환 (최초 호출 시 환경변수 설정으로 생성)"""
+    global _retry_policy
+    if _retry_policy is None:
+        _retry_policy = RetryPolicy(
+            budget_ratio=float(os.getenv('RETRY_BUDGET_RATIO', 0.2)),
+            budget_min_retries=int(os.getenv('RETRY_BUDGET_MIN_RETRIES', 10)),
+            budget_window_seconds=float(os.getenv('RETRY_BUDGET_WINDOW_SECONDS', 10.0)),
+        )
+    return _retry_policy
+
+
 def retry_with_backoff(
     max_attempts: int = 5,
     base_delay: float = 1.0,
@@ -16,8 +216,8 @@ def retry_with_backoff(
     exceptions: Tuple[Type[Exception], ...] = (Exception,)
 ):
     """
-    지수 백오프를 사용한 재시도 데코레이터
-    
+    공유 재시도 정책을 사용한 재시도 데코레이터
+
     Parameters:
     -----------
     max_attempts : int
@@ -27,10 +227,10 @@ def retry_with_backoff(
     max_delay : float
         최대 대기 시간 (초, 기본값: 60.0)
     exponential_base : float
-        지수 백오프 베이스 (기본값: 2.0)
+        하위 호환용 (decorrelated jitter 사용으로 무시됨)
     exceptions : Tuple[Type[Exception], ...]
         재시도할 예외 타입 (기본값: 모든 예외)
-    
+
     Returns:
     --------
     Callable : 데코레이터 함수
@@ -38,33 +238,26 @@ def retry_with_backoff(
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            last_exception = None
-            
-            for attempt in range(1, max_attempts + 1):
+            retry = get_retry_policy().start(max_attempts, base_delay, max_delay)
+
+            while True:
                 try:
                     return func(*args, **kwargs)
                 except exceptions as e:
-                    last_exception = e
-                    
-                    if attempt < max_attempts:
-                        # 지수 백오프 계산
-                        delay = min(base_delay * (exponential_base ** (attempt - 1)), max_delay)
-                        
-                        logger.warning(
-                            f"⚠️ {func.__name__} 실패 (시도 {attempt}/{max_attempts}): {e}"
-                        )
-                        logger.info(f"   {delay:.1f}초 후 재시도...")
-                        time.sleep(delay)
-                    else:
+                    delay = retry.next_delay()
+
+                    if delay is None:
                         logger.error(
-                            f"❌ {func.__name__} 최대 재시도 횟수 초과 ({max_attempts}회)"
+                            f"❌ {func.__name__} 재시도 중단 ({retry.stop_reason}, 시도 {retry.attempt}/{max_attempts})"
                         )
                         raise
-            
-            # 모든 재시도 실패
-            if last_exception:
-                raise last_exception
-            
+
+                    logger.warning(
+                        f"⚠️ {func.__name__} 실패 (시도 {retry.attempt - 1}/{max_attempts}): {e}"
+                    )
+                    logger.info(f"   {delay:.1f}초 후 재시도...")
+                    time.sleep(delay)
+
         return wrapper
     return decorator
 
@@ -77,8 +270,8 @@ def retry_on_http_error(
     retry_status_codes: Tuple[int, ...] = (500, 502, 503, 504)
 ):
     """
-    HTTP 에러 발생 시 재시도하는 데코레이터 (특히 502 Bad Gateway 등)
-    
+    HTTP 에러 발생 시 재시도하는 데코레이터 (특히 502 Bad Gateway 등, 공유 재시도 정책 사용)
+
     Parameters:
     -----------
     max_attempts : int
@@ -88,10 +281,10 @@ def retry_on_http_error(
     max_delay : float
         최대 대기 시간 (초, 기본값: 60.0)
     exponential_base : float
-        지수 백오프 베이스 (기본값: 2.0)
+        하위 호환용 (decorrelated jitter 사용으로 무시됨)
     retry_status_codes : Tuple[int, ...]
         재시도할 HTTP 상태 코드 (기본값: 500, 502, 503, 504)
-    
+
     Returns:
     --------
     Callable : 데코레이터 함수
@@ -100,40 +293,31 @@ def retry_on_http_error(
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
             import requests
-            
-            last_exception = None
-            
-            for attempt in range(1, max_attempts + 1):
+
+            retry = get_retry_policy().start(max_attempts, base_delay, max_delay)
+
+            while True:
                 try:
                     return func(*args, **kwargs)
                 except requests.exceptions.HTTPError as e:
-                    last_exception = e
-                    
-                    status_code = e.response.status_code if hasattr(e, 'response') else None
-                    
-                    if status_code in retry_status_codes and attempt < max_attempts:
-                        # 지수 백오프 계산
-                        delay = min(base_delay * (exponential_base ** (attempt - 1)), max_delay)
-                        
-                        logger.warning(
-                            f"⚠️ {func.__name__} HTTP {status_code} 에러 (시도 {attempt}/{max_attempts})"
+                    status_code = e.response.status_code if getattr(e, 'response', None) is not None else None
+
+                    # 재시도하지 않을 에러
+                    if status_code not in retry_status_codes:
+                        raise
+
+                    delay = retry.next_delay()
+                    if delay is None:
+                        logger.error(
+                            f"❌ {func.__name__} 재시도 중단 ({retry.stop_reason}, 시도 {retry.attempt}/{max_attempts})"
                         )
-                        logger.info(f"   {delay:.1f}초 후 재시도...")
-                        time.sleep(delay)
-                    else:
-                        # 재시도하지 않을 에러이거나 최대 재시도 횟수 초과
-                        if attempt >= max_attempts:
-                            logger.error(
-                                f"❌ {func.__name__} 최대 재시도 횟수 초과 ({max_attempts}회)"
-                            )
                         raise
-                except Exception as e:
-                    # HTTP 에러가 아닌 경우 즉시 재발
-                    raise
-            
-            # 모든 재시도 실패
-            if last_exception:
-                raise last_exception
-            
+
+                    logger.warning(
+                        f"⚠️ {func.__name__} HTTP {status_code} 에러 (시도 {retry.attempt - 1}/{max_attempts})"
+                    )
+                    logger.info(f"   {delay:.1f}초 후 재시도...")
+                    time.sleep(delay)
+
         return wrapper
     return decorator
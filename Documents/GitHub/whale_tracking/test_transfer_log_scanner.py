@@ -0,0 +1,287 @@
+# test_transfer_log_scanner.py
+# Transfer 로그 스캐너를 로컬 RPC 스텁으로 테스트 (외부 네트워크/API 키 불필요)
+
+import os
+import sys
+import json
+import threading
+import time
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 경로 설정
+PROJECT_ROOT = Path(__file__).parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# 테스트 중 가격 캐시 스냅샷 저장 안 함
+os.environ.setdefault('PRICE_CACHE_SNAPSHOT_PATH', '')
+# 일시적 오류 재시도 대기를 짧게
+os.environ.setdefault('TRANSFER_SCAN_RETRY_BASE_DELAY', '0.01')
+os.environ.setdefault('TRANSFER_SCAN_RETRY_MAX_DELAY', '0.05')
+
+# 모듈 import
+from src.utils.logger import logger
+from src.collectors.transfer_log_scanner import TransferLogScanner, TRANSFER_TOPIC
+
+USDT = '0xdac17f958d2ee523a2206206994597c13d831ec7'
+LATEST_BLOCK = 1200
+MAX_LOG_BLOCK_RANGE = 100  # 스텁 노드의 eth_getLogs 블록 범위 제한
+BLOCK_TIME = 12
+GENESIS_TIMESTAMP = 1_700_000_000
+SLOW_RESPONSE_SECONDS = 0.5  # 'timeout' 장애의 응답 지연 (스캐너 타임아웃보다 길게)
+
+
+def _topic(address: str) -> str:
+    return '0x' + '0' * 24 + address[2:]
+
+
+def _make_logs():
+    """블록 10개마다 고래(100만 USDT) 1건 + 소액 거래 + 제외 대상 로그 생성"""
+    logs = []
+    for block in range(0, LATEST_BLOCK + 1):
+        if block % 10 == 0:
+            logs.append({
+                'address': USDT,
+                'topics': [TRANSFER_TOPIC, _topic('0x' + '1' * 40), _topic('0x' + '2' * 40)],
+                'data': hex(1_000_000 * 10**6),
+                'blockNumber': hex(block),
+                'transactionHash': '0x%064x' % block,
+                'removed': False,
+            })
+        if block % 3 == 0:
+            logs.append({
+                'address': USDT,
+                'topics': [TRANSFER_TOPIC, _topic('0x' + '3' * 40), _topic('0x' + '4' * 40)],
+                'data': hex(10 * 10**6),
+                'blockNumber': hex(block),
+                'transactionHash': '0x%064x' % (10**6 + block),
+                'removed': False,
+            })
+        if block % 50 == 0:
+            # ERC-721 Transfer (topics 4개) - 제외 대상
+            logs.append({
+                'address': USDT,
+                'topics': [TRANSFER_TOPIC, _topic('0x' + '5' * 40), _topic('0x' + '6' * 40), '0x' + '0' * 63 + '1'],
+                'data': '0x',
+                'blockNumber': hex(block),
+                'transactionHash': '0x%064x' % (2 * 10**6 + block),
+                'removed': False,
+            })
+    return logs
+
+
+class _StubRpcHandler(BaseHTTPRequestHandler):
+    """eth_blockNumber / eth_getLogs / eth_getBlockByNumber만 지원하는 JSON-RPC 스텁"""
+
+    logs = _make_logs()
+    get_logs_calls = []
+    # 다음 eth_getLogs 요청들에 차례로 적용할 장애 ('http_429' | 'rpc_rate_limit' | 'timeout')
+    faults = []
+    # eth_getBlockByNumber가 null을 돌려주는 블록 (아직 동기화되지 않은 노드 흉내)
+    missing_blocks = set()
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, response, headers=None):
+        payload = json.dumps(response).encode()
+        try:
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(payload)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # 타임아웃으로 클라이언트가 먼저 끊은 경우
+
+    def _handle(self, request):
+        method, params = request['method'], request.get('params', [])
+        result = None
+
+        if method == 'eth_blockNumber':
+            result = hex(LATEST_BLOCK)
+        elif method == 'eth_getLogs':
+            from_block, to_block = int(params[0]['fromBlock'], 16), int(params[0]['toBlock'], 16)
+            self.get_logs_calls.append((from_block, to_block))
+            if to_block - from_block + 1 > MAX_LOG_BLOCK_RANGE:
+                return {'jsonrpc': '2.0', 'id': request['id'],
+                        'error': {'code': -32005, 'message': 'query returned more than 10000 results'}}
+            addresses = {a.lower() for a in params[0]['address']}
+            result = [log for log in self.logs
+                      if from_block <= int(log['blockNumber'], 16) <= to_block and log['address'] in addresses]
+        elif method == 'eth_getBlockByNumber':
+            block = int(params[0], 16)
+            if block not in self.missing_blocks:
+                result = {'number': params[0], 'timestamp': hex(GENESIS_TIMESTAMP + block * BLOCK_TIME)}
+
+        return {'jsonrpc': '2.0', 'id': request['id'], 'result': result}
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        if isinstance(body, list):
+            response = [self._handle(item) for item in body]
+        else:
+            if body['method'] == 'eth_getLogs' and self.faults:
+                fault = self.faults.pop(0)
+                self.get_logs_calls.append(fault)
+                if fault == 'http_429':
+                    self._send(429, {'error': 'Too Many Requests'}, {'Retry-After': '0'})
+                    return
+                if fault == 'rpc_rate_limit':
+                    self._send(200, {'jsonrpc': '2.0', 'id': body['id'],
+                                     'error': {'code': -32005, 'message': 'project ID request rate exceeded'}})
+                    return
+                if fault == 'timeout':
+                    # 스캐너가 먼저 타임아웃으로 끊으므로 응답은 버려짐
+                    time.sleep(SLOW_RESPONSE_SECONDS)
+                    self._send(200, {'jsonrpc': '2.0', 'id': body['id'], 'result': []})
+                    return
+            response = self._handle(body)
+
+        self._send(200, response)
+
+
+def _start_stub(faults=None, missing_blocks=(), logs=None):
+    """스텁 노드 시작 (호출 기록 초기화, faults는 앞쪽 eth_getLogs 요청부터 적용)"""
+    _StubRpcHandler.get_logs_calls = []
+    _StubRpcHandler.faults = list(faults or [])
+    _StubRpcHandler.missing_blocks = set(missing_blocks)
+    _StubRpcHandler.logs = logs if logs is not None else _make_logs()
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _StubRpcHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _covered_blocks():
+    """제한 이내로 성공한 eth_getLogs 요청이 덮은 블록 (장애 응답 제외)"""
+    calls = [call for call in _StubRpcHandler.get_logs_calls if isinstance(call, tuple)]
+    return sorted(b for a, z in calls if z - a + 1 <= MAX_LOG_BLOCK_RANGE for b in range(a, z + 1))
+
+
+def test_transfer_log_scanner():
+    """Transfer 로그 스캐너 테스트 (적응형 블록 범위, 일괄 디코딩, USD 고래 판정)"""
+
+    logger.info("=" * 60)
+    logger.info("🧪 Transfer 로그 스캐너 테스트 (로컬 RPC 스텁)")
+    logger.info("=" * 60)
+
+    server = _start_stub()
+
+    try:
+        scanner = TransferLogScanner(
+            chain='ethereum',
+            rpc_url=f"http://127.0.0.1:{server.server_address[1]}",
+            tokens={USDT: 'USDT'},
+            min_whale_usd=50_000,
+            block_range=1000,
+        )
+
+        whales = scanner.scan_recent(LATEST_BLOCK + 1)
+        logger.info(f"\n✅ 고래 거래 {len(whales)}건 탐지, eth_getLogs {len(_StubRpcHandler.get_logs_calls)}회 호출")
+
+        # 블록 10개마다 1건씩 고래 거래 (0 ~ 1200)
+        assert len(whales) == LATEST_BLOCK // 10 + 1
+        assert all(tx['amount'] == 1_000_000 and tx['amount_usd'] == 1_000_000 for tx in whales)
+        assert all(tx['coin_symbol'] == 'USDT' and tx['contract_address'] == USDT for tx in whales)
+        assert all(tx['from_address'] == '0x' + '1' * 40 and tx['to_address'] == '0x' + '2' * 40 for tx in whales)
+        assert all(tx['whale_category'] == 'WHALE' for tx in whales)
+
+        # 노드 제한을 넘는 요청은 범위를 줄여 재시도하고, 성공한 요청은 모두 제한 이내
+        assert _covered_blocks() == list(range(0, LATEST_BLOCK + 1)), "블록 구간이 빠짐없이/중복 없이 스캔되어야 합니다"
+
+        # 블록 타임스탬프 확인
+        sample = next(tx for tx in whales if tx['block_number'] == 100)
+        logger.info(f"\n📊 샘플: {sample['tx_hash'][:20]}... {sample['amount']:,.0f} {sample['coin_symbol']} "
+                    f"(${sample['amount_usd']:,.0f}) @ {sample['block_timestamp']}")
+
+        logger.info("\n" + "=" * 60)
+        logger.info("✅ 테스트 완료!")
+        logger.info("=" * 60)
+
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _scan_with_faults(faults=None, request_timeout=30.0, missing_blocks=(), logs=None):
+    """장애를 주입한 스텁으로 전체 구간 스캔 → (고래 거래, 스캐너)"""
+    server = _start_stub(faults, missing_blocks, logs)
+    try:
+        scanner = TransferLogScanner(
+            chain='ethereum',
+            rpc_url=f"http://127.0.0.1:{server.server_address[1]}",
+            tokens={USDT: 'USDT'},
+            min_whale_usd=50_000,
+            block_range=MAX_LOG_BLOCK_RANGE,
+            request_timeout=request_timeout,
+        )
+        return scanner.scan(0, LATEST_BLOCK), scanner
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_rate_limit_does_not_shrink_range():
+    """HTTP 429와 JSON-RPC rate limit 오류는 대기 후 같은 구간 재시도 (블록 범위/상한 유지)"""
+    logger.info("🧪 Transfer 로그 스캐너 rate limit 테스트")
+
+    faults = ['http_429', 'rpc_rate_limit', 'http_429']
+    whales, scanner = _scan_with_faults(faults)
+
+    assert _StubRpcHandler.faults == [], "주입한 장애가 모두 소진되어야 합니다"
+    assert len(whales) == LATEST_BLOCK // 10 + 1
+    # 상한은 노드의 실제 범위 제한(범위를 늘리다 걸린 값)까지만 내려감 - rate limit으로 줄어들지 않음
+    assert scanner._range_ceiling >= MAX_LOG_BLOCK_RANGE, "rate limit은 블록 범위 상한을 낮추면 안 됩니다"
+    assert _covered_blocks() == list(range(0, LATEST_BLOCK + 1))
+    logger.info("✅ rate limit 재시도 통과")
+
+
+def test_timeout_does_not_shrink_range():
+    """요청 타임아웃은 블록 범위를 줄이지 않고 같은 구간 재시도"""
+    logger.info("🧪 Transfer 로그 스캐너 타임아웃 테스트")
+
+    whales, scanner = _scan_with_faults(['timeout', 'timeout'], request_timeout=0.2)
+
+    assert len(whales) == LATEST_BLOCK // 10 + 1
+    assert scanner._range_ceiling >= MAX_LOG_BLOCK_RANGE, "타임아웃은 블록 범위 상한을 낮추면 안 됩니다"
+    assert _covered_blocks() == list(range(0, LATEST_BLOCK + 1))
+    logger.info("✅ 타임아웃 재시도 통과")
+
+
+def test_missing_block_timestamp_skips_rows():
+    """타임스탬프를 못 얻은 블록의 로그만 제외하고 나머지 스캔은 계속"""
+    logger.info("🧪 Transfer 로그 스캐너 블록 타임스탬프 누락 테스트")
+
+    whales, _ = _scan_with_faults(missing_blocks={100, 500})
+
+    assert len(whales) == LATEST_BLOCK // 10 + 1 - 2
+    assert {tx['block_number'] for tx in whales}.isdisjoint({100, 500})
+    assert _covered_blocks() == list(range(0, LATEST_BLOCK + 1))
+    logger.info("✅ 타임스탬프 누락 로그 제외 통과")
+
+
+def test_parse_failure_skips_range():
+    """한 구간의 로그 디코딩이 실패해도 예외가 전파되지 않고 다음 구간부터 계속 스캔"""
+    logger.info("🧪 Transfer 로그 스캐너 파싱 실패 테스트")
+
+    logs = _make_logs()
+    broken = next(log for log in logs if log['blockNumber'] == hex(550) and log['data'] == hex(1_000_000 * 10**6))
+    del broken['transactionHash']  # 고래 행 생성 중 KeyError
+
+    whales, _ = _scan_with_faults(logs=logs)
+
+    blocks = {tx['block_number'] for tx in whales}
+    assert 550 not in blocks
+    assert {0, LATEST_BLOCK} <= blocks, "실패한 구간 앞뒤 구간은 그대로 스캔되어야 합니다"
+    assert _covered_blocks() == list(range(0, LATEST_BLOCK + 1))
+    logger.info(f"✅ 파싱 실패 구간만 건너뜀 (고래 거래 {len(whales)}건)")
+
+
+if __name__ == '__main__':
+    test_transfer_log_scanner()
+    test_rate_limit_does_not_shrink_range()
+    test_timeout_does_not_shrink_range()
+    test_missing_block_timestamp_skips_rows()
+    test_parse_failure_skips_range()
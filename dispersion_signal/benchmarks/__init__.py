@@ -0,0 +1,4 @@
+"""
+오프라인 벤치마크 모음 (합성 데이터 기반, 네트워크 불필요)
+실행: python benchmarks/run_benchmarks.py --help
+"""
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Dispersion Signal - 핫 경로 벤치마크
+분산도 계산, 가격 이상치 탐지, 캐시 관리자, HTML 파서(Coinness/Upbit DataLab/DigitalCoinPrice/
+CoinPriceForecast), 심볼 추출, DB 행 변환, JSON 인코딩/디코딩(Binance 전체 티커, Etherscan 거래 페이지,
+DB 행/백업 페이로드), 백업 파일 생성/검증/복구를 합성 데이터로 오프라인 측정하고 저장된 기준선과 비교
+(--html-dir에 저장한 실제 페이지가 있으면 해당 HTML 벤치마크는 그 페이지로 측정)
+"""
+import argparse
+import gzip
+import json
+import logging
+import sys
+import os
+import tempfile
+from datetime import datetime
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from typing import Callable, List, Optional, Tuple
+
+from analysis.dispersion_calculator import DispersionCalculator
+from utils.data_quality import DataQualityValidator
+from collectors.coinness import CoinnessNewsCollector
+from collectors.upbit_datalab import UpbitDataLabCollector
+from collectors.digitalcoinprice import DigitalCoinPriceCollector
+from collectors.coinpriceforecast import CoinPriceForecastCollector
+from utils import html_parser
+from utils.entity_extractor import get_symbol_extractor
+from utils import json_codec
+from utils.backup import BackupReader, BackupWriter
+from database.models_phase4 import MultiSourcePrice
+from database.serialization import construct_trusted, to_rows
+from benchmarks import synthetic
+from benchmarks.harness import (
+    BenchmarkResult, run_case, results_to_json, save_results, load_results, compare_to_baseline, format_table
+)
+
+# CacheManager는 aiohttp가 필요 (async_collector 모듈 import 시)
+try:
+    from utils.async_collector import CacheManager, CacheConfig
+    CACHE_AVAILABLE = True
+except ImportError:
+    CACHE_AVAILABLE = False
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+# --html-dir에서 찾는 저장 페이지 파일명 (없으면 합성 페이지 사용)
+RECORDED_PAGES = ['coinness.html', 'upbit_insights.html', 'upbit_market.html',
+                  'digitalcoinprice.html', 'coinpriceforecast.html']
+
+# 검증 실패 경고 등 측정 대상 코드의 로그 출력은 억제
+bench_logger = logging.getLogger('benchmark')
+bench_logger.setLevel(logging.ERROR)
+
+
+def parse_arguments():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(
+        description='핫 경로 오프라인 벤치마크',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  python benchmarks/run_benchmarks.py
+  python benchmarks/run_benchmarks.py --quick --filter html
+  python benchmarks/run_benchmarks.py --filter html --html-dir ./recorded_pages
+  python benchmarks/run_benchmarks.py --save-baseline
+  python benchmarks/run_benchmarks.py --fail-on-regression --tolerance 0.3
+        """
+    )
+
+    parser.add_argument('--symbols', type=int, default=500, help='합성 심볼 수 (기본값: 500)')
+    parser.add_argument('--sources', type=int, default=6, help='심볼당 가격 소스 수 (기본값: 6)')
+    parser.add_argument('--articles', type=int, default=300, help='HTML 페이지당 기사/카드 수 (기본값: 300)')
+    parser.add_argument('--repeats', type=int, default=5, help='측정 반복 횟수 (기본값: 5)')
+    parser.add_argument('--seed', type=int, default=42, help='합성 데이터 시드 (기본값: 42)')
+    parser.add_argument('--html-dir', type=str,
+                        help=f'저장한 실제 페이지 디렉토리 ({", ".join(RECORDED_PAGES)} 중 있는 것만 사용)')
+    parser.add_argument('--quick', action='store_true', help='작은 입력으로 빠르게 실행 (스모크 테스트용)')
+    parser.add_argument('--filter', type=str, help='이름에 이 문자열이 포함된 벤치마크만 실행')
+    parser.add_argument('--baseline', type=str, default=DEFAULT_BASELINE, help='기준선 JSON 경로')
+    parser.add_argument('--save-baseline', action='store_true', help='이번 결과를 기준선으로 저장')
+    parser.add_argument('--output', type=str, help='이번 결과를 저장할 JSON 경로')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='허용 소요 시간/메모리 증가율 (기본값: 0.25)')
+    parser.add_argument('--fail-on-regression', action='store_true', help='회귀가 있으면 종료 코드 1')
+
+    args = parser.parse_args()
+    if args.quick:
+        args.symbols, args.articles, args.repeats = 50, 30, 2
+    return args
+
+
+def load_recorded_page(html_dir: Optional[str], filename: str) -> Optional[str]:
+    """--html-dir에 저장된 실제 페이지 (없으면 None)"""
+    if not html_dir:
+        return None
+    path = os.path.join(html_dir, filename)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        return f.read()
+
+
+def full_tree(func: Callable[[], object]) -> Callable[[], object]:
+    """대상 서브트리 파싱을 끄고 func 실행 (전체 트리 파싱 비교용)"""
+    def run():
+        previous = html_parser.PARSE_TARGETS_ONLY
+        html_parser.PARSE_TARGETS_ONLY = False
+        try:
+            return func()
+        finally:
+            html_parser.PARSE_TARGETS_ONLY = previous
+    return run
+
+
+def legacy_rows(records: List[dict]) -> List[dict]:
+    """기존 insert 경로: 검증 생성 + .dict() + 필드별 Decimal/datetime 변환 루프 (비교용)"""
+    data = []
+    for record in records:
+        data_dict = MultiSourcePrice(**record).dict()
+        data_dict['crypto_id'] = str(data_dict['crypto_id'])
+        for key, value in data_dict.items():
+            if hasattr(value, '__class__') and value.__class__.__name__ == 'Decimal':
+                data_dict[key] = float(value)
+            elif isinstance(value, datetime):
+                data_dict[key] = value.isoformat()
+        data.append(data_dict)
+    return data
+
+
+def legacy_backup_create(path: str, data: dict):
+    """기존 백업 생성: data_size 계산용 직렬화 + 들여쓰기 JSON 전체를 gzip 기본 레벨(9)로 (비교용)"""
+    backup_data = {'metadata': {'backup_type': 'full', 'version': '1.0', 'data_size': len(json.dumps(data))},
+                   'data': data}
+    with gzip.open(path, 'wt', encoding='utf-8') as f:
+        json.dump(backup_data, f, indent=2, ensure_ascii=False)
+
+
+def legacy_backup_verify(path: str) -> bool:
+    """기존 무결성 검증: 전체 압축 해제 + JSON 파싱 (비교용)"""
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        backup_data = json.load(f)
+    return 'metadata' in backup_data and 'data' in backup_data
+
+
+def chunked_backup_create(path: str, data: dict):
+    """청크 백업 생성 (DataBackupManager.create_backup과 같은 기록 방식)"""
+    writer = BackupWriter(path)
+    for key, value in data.items():
+        if isinstance(value, list):
+            writer.write_items(key, value)
+        else:
+            writer.write_value(key, value)
+    writer.close({'backup_type': 'full', 'version': '2.0'})
+
+
+def build_cases(args) -> List[Tuple[str, Callable[[], object], int]]:
+    """(이름, 측정 함수, 항목 수) 리스트 - 입력 데이터는 여기서 한 번만 생성"""
+    market = synthetic.generate_market_data(args.symbols, args.sources, args.seed)
+    rows = synthetic.generate_dispersion_rows(market, args.seed)
+    price_lists = [list(entry['prices'].values()) for entry in market.values()]
+    valid_price_lists = [[p for p in prices if p is not None] for prices in price_lists]
+
+    calculator = DispersionCalculator()
+    validator = DataQualityValidator(logger=bench_logger)
+
+    def price_dispersion():
+        for entry, prices in zip(market.values(), price_lists):
+            dispersion = calculator.calculate_price_dispersion(prices)
+            concentration = calculator.calculate_volume_concentration(entry['volumes'])
+            calculator.calculate_signal_level(dispersion, concentration, 0)
+
+    def market_summary():
+        calculator.calculate_market_dispersion_summary(rows)
+        calculator.get_top_dispersion_coins(rows, 10)
+        calculator.get_low_dispersion_coins(rows, 10)
+
+    def outliers(method):
+        def run():
+            for prices in valid_price_lists:
+                validator.detect_price_outliers(prices, method)
+        return run
+
+    def quality_report():
+        for symbol, entry in market.items():
+            prices = {source: price for source, price in entry['prices'].items() if price is not None}
+            validator.validate_price_data(prices, symbol)
+
+    cases = [
+        ('dispersion.price_dispersion', price_dispersion, len(market)),
+        ('dispersion.market_summary', market_summary, len(rows)),
+        ('quality.outliers_iqr', outliers('iqr'), len(market)),
+        ('quality.outliers_zscore', outliers('zscore'), len(market)),
+        ('quality.outliers_modified_zscore', outliers('modified_zscore'), len(market)),
+        ('quality.validate_price_data', quality_report, len(market)),
+    ]
+
+    if CACHE_AVAILABLE:
+        cache_dir = tempfile.mkdtemp(prefix='bench_cache_')
+        urls = [f'https://api.example.com/v1/coins/{symbol}' for symbol in market]
+        payloads = [{'symbol': s, 'prices': {k: str(v) for k, v in e['prices'].items()}} for s, e in market.items()]
+
+        def cache_set_get():
+            cache = CacheManager(CacheConfig(cache_directory=cache_dir, max_entries=len(urls) * 2),
+                                 logger=bench_logger)
+            for url, payload in zip(urls, payloads):
+                cache.set(url, payload, params={'vs': 'usd'})
+            for url in urls:
+                cache.get(url, params={'vs': 'usd'})
+                cache.get(url, params={'vs': 'krw'})  # 미스
+
+        cases.append(('cache.set_get', cache_set_get, len(urls) * 3))
+    else:
+        print("⚠️ aiohttp 미설치: cache.set_get 벤치마크 건너뜀")
+
+    coinness = CoinnessNewsCollector()
+    upbit = UpbitDataLabCollector()
+    digitalcoinprice = DigitalCoinPriceCollector()
+    coinpriceforecast = CoinPriceForecastCollector()
+    coinness_page = load_recorded_page(args.html_dir, 'coinness.html') or \
+        synthetic.generate_coinness_page(args.articles, args.seed)
+    insights_page = load_recorded_page(args.html_dir, 'upbit_insights.html') or \
+        synthetic.generate_upbit_insights_page(args.articles, args.seed)
+    market_page = load_recorded_page(args.html_dir, 'upbit_market.html') or \
+        synthetic.generate_upbit_market_page(args.articles // 3, args.articles, args.seed)
+    dcp_page = load_recorded_page(args.html_dir, 'digitalcoinprice.html') or \
+        synthetic.generate_digitalcoinprice_page(args.articles, args.seed)
+    cpf_page = load_recorded_page(args.html_dir, 'coinpriceforecast.html') or \
+        synthetic.generate_coinpriceforecast_page(args.articles, args.seed)
+    articles = coinness.parse_news_articles(coinness_page) or []
+
+    cases += [
+        ('html.coinness_parse_news', lambda: coinness.parse_news_articles(coinness_page), args.articles),
+        ('html.coinness_price_targets', lambda: coinness.extract_price_targets_from_news(articles), len(articles)),
+        ('html.upbit_parse_insights', lambda: upbit.parse_insights(insights_page), args.articles),
+        ('html.upbit_parse_market_indices', lambda: upbit.parse_market_indices(market_page), args.articles // 3),
+        ('html.upbit_parse_sector_analysis', lambda: upbit.parse_sector_analysis(market_page), args.articles),
+        ('html.digitalcoinprice_parse_targets',
+         lambda: digitalcoinprice.parse_price_targets(dcp_page, 'BTC'), args.articles),
+        ('html.coinpriceforecast_parse_predictions',
+         lambda: coinpriceforecast.parse_price_predictions(cpf_page, 'BTC'), args.articles),
+        # 대상 서브트리 파싱 대비 비교용: 전체 문서 트리 파싱 (HTML_PARSE_TARGETS_ONLY=false 동작)
+        ('html.coinness_parse_news.full_tree',
+         full_tree(lambda: coinness.parse_news_articles(coinness_page)), args.articles),
+        ('html.upbit_parse_insights.full_tree', full_tree(lambda: upbit.parse_insights(insights_page)), args.articles),
+        ('html.digitalcoinprice_parse_targets.full_tree',
+         full_tree(lambda: digitalcoinprice.parse_price_targets(dcp_page, 'BTC')), args.articles),
+        ('html.coinpriceforecast_parse_predictions.full_tree',
+         full_tree(lambda: coinpriceforecast.parse_price_predictions(cpf_page, 'BTC')), args.articles),
+    ]
+
+    extractor = get_symbol_extractor()
+    texts = [article['title'] + ' ' + (article['content'] or '') for article in articles]
+    cases.append(('text.symbol_extract_batch', lambda: extractor.extract_batch(texts), len(texts)))
+
+    records = synthetic.generate_multi_source_price_records(market, args.symbols * 10, args.seed)
+    cases += [
+        ('db.rows_validated_legacy', lambda: legacy_rows(records), len(records)),
+        ('db.rows_trusted_compiled',
+         lambda: to_rows([construct_trusted(MultiSourcePrice, **record) for record in records]), len(records)),
+    ]
+
+    # JSON 코덱 (JSON_BACKEND 자동 선택) 대비 비교용: 표준 json (.stdlib, requests의 response.json()과 같은 경로)
+    tickers_body = json.dumps(synthetic.generate_binance_tickers(args.symbols * 6, args.seed)).encode('utf-8')
+    etherscan_body = json.dumps(synthetic.generate_etherscan_txlist(args.symbols * 20, args.seed)).encode('utf-8')
+    db_rows = to_rows([construct_trusted(MultiSourcePrice, **record) for record in records])
+    cases += [
+        ('json.binance_tickers_decode', lambda: json_codec.loads(tickers_body), args.symbols * 6),
+        ('json.binance_tickers_decode.stdlib', lambda: json.loads(tickers_body.decode('utf-8')), args.symbols * 6),
+        ('json.etherscan_page_decode', lambda: json_codec.loads(etherscan_body), args.symbols * 20),
+        ('json.etherscan_page_decode.stdlib', lambda: json.loads(etherscan_body.decode('utf-8')), args.symbols * 20),
+        ('json.db_rows_encode', lambda: json_codec.dumps(db_rows), len(db_rows)),
+        ('json.db_rows_encode.stdlib', lambda: json.dumps(db_rows).encode('utf-8'), len(db_rows)),
+        # 백업: Decimal/UUID/datetime이 섞인 레코드, 들여쓰기 포함
+        ('json.backup_encode', lambda: json_codec.dumps({'data': records}, indent=True), len(records)),
+        ('json.backup_encode.stdlib',
+         lambda: json.dumps({'data': records}, default=json_codec.default, indent=2, ensure_ascii=False).encode('utf-8'),
+         len(records)),
+    ]
+
+    # 백업: DB 행 테이블 하나 (.legacy = 이전 JSON 단일 파일 형식)
+    backup_dir = tempfile.mkdtemp(prefix='bench_backup_')
+    backup_data = {'config': {'coins_count': args.symbols}, 'multi_source_prices': db_rows}
+    legacy_path = os.path.join(backup_dir, 'legacy.json.gz')
+    chunked_path = os.path.join(backup_dir, 'chunked.ndjson.gz')
+    legacy_backup_create(legacy_path, backup_data)
+    chunked_backup_create(chunked_path, backup_data)
+    cases += [
+        ('backup.create', lambda: chunked_backup_create(chunked_path, backup_data), len(db_rows)),
+        ('backup.create.legacy', lambda: legacy_backup_create(legacy_path, backup_data), len(db_rows)),
+        ('backup.verify', lambda: BackupReader(chunked_path).verify(), len(db_rows)),
+        ('backup.verify.legacy', lambda: legacy_backup_verify(legacy_path), len(db_rows)),
+        ('backup.restore_stream', lambda: sum(1 for _ in BackupReader(chunked_path).iter_records()), len(db_rows)),
+    ]
+    return cases
+
+
+def main():
+    """메인 실행 함수"""
+    args = parse_arguments()
+    params = {'symbols': args.symbols, 'sources': args.sources, 'articles': args.articles, 'seed': args.seed}
+
+    results: List[BenchmarkResult] = []
+    for name, func, items in build_cases(args):
+        if args.filter and args.filter not in name:
+            continue
+        results.append(run_case(name, func, items, repeats=args.repeats))
+        print(f"  ✓ {name}")
+
+    baseline = load_results(args.baseline)
+    if baseline is not None and baseline.get('params') != params:
+        print(f"⚠️ 기준선 입력 크기가 다름 ({baseline.get('params')}), 비교하지 않음")
+        baseline = None
+
+    print()
+    print(format_table(results, baseline))
+
+    payload = results_to_json(results, params)
+    if args.output:
+        save_results(args.output, payload)
+    if args.save_baseline:
+        save_results(args.baseline, payload)
+        print(f"\n💾 기준선 저장: {args.baseline}")
+        return
+
+    if baseline is None:
+        print(f"\nℹ️ 기준선 없음 ({args.baseline}) - --save-baseline으로 생성")
+        return
+
+    regressions = compare_to_baseline(results, baseline, args.tolerance, args.tolerance)
+    if not regressions:
+        print("\n✅ 기준선 대비 회귀 없음")
+        return
+
+    print(f"\n⚠️ 회귀 {len(regressions)}건")
+    for r in regressions:
+        print(f"  - {r.name} {r.metric}: {r.baseline:.6g} → {r.current:.6g} ({r.change * 100:+.1f}%)")
+    if args.fail_on_regression:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
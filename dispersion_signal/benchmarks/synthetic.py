@@ -0,0 +1,348 @@
+"""
+결정적 합성 데이터 생성기 (같은 seed → 같은 데이터)
+
+- 시장 데이터: 심볼 N개 × 소스 M개의 가격/거래량 (소스 간 편차, 가끔 None/이상치 포함)
+- DB 레코드: 시장 데이터로 만든 다중 소스 가격(MultiSourcePrice) 필드 값
+- API 응답: Binance 전체 티커(/api/v3/ticker/24hr), Etherscan 거래 목록 페이지(txlist) JSON 형태
+- HTML 페이지: Coinness 뉴스 목록, Upbit DataLab 지수/섹터/인사이트,
+  DigitalCoinPrice/CoinPriceForecast 예측 페이지 구조를 흉내 낸 문서
+"""
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Dict, List
+
+SOURCES = ['coincap', 'binance', 'coinpaprika', 'coingecko', 'cryptocompare', 'upbit', 'bithumb', 'kraken']
+
+_KNOWN_COINS = [
+    ('BTC', 'Bitcoin', '비트코인'), ('ETH', 'Ethereum', '이더리움'), ('SOL', 'Solana', '솔라나'),
+    ('XRP', 'Ripple', '리플'), ('DOGE', 'Dogecoin', '도지코인'), ('ADA', 'Cardano', '카르다노'),
+    ('AVAX', 'Avalanche', '아발란체'), ('LINK', 'Chainlink', '체인링크'), ('DOT', 'Polkadot', '폴카닷'),
+    ('ATOM', 'Cosmos', '코스모스'),
+]
+
+_HEADLINE_TEMPLATES = [
+    '{name} 가격 ${price:,} 목표, 분석가 "{days}일 내 {pct}% 상승 전망"',
+    '{symbol} breaks ${price:,} resistance as analysts target {pct}% rally',
+    '{name_ko} 고래 지갑 이동 포착… 시장 변동성 확대 우려',
+    '{symbol} 현물 ETF 자금 유입 {pct}% 증가, {name} 강세 지속',
+    '{name} 네트워크 업그레이드 앞두고 {symbol} 거래량 급증',
+]
+
+
+def _symbols(n_symbols: int) -> List[str]:
+    """알려진 코인 심볼 + SYM0001 형식 합성 심볼"""
+    known = [coin[0] for coin in _KNOWN_COINS]
+    return (known + [f'SYM{i:04d}' for i in range(n_symbols)])[:n_symbols]
+
+
+def generate_market_data(n_symbols: int, n_sources: int, seed: int = 42) -> Dict[str, Dict[str, Any]]:
+    """
+    심볼 × 소스 가격/거래량
+
+    Args:
+        n_symbols: 심볼 수
+        n_sources: 소스 수 (최대 len(SOURCES))
+        seed: 난수 시드
+
+    Returns:
+        {symbol: {'prices': {source: Decimal|None}, 'volumes': {source: Decimal}}}
+    """
+    rng = random.Random(seed)
+    sources = SOURCES[:n_sources]
+    data = {}
+    for symbol in _symbols(n_symbols):
+        base_price = 10 ** rng.uniform(-3, 5)
+        prices, volumes = {}, {}
+        for source in sources:
+            roll = rng.random()
+            if roll < 0.03:
+                price = None  # 소스 응답 없음
+            elif roll < 0.06:
+                price = base_price * rng.uniform(1.2, 2.0)  # 이상치
+            else:
+                price = base_price * (1 + rng.gauss(0, 0.004))
+            prices[source] = Decimal(str(round(price, 8))) if price is not None else None
+            volumes[source] = Decimal(str(round(rng.lognormvariate(14, 2), 2)))
+        data[symbol] = {'prices': prices, 'volumes': volumes}
+    return data
+
+
+def generate_dispersion_rows(market_data: Dict[str, Dict[str, Any]], seed: int = 42) -> List[Dict[str, Any]]:
+    """시장 요약 계산용 심볼별 분산도 행"""
+    rng = random.Random(seed)
+    return [
+        {
+            'symbol': symbol,
+            'price_dispersion': Decimal(str(round(rng.uniform(0, 5), 4))),
+            'signal_level': rng.randint(1, 5),
+        }
+        for symbol in market_data
+    ]
+
+
+def generate_multi_source_price_records(market_data: Dict[str, Dict[str, Any]], n_records: int,
+                                        seed: int = 42) -> List[Dict[str, Any]]:
+    """
+    MultiSourcePrice 필드 값 (main_phase4가 만드는 것과 같은 형태, 심볼을 돌아가며 시각만 다르게)
+
+    Args:
+        market_data: generate_market_data 결과
+        n_records: 레코드 수
+        seed: 난수 시드
+
+    Returns:
+        [{필드: 값}] (Decimal 가격, UUID crypto_id, timezone 있는 timestamp)
+    """
+    rng = random.Random(seed)
+    symbols = list(market_data)
+    crypto_ids = {symbol: uuid.UUID(int=rng.getrandbits(128)) for symbol in symbols}
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    records = []
+    for i in range(n_records):
+        symbol = symbols[i % len(symbols)]
+        prices = [p for p in market_data[symbol]['prices'].values() if p is not None][:3] or [Decimal(1)]
+        price_avg = sum(prices) / len(prices)
+        records.append({
+            'crypto_id': crypto_ids[symbol],
+            'timestamp': start + timedelta(minutes=i),
+            'coincap_price': prices[0],
+            'coinpaprika_price': prices[1] if len(prices) > 1 else None,
+            'coingecko_price': prices[2] if len(prices) > 2 else None,
+            'price_sources_count': len(prices),
+            'price_avg': price_avg,
+            'price_dispersion': (max(prices) - min(prices)) / price_avg * 100,
+            'raw_data': {'symbol': symbol, 'prices': [float(p) for p in prices]},
+        })
+    return records
+
+
+def generate_binance_tickers(n_tickers: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """
+    Binance 전체 티커 응답 (/api/v3/ticker/24hr 심볼 없이 호출, 가격/수량은 문자열 소수)
+
+    Args:
+        n_tickers: 티커 수 (실제 응답은 약 3000개, 2MB 안팎)
+        seed: 난수 시드
+
+    Returns:
+        티커 딕셔너리 리스트 (mock_api 픽스처와 같은 필드)
+    """
+    rng = random.Random(seed)
+    quotes = ['USDT', 'BTC', 'ETH', 'BNB', 'FDUSD', 'TRY']
+    bases = _symbols(-(-n_tickers // len(quotes)))  # 기준 자산 × 견적 자산 조합
+    close_time = 1729286399999
+    tickers = []
+    for i in range(n_tickers):
+        last = 10 ** rng.uniform(-4, 5)
+        open_price = last * (1 + rng.gauss(0, 0.03))
+        volume = rng.lognormvariate(10, 2)
+        first_id = rng.randint(1, 3_000_000_000)
+        count = rng.randint(0, 1_000_000)
+        tickers.append({
+            'symbol': bases[i % len(bases)] + quotes[i // len(bases)],
+            'priceChange': f'{last - open_price:.8f}',
+            'priceChangePercent': f'{(last - open_price) / open_price * 100:.3f}',
+            'weightedAvgPrice': f'{(last + open_price) / 2:.8f}',
+            'prevClosePrice': f'{open_price:.8f}',
+            'lastPrice': f'{last:.8f}',
+            'lastQty': f'{rng.uniform(0, 100):.8f}',
+            'bidPrice': f'{last * 0.9999:.8f}',
+            'bidQty': f'{rng.uniform(0, 100):.8f}',
+            'askPrice': f'{last * 1.0001:.8f}',
+            'askQty': f'{rng.uniform(0, 100):.8f}',
+            'openPrice': f'{open_price:.8f}',
+            'highPrice': f'{max(last, open_price) * 1.02:.8f}',
+            'lowPrice': f'{min(last, open_price) * 0.98:.8f}',
+            'volume': f'{volume:.8f}',
+            'quoteVolume': f'{volume * last:.8f}',
+            'openTime': close_time - 86_399_999,
+            'closeTime': close_time,
+            'firstId': first_id,
+            'lastId': first_id + count,
+            'count': count,
+        })
+    return tickers
+
+
+def generate_etherscan_txlist(n_rows: int, seed: int = 42) -> Dict[str, Any]:
+    """
+    Etherscan 거래 목록 응답 한 페이지 (module=account&action=txlist, 최대 offset=10000행)
+
+    Args:
+        n_rows: 행 수
+        seed: 난수 시드
+
+    Returns:
+        {'status', 'message', 'result': [거래]} (모든 값이 문자열, mock_api 픽스처와 같은 필드)
+    """
+    rng = random.Random(seed)
+    addresses = ['0x' + f'{rng.getrandbits(160):040x}' for _ in range(max(2, n_rows // 20))]
+    result = []
+    for i in range(n_rows):
+        block = 18_500_000 + i // 3
+        transfer = rng.random() < 0.7
+        result.append({
+            'blockNumber': str(block),
+            'timeStamp': str(1_700_000_000 + i * 4),
+            'hash': '0x' + f'{rng.getrandbits(256):064x}',
+            'nonce': str(rng.randint(0, 5000)),
+            'blockHash': '0x' + f'{rng.getrandbits(256):064x}',
+            'transactionIndex': str(rng.randint(0, 300)),
+            'from': rng.choice(addresses),
+            'to': rng.choice(addresses),
+            'value': str(rng.getrandbits(70)) if transfer else '0',
+            'gas': str(rng.randint(21_000, 500_000)),
+            'gasPrice': str(rng.randint(5, 80) * 1_000_000_000),
+            'isError': '0' if rng.random() > 0.02 else '1',
+            'txreceipt_status': '1',
+            'input': '0x' if transfer else '0xa9059cbb' + f'{rng.getrandbits(512):0128x}',
+            'contractAddress': '',
+            'cumulativeGasUsed': str(rng.randint(21_000, 15_000_000)),
+            'gasUsed': str(rng.randint(21_000, 300_000)),
+            'confirmations': str(rng.randint(1, 100_000)),
+        })
+    return {'status': '1', 'message': 'OK', 'result': result}
+
+
+def _headline(rng: random.Random) -> Dict[str, str]:
+    symbol, name, name_ko = rng.choice(_KNOWN_COINS)
+    template = rng.choice(_HEADLINE_TEMPLATES)
+    return {
+        'symbol': symbol,
+        'title': template.format(symbol=symbol, name=name, name_ko=name_ko,
+                                 price=rng.randint(1, 200) * 1000, days=rng.choice([7, 30, 90]),
+                                 pct=rng.randint(5, 80)),
+        'body': f'{name}({symbol}) 관련 시장 분석. 지지선 ${rng.randint(1, 100) * 100:,}, '
+                f'저항선 ${rng.randint(100, 300) * 100:,}. ' * rng.randint(1, 4),
+    }
+
+
+def _page(body: List[str]) -> str:
+    """공통 레이아웃 (내비게이션/스크립트 등 파서가 건너뛰어야 할 잡음 포함)"""
+    chrome = [
+        '<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8"><title>bench</title>',
+        '<script>window.__STATE__ = {"a": 1, "b": [1, 2, 3]};</script>',
+        '<link rel="stylesheet" href="/static/app.css"></head><body>',
+        '<nav class="gnb"><ul>' + ''.join(f'<li><a href="/menu/{i}">메뉴 {i}</a></li>' for i in range(20)) + '</ul></nav>',
+    ]
+    return '\n'.join(chrome + body + ['<footer class="footer">© bench</footer></body></html>'])
+
+
+def generate_coinness_page(n_articles: int, seed: int = 42) -> str:
+    """Coinness 뉴스 목록 페이지"""
+    rng = random.Random(seed)
+    body = ['<main class="news-list">']
+    for i in range(n_articles):
+        item = _headline(rng)
+        body.append(
+            f'<article class="news-item" data-id="{i}">'
+            f'<h3 class="news-title"><a class="title" href="/news/{100000 + i}">{item["title"]}</a></h3>'
+            f'<div class="news-summary"><p class="summary">{item["body"]}</p></div>'
+            f'<span class="news-date">2025-0{rng.randint(1, 9)}-{rng.randint(10, 28)} {rng.randint(10, 23)}:00</span>'
+            f'<div class="tags">' + ''.join(f'<span class="tag">#{t}</span>' for t in ('코인', item['symbol'])) + '</div>'
+            '</article>'
+        )
+    body.append('</main>')
+    return _page(body)
+
+
+def generate_upbit_insights_page(n_insights: int, seed: int = 42) -> str:
+    """Upbit DataLab 인사이트 페이지"""
+    rng = random.Random(seed)
+    body = ['<section class="insight-list">']
+    for i in range(n_insights):
+        item = _headline(rng)
+        body.append(
+            f'<div class="insight-card">'
+            f'<h4 class="insight-title">{item["title"]}</h4>'
+            f'<div class="insight-description">{item["body"]}</div>'
+            f'<a href="/insights/{i}">자세히 보기</a>'
+            '</div>'
+        )
+    body.append('</section>')
+    return _page(body)
+
+
+def generate_upbit_market_page(n_indices: int, n_sectors: int, seed: int = 42) -> str:
+    """Upbit DataLab 시장 지수 + 섹터 분석 페이지"""
+    rng = random.Random(seed)
+    body = ['<div class="market-indices">']
+    for i in range(n_indices):
+        body.append(
+            f'<div class="index-item">업비트{i} 지수 {rng.uniform(1000, 20000):,.2f} '
+            f'{rng.uniform(-5, 5):.2f}</div>'
+        )
+    body.append('</div><section class="sector-analysis">')
+    for i in range(n_sectors):
+        metric = rng.choice(['거래대금', '시가총액'])
+        body.append(
+            f'<div class="sector-chart">섹터 {i}\n{metric} {rng.randint(1, 900):,}억 {rng.uniform(0, 40):.2f}%\n'
+            f'기타 {rng.randint(1, 100)}</div>'
+        )
+    body.append('</section>')
+    return _page(body)
+
+
+def _page_noise(rng: random.Random, n_blocks: int) -> List[str]:
+    """실제 예측 페이지의 비대상 요소 (관련 코인 표, 댓글, 광고 슬롯) - 대상 서브트리 파싱이 건너뛰는 부분"""
+    blocks = []
+    for i in range(n_blocks):
+        coin = rng.choice(_KNOWN_COINS)
+        blocks.append(
+            f'<aside class="sidebar-related"><h5>{coin[1]} 관련</h5><ul>'
+            + ''.join(f'<li><a href="/coin/{c[0].lower()}">{c[1]}</a> <em>{rng.uniform(-9, 9):.2f}%</em></li>'
+                      for c in rng.sample(_KNOWN_COINS, 5))
+            + '</ul></aside>'
+            f'<div class="comment"><b>user{rng.randint(1, 9999)}</b><p>{_headline(rng)["body"]}</p></div>'
+            f'<div class="ad-slot" id="ad-{i}"><img src="/ads/{i}.png" alt=""></div>'
+        )
+    return blocks
+
+
+def generate_digitalcoinprice_page(n_rows: int, seed: int = 42) -> str:
+    """DigitalCoinPrice 예측 페이지 (현재가, 기간별 예측 섹션, 예측 카드, 분석 섹션 + 비대상 요소)"""
+    rng = random.Random(seed)
+    price = rng.uniform(10, 60000)
+    timeframes = ['Short term', 'Medium term', 'Long term', '1 month', '3 month', '6 month', '1 year', '2025', '2026']
+    body = [f'<div class="coin-header"><span class="price">${price:,.2f}</span></div>']
+    for i in range(n_rows):
+        timeframe = timeframes[i % len(timeframes)]
+        body.append(
+            f'<section class="forecast-block"><h3>{timeframe} forecast</h3>'
+            f'<table><tr><td>{timeframe}</td><td class="target-price">${price * rng.uniform(0.7, 2.5):,.2f}</td></tr></table>'
+            '</section>'
+        )
+        if i % 3 == 0:
+            body.append(
+                f'<div class="prediction-card">Current ${price:,.2f} → {timeframe} target '
+                f'${price * rng.uniform(0.8, 2.0):,.2f}</div>'
+                f'<div class="analysis-note">{_headline(rng)["body"]}</div>'
+            )
+    body += _page_noise(rng, n_rows * 2)
+    return _page(body)
+
+
+def generate_coinpriceforecast_page(n_rows: int, seed: int = 42) -> str:
+    """CoinPriceForecast 예측 페이지 (현재가, 예측 테이블 행, 연도별 전망/기술적 분석 섹션 + 비대상 요소)"""
+    rng = random.Random(seed)
+    price = rng.uniform(10, 60000)
+    labels = ['1 month', '3 months', '6 months', '1 year', 'end of 2025', '2026', '2027']
+    body = [f'<div class="current-price">${price:,.2f}</div><table class="prediction-table">']
+    for i in range(n_rows):
+        body.append(
+            f'<tr class="row"><td>{labels[i % len(labels)]}</td>'
+            f'<td>${price * rng.uniform(0.7, 3.0):,.2f}</td><td>{rng.uniform(-30, 200):.1f}%</td></tr>'
+        )
+    body.append('</table>')
+    for i in range(max(1, n_rows // 5)):
+        year = 2025 + i % 5
+        body.append(
+            f'<section class="outlook-year"><p>{year}: ${price * rng.uniform(0.8, 4.0):,.2f} 전망.</p>'
+            f'<p>{_headline(rng)["body"]}</p></section>'
+            f'<div class="technical-indicator">RSI {rng.uniform(20, 80):.1f}, MACD {rng.uniform(-5, 5):.2f}. '
+            f'{_headline(rng)["body"]}</div>'
+        )
+    body += _page_noise(rng, n_rows * 2)
+    return _page(body)
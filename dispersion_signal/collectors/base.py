@@ -9,8 +9,22 @@ import logging
 import requests
 import sys
 import os
+from urllib.parse import urlparse
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.logger import log_api_call, log_error
+from utils.monitoring import get_system_monitor
+from utils.retry_policy import get_retry_policy
+from utils.metrics import record_http_request
+from utils.json_codec import loads as json_loads
+
+# 재시도하지 않는 클라이언트 오류 (요청 자체가 잘못됐거나 인증/결제 문제, 호스트는 정상)
+# 401/403: 키 없음/권한 없음, 402: 유료 플랜 필요 (예: CoinPaprika) - 재시도해도 같은 응답
+NON_RETRYABLE_STATUS = {400, 401, 402, 403, 404, 405, 410, 422}
+
+# 429 응답의 Retry-After 최대 대기 시간 (초) - 이보다 길면 대기하지 않고 실패 처리
+MAX_RETRY_AFTER_SECONDS = float(os.getenv('MAX_RETRY_AFTER_SECONDS', 60))
+
+logger = logging.getLogger(__name__)
 
 class BaseCollector(ABC):
     """데이터 수집을 위한 베이스 클래스"""
@@ -29,6 +43,9 @@ class BaseCollector(ABC):
         self.rate_limit = rate_limit
         self.last_request_time = 0
         self.request_count = 0
+        self.request_timeout = float(os.getenv('API_REQUEST_TIMEOUT_SECONDS', 30))
+        # 서킷 브레이커 키 (호스트 단위로 모든 컬렉터가 공유)
+        self.host = urlparse(base_url).netloc or base_url
         self.session = requests.Session()
         self.session.headers.update({
             'Authorization': f'Bearer {api_key}',
@@ -56,6 +73,11 @@ class BaseCollector(ABC):
         """
         API 요청 실행
         
+        호스트 서킷이 열려 있으면 요청 없이 즉시 None 반환하고,
+        모든 결과는 공유 SystemMonitor에 기록되어 서킷 상태에 반영됨.
+        재시도는 공유 재시도 정책(decorrelated jitter, 재시도 예산)을 따르며
+        현재 컨텍스트의 데드라인(deadline_scope)이 지나면 중단
+        
         Args:
             endpoint: API 엔드포인트
             params: 요청 파라미터
@@ -65,44 +87,85 @@ class BaseCollector(ABC):
             API 응답 데이터 또는 None
         """
         url = f"{self.base_url}{endpoint}"
+        monitor = get_system_monitor()
+        retry = get_retry_policy().start(max_attempts=max_retries + 1)
         
-        for attempt in range(max_retries + 1):
+        while True:
+            # 서킷이 열려 있으면 즉시 실패 (죽은 호스트에 재시도 대기하지 않음)
+            if not monitor.circuit_breaker.allow_request(self.host):
+                logger.warning(f"서킷 열림, 요청 건너뜀: {self.host}{endpoint}")
+                record_http_request('sync', self.host, 'circuit_open')
+                return None
+            
+            if retry.expired:
+                logger.warning(f"데드라인 초과, 요청 건너뜀: {endpoint}")
+                return None
+            
+            retry_after = 0.0
             try:
                 # Rate limit 체크
                 self._rate_limit_check()
                 
                 # 요청 실행
                 start_time = time.time()
-                response = self.session.get(url, params=params)
+                response = self.session.get(url, params=params, timeout=retry.timeout(self.request_timeout))
                 response_time = time.time() - start_time
                 
                 # 요청 카운터 증가
                 self.request_count += 1
                 
                 # 로깅
-                logger = logging.getLogger(__name__)
                 log_api_call(logger, endpoint, response.status_code, response_time)
+                record_http_request('sync', self.host, response.status_code, response_time, len(response.content))
                 
                 if response.status_code == 200:
-                    return response.json()
-                elif response.status_code == 429:  # Rate limit exceeded
-                    wait_time = 60  # 1분 대기
-                    time.sleep(wait_time)
-                    continue
+                    monitor.monitor_api_call(self.host, True, response_time)
+                    return json_loads(response.content)
+                elif response.status_code in NON_RETRYABLE_STATUS:
+                    # 잘못된 요청(예: 없는 심볼)/인증·결제 오류 - 호스트는 응답하므로 실패로 집계하지 않고 재시도 없음
+                    monitor.monitor_api_call(self.host, True, response_time)
+                    log_error(logger, requests.HTTPError(f"HTTP {response.status_code}"), f"API 요청 실패: {endpoint}")
+                    return None
+                
+                monitor.monitor_api_call(self.host, False, response_time)
+                
+                if response.status_code == 429:  # Rate limit exceeded
+                    retry_after = self._retry_after(response)
+                    if retry_after is None:
+                        logger.warning(f"Rate limit 대기 시간 초과, 요청 포기: {endpoint}")
+                        return None
                 else:
                     response.raise_for_status()
                     
-            except requests.exceptions.RequestException as e:
-                if attempt < max_retries:
-                    wait_time = 2 ** attempt  # 지수 백오프
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    logger = logging.getLogger(__name__)
-                    log_error(logger, e, f"API 요청 실패: {endpoint}")
-                    return None
+            except (requests.exceptions.RequestException, ValueError) as e:
+                if getattr(e, 'response', None) is None:
+                    # 연결 실패/타임아웃/잘못된 JSON 본문 (HTTP 응답 오류는 위에서 이미 기록)
+                    monitor.monitor_api_call(self.host, False)
+                    record_http_request('sync', self.host, 'error')
+                last_error = e
+            else:
+                last_error = requests.HTTPError(f"HTTP {response.status_code}")
+            
+            wait_time = retry.next_delay(minimum=retry_after)
+            if wait_time is None:
+                log_error(logger, last_error, f"API 요청 실패 (재시도 중단: {retry.stop_reason}): {endpoint}")
+                return None
+            time.sleep(wait_time)
+    
+    @staticmethod
+    def _retry_after(response: requests.Response) -> Optional[float]:
+        """
+        429 응답의 최소 대기 시간 (Retry-After 헤더, 없으면 0 → 재시도 정책 백오프 사용)
+        
+        Returns:
+            대기 시간(초), MAX_RETRY_AFTER_SECONDS를 넘으면 None
+        """
+        try:
+            wait_time = float(response.headers.get('Retry-After', 0))
+        except (TypeError, ValueError):
+            wait_time = 0.0
         
-        return None
+        return wait_time if wait_time <= MAX_RETRY_AFTER_SECONDS else None
     
     @abstractmethod
     def collect_data(self, symbol: str, start_date: datetime, end_date: datetime, interval: str = '1hour') -> List[Dict[str, Any]]:
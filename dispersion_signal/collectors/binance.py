@@ -8,20 +8,24 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from .base import BaseCollector
+from config import Config
 from utils.logger import log_error
 
 class BinanceCollector(BaseCollector):
     """Binance API 데이터 수집기 (무료)"""
     
-    def __init__(self):
+    def __init__(self, base_url: Optional[str] = None):
         """
         Binance 수집기 초기화
         
         API 키 불필요 - 공개 엔드포인트 사용
+        
+        Args:
+            base_url: API 베이스 URL (기본값: Config.BINANCE_BASE_URL, 목 서버 테스트용)
         """
         super().__init__(
             api_key='public',  # 공개 엔드포인트
-            base_url='https://api.binance.com',
+            base_url=base_url or Config.BINANCE_BASE_URL,
             rate_limit=1200  # 분당 1200 요청 (매우 관대함)
         )
         
@@ -8,6 +8,7 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from collectors.base import BaseCollector
+from config import Config
 from utils.logger import log_error
 
 class CoinGeckoCollector(BaseCollector):
@@ -64,10 +65,14 @@ class CoinGeckoCollector(BaseCollector):
         'XPL': 'xpl',
     }
     
-    def __init__(self):
+    def __init__(self, base_url: Optional[str] = None):
+        """
+        Args:
+            base_url: API 베이스 URL (기본값: Config.COINGECKO_BASE_URL, 목 서버 테스트용)
+        """
         super().__init__(
             api_key=None,  # 무료 티어는 API 키 불필요
-            base_url='https://api.coingecko.com/api/v3',
+            base_url=base_url or Config.COINGECKO_BASE_URL,
             rate_limit=30  # 분당 30회 제한
         )
     
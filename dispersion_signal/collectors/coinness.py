@@ -3,8 +3,6 @@ Coinness 뉴스 데이터 수집 - 분석가 목표가 및 시장 분석 데이
 https://coinness.com/news 에서 암호화폐 관련 뉴스와 분석가 의견을 수집합니다.
 """
 
-import requests
-from bs4 import BeautifulSoup
 import time
 import re
 from typing import Dict, List, Optional, Any
@@ -15,12 +13,44 @@ import json
 
 from collectors.base import BaseCollector
 from utils.logger import log_error, log_info
+from utils.entity_extractor import get_symbol_extractor, extract_timeframe
+from utils.html_parser import HtmlTargets, TargetRule, parse_html
+from utils.page_cache import FetchedPage, get_page_cache
 
 logger = logging.getLogger(__name__)
 
+# 가격 목표가 패턴 (모듈 로드 시 한 번 컴파일)
+_PRICE_PATTERNS = [
+    re.compile(r'(\$[\d,]+\.?\d*)\s*(?:목표|target|예상|예측|전망)', re.IGNORECASE),
+    re.compile(r'(?:목표|target|예상|예측|전망).*?(\$[\d,]+\.?\d*)', re.IGNORECASE),
+    re.compile(r'(\d+,\d+)\s*(?:달러|dollar|usd)', re.IGNORECASE),
+    re.compile(r'(\d+\.\d+)\s*(?:만원|만 달러)', re.IGNORECASE),
+    re.compile(r'(\d+)\s*(?:달러|dollar|usd).*?(?:목표|target|예상)', re.IGNORECASE),
+]
+
+# 뉴스 목록 파싱 대상 (기사 요소 서브트리만 파싱) 및 기사 내부 요소 class 패턴
+_ARTICLE_RULE = TargetRule(['article', 'div'], ['article', 'news', 'post', 'item'])
+_ARTICLE_TARGETS = HtmlTargets(_ARTICLE_RULE)
+_TITLE_CLASS = re.compile(r'title|headline')
+_CONTENT_CLASS = re.compile(r'content|summary|excerpt')
+_DATE_CLASS = re.compile(r'date|time')
+
 class CoinnessNewsCollector(BaseCollector):
     """Coinness 뉴스 사이트 스크래핑을 통한 분석가 의견 및 시장 분석 데이터 수집기"""
     
+    # Coinness 분석가 프로필
+    ANALYST_PROFILE = {
+        'name': 'Coinness News Team',
+        'source': 'coinness',
+        'source_id': 'coinness_news',
+        'profile_url': 'https://coinness.com/news',
+        'bio': 'Coinness 뉴스팀의 암호화폐 시장 분석 및 뉴스',
+        'expertise_areas': ['sentiment', 'news'],
+        'reliability_score': 70.0,
+        'followers_count': 15000,
+        'is_active': True
+    }
+    
     def __init__(self):
         super().__init__(
             api_key=None,  # 웹 스크래핑이므로 API 키 불필요
@@ -36,54 +66,76 @@ class CoinnessNewsCollector(BaseCollector):
             'Upgrade-Insecure-Requests': '1'
         })
         self.logger = logger
+        self.page_cache = get_page_cache()
+        self.symbol_extractor = get_symbol_extractor()
     
-    def get_news_page(self, page: int = 1) -> Optional[str]:
+    def fetch_news_page(self, page: int = 1) -> Optional[FetchedPage]:
         """
-        뉴스 페이지 HTML 가져오기
+        뉴스 페이지 요청 (본문 + 지난 실행 이후 변경 여부)
         
         Args:
             page: 페이지 번호 (기본값: 1)
         
         Returns:
-            HTML 내용 또는 None
+            FetchedPage 또는 None (요청 실패)
         """
         try:
             url = f"{self.base_url}/news"
             if page > 1:
                 url += f"?page={page}"
             
-            response = requests.get(url, headers=self.session.headers, timeout=15)
-            response.raise_for_status()
-            
-            return response.text
+            return self.page_cache.fetch(url, headers=self.session.headers, timeout=15)
             
         except Exception as e:
             log_error(self.logger, e, f"Coinness 뉴스 페이지 {page} 조회 실패")
             return None
     
-    def get_coin_specific_news(self, symbol: str) -> Optional[str]:
+    def fetch_coin_specific_news(self, symbol: str) -> Optional[FetchedPage]:
         """
-        특정 코인 관련 뉴스 페이지 HTML 가져오기
+        특정 코인 관련 뉴스 페이지 요청 (본문 + 지난 실행 이후 변경 여부)
         
         Args:
             symbol: 코인 심볼 (예: 'BTC')
         
         Returns:
-            HTML 내용 또는 None
+            FetchedPage 또는 None (요청 실패)
         """
         try:
             # Coinness의 코인별 뉴스 URL 패턴 (실제 구조에 따라 조정 필요)
             url = f"{self.base_url}/news/search?q={symbol}"
             
-            response = requests.get(url, headers=self.session.headers, timeout=15)
-            response.raise_for_status()
-            
-            return response.text
+            return self.page_cache.fetch(url, headers=self.session.headers, timeout=15)
             
         except Exception as e:
             log_error(self.logger, e, f"Coinness {symbol} 뉴스 페이지 조회 실패")
             return None
     
+    def get_news_page(self, page: int = 1) -> Optional[str]:
+        """
+        뉴스 페이지 HTML 가져오기
+        
+        Args:
+            page: 페이지 번호 (기본값: 1)
+        
+        Returns:
+            HTML 내용 또는 None
+        """
+        fetched = self.fetch_news_page(page)
+        return fetched.text if fetched else None
+    
+    def get_coin_specific_news(self, symbol: str) -> Optional[str]:
+        """
+        특정 코인 관련 뉴스 페이지 HTML 가져오기
+        
+        Args:
+            symbol: 코인 심볼 (예: 'BTC')
+        
+        Returns:
+            HTML 내용 또는 None
+        """
+        fetched = self.fetch_coin_specific_news(symbol)
+        return fetched.text if fetched else None
+    
     def parse_news_articles(self, html_content: str) -> Optional[List[Dict[str, Any]]]:
         """
         HTML에서 뉴스 기사 정보 파싱
@@ -95,16 +147,16 @@ class CoinnessNewsCollector(BaseCollector):
             뉴스 기사 리스트 또는 None
         """
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = parse_html(html_content, _ARTICLE_TARGETS)
             articles = []
             
             # 뉴스 기사 요소 찾기 (실제 구조에 따라 조정 필요)
-            article_elements = soup.find_all(['article', 'div'], class_=re.compile(r'article|news|post|item'))
+            article_elements = _ARTICLE_RULE.find_all(soup)
             
             for element in article_elements:
                 try:
                     # 제목 추출
-                    title_elem = element.find(['h1', 'h2', 'h3', 'a'], class_=re.compile(r'title|headline'))
+                    title_elem = element.find(['h1', 'h2', 'h3', 'a'], class_=_TITLE_CLASS)
                     title = title_elem.get_text().strip() if title_elem else None
                     
                     # 링크 추출
@@ -114,15 +166,15 @@ class CoinnessNewsCollector(BaseCollector):
                         link = f"{self.base_url}{link}"
                     
                     # 요약/내용 추출
-                    content_elem = element.find(['p', 'div'], class_=re.compile(r'content|summary|excerpt'))
+                    content_elem = element.find(['p', 'div'], class_=_CONTENT_CLASS)
                     content = content_elem.get_text().strip() if content_elem else None
                     
                     # 날짜 추출
-                    date_elem = element.find(['time', 'span'], class_=re.compile(r'date|time'))
+                    date_elem = element.find(['time', 'span'], class_=_DATE_CLASS)
                     date_text = date_elem.get_text().strip() if date_elem else None
                     
                     # 코인 심볼 추출
-                    symbols = self._extract_symbols_from_text(title + ' ' + (content or ''))
+                    symbols = self.symbol_extractor.extract(title + ' ' + (content or ''))
                     
                     if title and len(title) > 10:  # 의미있는 제목만
                         articles.append({
@@ -144,53 +196,6 @@ class CoinnessNewsCollector(BaseCollector):
             log_error(self.logger, e, "Coinness 뉴스 기사 파싱 실패")
             return None
     
-    def _extract_symbols_from_text(self, text: str) -> List[str]:
-        """
-        텍스트에서 암호화폐 심볼 추출
-        
-        Args:
-            text: 분석할 텍스트
-        
-        Returns:
-            추출된 심볼 리스트
-        """
-        if not text:
-            return []
-        
-        # 주요 암호화폐 심볼 패턴
-        symbol_patterns = [
-            r'\b(BTC|Bitcoin)\b',
-            r'\b(ETH|Ethereum)\b',
-            r'\b(SOL|Solana)\b',
-            r'\b(XRP|Ripple)\b',
-            r'\b(BNB|Binance)\b',
-            r'\b(DOGE|Dogecoin)\b',
-            r'\b(TRX|Tron)\b',
-            r'\b(SUI|Sui)\b',
-            r'\b(AVAX|Avalanche)\b',
-            r'\b(TAO|Bittensor)\b',
-            r'\b(USDC|USD Coin)\b',
-            r'\b(USDT|Tether)\b',
-            r'\b(ADA|Cardano)\b',
-            r'\b(MATIC|Polygon)\b',
-            r'\b(DOT|Polkadot)\b',
-            r'\b(LINK|Chainlink)\b',
-            r'\b(UNI|Uniswap)\b',
-            r'\b(LTC|Litecoin)\b',
-            r'\b(BCH|Bitcoin Cash)\b',
-            r'\b(ATOM|Cosmos)\b'
-        ]
-        
-        symbols = []
-        for pattern in symbol_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                symbol = match.upper() if isinstance(match, str) else match[0].upper()
-                if symbol not in symbols:
-                    symbols.append(symbol)
-        
-        return symbols
-    
     def extract_price_targets_from_news(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         뉴스 기사에서 가격 목표가 정보 추출
@@ -207,24 +212,18 @@ class CoinnessNewsCollector(BaseCollector):
             text = (article.get('title', '') + ' ' + article.get('content', '')).lower()
             
             # 가격 목표가 패턴 찾기
-            price_patterns = [
-                r'(\$[\d,]+\.?\d*)\s*(?:목표|target|예상|예측|전망)',
-                r'(?:목표|target|예상|예측|전망).*?(\$[\d,]+\.?\d*)',
-                r'(\d+,\d+)\s*(?:달러|dollar|usd)',
-                r'(\d+\.\d+)\s*(?:만원|만 달러)',
-                r'(\d+)\s*(?:달러|dollar|usd).*?(?:목표|target|예상)'
-            ]
-            
-            for pattern in price_patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
+            timeframe_info = None
+            for pattern in _PRICE_PATTERNS:
+                matches = pattern.finditer(text)
                 
                 for match in matches:
                     try:
                         price_str = match.group(1).replace(',', '').replace('$', '')
                         target_price = float(price_str)
                         
-                        # 시간대 정보 추출
-                        timeframe_info = self._extract_timeframe_from_text(text)
+                        # 시간대 정보 추출 (기사당 한 번)
+                        if timeframe_info is None:
+                            timeframe_info = extract_timeframe(text)
                         
                         # 현재 가격 추정 (뉴스에서 직접 추출하기 어려우므로 기본값 사용)
                         current_price = target_price * 0.8  # 임시 추정값
@@ -249,33 +248,6 @@ class CoinnessNewsCollector(BaseCollector):
         
         return targets
     
-    def _extract_timeframe_from_text(self, text: str) -> Dict[str, Any]:
-        """
-        텍스트에서 시간대 정보 추출
-        
-        Args:
-            text: 분석할 텍스트
-        
-        Returns:
-            시간대 정보 딕셔너리
-        """
-        text = text.lower()
-        
-        if any(word in text for word in ['단기', 'short', '1개월', '1 month', '1m']):
-            return {'type': 'short_term', 'months': 1}
-        elif any(word in text for word in ['중기', 'medium', '3개월', '3 month', '3m', '분기']):
-            return {'type': 'short_term', 'months': 3}
-        elif any(word in text for word in ['6개월', '6 month', '6m', '반년']):
-            return {'type': 'medium_term', 'months': 6}
-        elif any(word in text for word in ['장기', 'long', '1년', '1 year', '1y', '12개월']):
-            return {'type': 'medium_term', 'months': 12}
-        elif any(word in text for word in ['2년', '2 year', '2y', '2025']):
-            return {'type': 'long_term', 'months': 24}
-        elif any(word in text for word in ['3년', '3 year', '3y', '2026']):
-            return {'type': 'long_term', 'months': 36}
-        else:
-            return {'type': 'medium_term', 'months': 6}  # 기본값
-    
     def analyze_sentiment(self, articles: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         뉴스 기사들의 감성 분석
@@ -375,27 +347,6 @@ class CoinnessNewsCollector(BaseCollector):
         Returns:
             수집된 분석가 데이터 딕셔너리
         """
-        collected_data = {
-            'analyst_profiles': [],
-            'analyst_targets': [],
-            'insights': [],
-            'sentiment_analysis': []
-        }
-        
-        # Coinness 분석가 프로필 생성
-        analyst_profile = {
-            'name': 'Coinness News Team',
-            'source': 'coinness',
-            'source_id': 'coinness_news',
-            'profile_url': 'https://coinness.com/news',
-            'bio': 'Coinness 뉴스팀의 암호화폐 시장 분석 및 뉴스',
-            'expertise_areas': ['sentiment', 'news'],
-            'reliability_score': 70.0,
-            'followers_count': 15000,
-            'is_active': True
-        }
-        collected_data['analyst_profiles'].append(analyst_profile)
-        
         all_articles = []
         
         # 일반 뉴스 수집
@@ -434,6 +385,26 @@ class CoinnessNewsCollector(BaseCollector):
                 log_error(self.logger, e, f"Coinness {symbol} 뉴스 수집 실패")
                 continue
         
+        return self.build_analyst_data(all_articles)
+    
+    def build_analyst_data(self, all_articles: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        수집한 기사로 분석가 데이터 구성 (중복 제거, 목표가 추출, 감성 분석, 인사이트)
+        요청 없이 계산만 하므로 프로세스 풀에서 실행 가능
+        
+        Args:
+            all_articles: parse_news_articles 결과를 이어 붙인 기사 리스트
+        
+        Returns:
+            수집된 분석가 데이터 딕셔너리
+        """
+        collected_data = {
+            'analyst_profiles': [dict(self.ANALYST_PROFILE)],
+            'analyst_targets': [],
+            'insights': [],
+            'sentiment_analysis': []
+        }
+        
         # 중복 제거
         unique_articles = []
         seen_titles = set()
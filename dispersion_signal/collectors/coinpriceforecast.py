@@ -3,8 +3,6 @@ CoinPriceForecast 웹 스크래핑 - 분석가 목표가 데이터 수집
 https://coinpriceforecast.com/ 에서 분석가 목표가 정보를 수집합니다.
 """
 
-import requests
-from bs4 import BeautifulSoup
 import time
 import re
 from typing import Dict, List, Optional, Any
@@ -15,12 +13,38 @@ import json
 
 from collectors.base import BaseCollector
 from utils.logger import log_error, log_info
+from utils.html_parser import HtmlTargets, TargetRule, parse_html
+from utils.page_cache import get_page_cache
 
 logger = logging.getLogger(__name__)
 
+# 예측 페이지 파싱 대상: 현재가 요소, 예측 테이블, 예측 섹션
+_CURRENT_PRICE_RULE = TargetRule(['span', 'div'], ['price', 'current'])
+_TABLE_RULE = TargetRule(['table', 'div'], ['prediction', 'forecast', 'target', 'table'])
+_SECTION_RULE = TargetRule(['div', 'section'], ['prediction', 'forecast', 'outlook'])
+_PREDICTION_TARGETS = HtmlTargets(_CURRENT_PRICE_RULE, _TABLE_RULE, _SECTION_RULE)
+_ROW_CLASS = re.compile(r'row|item')
+_TECHNICAL_RULE = TargetRule(['div', 'section'], ['technical', 'analysis', 'chart', 'indicator'])
+_TECHNICAL_TARGETS = HtmlTargets(_TECHNICAL_RULE)
+_FUNDAMENTAL_RULE = TargetRule(['div', 'section'], ['fundamental', 'outlook', 'future', 'adoption'])
+_FUNDAMENTAL_TARGETS = HtmlTargets(_FUNDAMENTAL_RULE)
+
 class CoinPriceForecastCollector(BaseCollector):
     """CoinPriceForecast 웹사이트 스크래핑을 통한 분석가 목표가 데이터 수집기"""
     
+    # CoinPriceForecast 분석가 프로필
+    ANALYST_PROFILE = {
+        'name': 'CoinPriceForecast Research Team',
+        'source': 'coinpriceforecast',
+        'source_id': 'coinpriceforecast_research',
+        'profile_url': 'https://coinpriceforecast.com/',
+        'bio': 'CoinPriceForecast 전문 분석팀의 암호화폐 예측 및 분석',
+        'expertise_areas': ['technical', 'fundamental'],
+        'reliability_score': 80.0,
+        'followers_count': 30000,
+        'is_active': True
+    }
+    
     def __init__(self):
         super().__init__(
             api_key=None,  # 웹 스크래핑이므로 API 키 불필요
@@ -36,13 +60,15 @@ class CoinPriceForecastCollector(BaseCollector):
             'Upgrade-Insecure-Requests': '1'
         })
         self.logger = logger
+        self.page_cache = get_page_cache()
     
-    def get_coin_prediction_page(self, symbol: str) -> Optional[str]:
+    def get_coin_prediction_page(self, symbol: str, skip_unchanged: bool = False) -> Optional[str]:
         """
         코인별 예측 페이지 HTML 가져오기
         
         Args:
             symbol: 코인 심볼 (예: 'BTC')
+            skip_unchanged: 지난 실행 이후 변경 없는 페이지면 None 반환 (파싱/저장 건너뜀)
         
         Returns:
             HTML 내용 또는 None
@@ -51,10 +77,12 @@ class CoinPriceForecastCollector(BaseCollector):
             # CoinPriceForecast의 예측 페이지 URL 패턴
             url = f"{self.base_url}/{symbol.lower()}-price-prediction"
             
-            response = requests.get(url, headers=self.session.headers, timeout=15)
-            response.raise_for_status()
+            page = self.page_cache.fetch(url, headers=self.session.headers, timeout=15)
+            if skip_unchanged and not page.changed:
+                log_info(self.logger, f"CoinPriceForecast {symbol} 예측 페이지 변경 없음 ({page.status}), 건너뜀")
+                return None
             
-            return response.text
+            return page.text
             
         except Exception as e:
             log_error(self.logger, e, f"CoinPriceForecast {symbol} 예측 페이지 조회 실패")
@@ -72,11 +100,11 @@ class CoinPriceForecastCollector(BaseCollector):
             가격 예측 리스트 또는 None
         """
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = parse_html(html_content, _PREDICTION_TARGETS)
             predictions = []
             
             # 현재 가격 추출
-            current_price_elem = soup.find(['span', 'div'], class_=re.compile(r'price|current'))
+            current_price_elem = _CURRENT_PRICE_RULE.find(soup)
             current_price = None
             
             if current_price_elem:
@@ -86,10 +114,10 @@ class CoinPriceForecastCollector(BaseCollector):
                     current_price = float(price_match.group(1))
             
             # 예측 테이블 찾기
-            prediction_tables = soup.find_all(['table', 'div'], class_=re.compile(r'prediction|forecast|target|table'))
+            prediction_tables = _TABLE_RULE.find_all(soup)
             
             for table in prediction_tables:
-                rows = table.find_all(['tr', 'div'], class_=re.compile(r'row|item'))
+                rows = table.find_all(['tr', 'div'], class_=_ROW_CLASS)
                 
                 for row in rows:
                     row_text = row.get_text().lower()
@@ -120,7 +148,7 @@ class CoinPriceForecastCollector(BaseCollector):
                             continue
             
             # 추가적인 예측 섹션 찾기
-            prediction_sections = soup.find_all(['div', 'section'], class_=re.compile(r'prediction|forecast|outlook'))
+            prediction_sections = _SECTION_RULE.find_all(soup)
             
             for section in prediction_sections:
                 section_text = section.get_text()
@@ -245,12 +273,11 @@ class CoinPriceForecastCollector(BaseCollector):
             기술적 분석 정보 리스트 또는 None
         """
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = parse_html(html_content, _TECHNICAL_TARGETS)
             analysis = []
             
             # 기술적 분석 관련 섹션 찾기
-            tech_sections = soup.find_all(['div', 'section'], 
-                                       class_=re.compile(r'technical|analysis|chart|indicator'))
+            tech_sections = _TECHNICAL_RULE.find_all(soup)
             
             for section in tech_sections:
                 text = section.get_text().strip()
@@ -283,12 +310,11 @@ class CoinPriceForecastCollector(BaseCollector):
             펀더멘털 분석 정보 리스트 또는 None
         """
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = parse_html(html_content, _FUNDAMENTAL_TARGETS)
             analysis = []
             
             # 펀더멘털 분석 관련 섹션 찾기
-            fund_sections = soup.find_all(['div', 'section'], 
-                                        class_=re.compile(r'fundamental|outlook|future|adoption'))
+            fund_sections = _FUNDAMENTAL_RULE.find_all(soup)
             
             for section in fund_sections:
                 text = section.get_text().strip()
@@ -351,6 +377,23 @@ class CoinPriceForecastCollector(BaseCollector):
             log_error(self.logger, e, f"CoinPriceForecast 데이터 수집 실패: {symbol}")
             return []
     
+    def parse_prediction_page(self, html_content: str, symbol: str) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        예측 페이지 1개에서 가격 예측과 기술적/펀더멘털 분석 추출 (요청 없이 파싱만, 프로세스 풀에서 실행 가능)
+        
+        Args:
+            html_content: HTML 내용
+            symbol: 코인 심볼
+        
+        Returns:
+            {'analyst_targets': [...], 'insights': [...]}
+        """
+        return {
+            'analyst_targets': self.parse_price_predictions(html_content, symbol) or [],
+            'insights': (self.get_technical_analysis(html_content, symbol) or [])
+                        + (self.get_fundamental_analysis(html_content, symbol) or [])
+        }
+    
     def collect_analyst_data(self, symbols: List[str]) -> Dict[str, Any]:
         """
         여러 코인에 대한 분석가 데이터 수집
@@ -362,25 +405,11 @@ class CoinPriceForecastCollector(BaseCollector):
             수집된 분석가 데이터 딕셔너리
         """
         collected_data = {
-            'analyst_profiles': [],
+            'analyst_profiles': [dict(self.ANALYST_PROFILE)],
             'analyst_targets': [],
             'insights': []
         }
         
-        # CoinPriceForecast 분석가 프로필 생성
-        analyst_profile = {
-            'name': 'CoinPriceForecast Research Team',
-            'source': 'coinpriceforecast',
-            'source_id': 'coinpriceforecast_research',
-            'profile_url': 'https://coinpriceforecast.com/',
-            'bio': 'CoinPriceForecast 전문 분석팀의 암호화폐 예측 및 분석',
-            'expertise_areas': ['technical', 'fundamental'],
-            'reliability_score': 80.0,
-            'followers_count': 30000,
-            'is_active': True
-        }
-        collected_data['analyst_profiles'].append(analyst_profile)
-        
         for symbol in symbols:
             try:
                 log_info(self.logger, f"CoinPriceForecast {symbol} 분석가 데이터 수집 중...")
@@ -390,20 +419,10 @@ class CoinPriceForecastCollector(BaseCollector):
                 if not html_content:
                     continue
                 
-                # 가격 예측 파싱
-                predictions = self.parse_price_predictions(html_content, symbol)
-                if predictions:
-                    collected_data['analyst_targets'].extend(predictions)
-                
-                # 기술적 분석 추출
-                tech_analysis = self.get_technical_analysis(html_content, symbol)
-                if tech_analysis:
-                    collected_data['insights'].extend(tech_analysis)
-                
-                # 펀더멘털 분석 추출
-                fund_analysis = self.get_fundamental_analysis(html_content, symbol)
-                if fund_analysis:
-                    collected_data['insights'].extend(fund_analysis)
+                # 가격 예측 파싱 + 기술적/펀더멘털 분석 추출
+                page_data = self.parse_prediction_page(html_content, symbol)
+                collected_data['analyst_targets'].extend(page_data['analyst_targets'])
+                collected_data['insights'].extend(page_data['insights'])
                 
                 # Rate limiting
                 time.sleep(2)
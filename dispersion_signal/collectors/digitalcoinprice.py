@@ -3,8 +3,6 @@ DigitalCoinPrice 웹 스크래핑 - 분석가 목표가 데이터 수집
 https://digitalcoinprice.com/forecast 에서 분석가 목표가 정보를 수집합니다.
 """
 
-import requests
-from bs4 import BeautifulSoup
 import time
 import re
 from typing import Dict, List, Optional, Any
@@ -15,12 +13,37 @@ import json
 
 from collectors.base import BaseCollector
 from utils.logger import log_error, log_info
+from utils.html_parser import HtmlTargets, TargetRule, parse_html
+from utils.page_cache import get_page_cache
 
 logger = logging.getLogger(__name__)
 
+# 예측 페이지 파싱 대상: 예측 섹션, 예측 카드, 가격 요소 (find_next 대상도 트리에 남도록 포함)
+_FORECAST_RULE = TargetRule(['div', 'section'], ['forecast', 'prediction', 'target'])
+_CARD_RULE = TargetRule(['div', 'card'], ['prediction', 'forecast', 'target'])
+_PRICE_RULE = TargetRule(['span', 'div', 'td'], ['price', 'target', 'prediction'])
+_FORECAST_TARGETS = HtmlTargets(_FORECAST_RULE, _CARD_RULE, _PRICE_RULE)
+_ANALYSIS_RULE = TargetRule(['div', 'section', 'article'], ['analysis', 'insight', 'opinion', 'outlook'])
+_ANALYSIS_TARGETS = HtmlTargets(_ANALYSIS_RULE)
+_TIMEFRAME_TEXTS = ['short', 'medium', 'long', '1 month', '3 month', '6 month', '1 year', '2025', '2026']
+_TIMEFRAME_TEXT_PATTERNS = [(text, re.compile(text, re.IGNORECASE)) for text in _TIMEFRAME_TEXTS]
+
 class DigitalCoinPriceCollector(BaseCollector):
     """DigitalCoinPrice 웹사이트 스크래핑을 통한 분석가 목표가 데이터 수집기"""
     
+    # DigitalCoinPrice 분석가 프로필
+    ANALYST_PROFILE = {
+        'name': 'DigitalCoinPrice Research Team',
+        'source': 'digitalcoinprice',
+        'source_id': 'digitalcoinprice_research',
+        'profile_url': 'https://digitalcoinprice.com/forecast',
+        'bio': 'DigitalCoinPrice 전문 분석팀의 암호화폐 예측',
+        'expertise_areas': ['technical', 'fundamental'],
+        'reliability_score': 75.0,
+        'followers_count': 25000,
+        'is_active': True
+    }
+    
     def __init__(self):
         super().__init__(
             api_key=None,  # 웹 스크래핑이므로 API 키 불필요
@@ -36,13 +59,15 @@ class DigitalCoinPriceCollector(BaseCollector):
             'Upgrade-Insecure-Requests': '1'
         })
         self.logger = logger
+        self.page_cache = get_page_cache()
     
-    def get_coin_forecast_page(self, symbol: str) -> Optional[str]:
+    def get_coin_forecast_page(self, symbol: str, skip_unchanged: bool = False) -> Optional[str]:
         """
         코인별 예측 페이지 HTML 가져오기
         
         Args:
             symbol: 코인 심볼 (예: 'BTC')
+            skip_unchanged: 지난 실행 이후 변경 없는 페이지면 None 반환 (파싱/저장 건너뜀)
         
         Returns:
             HTML 내용 또는 None
@@ -51,10 +76,12 @@ class DigitalCoinPriceCollector(BaseCollector):
             # DigitalCoinPrice의 예측 페이지 URL 패턴
             url = f"{self.base_url}/forecast/{symbol.lower()}"
             
-            response = requests.get(url, headers=self.session.headers, timeout=15)
-            response.raise_for_status()
+            page = self.page_cache.fetch(url, headers=self.session.headers, timeout=15)
+            if skip_unchanged and not page.changed:
+                log_info(self.logger, f"DigitalCoinPrice {symbol} 예측 페이지 변경 없음 ({page.status}), 건너뜀")
+                return None
             
-            return response.text
+            return page.text
             
         except Exception as e:
             log_error(self.logger, e, f"DigitalCoinPrice {symbol} 예측 페이지 조회 실패")
@@ -72,7 +99,7 @@ class DigitalCoinPriceCollector(BaseCollector):
             가격 목표가 리스트 또는 None
         """
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = parse_html(html_content, _FORECAST_TARGETS)
             targets = []
             
             # 현재 가격 추출
@@ -86,19 +113,17 @@ class DigitalCoinPriceCollector(BaseCollector):
                     current_price = float(price_match.group(1))
             
             # 예측 테이블 또는 섹션 찾기
-            forecast_sections = soup.find_all(['div', 'section'], class_=re.compile(r'forecast|prediction|target'))
+            forecast_sections = _FORECAST_RULE.find_all(soup)
             
             for section in forecast_sections:
                 # 시간대별 예측 찾기
-                timeframes = ['short', 'medium', 'long', '1 month', '3 month', '6 month', '1 year', '2025', '2026']
-                
-                for timeframe_text in timeframes:
-                    timeframe_elem = section.find(text=re.compile(timeframe_text, re.IGNORECASE))
+                for timeframe_text, timeframe_pattern in _TIMEFRAME_TEXT_PATTERNS:
+                    timeframe_elem = section.find(string=timeframe_pattern)
                     if timeframe_elem:
                         parent = timeframe_elem.parent
                         
                         # 가격 정보 추출
-                        price_elem = parent.find_next(['span', 'div', 'td'], class_=re.compile(r'price|target|prediction'))
+                        price_elem = parent.find_next(list(_PRICE_RULE.tags), class_=_PRICE_RULE.pattern)
                         if price_elem:
                             price_text = price_elem.get_text().strip()
                             price_match = re.search(r'\$?([\d,]+\.?\d*)', price_text.replace(',', ''))
@@ -123,7 +148,7 @@ class DigitalCoinPriceCollector(BaseCollector):
                                 })
             
             # 추가적인 예측 정보가 있는지 확인
-            prediction_cards = soup.find_all(['div', 'card'], class_=re.compile(r'prediction|forecast|target'))
+            prediction_cards = _CARD_RULE.find_all(soup)
             
             for card in prediction_cards:
                 card_text = card.get_text().lower()
@@ -232,12 +257,11 @@ class DigitalCoinPriceCollector(BaseCollector):
             분석가 인사이트 리스트 또는 None
         """
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = parse_html(html_content, _ANALYSIS_TARGETS)
             insights = []
             
             # 분석 관련 텍스트 추출
-            analysis_sections = soup.find_all(['div', 'section', 'article'], 
-                                            class_=re.compile(r'analysis|insight|opinion|outlook'))
+            analysis_sections = _ANALYSIS_RULE.find_all(soup)
             
             for section in analysis_sections:
                 text = section.get_text().strip()
@@ -300,6 +324,22 @@ class DigitalCoinPriceCollector(BaseCollector):
             log_error(self.logger, e, f"DigitalCoinPrice 데이터 수집 실패: {symbol}")
             return []
     
+    def parse_forecast_page(self, html_content: str, symbol: str) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        예측 페이지 1개에서 목표가와 인사이트 추출 (요청 없이 파싱만, 프로세스 풀에서 실행 가능)
+        
+        Args:
+            html_content: HTML 내용
+            symbol: 코인 심볼
+        
+        Returns:
+            {'analyst_targets': [...], 'insights': [...]}
+        """
+        return {
+            'analyst_targets': self.parse_price_targets(html_content, symbol) or [],
+            'insights': self.get_analyst_insights(html_content, symbol) or []
+        }
+    
     def collect_analyst_data(self, symbols: List[str]) -> Dict[str, Any]:
         """
         여러 코인에 대한 분석가 데이터 수집
@@ -311,25 +351,11 @@ class DigitalCoinPriceCollector(BaseCollector):
             수집된 분석가 데이터 딕셔너리
         """
         collected_data = {
-            'analyst_profiles': [],
+            'analyst_profiles': [dict(self.ANALYST_PROFILE)],
             'analyst_targets': [],
             'insights': []
         }
         
-        # DigitalCoinPrice 분석가 프로필 생성
-        analyst_profile = {
-            'name': 'DigitalCoinPrice Research Team',
-            'source': 'digitalcoinprice',
-            'source_id': 'digitalcoinprice_research',
-            'profile_url': 'https://digitalcoinprice.com/forecast',
-            'bio': 'DigitalCoinPrice 전문 분석팀의 암호화폐 예측',
-            'expertise_areas': ['technical', 'fundamental'],
-            'reliability_score': 75.0,
-            'followers_count': 25000,
-            'is_active': True
-        }
-        collected_data['analyst_profiles'].append(analyst_profile)
-        
         for symbol in symbols:
             try:
                 log_info(self.logger, f"DigitalCoinPrice {symbol} 분석가 데이터 수집 중...")
@@ -339,15 +365,10 @@ class DigitalCoinPriceCollector(BaseCollector):
                 if not html_content:
                     continue
                 
-                # 가격 목표가 파싱
-                targets = self.parse_price_targets(html_content, symbol)
-                if targets:
-                    collected_data['analyst_targets'].extend(targets)
-                
-                # 분석가 인사이트 추출
-                insights = self.get_analyst_insights(html_content, symbol)
-                if insights:
-                    collected_data['insights'].extend(insights)
+                # 가격 목표가 파싱 + 분석가 인사이트 추출
+                page_data = self.parse_forecast_page(html_content, symbol)
+                collected_data['analyst_targets'].extend(page_data['analyst_targets'])
+                collected_data['insights'].extend(page_data['insights'])
                 
                 # Rate limiting
                 time.sleep(2)
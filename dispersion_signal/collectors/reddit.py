@@ -2,22 +2,167 @@
 Reddit API 클라이언트
 """
 import requests
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import base64
+import json
+import logging
 import sys
 import os
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from collectors.base import BaseCollector
+from config import Config
 from utils.logger import log_error
+from utils.entity_extractor import SymbolExtractor, build_default_aliases
+
+logger = logging.getLogger(__name__)
+
+@lru_cache(maxsize=32)
+def _tracked_extractor(symbols: Tuple[str, ...]) -> SymbolExtractor:
+    """추적 심볼로 제한한 기본 사전 추출기 (심볼 목록별로 한 번만 구성)"""
+    return SymbolExtractor(build_default_aliases(), symbols)
+
+
+def _empty_mentions() -> Dict[str, Any]:
+    return {
+        'total_mentions': 0,
+        'positive_mentions': 0,
+        'negative_mentions': 0,
+        'neutral_mentions': 0,
+        'subreddit_breakdown': {}
+    }
+
+
+def _score_sentiment(score: int) -> str:
+    """간단한 감성 분석 (업보트/다운보트 기반) - 집계 키 반환"""
+    if score > 10:
+        return 'positive_mentions'
+    if score < -5:
+        return 'negative_mentions'
+    return 'neutral_mentions'
+
+
+class RedditIngestState:
+    """
+    Reddit 증분 수집 상태 (JSON 파일 1개, 권한 600)
+    
+    - token: OAuth 토큰과 만료 시각 (만료 전까지 재사용)
+    - cursors: 서브레딧별 마지막으로 집계한 포스트 (fullname, created_utc)
+    - buckets: 심볼별 시간 버킷 언급 집계 (포스트 작성 시각 기준)
+    - totals: 심볼별 기간 합계 - 새 포스트는 더하고 기간을 벗어난 버킷은 빼서 갱신
+    """
+    
+    VERSION = 1
+    
+    def __init__(self, path: str, window_days: float = 7, bucket_minutes: int = 60):
+        self.path = Path(path)
+        self.window_seconds = window_days * 86400
+        self.bucket_seconds = bucket_minutes * 60
+        self.data = self._load()
+    
+    def _empty(self, token: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return {'version': self.VERSION, 'bucket_seconds': self.bucket_seconds,
+                'token': token, 'cursors': {}, 'buckets': {}, 'totals': {}}
+    
+    def _load(self) -> Dict[str, Any]:
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return self._empty()
+        except (OSError, ValueError) as e:
+            logger.warning(f"Reddit 상태 파일 읽기 실패, 새로 시작: {self.path} ({e})")
+            return self._empty()
+        
+        if data.get('version') != self.VERSION or data.get('bucket_seconds') != self.bucket_seconds:
+            # 버킷 크기가 바뀌면 집계는 다시 쌓음 (토큰만 유지)
+            logger.info("Reddit 집계 버킷 설정 변경, 커서/집계 초기화")
+            return self._empty(data.get('token'))
+        return data
+    
+    def save(self):
+        """임시 파일에 쓴 뒤 교체 (토큰 포함이므로 소유자만 읽기 가능)"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+    
+    def get_token(self, identity: str, margin_seconds: float = 60) -> Optional[str]:
+        """만료 전 저장된 토큰 (다른 계정/앱의 토큰이면 None)"""
+        token = self.data.get('token')
+        if token and token.get('identity') == identity and token.get('expires_at', 0) > time.time() + margin_seconds:
+            return token['access_token']
+        return None
+    
+    def set_token(self, identity: str, access_token: str, expires_in: float):
+        self.data['token'] = {'identity': identity, 'access_token': access_token,
+                              'expires_at': time.time() + expires_in}
+    
+    def get_cursor(self, subreddit: str) -> Optional[Dict[str, Any]]:
+        return self.data['cursors'].get(subreddit.lower())
+    
+    def set_cursor(self, subreddit: str, fullname: str, created_utc: float):
+        self.data['cursors'][subreddit.lower()] = {'fullname': fullname, 'created_utc': created_utc}
+    
+    def add_mention(self, symbol: str, created_utc: float, sentiment: str, subreddit: str):
+        """포스트 1개의 언급을 버킷과 기간 합계에 반영"""
+        bucket_start = str(int(created_utc // self.bucket_seconds * self.bucket_seconds))
+        bucket = self.data['buckets'].setdefault(symbol, {}).setdefault(bucket_start, _empty_mentions())
+        total = self.data['totals'].setdefault(symbol, _empty_mentions())
+        for entry in (bucket, total):
+            entry['total_mentions'] += 1
+            entry[sentiment] += 1
+            breakdown = entry['subreddit_breakdown']
+            breakdown[subreddit] = breakdown.get(subreddit, 0) + 1
+    
+    def expire(self, now: Optional[float] = None) -> int:
+        """기간을 벗어난 버킷을 기간 합계에서 빼고 삭제, 삭제한 버킷 수 반환"""
+        window_start = (now or time.time()) - self.window_seconds
+        expired = 0
+        for symbol, buckets in self.data['buckets'].items():
+            total = self.data['totals'][symbol]
+            for bucket_start in [b for b in buckets if int(b) + self.bucket_seconds <= window_start]:
+                bucket = buckets.pop(bucket_start)
+                for key in ('total_mentions', 'positive_mentions', 'negative_mentions', 'neutral_mentions'):
+                    total[key] -= bucket[key]
+                for subreddit, count in bucket['subreddit_breakdown'].items():
+                    remaining = total['subreddit_breakdown'].get(subreddit, 0) - count
+                    if remaining > 0:
+                        total['subreddit_breakdown'][subreddit] = remaining
+                    else:
+                        total['subreddit_breakdown'].pop(subreddit, None)
+                expired += 1
+        return expired
+    
+    def window_mentions(self, symbols: List[str]) -> Dict[str, Any]:
+        """심볼별 기간 합계 (get_crypto_mentions와 같은 형식)"""
+        result = {}
+        for symbol in symbols:
+            total = self.data['totals'].get(symbol.upper(), _empty_mentions())
+            result[symbol] = dict(total, subreddit_breakdown=dict(total['subreddit_breakdown']))
+        return result
+
 
 class RedditCollector(BaseCollector):
     """Reddit API 클라이언트"""
     
     def __init__(self, client_id: str, client_secret: str, 
-                 username: str, password: str, user_agent: str):
+                 username: str, password: str, user_agent: str,
+                 base_url: Optional[str] = None, auth_url: Optional[str] = None,
+                 state_path: Optional[str] = None):
+        """
+        Args:
+            base_url: API 베이스 URL (기본값: Config.REDDIT_BASE_URL, 목 서버 테스트용)
+            auth_url: OAuth 토큰 URL (기본값: Config.REDDIT_AUTH_URL)
+            state_path: 토큰/커서/언급 집계 저장 파일 (기본값: Config.REDDIT_STATE_PATH, 빈 값이면 저장 안 함)
+        """
         super().__init__(
             api_key=None,  # Reddit은 OAuth 사용
-            base_url='https://oauth.reddit.com',
+            base_url=base_url or Config.REDDIT_BASE_URL,
             rate_limit=60  # 분당 60회
         )
         
@@ -26,13 +171,37 @@ class RedditCollector(BaseCollector):
         self.username = username
         self.password = password
         self.user_agent = user_agent
+        self.auth_url = auth_url or Config.REDDIT_AUTH_URL
         self.access_token = None
+        self.logger = logger
+        
+        state_path = Config.REDDIT_STATE_PATH if state_path is None else state_path
+        self.state = RedditIngestState(state_path, Config.REDDIT_WINDOW_DAYS,
+                                       Config.REDDIT_BUCKET_MINUTES) if state_path else None
         
-        # OAuth 토큰 획득
+        # OAuth 토큰 획득 (저장된 토큰이 만료 전이면 재사용)
         self._get_access_token()
     
+    @property
+    def _token_identity(self) -> str:
+        return f"{self.client_id}:{self.username}"
+    
+    def _set_session_token(self, access_token: str):
+        self.access_token = access_token
+        self.session.headers.update({
+            'Authorization': f'Bearer {self.access_token}',
+            'User-Agent': self.user_agent
+        })
+    
     def _get_access_token(self):
         """Reddit OAuth 토큰 획득"""
+        if self.state is not None:
+            cached_token = self.state.get_token(self._token_identity)
+            if cached_token:
+                self._set_session_token(cached_token)
+                self.logger.info("Reddit OAuth 토큰 재사용 (만료 전)")
+                return
+        
         try:
             # Basic Auth 헤더 생성
             auth_string = f"{self.client_id}:{self.client_secret}"
@@ -51,20 +220,22 @@ class RedditCollector(BaseCollector):
             }
             
             response = requests.post(
-                'https://www.reddit.com/api/v1/access_token',
+                self.auth_url,
                 headers=headers,
-                data=data
+                data=data,
+                timeout=self.request_timeout
             )
             
             if response.status_code == 200:
                 token_data = response.json()
-                self.access_token = token_data['access_token']
                 
                 # 세션 헤더 설정
-                self.session.headers.update({
-                    'Authorization': f'Bearer {self.access_token}',
-                    'User-Agent': self.user_agent
-                })
+                self._set_session_token(token_data['access_token'])
+                
+                if self.state is not None:
+                    self.state.set_token(self._token_identity, self.access_token,
+                                         token_data.get('expires_in', 3600))
+                    self.state.save()
                 
                 if self.logger:
                     self.logger.info("Reddit OAuth 토큰 획득 성공")
@@ -97,6 +268,29 @@ class RedditCollector(BaseCollector):
         }
         return self._make_request(endpoint, params=params)
     
+    def get_subreddit_listing(self, subreddit: str, listing: str = 'new', limit: int = 100,
+                              after: Optional[str] = None,
+                              before: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        서브레딧 리스팅 한 페이지 조회
+        
+        Args:
+            subreddit: 서브레딧 이름
+            listing: 리스팅 종류 (new, hot, top, rising)
+            limit: 페이지 크기 (최대 100)
+            after: 이 포스트(fullname, t3_xxx)보다 뒤(오래된 쪽) 페이지
+            before: 이 포스트보다 앞(새로운 쪽) 페이지
+        
+        Returns:
+            리스팅 데이터
+        """
+        params = {'limit': min(limit, 100)}
+        if after:
+            params['after'] = after
+        if before:
+            params['before'] = before
+        return self._make_request(f"/r/{subreddit}/{listing}", params=params)
+    
     def search_posts(self, query: str, subreddit: str = None, 
                     limit: int = 100) -> Optional[Dict[str, Any]]:
         """
@@ -124,13 +318,17 @@ class RedditCollector(BaseCollector):
         return self._make_request(endpoint, params=params)
     
     def get_crypto_mentions(self, symbols: List[str], 
-                           subreddits: List[str] = None) -> Dict[str, Any]:
+                           subreddits: List[str] = None,
+                           mode: Optional[str] = None) -> Dict[str, Any]:
         """
         암호화폐 언급 분석
         
         Args:
             symbols: 코인 심볼 리스트
             subreddits: 분석할 서브레딧 리스트
+            mode: 'scan' (서브레딧 리스팅을 한 번 훑어 모든 심볼 동시 매칭),
+                  'incremental' (지난 실행 이후 새 포스트만 수집해 로컬 기간 집계 갱신) 또는
+                  'search' (심볼 × 서브레딧마다 검색), 기본값 Config.REDDIT_MENTION_MODE
         
         Returns:
             코인별 언급 분석 결과
@@ -138,6 +336,16 @@ class RedditCollector(BaseCollector):
         if subreddits is None:
             subreddits = ['cryptocurrency', 'bitcoin', 'ethereum', 'solana']
         
+        mode = mode or Config.REDDIT_MENTION_MODE
+        if mode == 'incremental':
+            if self.state is not None:
+                self.ingest_new_posts(symbols, subreddits)
+                return self.state.window_mentions(symbols)
+            self.logger.warning("REDDIT_STATE_PATH 미설정: 증분 모드 대신 리스팅 스캔 사용")
+            mode = 'scan'
+        if mode == 'scan':
+            return self.scan_crypto_mentions(symbols, subreddits)
+        
         crypto_mentions = {}
         
         for symbol in symbols:
@@ -181,6 +389,198 @@ class RedditCollector(BaseCollector):
         
         return crypto_mentions
     
+    def scan_crypto_mentions(self, symbols: List[str], subreddits: List[str],
+                             listings: Tuple[str, ...] = ('new', 'hot'),
+                             max_pages: Optional[int] = None,
+                             max_age_days: Optional[float] = 7,
+                             aliases: Optional[Dict[str, List[str]]] = None) -> Dict[str, Any]:
+        """
+        서브레딧 리스팅을 한 번씩 훑어 모든 심볼의 언급을 한 번에 집계
+        
+        (심볼 × 서브레딧) 검색 대신 서브레딧당 리스팅 몇 페이지만 요청하고,
+        공유 엔티티 추출기로 포스트 제목+본문의 모든 심볼/코인 이름을 한 번에 매칭.
+        포스트당 심볼은 한 번만 집계하고, hot/new에 중복으로 나온 포스트는 한 번만 처리.
+        
+        Args:
+            symbols: 코인 심볼 리스트
+            subreddits: 분석할 서브레딧 리스트
+            listings: 훑을 리스팅 종류
+            max_pages: 리스팅당 최대 페이지 수 (페이지당 100개, 기본값 Config.REDDIT_SCAN_MAX_PAGES)
+            max_age_days: 이보다 오래된 포스트는 제외, new 리스팅은 여기서 페이지 중단 (None이면 제한 없음)
+            aliases: 심볼별 추가 이름 (기본값 utils.entity_extractor 기본 사전)
+        
+        Returns:
+            코인별 언급 분석 결과 (get_crypto_mentions와 같은 형식)
+        """
+        max_pages = max_pages or Config.REDDIT_SCAN_MAX_PAGES
+        symbols = [s.upper() for s in symbols]
+        match_symbols = self._mention_matcher(symbols, aliases)
+        cutoff = time.time() - max_age_days * 86400 if max_age_days is not None else None
+        
+        crypto_mentions = {symbol: _empty_mentions() for symbol in symbols}
+        requests_made = 0
+        posts_scanned = 0
+        
+        for subreddit in subreddits:
+            seen = set()
+            for listing in listings:
+                after = None
+                for _ in range(max_pages):
+                    try:
+                        page = self.get_subreddit_listing(subreddit, listing, limit=100, after=after)
+                        requests_made += 1
+                    except Exception as e:
+                        log_error(self.logger, e, f"Reddit 리스팅 조회 실패: r/{subreddit}/{listing}")
+                        break
+                    
+                    if not page or 'data' not in page:
+                        break
+                    
+                    reached_cutoff = False
+                    for post in page['data'].get('children', []):
+                        post_data = post.get('data', {})
+                        if cutoff is not None and post_data.get('created_utc', cutoff) < cutoff:
+                            reached_cutoff = True
+                            continue
+                        fullname = post_data.get('name')
+                        if fullname in seen:
+                            continue
+                        seen.add(fullname)
+                        posts_scanned += 1
+                        
+                        matched = match_symbols(post_data)
+                        if not matched:
+                            continue
+                        
+                        # 검색 모드와 같은 점수 기준
+                        sentiment = _score_sentiment(post_data.get('score', 0))
+                        for symbol in matched:
+                            mentions = crypto_mentions[symbol]
+                            mentions['total_mentions'] += 1
+                            mentions[sentiment] += 1
+                            breakdown = mentions['subreddit_breakdown']
+                            breakdown[subreddit] = breakdown.get(subreddit, 0) + 1
+                    
+                    after = page['data'].get('after')
+                    # new는 최신순이므로 기준 시각 이전 포스트가 나오면 더 볼 필요 없음
+                    if not after or (reached_cutoff and listing == 'new'):
+                        break
+        
+        if self.logger:
+            self.logger.info(f"Reddit 리스팅 스캔: 요청 {requests_made}회, 포스트 {posts_scanned}개, "
+                             f"심볼 {len(symbols)}개")
+        
+        return crypto_mentions
+    
+    def _mention_matcher(self, symbols: List[str], aliases: Optional[Dict[str, List[str]]] = None):
+        """포스트 데이터 → 언급된 심볼 집합 함수 (제목+본문을 한 번에 매칭)"""
+        if aliases is None:
+            extractor = _tracked_extractor(tuple(sorted(set(symbols))))
+        else:
+            extractor = SymbolExtractor(aliases, symbols)
+        
+        def match(post_data: Dict[str, Any]) -> set:
+            text = f"{post_data.get('title', '')}\n{post_data.get('selftext', '')}"
+            return {m.symbol for m in extractor.finditer(text)}
+        
+        return match
+    
+    def ingest_new_posts(self, symbols: List[str], subreddits: List[str],
+                         aliases: Optional[Dict[str, List[str]]] = None) -> Dict[str, int]:
+        """
+        지난 실행 이후 새 포스트만 수집해 로컬 기간 집계에 반영
+        
+        서브레딧별로 마지막 집계 포스트(before 커서)보다 새로운 포스트만 new 리스팅에서 가져와
+        작성 시각 버킷에 더하고, 기간(Config.REDDIT_WINDOW_DAYS)을 벗어난 버킷은 합계에서 뺌.
+        점수 기반 감성이 의미 있도록 Config.REDDIT_SETTLE_MINUTES보다 최근 포스트는
+        커서를 넘기지 않고 다음 실행으로 미룸. 집계는 수집 시점의 심볼 목록 기준.
+        
+        Args:
+            symbols: 코인 심볼 리스트
+            subreddits: 수집할 서브레딧 리스트
+            aliases: 심볼별 추가 이름 (기본값 utils.entity_extractor 기본 사전)
+        
+        Returns:
+            서브레딧별 새로 집계한 포스트 수
+        """
+        symbols = [s.upper() for s in symbols]
+        match_symbols = self._mention_matcher(symbols, aliases)
+        now = time.time()
+        settle_cutoff = now - Config.REDDIT_SETTLE_MINUTES * 60
+        window_start = now - self.state.window_seconds
+        
+        ingested = {}
+        for subreddit in subreddits:
+            cursor = self.state.get_cursor(subreddit)
+            try:
+                posts = self._fetch_posts_since(subreddit, cursor, window_start)
+            except Exception as e:
+                log_error(self.logger, e, f"Reddit 새 포스트 조회 실패: r/{subreddit}")
+                continue
+            
+            ready = [p for p in posts
+                     if window_start <= p.get('created_utc', 0) <= settle_cutoff
+                     and (cursor is None or p['created_utc'] >= cursor['created_utc'])]
+            for post_data in ready:
+                sentiment = _score_sentiment(post_data.get('score', 0))
+                for symbol in match_symbols(post_data):
+                    self.state.add_mention(symbol, post_data['created_utc'], sentiment, subreddit)
+            
+            if ready:
+                newest = max(ready, key=lambda p: p['created_utc'])
+                self.state.set_cursor(subreddit, newest['name'], newest['created_utc'])
+            ingested[subreddit] = len(ready)
+        
+        expired = self.state.expire(now)
+        self.state.save()
+        
+        self.logger.info(f"Reddit 증분 수집: 새 포스트 {sum(ingested.values())}개 {ingested}, "
+                         f"만료 버킷 {expired}개")
+        return ingested
+    
+    def _fetch_posts_since(self, subreddit: str, cursor: Optional[Dict[str, Any]],
+                           oldest_utc: float) -> List[Dict[str, Any]]:
+        """
+        커서 포스트보다 새로운 포스트 (중복 제거)
+        
+        커서가 있으면 before 페이지네이션으로 커서 바로 다음부터 최신까지 조회.
+        커서 포스트가 삭제되면 before 조회가 빈 결과가 되므로, 이때와 첫 실행은
+        최신순(after)으로 커서 시각 또는 기간 시작 시각까지 조회.
+        """
+        max_pages = Config.REDDIT_SCAN_MAX_PAGES
+        posts: Dict[str, Dict[str, Any]] = {}
+        
+        if cursor is not None:
+            before = cursor['fullname']
+            for _ in range(max_pages):
+                page = self.get_subreddit_listing(subreddit, 'new', limit=100, before=before)
+                children = (page or {}).get('data', {}).get('children', [])
+                for post in children:
+                    posts[post['data']['name']] = post['data']
+                before = page['data'].get('before') if children else None
+                if not before:
+                    break
+            if posts:
+                return list(posts.values())
+            oldest_utc = max(oldest_utc, cursor['created_utc'])
+        
+        after = None
+        for _ in range(max_pages):
+            page = self.get_subreddit_listing(subreddit, 'new', limit=100, after=after)
+            children = (page or {}).get('data', {}).get('children', [])
+            reached = False
+            for post in children:
+                post_data = post['data']
+                if post_data.get('created_utc', 0) < oldest_utc or (
+                        cursor is not None and post_data.get('name') == cursor['fullname']):
+                    reached = True
+                    break
+                posts[post_data['name']] = post_data
+            after = page['data'].get('after') if children else None
+            if reached or not after:
+                break
+        return list(posts.values())
+    
     def get_subreddit_info(self, subreddit: str) -> Optional[Dict[str, Any]]:
         """
         서브레딧 정보 조회
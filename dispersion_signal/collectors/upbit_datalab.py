@@ -3,8 +3,6 @@ Upbit DataLab 데이터 수집 - 분석가 목표가 및 시장 분석 데이터
 https://datalab.upbit.com 에서 업비트의 디지털 자산 분석 데이터를 수집합니다.
 """
 
-import requests
-from bs4 import BeautifulSoup
 import time
 import re
 from typing import Dict, List, Optional, Any
@@ -15,12 +13,48 @@ import json
 
 from collectors.base import BaseCollector
 from utils.logger import log_error, log_info
+from utils.entity_extractor import get_symbol_extractor, extract_timeframe
+from utils.html_parser import HtmlTargets, TargetRule, parse_html
+from utils.page_cache import get_page_cache
 
 logger = logging.getLogger(__name__)
 
+# 가격 목표가 패턴 (한국어 포함, 모듈 로드 시 한 번 컴파일)
+_PRICE_PATTERNS = [
+    re.compile(r'(\d+,\d+)\s*(?:원|won|krw)', re.IGNORECASE),
+    re.compile(r'(\d+\.\d+)\s*(?:만원|만 달러)', re.IGNORECASE),
+    re.compile(r'(\$[\d,]+\.?\d*)\s*(?:목표|target|예상|예측|전망)', re.IGNORECASE),
+    re.compile(r'(?:목표|target|예상|예측|전망).*?(\$[\d,]+\.?\d*)', re.IGNORECASE),
+    re.compile(r'(\d+)\s*(?:달러|dollar|usd).*?(?:목표|target|예상)', re.IGNORECASE),
+    re.compile(r'(\d+,\d+)\s*(?:달러|dollar|usd)', re.IGNORECASE),
+]
+
+# 페이지별 파싱 대상 (대상 요소 서브트리만 파싱) 및 인사이트 내부 요소 class 패턴
+_INDEX_RULE = TargetRule(['div', 'span'], ['index', 'indices', 'market'])
+_SECTOR_RULE = TargetRule(['div', 'section'], ['sector', 'analysis', 'chart'])
+_INSIGHT_RULE = TargetRule(['div', 'article', 'section'], ['insight', 'analysis', 'report', 'article'])
+_INDEX_TARGETS = HtmlTargets(_INDEX_RULE)
+_SECTOR_TARGETS = HtmlTargets(_SECTOR_RULE)
+_INSIGHT_TARGETS = HtmlTargets(_INSIGHT_RULE)
+_TITLE_CLASS = re.compile(r'title|headline')
+_CONTENT_CLASS = re.compile(r'content|description|summary')
+
 class UpbitDataLabCollector(BaseCollector):
     """Upbit DataLab 웹사이트 스크래핑을 통한 분석가 목표가 및 시장 분석 데이터 수집기"""
     
+    # Upbit DataLab 분석가 프로필
+    ANALYST_PROFILE = {
+        'name': 'Upbit DataLab Research Team',
+        'source': 'upbit_datalab',
+        'source_id': 'upbit_datalab_research',
+        'profile_url': 'https://datalab.upbit.com',
+        'bio': '업비트 데이터랩 전문 분석팀의 디지털 자산 시장 분석',
+        'expertise_areas': ['technical', 'fundamental', 'market'],
+        'reliability_score': 90.0,  # 업비트는 높은 신뢰도
+        'followers_count': 100000,
+        'is_active': True
+    }
+    
     def __init__(self):
         super().__init__(
             api_key=None,  # 웹 스크래핑이므로 API 키 불필요
@@ -36,55 +70,72 @@ class UpbitDataLabCollector(BaseCollector):
             'Upgrade-Insecure-Requests': '1'
         })
         self.logger = logger
+        self.page_cache = get_page_cache()
+        self.symbol_extractor = get_symbol_extractor()
     
-    def get_main_page(self) -> Optional[str]:
+    def get_main_page(self, skip_unchanged: bool = False) -> Optional[str]:
         """
         메인 페이지 HTML 가져오기
         
+        Args:
+            skip_unchanged: 지난 실행 이후 변경 없는 페이지면 None 반환 (파싱/저장 건너뜀)
+        
         Returns:
             HTML 내용 또는 None
         """
         try:
-            response = requests.get(self.base_url, headers=self.session.headers, timeout=15)
-            response.raise_for_status()
+            page = self.page_cache.fetch(self.base_url, headers=self.session.headers, timeout=15)
+            if skip_unchanged and not page.changed:
+                log_info(self.logger, f"Upbit DataLab 메인 페이지 변경 없음 ({page.status}), 건너뜀")
+                return None
             
-            return response.text
+            return page.text
             
         except Exception as e:
             log_error(self.logger, e, "Upbit DataLab 메인 페이지 조회 실패")
             return None
     
-    def get_insights_page(self) -> Optional[str]:
+    def get_insights_page(self, skip_unchanged: bool = False) -> Optional[str]:
         """
         인사이트 페이지 HTML 가져오기
         
+        Args:
+            skip_unchanged: 지난 실행 이후 변경 없는 페이지면 None 반환 (파싱/저장 건너뜀)
+        
         Returns:
             HTML 내용 또는 None
         """
         try:
             url = f"{self.base_url}/insights"
-            response = requests.get(url, headers=self.session.headers, timeout=15)
-            response.raise_for_status()
+            page = self.page_cache.fetch(url, headers=self.session.headers, timeout=15)
+            if skip_unchanged and not page.changed:
+                log_info(self.logger, f"Upbit DataLab 인사이트 페이지 변경 없음 ({page.status}), 건너뜀")
+                return None
             
-            return response.text
+            return page.text
             
         except Exception as e:
             log_error(self.logger, e, "Upbit DataLab 인사이트 페이지 조회 실패")
             return None
     
-    def get_sector_analysis_page(self) -> Optional[str]:
+    def get_sector_analysis_page(self, skip_unchanged: bool = False) -> Optional[str]:
         """
         섹터 분석 페이지 HTML 가져오기
         
+        Args:
+            skip_unchanged: 지난 실행 이후 변경 없는 페이지면 None 반환 (파싱/저장 건너뜀)
+        
         Returns:
             HTML 내용 또는 None
         """
         try:
             url = f"{self.base_url}/sector"
-            response = requests.get(url, headers=self.session.headers, timeout=15)
-            response.raise_for_status()
+            page = self.page_cache.fetch(url, headers=self.session.headers, timeout=15)
+            if skip_unchanged and not page.changed:
+                log_info(self.logger, f"Upbit DataLab 섹터 분석 페이지 변경 없음 ({page.status}), 건너뜀")
+                return None
             
-            return response.text
+            return page.text
             
         except Exception as e:
             log_error(self.logger, e, "Upbit DataLab 섹터 분석 페이지 조회 실패")
@@ -101,11 +152,11 @@ class UpbitDataLabCollector(BaseCollector):
             시장 지수 리스트 또는 None
         """
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = parse_html(html_content, _INDEX_TARGETS)
             indices = []
             
             # 시장 지수 요소 찾기
-            index_elements = soup.find_all(['div', 'span'], class_=re.compile(r'index|indices|market'))
+            index_elements = _INDEX_RULE.find_all(soup)
             
             for element in index_elements:
                 try:
@@ -151,11 +202,11 @@ class UpbitDataLabCollector(BaseCollector):
             섹터 분석 리스트 또는 None
         """
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = parse_html(html_content, _SECTOR_TARGETS)
             sectors = []
             
             # 섹터 분석 요소 찾기
-            sector_elements = soup.find_all(['div', 'section'], class_=re.compile(r'sector|analysis|chart'))
+            sector_elements = _SECTOR_RULE.find_all(soup)
             
             for element in sector_elements:
                 try:
@@ -205,21 +256,20 @@ class UpbitDataLabCollector(BaseCollector):
             인사이트 리스트 또는 None
         """
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = parse_html(html_content, _INSIGHT_TARGETS)
             insights = []
             
             # 인사이트 요소 찾기
-            insight_elements = soup.find_all(['div', 'article', 'section'], 
-                                          class_=re.compile(r'insight|analysis|report|article'))
+            insight_elements = _INSIGHT_RULE.find_all(soup)
             
             for element in insight_elements:
                 try:
                     # 제목 추출
-                    title_elem = element.find(['h1', 'h2', 'h3', 'h4'], class_=re.compile(r'title|headline'))
+                    title_elem = element.find(['h1', 'h2', 'h3', 'h4'], class_=_TITLE_CLASS)
                     title = title_elem.get_text().strip() if title_elem else None
                     
                     # 내용 추출
-                    content_elem = element.find(['p', 'div'], class_=re.compile(r'content|description|summary'))
+                    content_elem = element.find(['p', 'div'], class_=_CONTENT_CLASS)
                     content = content_elem.get_text().strip() if content_elem else None
                     
                     # 링크 추출
@@ -230,7 +280,7 @@ class UpbitDataLabCollector(BaseCollector):
                     
                     if title and len(title) > 10:  # 의미있는 제목만
                         # 코인 심볼 추출
-                        symbols = self._extract_symbols_from_text(title + ' ' + (content or ''))
+                        symbols = self.symbol_extractor.extract(title + ' ' + (content or ''))
                         
                         insights.append({
                             'title': title,
@@ -250,53 +300,6 @@ class UpbitDataLabCollector(BaseCollector):
             log_error(self.logger, e, "Upbit DataLab 인사이트 파싱 실패")
             return None
     
-    def _extract_symbols_from_text(self, text: str) -> List[str]:
-        """
-        텍스트에서 암호화폐 심볼 추출
-        
-        Args:
-            text: 분석할 텍스트
-        
-        Returns:
-            추출된 심볼 리스트
-        """
-        if not text:
-            return []
-        
-        # 주요 암호화폐 심볼 패턴 (한국어 포함)
-        symbol_patterns = [
-            r'\b(BTC|비트코인|Bitcoin)\b',
-            r'\b(ETH|이더리움|Ethereum)\b',
-            r'\b(SOL|솔라나|Solana)\b',
-            r'\b(XRP|리플|Ripple)\b',
-            r'\b(BNB|바이낸스|Binance)\b',
-            r'\b(DOGE|도지코인|Dogecoin)\b',
-            r'\b(TRX|트론|Tron)\b',
-            r'\b(SUI|수이|Sui)\b',
-            r'\b(AVAX|아발란체|Avalanche)\b',
-            r'\b(TAO|비텐서|Bittensor)\b',
-            r'\b(USDC|USD Coin)\b',
-            r'\b(USDT|테더|Tether)\b',
-            r'\b(ADA|카르다노|Cardano)\b',
-            r'\b(MATIC|폴리곤|Polygon)\b',
-            r'\b(DOT|폴카닷|Polkadot)\b',
-            r'\b(LINK|체인링크|Chainlink)\b',
-            r'\b(UNI|유니스왑|Uniswap)\b',
-            r'\b(LTC|라이트코인|Litecoin)\b',
-            r'\b(BCH|비트코인캐시|Bitcoin Cash)\b',
-            r'\b(ATOM|코스모스|Cosmos)\b'
-        ]
-        
-        symbols = []
-        for pattern in symbol_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                symbol = match.upper() if isinstance(match, str) else match[0].upper()
-                if symbol not in symbols:
-                    symbols.append(symbol)
-        
-        return symbols
-    
     def extract_price_targets_from_insights(self, insights: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         인사이트에서 가격 목표가 정보 추출
@@ -312,26 +315,19 @@ class UpbitDataLabCollector(BaseCollector):
         for insight in insights:
             text = (insight.get('title', '') + ' ' + insight.get('content', '')).lower()
             
-            # 가격 목표가 패턴 찾기 (한국어 포함)
-            price_patterns = [
-                r'(\d+,\d+)\s*(?:원|won|krw)',
-                r'(\d+\.\d+)\s*(?:만원|만 달러)',
-                r'(\$[\d,]+\.?\d*)\s*(?:목표|target|예상|예측|전망)',
-                r'(?:목표|target|예상|예측|전망).*?(\$[\d,]+\.?\d*)',
-                r'(\d+)\s*(?:달러|dollar|usd).*?(?:목표|target|예상)',
-                r'(\d+,\d+)\s*(?:달러|dollar|usd)'
-            ]
-            
-            for pattern in price_patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
+            # 가격 목표가 패턴 찾기
+            timeframe_info = None
+            for pattern in _PRICE_PATTERNS:
+                matches = pattern.finditer(text)
                 
                 for match in matches:
                     try:
                         price_str = match.group(1).replace(',', '').replace('$', '')
                         target_price = float(price_str)
                         
-                        # 시간대 정보 추출
-                        timeframe_info = self._extract_timeframe_from_text(text)
+                        # 시간대 정보 추출 (기사당 한 번)
+                        if timeframe_info is None:
+                            timeframe_info = extract_timeframe(text)
                         
                         # 현재 가격 추정
                         current_price = target_price * 0.85  # 임시 추정값
@@ -356,33 +352,6 @@ class UpbitDataLabCollector(BaseCollector):
         
         return targets
     
-    def _extract_timeframe_from_text(self, text: str) -> Dict[str, Any]:
-        """
-        텍스트에서 시간대 정보 추출
-        
-        Args:
-            text: 분석할 텍스트
-        
-        Returns:
-            시간대 정보 딕셔너리
-        """
-        text = text.lower()
-        
-        if any(word in text for word in ['단기', 'short', '1개월', '1 month', '1m']):
-            return {'type': 'short_term', 'months': 1}
-        elif any(word in text for word in ['중기', 'medium', '3개월', '3 month', '3m', '분기']):
-            return {'type': 'short_term', 'months': 3}
-        elif any(word in text for word in ['6개월', '6 month', '6m', '반년']):
-            return {'type': 'medium_term', 'months': 6}
-        elif any(word in text for word in ['장기', 'long', '1년', '1 year', '1y', '12개월']):
-            return {'type': 'medium_term', 'months': 12}
-        elif any(word in text for word in ['2년', '2 year', '2y', '2025']):
-            return {'type': 'long_term', 'months': 24}
-        elif any(word in text for word in ['3년', '3 year', '3y', '2026']):
-            return {'type': 'long_term', 'months': 36}
-        else:
-            return {'type': 'medium_term', 'months': 6}  # 기본값
-    
     def collect_data(self, symbol: str, start_date: datetime, end_date: datetime, interval: str = '1hour') -> List[Dict[str, Any]]:
         """
         데이터 수집 (BaseCollector 추상 메서드 구현)
@@ -431,6 +400,22 @@ class UpbitDataLabCollector(BaseCollector):
             log_error(self.logger, e, f"Upbit DataLab 데이터 수집 실패: {symbol}")
             return []
     
+    def parse_insights_page(self, html_content: str) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        인사이트 페이지에서 인사이트와 가격 목표가 추출 (요청 없이 파싱만, 프로세스 풀에서 실행 가능)
+        
+        Args:
+            html_content: HTML 내용
+        
+        Returns:
+            {'insights': [...], 'analyst_targets': [...]}
+        """
+        insights = self.parse_insights(html_content) or []
+        return {
+            'insights': insights,
+            'analyst_targets': self.extract_price_targets_from_insights(insights) if insights else []
+        }
+    
     def collect_analyst_data(self) -> Dict[str, Any]:
         """
         Upbit DataLab에서 분석가 데이터 수집
@@ -439,27 +424,13 @@ class UpbitDataLabCollector(BaseCollector):
             수집된 분석가 데이터 딕셔너리
         """
         collected_data = {
-            'analyst_profiles': [],
+            'analyst_profiles': [dict(self.ANALYST_PROFILE)],
             'analyst_targets': [],
             'insights': [],
             'market_indices': [],
             'sector_analysis': []
         }
         
-        # Upbit DataLab 분석가 프로필 생성
-        analyst_profile = {
-            'name': 'Upbit DataLab Research Team',
-            'source': 'upbit_datalab',
-            'source_id': 'upbit_datalab_research',
-            'profile_url': 'https://datalab.upbit.com',
-            'bio': '업비트 데이터랩 전문 분석팀의 디지털 자산 시장 분석',
-            'expertise_areas': ['technical', 'fundamental', 'market'],
-            'reliability_score': 90.0,  # 업비트는 높은 신뢰도
-            'followers_count': 100000,
-            'is_active': True
-        }
-        collected_data['analyst_profiles'].append(analyst_profile)
-        
         try:
             log_info(self.logger, "Upbit DataLab 메인 페이지 수집 중...")
             
@@ -478,13 +449,10 @@ class UpbitDataLabCollector(BaseCollector):
             # 인사이트 페이지 수집
             insights_html = self.get_insights_page()
             if insights_html:
-                insights = self.parse_insights(insights_html)
-                if insights:
-                    collected_data['insights'].extend(insights)
-                    
-                    # 가격 목표가 추출
-                    targets = self.extract_price_targets_from_insights(insights)
-                    collected_data['analyst_targets'].extend(targets)
+                # 인사이트 파싱 + 가격 목표가 추출
+                page_data = self.parse_insights_page(insights_html)
+                collected_data['insights'].extend(page_data['insights'])
+                collected_data['analyst_targets'].extend(page_data['analyst_targets'])
             
             time.sleep(2)  # Rate limiting
             
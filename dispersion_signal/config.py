@@ -14,8 +14,8 @@ class Config:
     SUPABASE_URL = os.getenv('SUPABASE_URL', 'https://goeqmhurrhgwmazaxfpm.supabase.co')
     SUPABASE_SERVICE_ROLE_KEY = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
     
-    # Binance API 설정 (무료)
-    BINANCE_BASE_URL = 'https://api.binance.com'
+    # Binance API 설정 (무료) - *_BASE_URL 환경변수로 목 서버(mock_api) 등으로 변경 가능
+    BINANCE_BASE_URL = os.getenv('BINANCE_BASE_URL', 'https://api.binance.com')
     BINANCE_RATE_LIMIT = 1200  # 분당 1200 요청 (매우 관대함)
     
     # CryptoQuant API 설정 (향후 확장용)
@@ -62,13 +62,32 @@ class Config:
     REDDIT_REDIRECT_URI = os.getenv('REDDIT_REDIRECT_URI', 'http://localhost:8080/callback')
     REDDIT_USER_AGENT = os.getenv('REDDIT_USER_AGENT', 'coin_by_emotion/1.0')
     REDDIT_RATE_LIMIT = 60  # 분당 60회
+    REDDIT_BASE_URL = os.getenv('REDDIT_BASE_URL', 'https://oauth.reddit.com')
+    REDDIT_AUTH_URL = os.getenv('REDDIT_AUTH_URL', 'https://www.reddit.com/api/v1/access_token')
+    # 언급 집계 방식: scan (서브레딧 리스팅 1회 스캔으로 전체 심볼 매칭) / search (심볼별 검색)
+    #               / incremental (지난 실행 이후 새 포스트만 수집해 로컬 집계 갱신)
+    REDDIT_MENTION_MODE = os.getenv('REDDIT_MENTION_MODE', 'scan')
+    REDDIT_SCAN_MAX_PAGES = int(os.getenv('REDDIT_SCAN_MAX_PAGES', 3))  # 리스팅당 최대 페이지 (페이지당 100개)
+    # OAuth 토큰/커서/언급 집계 저장 파일 (비우면 저장 안 함)
+    REDDIT_STATE_PATH = os.getenv('REDDIT_STATE_PATH', 'cache/reddit_state.json')
+    REDDIT_WINDOW_DAYS = float(os.getenv('REDDIT_WINDOW_DAYS', 7))  # 증분 집계 기간
+    REDDIT_BUCKET_MINUTES = int(os.getenv('REDDIT_BUCKET_MINUTES', 60))  # 증분 집계 시간 버킷 크기
+    # 점수 기반 감성 판단을 위해 이보다 최근 포스트는 다음 실행에서 수집
+    REDDIT_SETTLE_MINUTES = float(os.getenv('REDDIT_SETTLE_MINUTES', 120))
     
     # Phase 4 API 설정
     COINCAP_BASE_URL = 'https://api.coincap.io/v2'
     COINPAPRIKA_BASE_URL = 'https://api.coinpaprika.com/v1'
-    COINGECKO_BASE_URL = 'https://api.coingecko.com/api/v3'
+    COINGECKO_BASE_URL = os.getenv('COINGECKO_BASE_URL', 'https://api.coingecko.com/api/v3')
     COINGECKO_RATE_LIMIT = 30  # 분당 30회
     
+    # 분석가 목표가 스크래핑 병렬화 (main_analyst_targets)
+    SCRAPE_FETCH_WORKERS = int(os.getenv('SCRAPE_FETCH_WORKERS', 8))  # 페이지 요청 스레드 수
+    # HTML 파싱/정규식 추출 프로세스 수 (0이면 프로세스 풀 없이 요청 스레드에서 파싱)
+    SCRAPE_PARSE_WORKERS = int(os.getenv('SCRAPE_PARSE_WORKERS', min(4, os.cpu_count() or 1)))
+    SCRAPE_SITE_CONCURRENCY = int(os.getenv('SCRAPE_SITE_CONCURRENCY', 2))  # 사이트별 동시 요청 수
+    SCRAPE_SITE_INTERVAL = float(os.getenv('SCRAPE_SITE_INTERVAL', 2))  # 사이트별 요청 시작 최소 간격 (초)
+    
     # 로깅 설정
     LOG_LEVEL = 'INFO'
     LOG_FILE = 'logs/collector.log'
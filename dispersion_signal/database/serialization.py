@@ -0,0 +1,232 @@
+"""
+Pydantic 모델 ↔ DB 행 변환 (insert/upsert 공용)
+
+- 모델별 행 변환 함수를 처음 쓸 때 한 번만 생성 (필드 타입별 변환식을 풀어 쓴 함수 코드를 컴파일),
+  이후 레코드마다 model.dict()와 필드별 타입 검사 없이 __dict__ 값을 바로 변환
+  UUID → str, Decimal → float, datetime/date → ISO 문자열, Enum → 값,
+  dict/list 필드는 내부 값까지 같은 규칙으로 변환
+  (타입이 정해지지 않은 값(dict/list 내부, Any)은 utils/json_codec의 default로 변환 - API/백업 JSON과 같은 규칙)
+- construct_trusted: 우리 코드가 계산한 값(다중 소스 가격 등)으로 모델을 만들 때 검증 생략
+  모델별 기본값/default_factory를 미리 모아 두고 __dict__를 바로 채움 (model_construct보다 빠름)
+  (외부 API/스크래핑 값은 기존처럼 모델 생성자로 검증)
+
+환경변수:
+- MODEL_TRUSTED_CONSTRUCT: false면 construct_trusted도 전체 검증 (디버깅용, 기본값 true)
+"""
+import copy
+import os
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Type, TypeVar, Union, get_args, get_origin
+from uuid import UUID
+
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
+
+from utils.json_codec import default as json_default
+
+TRUSTED_CONSTRUCT = os.getenv('MODEL_TRUSTED_CONSTRUCT', 'true').lower() != 'false'
+
+ModelT = TypeVar('ModelT', bound=BaseModel)
+
+
+_IMMUTABLE_DEFAULTS = (type(None), str, bytes, int, float, bool, Decimal, datetime, date, UUID, Enum, tuple, frozenset)
+
+
+class _TrustedConstructor:
+    """모델 한 종류의 검증 없는 생성기 (필드별 기본값/팩토리를 미리 구성)"""
+
+    def __init__(self, model_class: Type[BaseModel]):
+        self.model_class = model_class
+        # (필드 이름, 기본값, 팩토리) - 필수 필드는 둘 다 None이고 값이 없으면 빠짐 (model_construct와 동일)
+        self.fields: List[Tuple[str, Any, Optional[Callable[[], Any]]]] = []
+        for name, field in model_class.model_fields.items():
+            if field.default_factory is not None:
+                self.fields.append((name, None, field.default_factory))
+            elif field.default is PydanticUndefined:
+                self.fields.append((name, PydanticUndefined, None))
+            elif isinstance(field.default, _IMMUTABLE_DEFAULTS):
+                self.fields.append((name, field.default, None))
+            else:
+                self.fields.append((name, None, lambda default=field.default: copy.deepcopy(default)))
+        # private 속성/추가 필드가 있는 모델은 pydantic 구현 사용
+        self.use_model_construct = bool(model_class.__private_attributes__) or \
+            model_class.model_config.get('extra') == 'allow'
+
+    def __call__(self, values: Dict[str, Any]) -> BaseModel:
+        if self.use_model_construct:
+            return self.model_class.model_construct(**values)
+        data = {}
+        for name, default, factory in self.fields:
+            if name in values:
+                data[name] = values[name]
+            elif factory is not None:
+                data[name] = factory()
+            elif default is not PydanticUndefined:
+                data[name] = default
+        model = self.model_class.__new__(self.model_class)
+        object.__setattr__(model, '__dict__', data)
+        object.__setattr__(model, '__pydantic_fields_set__', set(values))
+        object.__setattr__(model, '__pydantic_extra__', None)
+        object.__setattr__(model, '__pydantic_private__', None)
+        return model
+
+
+_constructors: Dict[type, _TrustedConstructor] = {}
+
+
+def construct_trusted(model_class: Type[ModelT], **values) -> ModelT:
+    """
+    검증 없이 모델 생성 (기본값/default_factory는 채움)
+
+    값 계산 validator(always=True 등)도 실행되지 않으므로 필요한 필드는 호출자가 모두 채워야 함.
+    타입 변환도 하지 않으므로 값은 이미 필드 타입이어야 함
+    (예: crypto_id는 UUID - get_crypto_id 반환값은 그대로, 문자열 ID는 UUID(...)로 바꿔서 전달)
+
+    Args:
+        model_class: Pydantic 모델 클래스
+        **values: 필드 값 (모델 필드 타입과 같은 타입)
+
+    Returns:
+        모델 인스턴스
+    """
+    if not TRUSTED_CONSTRUCT:
+        return model_class(**values)
+    constructor = _constructors.get(model_class)
+    if constructor is None:
+        constructor = _constructors[model_class] = _TrustedConstructor(model_class)
+    return constructor(values)
+
+
+def _iso_value(value):
+    return value if isinstance(value, str) else value.isoformat()
+
+
+def _enum_value(value):
+    return value.value if isinstance(value, Enum) else value
+
+
+_PLAIN_TYPES = frozenset({type(None), str, bool, int, float})
+
+
+def to_jsonable(value: Any) -> Any:
+    """임의 값을 DB/JSON용 값으로 변환 (dict/list는 재귀)"""
+    if type(value) in _PLAIN_TYPES:
+        return value
+    if isinstance(value, dict):
+        return {key: item if type(item) in _PLAIN_TYPES else to_jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [item if type(item) in _PLAIN_TYPES else to_jsonable(item) for item in value]
+    if isinstance(value, BaseModel):
+        return get_row_serializer(type(value)).serialize(value)
+    try:
+        return json_default(value)  # Decimal/UUID/datetime/Enum 등 (JSON 코덱과 같은 규칙)
+    except TypeError:
+        return value
+
+
+def _converter_for(annotation: Any) -> Optional[Callable[[Any], Any]]:
+    """필드 타입 → 변환 함수 (변환이 필요 없으면 None)"""
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) != 1:
+            return to_jsonable
+        annotation = args[0]
+
+    if annotation in (str, int, float, bool):
+        return None
+    if not isinstance(annotation, type):
+        return to_jsonable  # Dict[...], List[...], Any, Literal 등
+    if issubclass(annotation, Decimal):
+        return float
+    if issubclass(annotation, UUID):
+        return str
+    if issubclass(annotation, (datetime, date)):
+        return _iso_value
+    if issubclass(annotation, Enum):
+        return _enum_value
+    return to_jsonable
+
+
+class RowSerializer:
+    """모델 한 종류의 행 변환기 (제외 필드 조합별로 변환 함수를 생성해 재사용)"""
+
+    def __init__(self, model_class: Type[BaseModel]):
+        self.model_class = model_class
+        self.fields: List[Tuple[str, Optional[Callable[[Any], Any]]]] = [
+            (name, _converter_for(field.annotation)) for name, field in model_class.model_fields.items()
+        ]
+        self._functions: Dict[frozenset, Callable[[BaseModel], Dict[str, Any]]] = {}
+
+    def _compile(self, exclude: frozenset) -> Callable[[BaseModel], Dict[str, Any]]:
+        """필드별 변환식을 풀어 쓴 함수 생성 (반복문/필드 이름 조회 없음)"""
+        namespace = {}
+        lines = ['def serialize(model):', '    values = model.__dict__']
+        items = []
+        for i, (name, convert) in enumerate(self.fields):
+            if name in exclude:
+                continue
+            if convert is None:
+                items.append(f'{name!r}: values.get({name!r})')
+                continue
+            lines.append(f'    value_{i} = values.get({name!r})')
+            if convert is _iso_value:
+                # isoformat은 메서드 직접 호출 (trusted 생성 시 이미 문자열일 수 있음)
+                expression = f'value_{i} if value_{i}.__class__ is str else value_{i}.isoformat()'
+            else:
+                namespace[f'convert_{i}'] = convert
+                expression = f'convert_{i}(value_{i})'
+            items.append(f'{name!r}: None if value_{i} is None else {expression}')
+        lines.append('    return {' + ', '.join(items) + '}')
+        exec('\n'.join(lines), namespace)
+        return namespace['serialize']
+
+    def serialize(self, model: BaseModel, exclude: Optional[Set[str]] = None) -> Dict[str, Any]:
+        """
+        모델 → DB 행 딕셔너리
+
+        Args:
+            model: 모델 인스턴스
+            exclude: 제외할 필드 (예: {'id'})
+
+        Returns:
+            JSON으로 바로 보낼 수 있는 딕셔너리 (필드 순서는 모델 정의 순서)
+        """
+        return self.function(exclude)(model)
+
+    def function(self, exclude: Optional[Set[str]] = None) -> Callable[[BaseModel], Dict[str, Any]]:
+        """제외 필드 조합에 맞는 변환 함수 (처음 요청 시 생성)"""
+        key = frozenset(exclude) if exclude else frozenset()
+        function = self._functions.get(key)
+        if function is None:
+            function = self._functions[key] = self._compile(key)
+        return function
+
+
+_serializers: Dict[type, RowSerializer] = {}
+
+
+def get_row_serializer(model_class: Type[BaseModel]) -> RowSerializer:
+    """모델별 행 변환기 (모델당 한 번 구성)"""
+    serializer = _serializers.get(model_class)
+    if serializer is None:
+        serializer = _serializers[model_class] = RowSerializer(model_class)
+    return serializer
+
+
+def to_row(model: BaseModel, exclude: Optional[Set[str]] = None) -> Dict[str, Any]:
+    """모델 1개 → DB 행"""
+    return get_row_serializer(type(model)).serialize(model, exclude)
+
+
+def to_rows(models: Iterable[BaseModel], exclude: Optional[Set[str]] = None) -> List[Dict[str, Any]]:
+    """모델 리스트 → DB 행 리스트 (같은 모델이면 변환기 조회도 한 번)"""
+    rows = []
+    model_class, serialize = None, None
+    for model in models:
+        if type(model) is not model_class:
+            model_class = type(model)
+            serialize = get_row_serializer(model_class).function(exclude)
+        rows.append(serialize(model))
+    return rows
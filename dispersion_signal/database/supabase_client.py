@@ -10,7 +10,9 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from .models import OnchainMetric, SentimentMetric, DerivativesMetric, DispersionScore, Cryptocurrency
+from .serialization import to_rows
 from utils.logger import log_error
+from utils.metrics import track_db_write
 
 class SupabaseClient:
     """Supabase 데이터베이스 클라이언트"""
@@ -51,6 +53,7 @@ class SupabaseClient:
             log_error(self.logger, e, f"crypto_id 조회 실패: {symbol}")
             return None
     
+    @track_db_write('onchain_metrics')
     def insert_onchain_metrics(self, metrics: List[OnchainMetric]) -> bool:
         """
         온체인 메트릭 데이터 배치 삽입
@@ -63,16 +66,7 @@ class SupabaseClient:
         """
         try:
             # Pydantic 모델을 딕셔너리로 변환
-            data = []
-            for metric in metrics:
-                metric_dict = metric.dict()
-                # UUID를 문자열로 변환
-                metric_dict['crypto_id'] = str(metric_dict['crypto_id'])
-                # Decimal을 float로 변환
-                for key, value in metric_dict.items():
-                    if hasattr(value, '__class__') and value.__class__.__name__ == 'Decimal':
-                        metric_dict[key] = float(value)
-                data.append(metric_dict)
+            data = to_rows(metrics)
             
             # 배치 삽입 (upsert 사용)
             response = self.client.table('onchain_metrics')\
@@ -86,6 +80,7 @@ class SupabaseClient:
             log_error(self.logger, e, "온체인 메트릭 삽입 실패")
             return False
     
+    @track_db_write('sentiment_metrics')
     def insert_sentiment_metrics(self, metrics: List[SentimentMetric]) -> bool:
         """
         감성 메트릭 데이터 배치 삽입
@@ -97,15 +92,7 @@ class SupabaseClient:
             성공 여부
         """
         try:
-            data = []
-            for metric in metrics:
-                metric_dict = metric.dict()
-                metric_dict['crypto_id'] = str(metric_dict['crypto_id'])
-                # Decimal을 float로 변환
-                for key, value in metric_dict.items():
-                    if hasattr(value, '__class__') and value.__class__.__name__ == 'Decimal':
-                        metric_dict[key] = float(value)
-                data.append(metric_dict)
+            data = to_rows(metrics)
             
             response = self.client.table('sentiment_metrics')\
                 .upsert(data, on_conflict='crypto_id,timestamp,data_source')\
@@ -118,6 +105,7 @@ class SupabaseClient:
             log_error(self.logger, e, "감성 메트릭 삽입 실패")
             return False
     
+    @track_db_write('derivatives_metrics')
     def insert_derivatives_metrics(self, metrics: List[DerivativesMetric]) -> bool:
         """
         파생상품 메트릭 데이터 배치 삽입
@@ -129,15 +117,7 @@ class SupabaseClient:
             성공 여부
         """
         try:
-            data = []
-            for metric in metrics:
-                metric_dict = metric.dict()
-                metric_dict['crypto_id'] = str(metric_dict['crypto_id'])
-                # Decimal을 float로 변환
-                for key, value in metric_dict.items():
-                    if hasattr(value, '__class__') and value.__class__.__name__ == 'Decimal':
-                        metric_dict[key] = float(value)
-                data.append(metric_dict)
+            data = to_rows(metrics)
             
             response = self.client.table('derivatives_metrics')\
                 .upsert(data, on_conflict='crypto_id,timestamp,data_source')\
@@ -150,6 +130,7 @@ class SupabaseClient:
             log_error(self.logger, e, "파생상품 메트릭 삽입 실패")
             return False
     
+    @track_db_write('dispersion_scores')
     def insert_dispersion_scores(self, scores: List[DispersionScore]) -> bool:
         """
         분산도 점수 데이터 배치 삽입
@@ -161,15 +142,7 @@ class SupabaseClient:
             성공 여부
         """
         try:
-            data = []
-            for score in scores:
-                score_dict = score.dict()
-                score_dict['crypto_id'] = str(score_dict['crypto_id'])
-                # Decimal을 float로 변환
-                for key, value in score_dict.items():
-                    if hasattr(value, '__class__') and value.__class__.__name__ == 'Decimal':
-                        score_dict[key] = float(value)
-                data.append(score_dict)
+            data = to_rows(scores)
             
             response = self.client.table('dispersion_scores')\
                 .upsert(data, on_conflict='crypto_id,timestamp')\
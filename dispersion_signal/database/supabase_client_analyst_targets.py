@@ -17,7 +17,9 @@ from database.models_analyst_targets import (
     CollectedAnalystData, validate_price_target, validate_analyst_profile,
     calculate_consensus_direction, calculate_price_dispersion
 )
+from database.serialization import to_row
 from utils.logger import log_error, log_info
+from utils.metrics import track_db_write
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +37,7 @@ class SupabaseClientAnalystTargets:
         self.client: Client = create_client(supabase_url, supabase_key)
         self.logger = logger
     
+    @track_db_write('analyst_profiles')
     def insert_analyst_profile(self, profile: AnalystProfile) -> Optional[str]:
         """
         분석가 프로필 삽입
@@ -50,7 +53,7 @@ class SupabaseClientAnalystTargets:
                 log_error(self.logger, None, f"분석가 프로필 유효성 검증 실패: {profile.name}")
                 return None
             
-            data = profile.dict(exclude={'id'})
+            data = to_row(profile, exclude={'id'})
             data['created_at'] = datetime.now().isoformat()
             data['updated_at'] = datetime.now().isoformat()
             
@@ -89,7 +92,7 @@ class SupabaseClientAnalystTargets:
             if existing.data:
                 # 업데이트
                 profile_id = existing.data[0]['id']
-                data = profile.dict(exclude={'id'})
+                data = to_row(profile, exclude={'id'})
                 data['updated_at'] = datetime.now().isoformat()
                 
                 self.client.table('analyst_profiles')\
@@ -107,6 +110,7 @@ class SupabaseClientAnalystTargets:
             log_error(self.logger, e, f"분석가 프로필 업서트 오류: {profile.name}")
             return None
     
+    @track_db_write('analyst_targets')
     def insert_analyst_target(self, target: AnalystTarget) -> Optional[str]:
         """
         분석가 목표가 삽입
@@ -122,18 +126,10 @@ class SupabaseClientAnalystTargets:
                 log_error(self.logger, None, f"가격 목표가 유효성 검증 실패: {target.symbol}")
                 return None
             
-            data = target.dict(exclude={'id'})
+            data = to_row(target, exclude={'id'})
             data['created_at'] = datetime.now().isoformat()
             data['updated_at'] = datetime.now().isoformat()
             
-            # Decimal을 float로 변환
-            if isinstance(data.get('current_price'), Decimal):
-                data['current_price'] = float(data['current_price'])
-            if isinstance(data.get('target_price'), Decimal):
-                data['target_price'] = float(data['target_price'])
-            if isinstance(data.get('price_change_percent'), Decimal):
-                data['price_change_percent'] = float(data['price_change_percent'])
-            
             response = self.client.table('analyst_targets').insert(data).execute()
             
             if response.data:
@@ -148,6 +144,7 @@ class SupabaseClientAnalystTargets:
             log_error(self.logger, e, f"분석가 목표가 삽입 오류: {target.symbol}")
             return None
     
+    @track_db_write('prediction_accuracy')
     def insert_prediction_accuracy(self, accuracy: PredictionAccuracy) -> Optional[str]:
         """
         예측 정확도 삽입
@@ -159,17 +156,9 @@ class SupabaseClientAnalystTargets:
             삽입된 레코드의 ID 또는 None
         """
         try:
-            data = accuracy.dict(exclude={'id'})
+            data = to_row(accuracy, exclude={'id'})
             data['created_at'] = datetime.now().isoformat()
             
-            # Decimal을 float로 변환
-            if isinstance(data.get('predicted_price'), Decimal):
-                data['predicted_price'] = float(data['predicted_price'])
-            if isinstance(data.get('actual_price'), Decimal):
-                data['actual_price'] = float(data['actual_price'])
-            if isinstance(data.get('price_accuracy'), Decimal):
-                data['price_accuracy'] = float(data['price_accuracy'])
-            
             response = self.client.table('prediction_accuracy').insert(data).execute()
             
             if response.data:
@@ -184,6 +173,7 @@ class SupabaseClientAnalystTargets:
             log_error(self.logger, e, f"예측 정확도 삽입 오류: {accuracy.symbol}")
             return None
     
+    @track_db_write('market_insights')
     def insert_market_insight(self, insight: MarketInsight) -> Optional[str]:
         """
         시장 인사이트 삽입
@@ -195,7 +185,7 @@ class SupabaseClientAnalystTargets:
             삽입된 레코드의 ID 또는 None
         """
         try:
-            data = insight.dict(exclude={'id'})
+            data = to_row(insight, exclude={'id'})
             data['created_at'] = datetime.now().isoformat()
             
             response = self.client.table('market_insights').insert(data).execute()
@@ -212,6 +202,7 @@ class SupabaseClientAnalystTargets:
             log_error(self.logger, e, f"시장 인사이트 삽입 오류: {insight.symbol}")
             return None
     
+    @track_db_write('sentiment_analysis')
     def insert_sentiment_analysis(self, sentiment: SentimentAnalysis) -> Optional[str]:
         """
         감성 분석 삽입
@@ -223,7 +214,7 @@ class SupabaseClientAnalystTargets:
             삽입된 레코드의 ID 또는 None
         """
         try:
-            data = sentiment.dict(exclude={'id'})
+            data = to_row(sentiment, exclude={'id'})
             data['created_at'] = datetime.now().isoformat()
             
             response = self.client.table('sentiment_analysis').insert(data).execute()
@@ -240,6 +231,7 @@ class SupabaseClientAnalystTargets:
             log_error(self.logger, e, f"감성 분석 삽입 오류: {sentiment.symbol}")
             return None
     
+    @track_db_write('market_indices')
     def insert_market_index(self, index: MarketIndex) -> Optional[str]:
         """
         시장 지수 삽입
@@ -251,7 +243,7 @@ class SupabaseClientAnalystTargets:
             삽입된 레코드의 ID 또는 None
         """
         try:
-            data = index.dict(exclude={'id'})
+            data = to_row(index, exclude={'id'})
             data['created_at'] = datetime.now().isoformat()
             
             response = self.client.table('market_indices').insert(data).execute()
@@ -268,6 +260,7 @@ class SupabaseClientAnalystTargets:
             log_error(self.logger, e, f"시장 지수 삽입 오류: {index.name}")
             return None
     
+    @track_db_write('sector_analysis')
     def insert_sector_analysis(self, sector: SectorAnalysis) -> Optional[str]:
         """
         섹터 분석 삽입
@@ -279,7 +272,7 @@ class SupabaseClientAnalystTargets:
             삽입된 레코드의 ID 또는 None
         """
         try:
-            data = sector.dict(exclude={'id'})
+            data = to_row(sector, exclude={'id'})
             data['created_at'] = datetime.now().isoformat()
             
             response = self.client.table('sector_analysis').insert(data).execute()
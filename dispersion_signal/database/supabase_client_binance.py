@@ -2,7 +2,6 @@
 Supabase 클라이언트 및 데이터베이스 작업 (Binance API 버전)
 """
 from typing import List, Dict, Any, Optional
-from datetime import datetime, date
 from uuid import UUID
 import logging
 from supabase import create_client, Client
@@ -13,7 +12,9 @@ from .models_binance import (
     CryptocurrencyBinance, MarketDataDaily, PriceHistory, 
     CurrentPrice, TopCoin, SentimentMetric, DerivativesMetric, DispersionScore
 )
+from .serialization import to_rows
 from utils.logger import log_error
+from utils.metrics import track_db_write
 
 class SupabaseClientBinance:
     """Supabase 데이터베이스 클라이언트 (Binance API 버전)"""
@@ -57,6 +58,7 @@ class SupabaseClientBinance:
             log_error(self.logger, e, f"crypto_id 조회 실패: {symbol}")
             return None
     
+    @track_db_write('cryptocurrencies')
     def upsert_cryptocurrencies(self, coins: List[TopCoin]) -> bool:
         """
         코인 마스터 데이터 업서트
@@ -90,6 +92,7 @@ class SupabaseClientBinance:
             log_error(self.logger, e, "코인 마스터 데이터 업서트 실패")
             return False
     
+    @track_db_write('market_data_daily')
     def insert_market_data_daily(self, market_data: List[MarketDataDaily]) -> bool:
         """
         일일 시장 데이터 배치 삽입
@@ -101,21 +104,7 @@ class SupabaseClientBinance:
             성공 여부
         """
         try:
-            data = []
-            for data_point in market_data:
-                data_dict = data_point.dict()
-                data_dict['crypto_id'] = str(data_dict['crypto_id'])
-                
-                # Decimal을 float로 변환
-                for key, value in data_dict.items():
-                    if hasattr(value, '__class__') and value.__class__.__name__ == 'Decimal':
-                        data_dict[key] = float(value)
-                    elif isinstance(value, date):
-                        data_dict[key] = value.isoformat()
-                    elif isinstance(value, datetime):
-                        data_dict[key] = value.isoformat()
-                
-                data.append(data_dict)
+            data = to_rows(market_data)
             
             response = self.client.table('market_data_daily')\
                 .upsert(data, on_conflict='crypto_id,date,data_source')\
@@ -128,6 +117,7 @@ class SupabaseClientBinance:
             log_error(self.logger, e, "일일 시장 데이터 삽입 실패")
             return False
     
+    @track_db_write('price_history')
     def insert_price_history(self, price_history: List[PriceHistory]) -> bool:
         """
         히스토리컬 가격 데이터 배치 삽입
@@ -139,19 +129,7 @@ class SupabaseClientBinance:
             성공 여부
         """
         try:
-            data = []
-            for price_point in price_history:
-                price_dict = price_point.dict()
-                price_dict['crypto_id'] = str(price_dict['crypto_id'])
-                
-                # Decimal을 float로 변환
-                for key, value in price_dict.items():
-                    if hasattr(value, '__class__') and value.__class__.__name__ == 'Decimal':
-                        price_dict[key] = float(value)
-                    elif isinstance(value, datetime):
-                        price_dict[key] = value.isoformat()
-                
-                data.append(price_dict)
+            data = to_rows(price_history)
             
             response = self.client.table('price_history')\
                 .upsert(data, on_conflict='crypto_id,timestamp,data_source')\
@@ -164,6 +142,7 @@ class SupabaseClientBinance:
             log_error(self.logger, e, "히스토리컬 가격 데이터 삽입 실패")
             return False
     
+    @track_db_write('current_prices')
     def insert_current_prices(self, current_prices: List[CurrentPrice]) -> bool:
         """
         현재 가격 데이터 배치 삽입
@@ -175,19 +154,7 @@ class SupabaseClientBinance:
             성공 여부
         """
         try:
-            data = []
-            for price_point in current_prices:
-                price_dict = price_point.dict()
-                price_dict['crypto_id'] = str(price_dict['crypto_id'])
-                
-                # Decimal을 float로 변환
-                for key, value in price_dict.items():
-                    if hasattr(value, '__class__') and value.__class__.__name__ == 'Decimal':
-                        price_dict[key] = float(value)
-                    elif isinstance(value, datetime):
-                        price_dict[key] = value.isoformat()
-                
-                data.append(price_dict)
+            data = to_rows(current_prices)
             
             response = self.client.table('current_prices')\
                 .upsert(data, on_conflict='crypto_id,timestamp,data_source')\
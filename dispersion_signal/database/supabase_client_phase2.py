@@ -2,7 +2,6 @@
 Supabase 클라이언트 및 데이터베이스 작업 (Phase 2)
 """
 from typing import List, Dict, Any, Optional
-from datetime import datetime
 from uuid import UUID
 import logging
 from supabase import create_client, Client
@@ -13,7 +12,9 @@ from .models_phase2 import (
     MarketCapData, SocialData, NewsSentiment, GlobalMetrics,
     CryptocurrencyBinance, MarketDataDaily, PriceHistory, CurrentPrice
 )
+from .serialization import to_row, to_rows
 from utils.logger import log_error
+from utils.metrics import track_db_write
 
 class SupabaseClientPhase2:
     """Supabase 데이터베이스 클라이언트 (Phase 2)"""
@@ -57,6 +58,7 @@ class SupabaseClientPhase2:
             log_error(self.logger, e, f"crypto_id 조회 실패: {symbol}")
             return None
     
+    @track_db_write('market_cap_data')
     def insert_market_cap_data(self, market_cap_data: List[MarketCapData]) -> bool:
         """
         시가총액 데이터 배치 삽입
@@ -68,19 +70,7 @@ class SupabaseClientPhase2:
             성공 여부
         """
         try:
-            data = []
-            for data_point in market_cap_data:
-                data_dict = data_point.dict()
-                data_dict['crypto_id'] = str(data_dict['crypto_id'])
-                
-                # Decimal을 float로 변환
-                for key, value in data_dict.items():
-                    if hasattr(value, '__class__') and value.__class__.__name__ == 'Decimal':
-                        data_dict[key] = float(value)
-                    elif isinstance(value, datetime):
-                        data_dict[key] = value.isoformat()
-                
-                data.append(data_dict)
+            data = to_rows(market_cap_data)
             
             response = self.client.table('market_cap_data')\
                 .upsert(data, on_conflict='crypto_id,timestamp,data_source')\
@@ -93,6 +83,7 @@ class SupabaseClientPhase2:
             log_error(self.logger, e, "시가총액 데이터 삽입 실패")
             return False
     
+    @track_db_write('social_data')
     def insert_social_data(self, social_data: List[SocialData]) -> bool:
         """
         소셜 데이터 배치 삽입
@@ -104,19 +95,7 @@ class SupabaseClientPhase2:
             성공 여부
         """
         try:
-            data = []
-            for data_point in social_data:
-                data_dict = data_point.dict()
-                data_dict['crypto_id'] = str(data_dict['crypto_id'])
-                
-                # Decimal을 float로 변환
-                for key, value in data_dict.items():
-                    if hasattr(value, '__class__') and value.__class__.__name__ == 'Decimal':
-                        data_dict[key] = float(value)
-                    elif isinstance(value, datetime):
-                        data_dict[key] = value.isoformat()
-                
-                data.append(data_dict)
+            data = to_rows(social_data)
             
             response = self.client.table('social_data')\
                 .upsert(data, on_conflict='crypto_id,timestamp,data_source')\
@@ -129,6 +108,7 @@ class SupabaseClientPhase2:
             log_error(self.logger, e, "소셜 데이터 삽입 실패")
             return False
     
+    @track_db_write('news_sentiment')
     def insert_news_sentiment(self, news_sentiment: List[NewsSentiment]) -> bool:
         """
         뉴스 감성 데이터 배치 삽입
@@ -140,19 +120,7 @@ class SupabaseClientPhase2:
             성공 여부
         """
         try:
-            data = []
-            for data_point in news_sentiment:
-                data_dict = data_point.dict()
-                data_dict['crypto_id'] = str(data_dict['crypto_id'])
-                
-                # Decimal을 float로 변환
-                for key, value in data_dict.items():
-                    if hasattr(value, '__class__') and value.__class__.__name__ == 'Decimal':
-                        data_dict[key] = float(value)
-                    elif isinstance(value, datetime):
-                        data_dict[key] = value.isoformat()
-                
-                data.append(data_dict)
+            data = to_rows(news_sentiment)
             
             response = self.client.table('news_sentiment')\
                 .upsert(data, on_conflict='crypto_id,timestamp,data_source')\
@@ -165,6 +133,7 @@ class SupabaseClientPhase2:
             log_error(self.logger, e, "뉴스 감성 데이터 삽입 실패")
             return False
     
+    @track_db_write('global_metrics')
     def insert_global_metrics(self, global_metrics: GlobalMetrics) -> bool:
         """
         글로벌 메트릭 데이터 삽입
@@ -176,14 +145,7 @@ class SupabaseClientPhase2:
             성공 여부
         """
         try:
-            data_dict = global_metrics.dict()
-            
-            # Decimal을 float로 변환
-            for key, value in data_dict.items():
-                if hasattr(value, '__class__') and value.__class__.__name__ == 'Decimal':
-                    data_dict[key] = float(value)
-                elif isinstance(value, datetime):
-                    data_dict[key] = value.isoformat()
+            data_dict = to_row(global_metrics)
             
             response = self.client.table('global_metrics')\
                 .upsert([data_dict], on_conflict='timestamp,data_source')\
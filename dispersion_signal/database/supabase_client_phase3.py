@@ -2,7 +2,6 @@
 Supabase 클라이언트 및 데이터베이스 작업 (Phase 3)
 """
 from typing import List, Dict, Any, Optional
-from datetime import datetime, date
 from uuid import UUID
 import logging
 from supabase import create_client, Client
@@ -10,7 +9,9 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from .models_phase3 import DispersionSignal, DispersionSummaryDaily
+from .serialization import to_row, to_rows
 from utils.logger import log_error
+from utils.metrics import track_db_write
 
 class SupabaseClientPhase3:
     """Supabase 데이터베이스 클라이언트 (Phase 3)"""
@@ -54,6 +55,7 @@ class SupabaseClientPhase3:
             log_error(self.logger, e, f"crypto_id 조회 실패: {symbol}")
             return None
     
+    @track_db_write('dispersion_signals')
     def insert_dispersion_signals(self, signals: List[DispersionSignal]) -> bool:
         """
         분산도 신호 데이터 배치 삽입
@@ -65,19 +67,7 @@ class SupabaseClientPhase3:
             성공 여부
         """
         try:
-            data = []
-            for signal in signals:
-                data_dict = signal.dict()
-                data_dict['crypto_id'] = str(data_dict['crypto_id'])
-                
-                # Decimal을 float로 변환
-                for key, value in data_dict.items():
-                    if hasattr(value, '__class__') and value.__class__.__name__ == 'Decimal':
-                        data_dict[key] = float(value)
-                    elif isinstance(value, datetime):
-                        data_dict[key] = value.isoformat()
-                
-                data.append(data_dict)
+            data = to_rows(signals)
             
             response = self.client.table('dispersion_signals')\
                 .upsert(data, on_conflict='crypto_id,timestamp')\
@@ -90,6 +80,7 @@ class SupabaseClientPhase3:
             log_error(self.logger, e, "분산도 신호 데이터 삽입 실패")
             return False
     
+    @track_db_write('dispersion_summary_daily')
     def insert_dispersion_summary(self, summary: DispersionSummaryDaily) -> bool:
         """
         일일 분산도 요약 데이터 삽입
@@ -101,14 +92,7 @@ class SupabaseClientPhase3:
             성공 여부
         """
         try:
-            data_dict = summary.dict()
-            
-            # Decimal을 float로 변환
-            for key, value in data_dict.items():
-                if hasattr(value, '__class__') and value.__class__.__name__ == 'Decimal':
-                    data_dict[key] = float(value)
-                elif isinstance(value, date):
-                    data_dict[key] = value.isoformat()
+            data_dict = to_row(summary)
             
             response = self.client.table('dispersion_summary_daily')\
                 .upsert([data_dict], on_conflict='date')\
@@ -2,7 +2,6 @@
 Supabase 클라이언트 및 데이터베이스 작업 (Phase 4)
 """
 from typing import List, Dict, Any, Optional
-from datetime import datetime
 from uuid import UUID
 import logging
 from supabase import create_client, Client
@@ -10,7 +9,9 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from .models_phase4 import MultiSourcePrice, RedditSentiment, EnhancedDispersionSignal
+from .serialization import to_rows
 from utils.logger import log_error
+from utils.metrics import track_db_write
 
 class SupabaseClientPhase4:
     """Supabase 데이터베이스 클라이언트 (Phase 4)"""
@@ -54,6 +55,7 @@ class SupabaseClientPhase4:
             log_error(self.logger, e, f"crypto_id 조회 실패: {symbol}")
             return None
     
+    @track_db_write('multi_source_prices')
     def insert_multi_source_prices(self, prices: List[MultiSourcePrice]) -> bool:
         """
         다중 소스 가격 데이터 배치 삽입
@@ -65,19 +67,7 @@ class SupabaseClientPhase4:
             성공 여부
         """
         try:
-            data = []
-            for price in prices:
-                data_dict = price.dict()
-                data_dict['crypto_id'] = str(data_dict['crypto_id'])
-                
-                # Decimal을 float로 변환
-                for key, value in data_dict.items():
-                    if hasattr(value, '__class__') and value.__class__.__name__ == 'Decimal':
-                        data_dict[key] = float(value)
-                    elif isinstance(value, datetime):
-                        data_dict[key] = value.isoformat()
-                
-                data.append(data_dict)
+            data = to_rows(prices)
             
             response = self.client.table('multi_source_prices')\
                 .upsert(data, on_conflict='crypto_id,timestamp')\
@@ -90,6 +80,7 @@ class SupabaseClientPhase4:
             log_error(self.logger, e, "다중 소스 가격 데이터 삽입 실패")
             return False
     
+    @track_db_write('reddit_sentiment')
     def insert_reddit_sentiment(self, sentiments: List[RedditSentiment]) -> bool:
         """
         Reddit 감성 데이터 배치 삽입
@@ -101,19 +92,7 @@ class SupabaseClientPhase4:
             성공 여부
         """
         try:
-            data = []
-            for sentiment in sentiments:
-                data_dict = sentiment.dict()
-                data_dict['crypto_id'] = str(data_dict['crypto_id'])
-                
-                # Decimal을 float로 변환
-                for key, value in data_dict.items():
-                    if hasattr(value, '__class__') and value.__class__.__name__ == 'Decimal':
-                        data_dict[key] = float(value)
-                    elif isinstance(value, datetime):
-                        data_dict[key] = value.isoformat()
-                
-                data.append(data_dict)
+            data = to_rows(sentiments)
             
             response = self.client.table('reddit_sentiment')\
                 .upsert(data, on_conflict='crypto_id,timestamp,data_source')\
@@ -126,6 +105,7 @@ class SupabaseClientPhase4:
             log_error(self.logger, e, "Reddit 감성 데이터 삽입 실패")
             return False
     
+    @track_db_write('enhanced_dispersion_signals')
     def insert_enhanced_dispersion_signals(self, signals: List[EnhancedDispersionSignal]) -> bool:
         """
         향상된 분산도 신호 데이터 배치 삽입
@@ -137,19 +117,7 @@ class SupabaseClientPhase4:
             성공 여부
         """
         try:
-            data = []
-            for signal in signals:
-                data_dict = signal.dict()
-                data_dict['crypto_id'] = str(data_dict['crypto_id'])
-                
-                # Decimal을 float로 변환
-                for key, value in data_dict.items():
-                    if hasattr(value, '__class__') and value.__class__.__name__ == 'Decimal':
-                        data_dict[key] = float(value)
-                    elif isinstance(value, datetime):
-                        data_dict[key] = value.isoformat()
-                
-                data.append(data_dict)
+            data = to_rows(signals)
             
             response = self.client.table('enhanced_dispersion_signals')\
                 .upsert(data, on_conflict='crypto_id,timestamp')\
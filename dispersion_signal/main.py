@@ -20,6 +20,7 @@ from collectors.cryptoquant import CryptoQuantCollector
 from database.supabase_client import SupabaseClient
 from database.models import OnchainMetric
 from utils.logger import setup_logger, log_data_collection, log_error
+from utils.metrics import track_stage, start_metrics_exporter
 
 def parse_arguments():
     """명령행 인자 파싱"""
@@ -109,6 +110,7 @@ def test_connection(supabase_client: SupabaseClient, logger):
         logger.error("❌ Supabase 연결 실패")
         return False
 
+@track_stage('cryptoquant')
 def collect_cryptoquant_data(symbol: str, days: int, interval: str, dry_run: bool = False) -> bool:
     """
     CryptoQuant 데이터 수집 및 저장
@@ -235,6 +237,7 @@ def collect_cryptoquant_data(symbol: str, days: int, interval: str, dry_run: boo
 def main():
     """메인 함수"""
     args = parse_arguments()
+    start_metrics_exporter('cryptoquant')
     
     # 로거 설정
     logger = setup_logger('dispersion_signal', Config.LOG_FILE, Config.LOG_LEVEL)
@@ -16,6 +16,9 @@ from dotenv import load_dotenv
 # 로컬 모듈 임포트
 from config import Config
 from utils.logger import setup_logger, log_info, log_error
+from utils.metrics import track_stage, start_metrics_exporter
+from utils.scrape_executor import ScrapeExecutor
+from utils.page_cache import get_page_cache
 from database.supabase_client_analyst_targets import SupabaseClientAnalystTargets
 from database.models_analyst_targets import (
     CollectedAnalystData, AnalystProfile, AnalystTarget, 
@@ -59,7 +62,53 @@ class AnalystTargetsCollector:
         self.collectors['upbit_datalab'] = UpbitDataLabCollector()
         
         log_info(logger, f"총 {len(self.collectors)}개 수집기 초기화 완료")
+        
+        # 페이지 요청은 스레드 풀(사이트별 동시 요청/간격 제한), 파싱은 프로세스 풀에서 실행
+        self.executor = ScrapeExecutor(
+            fetch_workers=Config.SCRAPE_FETCH_WORKERS,
+            parse_workers=Config.SCRAPE_PARSE_WORKERS,
+            site_concurrency=Config.SCRAPE_SITE_CONCURRENCY,
+            site_interval=Config.SCRAPE_SITE_INTERVAL
+        )
+        # 페이지별 ETag/Last-Modified/본문 해시 (저장까지 성공한 실행만 다음 실행의 기준으로 반영)
+        self.page_cache = get_page_cache()
+    
+    def close(self):
+        """스레드/프로세스 풀 종료"""
+        self.executor.shutdown()
+    
+    async def _fetch_and_parse(self, site: str, fetch_func, fetch_args: tuple,
+                               parse_method: str, parse_args: tuple = ()) -> Optional[Any]:
+        """
+        페이지 1개 요청 후 파싱 - parse_method(html, *parse_args)
+        요청 실패 또는 지난 실행 이후 변경 없는 페이지(fetch_func(*fetch_args, True))면 None
+        """
+        html_content = await self.executor.fetch(site, fetch_func, *fetch_args, True)
+        if not html_content:
+            return None
+        return await self.executor.parse(type(self.collectors[site]), parse_method, html_content, *parse_args)
+    
+    async def _collect_symbol_pages(self, site: str, fetch_func, parse_method: str,
+                                    symbols: List[str]) -> Dict[str, Any]:
+        """심볼별 페이지를 동시에 요청/파싱해 한 사이트의 수집 데이터로 합침 (파싱한 페이지가 없으면 빈 딕셔너리)"""
+        collector = self.collectors[site]
+        data = {'analyst_profiles': [dict(collector.ANALYST_PROFILE)], 'analyst_targets': [], 'insights': []}
+        
+        results = await asyncio.gather(
+            *(self._fetch_and_parse(site, fetch_func, (symbol,), parse_method, (symbol,)) for symbol in symbols),
+            return_exceptions=True
+        )
+        parsed_pages = 0
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, Exception):
+                log_error(logger, result, f"{site} {symbol} 데이터 수집 실패")
+            elif result:
+                parsed_pages += 1
+                data['analyst_targets'].extend(result['analyst_targets'])
+                data['insights'].extend(result['insights'])
+        return data if parsed_pages else {}
     
+    @track_stage('analyst_targets')
     async def collect_from_messari(self, symbols: List[str]) -> Dict[str, Any]:
         """Messari에서 데이터 수집"""
         if 'messari' not in self.collectors:
@@ -67,51 +116,117 @@ class AnalystTargetsCollector:
         
         try:
             log_info(logger, "Messari 데이터 수집 시작")
-            data = self.collectors['messari'].collect_analyst_data(symbols)
+            data = await self.executor.run_blocking(self.collectors['messari'].collect_analyst_data, symbols)
             log_info(logger, f"Messari 데이터 수집 완료: {len(data.get('analyst_targets', []))}개 목표가")
             return data
         except Exception as e:
             log_error(logger, e, "Messari 데이터 수집 실패")
             return {}
     
+    @track_stage('analyst_targets')
     async def collect_from_digitalcoinprice(self, symbols: List[str]) -> Dict[str, Any]:
         """DigitalCoinPrice에서 데이터 수집"""
         try:
             log_info(logger, "DigitalCoinPrice 데이터 수집 시작")
-            data = self.collectors['digitalcoinprice'].collect_analyst_data(symbols)
+            collector = self.collectors['digitalcoinprice']
+            data = await self._collect_symbol_pages(
+                'digitalcoinprice', collector.get_coin_forecast_page, 'parse_forecast_page', symbols
+            )
             log_info(logger, f"DigitalCoinPrice 데이터 수집 완료: {len(data.get('analyst_targets', []))}개 목표가")
             return data
         except Exception as e:
             log_error(logger, e, "DigitalCoinPrice 데이터 수집 실패")
             return {}
     
+    @track_stage('analyst_targets')
     async def collect_from_coinpriceforecast(self, symbols: List[str]) -> Dict[str, Any]:
         """CoinPriceForecast에서 데이터 수집"""
         try:
             log_info(logger, "CoinPriceForecast 데이터 수집 시작")
-            data = self.collectors['coinpriceforecast'].collect_analyst_data(symbols)
+            collector = self.collectors['coinpriceforecast']
+            data = await self._collect_symbol_pages(
+                'coinpriceforecast', collector.get_coin_prediction_page, 'parse_prediction_page', symbols
+            )
             log_info(logger, f"CoinPriceForecast 데이터 수집 완료: {len(data.get('analyst_targets', []))}개 목표가")
             return data
         except Exception as e:
             log_error(logger, e, "CoinPriceForecast 데이터 수집 실패")
             return {}
     
-    async def collect_from_coinness(self, symbols: List[str]) -> Dict[str, Any]:
+    @track_stage('analyst_targets')
+    async def collect_from_coinness(self, symbols: List[str], max_pages: int = 3) -> Dict[str, Any]:
         """Coinness에서 데이터 수집"""
         try:
             log_info(logger, "Coinness 데이터 수집 시작")
-            data = self.collectors['coinness'].collect_analyst_data(symbols)
+            collector = self.collectors['coinness']
+            
+            # 뉴스 목록 페이지 + 코인별 뉴스 페이지 (기사 순서는 순차 수집과 동일)
+            pages = [(collector.fetch_news_page, page) for page in range(1, max_pages + 1)]
+            pages += [(collector.fetch_coin_specific_news, symbol) for symbol in symbols]
+            fetched = await asyncio.gather(
+                *(self.executor.fetch('coinness', fetch, arg) for fetch, arg in pages),
+                return_exceptions=True
+            )
+            for result in fetched:
+                if isinstance(result, Exception):
+                    log_error(logger, result, "Coinness 페이지 요청 실패")
+            fetched = [page for page in fetched if page is not None and not isinstance(page, Exception)]
+            if not fetched:
+                return {}
+            
+            # 감성 분석은 전체 기사 기준이므로 페이지 단위가 아니라 모든 페이지가 그대로일 때만 건너뜀
+            if not any(page.changed for page in fetched):
+                log_info(logger, f"Coinness 페이지 {len(fetched)}개 모두 변경 없음, 파싱/저장 건너뜀")
+                return {}
+            
+            results = await asyncio.gather(
+                *(self.executor.parse(type(collector), 'parse_news_articles', page.text)
+                  for page in fetched if page.text),
+                return_exceptions=True
+            )
+            all_articles = []
+            for result in results:
+                if isinstance(result, Exception):
+                    log_error(logger, result, "Coinness 뉴스 파싱 실패")
+                elif result:
+                    all_articles.extend(result)
+            
+            # 중복 제거/목표가 추출/감성 분석도 프로세스 풀에서
+            data = await self.executor.parse(type(collector), 'build_analyst_data', all_articles)
             log_info(logger, f"Coinness 데이터 수집 완료: {len(data.get('analyst_targets', []))}개 목표가")
             return data
         except Exception as e:
             log_error(logger, e, "Coinness 데이터 수집 실패")
             return {}
     
+    @track_stage('analyst_targets')
     async def collect_from_upbit_datalab(self) -> Dict[str, Any]:
         """Upbit DataLab에서 데이터 수집"""
         try:
             log_info(logger, "Upbit DataLab 데이터 수집 시작")
-            data = self.collectors['upbit_datalab'].collect_analyst_data()
+            collector = self.collectors['upbit_datalab']
+            data = {
+                'analyst_profiles': [dict(collector.ANALYST_PROFILE)],
+                'analyst_targets': [],
+                'insights': [],
+                'market_indices': [],
+                'sector_analysis': []
+            }
+            
+            # 메인(시장 지수), 인사이트, 섹터 분석 페이지를 동시에 요청/파싱
+            indices, insights_data, sectors = await asyncio.gather(
+                self._fetch_and_parse('upbit_datalab', collector.get_main_page, (), 'parse_market_indices'),
+                self._fetch_and_parse('upbit_datalab', collector.get_insights_page, (), 'parse_insights_page'),
+                self._fetch_and_parse('upbit_datalab', collector.get_sector_analysis_page, (), 'parse_sector_analysis')
+            )
+            data['market_indices'].extend(indices or [])
+            if insights_data:
+                data['insights'].extend(insights_data['insights'])
+                data['analyst_targets'].extend(insights_data['analyst_targets'])
+            data['sector_analysis'].extend(sectors or [])
+            if indices is None and insights_data is None and sectors is None:
+                log_info(logger, "Upbit DataLab 파싱한 페이지 없음, 저장 건너뜀")
+                return {}
             log_info(logger, f"Upbit DataLab 데이터 수집 완료: {len(data.get('analyst_targets', []))}개 목표가")
             return data
         except Exception as e:
@@ -183,6 +298,7 @@ class AnalystTargetsCollector:
         log_info(logger, f"데이터 통합 완료: 총 {merged_data.total_records}개 레코드")
         return merged_data
     
+    @track_stage('analyst_targets')
     async def collect_all_data(self, symbols: List[str], dry_run: bool = False) -> bool:
         """모든 소스에서 데이터 수집"""
         try:
@@ -195,7 +311,7 @@ class AnalystTargetsCollector:
             if 'messari' in self.collectors:
                 tasks.append(self.collect_from_messari(symbols))
             
-            # 웹 스크래핑 (병렬 실행)
+            # 웹 스크래핑 (사이트 간/사이트 내 페이지 동시 요청, 파싱은 프로세스 풀)
             tasks.append(self.collect_from_digitalcoinprice(symbols))
             tasks.append(self.collect_from_coinpriceforecast(symbols))
             tasks.append(self.collect_from_coinness(symbols))
@@ -218,6 +334,8 @@ class AnalystTargetsCollector:
             if dry_run:
                 log_info(logger, f"Dry-run 모드: 데이터 저장 건너뜀")
                 log_info(logger, f"수집된 데이터: {merged_data.total_records}개 레코드")
+                # 저장하지 않았으므로 다음 실행에서 같은 페이지를 다시 처리
+                self.page_cache.discard()
                 return True
             
             # Supabase에 저장
@@ -227,10 +345,17 @@ class AnalystTargetsCollector:
             total_saved = sum(save_results[key] for key in save_results if key != 'errors')
             log_info(logger, f"데이터 저장 완료: {total_saved}개 성공, {save_results['errors']}개 실패")
             
+            # 모두 저장된 경우에만 페이지 검증자/해시 반영 (실패 시 다음 실행에서 변경 없음으로 건너뛰지 않음)
+            if save_results['errors'] == 0:
+                self.page_cache.commit()
+            else:
+                self.page_cache.discard()
+            
             return save_results['errors'] == 0
             
         except Exception as e:
             log_error(logger, e, "분석가 목표가 데이터 수집 실패")
+            self.page_cache.discard()
             return False
     
     def get_collection_status(self) -> Dict[str, Any]:
@@ -280,6 +405,7 @@ async def main():
                        help='최대 수집할 코인 수')
     
     args = parser.parse_args()
+    start_metrics_exporter('analyst_targets')
     
     # 환경 변수 로드
     load_dotenv()
@@ -287,75 +413,79 @@ async def main():
     # 수집기 초기화
     collector = AnalystTargetsCollector()
     
-    if args.mode == 'test':
-        # 수집기 테스트 (데이터베이스 연결 없이)
-        log_info(logger, "수집기 테스트 시작")
-        test_symbols = args.symbols[:3]  # 처음 3개만 테스트
-        
-        # Messari 테스트
-        if 'messari' in collector.collectors:
+    # 수집 중 예외가 나도 스레드/프로세스 풀은 항상 종료
+    try:
+        if args.mode == 'test':
+            # 수집기 테스트 (데이터베이스 연결 없이)
+            log_info(logger, "수집기 테스트 시작")
+            test_symbols = args.symbols[:3]  # 처음 3개만 테스트
+            
+            # Messari 테스트
+            if 'messari' in collector.collectors:
+                try:
+                    messari_data = await collector.collect_from_messari(test_symbols)
+                    log_info(logger, f"✅ Messari 테스트 성공: {len(messari_data.get('analyst_targets', []))}개 목표가")
+                except Exception as e:
+                    log_error(logger, e, "❌ Messari 테스트 실패")
+            
+            # 웹 스크래핑 테스트
             try:
-                messari_data = await collector.collect_from_messari(test_symbols)
-                log_info(logger, f"✅ Messari 테스트 성공: {len(messari_data.get('analyst_targets', []))}개 목표가")
+                digitalcoinprice_data = await collector.collect_from_digitalcoinprice(test_symbols)
+                log_info(logger, f"✅ DigitalCoinPrice 테스트 성공: {len(digitalcoinprice_data.get('analyst_targets', []))}개 목표가")
             except Exception as e:
-                log_error(logger, e, "❌ Messari 테스트 실패")
-        
-        # 웹 스크래핑 테스트
-        try:
-            digitalcoinprice_data = await collector.collect_from_digitalcoinprice(test_symbols)
-            log_info(logger, f"✅ DigitalCoinPrice 테스트 성공: {len(digitalcoinprice_data.get('analyst_targets', []))}개 목표가")
-        except Exception as e:
-            log_error(logger, e, "❌ DigitalCoinPrice 테스트 실패")
-        
-        try:
-            coinpriceforecast_data = await collector.collect_from_coinpriceforecast(test_symbols)
-            log_info(logger, f"✅ CoinPriceForecast 테스트 성공: {len(coinpriceforecast_data.get('analyst_targets', []))}개 목표가")
-        except Exception as e:
-            log_error(logger, e, "❌ CoinPriceForecast 테스트 실패")
-        
-        try:
-            coinness_data = await collector.collect_from_coinness(test_symbols)
-            log_info(logger, f"✅ Coinness 테스트 성공: {len(coinness_data.get('analyst_targets', []))}개 목표가")
-        except Exception as e:
-            log_error(logger, e, "❌ Coinness 테스트 실패")
-        
-        try:
-            upbit_data = await collector.collect_from_upbit_datalab()
-            log_info(logger, f"✅ Upbit DataLab 테스트 성공: {len(upbit_data.get('analyst_targets', []))}개 목표가")
-        except Exception as e:
-            log_error(logger, e, "❌ Upbit DataLab 테스트 실패")
-        
-        log_info(logger, "수집기 테스트 완료")
-    
-    elif args.mode == 'status':
-        # 상태 조회
-        log_info(logger, "수집 상태 조회 시작")
-        status = collector.get_collection_status()
-        
-        log_info(logger, f"수집 상태: {status['status']}")
-        log_info(logger, f"최근 목표가: {status.get('recent_targets_count', 0)}개")
-        log_info(logger, f"상위 분석가: {status.get('top_analysts_count', 0)}개")
-        log_info(logger, f"코인별 집계: {status.get('coin_summaries_count', 0)}개")
-        
-        if status['status'] == 'error':
-            log_error(logger, None, f"상태 조회 오류: {status.get('error', 'Unknown error')}")
-    
-    elif args.mode == 'collect':
-        # 데이터 수집
-        symbols = args.symbols[:args.max_symbols]
-        
-        log_info(logger, f"분석가 목표가 데이터 수집 시작: {len(symbols)}개 코인")
-        log_info(logger, f"수집 대상 코인: {', '.join(symbols)}")
-        
-        if args.dry_run:
-            log_info(logger, "Dry-run 모드로 실행")
+                log_error(logger, e, "❌ DigitalCoinPrice 테스트 실패")
+            
+            try:
+                coinpriceforecast_data = await collector.collect_from_coinpriceforecast(test_symbols)
+                log_info(logger, f"✅ CoinPriceForecast 테스트 성공: {len(coinpriceforecast_data.get('analyst_targets', []))}개 목표가")
+            except Exception as e:
+                log_error(logger, e, "❌ CoinPriceForecast 테스트 실패")
+            
+            try:
+                coinness_data = await collector.collect_from_coinness(test_symbols)
+                log_info(logger, f"✅ Coinness 테스트 성공: {len(coinness_data.get('analyst_targets', []))}개 목표가")
+            except Exception as e:
+                log_error(logger, e, "❌ Coinness 테스트 실패")
+            
+            try:
+                upbit_data = await collector.collect_from_upbit_datalab()
+                log_info(logger, f"✅ Upbit DataLab 테스트 성공: {len(upbit_data.get('analyst_targets', []))}개 목표가")
+            except Exception as e:
+                log_error(logger, e, "❌ Upbit DataLab 테스트 실패")
+            
+            log_info(logger, "수집기 테스트 완료")
         
-        success = await collector.collect_all_data(symbols, dry_run=args.dry_run)
+        elif args.mode == 'status':
+            # 상태 조회
+            log_info(logger, "수집 상태 조회 시작")
+            status = collector.get_collection_status()
+            
+            log_info(logger, f"수집 상태: {status['status']}")
+            log_info(logger, f"최근 목표가: {status.get('recent_targets_count', 0)}개")
+            log_info(logger, f"상위 분석가: {status.get('top_analysts_count', 0)}개")
+            log_info(logger, f"코인별 집계: {status.get('coin_summaries_count', 0)}개")
+            
+            if status['status'] == 'error':
+                log_error(logger, None, f"상태 조회 오류: {status.get('error', 'Unknown error')}")
         
-        if success:
-            log_info(logger, "✅ 분석가 목표가 데이터 수집 완료")
-        else:
-            log_error(logger, None, "❌ 분석가 목표가 데이터 수집 실패")
+        elif args.mode == 'collect':
+            # 데이터 수집
+            symbols = args.symbols[:args.max_symbols]
+            
+            log_info(logger, f"분석가 목표가 데이터 수집 시작: {len(symbols)}개 코인")
+            log_info(logger, f"수집 대상 코인: {', '.join(symbols)}")
+            
+            if args.dry_run:
+                log_info(logger, "Dry-run 모드로 실행")
+            
+            success = await collector.collect_all_data(symbols, dry_run=args.dry_run)
+            
+            if success:
+                log_info(logger, "✅ 분석가 목표가 데이터 수집 완료")
+            else:
+                log_error(logger, None, "❌ 분석가 목표가 데이터 수집 실패")
+    finally:
+        collector.close()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -22,6 +22,7 @@ from database.models_binance import (
     CurrentPrice, TopCoin
 )
 from utils.logger import setup_logger, log_data_collection, log_error
+from utils.metrics import track_stage, start_metrics_exporter
 
 def parse_arguments():
     """명령행 인자 파싱"""
@@ -126,6 +127,7 @@ def test_connection(supabase_client: SupabaseClientBinance, logger):
         logger.error("❌ Supabase 연결 실패")
         return False
 
+@track_stage('binance')
 def collect_top_coins(binance_collector: BinanceCollector, supabase_client: SupabaseClientBinance, 
                      coins_count: int, logger) -> List[str]:
     """
@@ -188,6 +190,7 @@ def collect_top_coins(binance_collector: BinanceCollector, supabase_client: Supa
         log_error(logger, e, "상위 코인 수집")
         return []
 
+@track_stage('binance')
 def collect_daily_data(binance_collector: BinanceCollector, supabase_client: SupabaseClientBinance,
                       symbols: List[str], dry_run: bool, logger) -> bool:
     """
@@ -280,6 +283,7 @@ def collect_daily_data(binance_collector: BinanceCollector, supabase_client: Sup
         log_error(logger, e, "일일 데이터 수집 프로세스")
         return False
 
+@track_stage('binance')
 def collect_historical_data(binance_collector: BinanceCollector, supabase_client: SupabaseClientBinance,
                           symbols: List[str], days: int, dry_run: bool, logger) -> bool:
     """
@@ -367,6 +371,7 @@ def collect_historical_data(binance_collector: BinanceCollector, supabase_client
 def main():
     """메인 함수"""
     args = parse_arguments()
+    start_metrics_exporter('binance')
     
     # 로거 설정
     logger = setup_logger('dispersion_signal', Config.LOG_FILE, Config.LOG_LEVEL)
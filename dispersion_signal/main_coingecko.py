@@ -19,6 +19,7 @@ from collectors.coingecko import CoinGeckoCollector
 from database.supabase_client import SupabaseClient
 from database.models_coingecko import MarketMetric, PriceHistory, ExchangeData
 from utils.logger import setup_logger, log_data_collection, log_error
+from utils.metrics import track_stage, start_metrics_exporter
 
 def parse_arguments():
     """명령행 인자 파싱"""
@@ -99,6 +100,7 @@ def test_connection(supabase_client: SupabaseClient, logger):
         logger.error("❌ Supabase 연결 실패")
         return False
 
+@track_stage('coingecko')
 def collect_coingecko_data(symbol: str, days: int, dry_run: bool = False) -> bool:
     """
     CoinGecko 데이터 수집 및 저장
@@ -267,6 +269,7 @@ def collect_coingecko_data(symbol: str, days: int, dry_run: bool = False) -> boo
 def main():
     """메인 함수"""
     args = parse_arguments()
+    start_metrics_exporter('coingecko')
     
     # 로거 설정
     logger = setup_logger('dispersion_signal', Config.LOG_FILE, Config.LOG_LEVEL)
@@ -15,6 +15,8 @@ from typing import List, Dict, Any, Optional
 from uuid import UUID
 from decimal import Decimal
 
+import requests
+
 # 프로젝트 모듈 임포트
 from config import Config
 from collectors.binance import BinanceCollector
@@ -27,15 +29,23 @@ from collectors.reddit import RedditCollector
 
 from database.supabase_client_phase4 import SupabaseClientPhase4
 from database.models_phase4 import MultiSourcePrice, RedditSentiment, EnhancedDispersionSignal
+from database.serialization import construct_trusted
 
 # 새로운 유틸리티 모듈들
 from utils.data_quality import DataQualityValidator
-from utils.monitoring import SystemMonitor, AlertConfig, AlertSeverity
+from utils.monitoring import SystemMonitor, AlertConfig, AlertSeverity, get_system_monitor, set_system_monitor
 from utils.backup import DataBackupManager, BackupConfig, BackupType
 from utils.async_collector import OptimizedDataCollector, AsyncRequestConfig, CacheConfig
 from utils.security import SecurityManager, SecurityConfig, APISecurityValidator
+from utils.retry_policy import deadline_scope
 
 from utils.logger import setup_logger, log_data_collection, log_error
+from utils.metrics import track_stage, start_metrics_exporter
+from utils.tracing import span
+
+# BaseCollector를 거치지 않는 보조 API 호스트 (서킷 브레이커/모니터 키는 BaseCollector와 같은 호스트 단위)
+CRYPTOPANIC_HOST = 'cryptopanic.com'
+ALTERNATIVE_HOST = 'api.alternative.me'
 
 def parse_arguments():
     """명령행 인자 파싱"""
@@ -136,6 +146,20 @@ def parse_arguments():
         help='최대 동시 요청 수 (비동기 모드)'
     )
     
+    parser.add_argument(
+        '--run-deadline',
+        type=float,
+        default=float(os.getenv('RUN_DEADLINE_SECONDS', 1800)),
+        help='전체 수집 실행 제한 시간 (초, 0이면 제한 없음)'
+    )
+    
+    parser.add_argument(
+        '--stage-deadline',
+        type=float,
+        default=float(os.getenv('STAGE_DEADLINE_SECONDS', 600)),
+        help='단계별(가격/감정 분석) 제한 시간 (초, 0이면 제한 없음)'
+    )
+    
     return parser.parse_args()
 
 def initialize_enhanced_system(logger) -> Dict[str, Any]:
@@ -153,6 +177,8 @@ def initialize_enhanced_system(logger) -> Dict[str, Any]:
         slack_webhook_url=""
     )
     monitor = SystemMonitor(alert_config, logger)
+    # 모든 컬렉터의 _make_request가 같은 모니터(서킷 브레이커)를 공유
+    set_system_monitor(monitor)
     
     # 백업 시스템
     backup_config = BackupConfig(
@@ -189,6 +215,7 @@ def initialize_enhanced_system(logger) -> Dict[str, Any]:
         'security_manager': security_manager
     }
 
+@track_stage('enhanced')
 async def collect_multi_source_prices_enhanced(symbols: List[str], supabase_client: SupabaseClientPhase4,
                                               enhanced_system: Dict[str, Any], dry_run: bool, logger) -> bool:
     """개선된 다중 소스 가격 수집"""
@@ -206,18 +233,10 @@ async def collect_multi_source_prices_enhanced(symbols: List[str], supabase_clie
     # 작동하는 API들 추가
     from collectors.binance import BinanceCollector
     from collectors.cryptocompare import CryptoCompareCollector
-    from collectors.reddit import RedditCollector
     from config import Config
     
     binance_collector = BinanceCollector()
     cryptocompare_collector = CryptoCompareCollector(Config.CRYPTOCOMPARE_API_KEY)
-    reddit_collector = RedditCollector(
-        client_id=Config.REDDIT_CLIENT_ID,
-        client_secret=Config.REDDIT_CLIENT_SECRET,
-        username=Config.REDDIT_USERNAME,
-        password=Config.REDDIT_PASSWORD,
-        user_agent=Config.REDDIT_USER_AGENT
-    )
     
     collected_data = []
     success_count = 0
@@ -229,105 +248,86 @@ async def collect_multi_source_prices_enhanced(symbols: List[str], supabase_clie
             # 비동기 가격 수집
             prices = {}
             
-            # CoinCap (DNS 문제로 임시 비활성화)
-            # try:
-            #     coincap_price = coincap_collector.get_coin_price(symbol)
-            #     if coincap_price:
-            #         prices['coincap'] = Decimal(str(coincap_price))
-            #         monitor.monitor_api_call('coincap', True)
-            #     else:
-            #         monitor.monitor_api_call('coincap', False)
-            # except Exception as e:
-            #     monitor.monitor_api_call('coincap', False)
-            #     logger.warning(f"CoinCap {symbol} 가격 수집 실패: {e}")
+            # 가격 API는 모두 BaseCollector 경유 - 결과는 호스트 단위로 모니터/서킷 브레이커에 기록되고,
+            # 호스트 서킷이 열려 있으면 요청 없이 None (여기서 API 이름으로 다시 기록하지 않음)
+            
+            # CoinCap
+            with span('coincap'):
+                try:
+                    coincap_price = coincap_collector.get_coin_price(symbol)
+                    if coincap_price:
+                        prices['coincap'] = Decimal(str(coincap_price))
+                except Exception as e:
+                    logger.warning(f"CoinCap {symbol} 가격 수집 실패: {e}")
             
             # Binance API
-            try:
-                binance_data = binance_collector.get_current_price(symbol + 'USDT')
-                if binance_data and 'data' in binance_data and 'price' in binance_data['data']:
-                    prices['binance'] = Decimal(str(binance_data['data']['price']))
-                    monitor.monitor_api_call('binance', True)
-                else:
-                    monitor.monitor_api_call('binance', False)
-            except Exception as e:
-                monitor.monitor_api_call('binance', False)
-                logger.warning(f"Binance {symbol} 가격 수집 실패: {e}")
+            with span('binance'):
+                try:
+                    binance_data = binance_collector.get_current_price(symbol + 'USDT')
+                    if binance_data and 'data' in binance_data and 'price' in binance_data['data']:
+                        prices['binance'] = Decimal(str(binance_data['data']['price']))
+                except Exception as e:
+                    logger.warning(f"Binance {symbol} 가격 수집 실패: {e}")
             
             # CryptoCompare API (가격 조회 메서드 없음으로 비활성화)
             # try:
             #     cryptocompare_price = cryptocompare_collector.get_price(symbol, 'USD')
             #     if cryptocompare_price:
             #         prices['cryptocompare'] = Decimal(str(cryptocompare_price))
-            #         monitor.monitor_api_call('cryptocompare', True)
-            #     else:
-            #         monitor.monitor_api_call('cryptocompare', False)
             # except Exception as e:
-            #     monitor.monitor_api_call('cryptocompare', False)
             #     logger.warning(f"CryptoCompare {symbol} 가격 수집 실패: {e}")
             
-            # CoinPaprika (402 Payment Required로 임시 비활성화)
-            # try:
-            #     coinpaprika_price = coinpaprika_collector.get_coin_price_by_symbol(symbol)
-            #     if coinpaprika_price:
-            #         prices['coinpaprika'] = Decimal(str(coinpaprika_price))
-            #         monitor.monitor_api_call('coinpaprika', True)
-            #     else:
-            #         monitor.monitor_api_call('coinpaprika', False)
-            # except Exception as e:
-            #     monitor.monitor_api_call('coinpaprika', False)
-            #     logger.warning(f"CoinPaprika {symbol} 가격 수집 실패: {e}")
+            # CoinPaprika (402 등 인증/결제 오류는 재시도/서킷 집계 없이 바로 None)
+            with span('coinpaprika'):
+                try:
+                    coinpaprika_price = coinpaprika_collector.get_coin_price_by_symbol(symbol)
+                    if coinpaprika_price:
+                        prices['coinpaprika'] = Decimal(str(coinpaprika_price))
+                except Exception as e:
+                    logger.warning(f"CoinPaprika {symbol} 가격 수집 실패: {e}")
             
-            # CoinGecko (Rate Limit 문제로 임시 비활성화)
-            # try:
-            #     coingecko_price = coingecko_collector.get_coin_price_by_symbol(symbol)
-            #     if coingecko_price:
-            #         prices['coingecko'] = Decimal(str(coingecko_price))
-            #         monitor.monitor_api_call('coingecko', True)
-            #     else:
-            #         monitor.monitor_api_call('coingecko', False)
-            # except Exception as e:
-            #     monitor.monitor_api_call('coingecko', False)
-            #     logger.warning(f"CoinGecko {symbol} 가격 수집 실패: {e}")
+            # CoinGecko (Rate Limit 시 Retry-After 상한 이내에서만 대기)
+            with span('coingecko'):
+                try:
+                    coingecko_price = coingecko_collector.get_coin_price_by_symbol(symbol)
+                    if coingecko_price:
+                        prices['coingecko'] = Decimal(str(coingecko_price))
+                except Exception as e:
+                    logger.warning(f"CoinGecko {symbol} 가격 수집 실패: {e}")
             
-            # 추가 데이터 소스들 (가격이 아닌 다른 데이터)
+            # 추가 데이터 소스들 (가격이 아닌 다른 데이터, BaseCollector를 거치지 않으므로 직접 호스트 서킷 확인/기록)
             additional_data = {}
             
             # CryptoPanic 뉴스 데이터
-            try:
-                import requests
-                import os
-                from dotenv import load_dotenv
-                load_dotenv()
-                
-                cryptopanic_key = os.getenv('CRYPTOPANIC_API_KEY')
-                if cryptopanic_key:
+            cryptopanic_key = os.getenv('CRYPTOPANIC_API_KEY')
+            if cryptopanic_key and monitor.circuit_breaker.allow_request(CRYPTOPANIC_HOST):
+                try:
+                    start_time = time.time()
                     response = requests.get(
-                        f'https://cryptopanic.com/api/v1/posts/?auth_token={cryptopanic_key}&public=true&currencies={symbol}&limit=5',
+                        f'https://{CRYPTOPANIC_HOST}/api/v1/posts/?auth_token={cryptopanic_key}&public=true&currencies={symbol}&limit=5',
                         timeout=10
                     )
+                    monitor.monitor_api_call(CRYPTOPANIC_HOST, response.status_code == 200, time.time() - start_time)
                     if response.status_code == 200:
                         data = response.json()
                         additional_data['cryptopanic_news_count'] = len(data.get('results', []))
-                        monitor.monitor_api_call('cryptopanic', True)
-                    else:
-                        monitor.monitor_api_call('cryptopanic', False)
-            except Exception as e:
-                monitor.monitor_api_call('cryptopanic', False)
-                logger.warning(f"CryptoPanic {symbol} 뉴스 수집 실패: {e}")
+                except Exception as e:
+                    monitor.monitor_api_call(CRYPTOPANIC_HOST, False)
+                    logger.warning(f"CryptoPanic {symbol} 뉴스 수집 실패: {e}")
             
             # Alternative.me Fear & Greed Index
-            try:
-                response = requests.get('https://api.alternative.me/fng/', timeout=10)
-                if response.status_code == 200:
-                    data = response.json()
-                    if 'data' in data and len(data['data']) > 0:
+            if monitor.circuit_breaker.allow_request(ALTERNATIVE_HOST):
+                try:
+                    start_time = time.time()
+                    response = requests.get(f'https://{ALTERNATIVE_HOST}/fng/', timeout=10)
+                    data = response.json() if response.status_code == 200 else {}
+                    success = bool(data.get('data'))
+                    monitor.monitor_api_call(ALTERNATIVE_HOST, success, time.time() - start_time)
+                    if success:
                         additional_data['fear_greed_index'] = int(data['data'][0]['value'])
-                        monitor.monitor_api_call('alternative', True)
-                    else:
-                        monitor.monitor_api_call('alternative', False)
-            except Exception as e:
-                monitor.monitor_api_call('alternative', False)
-                logger.warning(f"Alternative.me Fear & Greed Index 수집 실패: {e}")
+                except Exception as e:
+                    monitor.monitor_api_call(ALTERNATIVE_HOST, False)
+                    logger.warning(f"Alternative.me Fear & Greed Index 수집 실패: {e}")
             
             # 데이터 품질 검증
             is_valid, errors = quality_validator.validate_price_data(prices, symbol)
@@ -355,7 +355,8 @@ async def collect_multi_source_prices_enhanced(symbols: List[str], supabase_clie
                 
                 crypto_id = supabase_client.get_crypto_id(symbol)
                 if crypto_id:
-                    multi_source_price = MultiSourcePrice(
+                    multi_source_price = construct_trusted(
+                        MultiSourcePrice,
                         crypto_id=crypto_id,
                         timestamp=datetime.now(timezone.utc),
                         coincap_price=prices.get('coincap'),
@@ -386,6 +387,7 @@ async def collect_multi_source_prices_enhanced(symbols: List[str], supabase_clie
     
     return success_count > 0
 
+@track_stage('enhanced')
 async def analyze_reddit_sentiment_enhanced(symbols: List[str], supabase_client: SupabaseClientPhase4,
                                          enhanced_system: Dict[str, Any], dry_run: bool, logger) -> bool:
     """개선된 Reddit 감성 분석"""
@@ -407,13 +409,13 @@ async def analyze_reddit_sentiment_enhanced(symbols: List[str], supabase_client:
         collected_data = []
         success_count = 0
         
+        # 전체 심볼을 한 번에 집계 (scan 모드: 서브레딧 리스팅 1회 스캔)
+        crypto_mentions = reddit_collector.get_crypto_mentions(symbols)
+        
         for symbol in symbols:
             try:
                 logger.info(f"  {symbol} 감성 분석 중...")
                 
-                # Reddit 감성 분석
-                crypto_mentions = reddit_collector.get_crypto_mentions([symbol])
-                
                 if symbol in crypto_mentions:
                     mention_data = crypto_mentions[symbol]
                     total_mentions = mention_data['total_mentions']
@@ -440,7 +442,8 @@ async def analyze_reddit_sentiment_enhanced(symbols: List[str], supabase_client:
                     
                     crypto_id = supabase_client.get_crypto_id(symbol)
                     if crypto_id:
-                        reddit_sentiment = RedditSentiment(
+                        reddit_sentiment = construct_trusted(
+                            RedditSentiment,
                             crypto_id=crypto_id,
                             timestamp=datetime.now(timezone.utc),
                             total_mentions=total_mentions,
@@ -475,6 +478,7 @@ async def analyze_reddit_sentiment_enhanced(symbols: List[str], supabase_client:
         log_error(logger, e, "Reddit 감성 분석")
         return False
 
+@track_stage('enhanced')
 def create_backup(enhanced_system: Dict[str, Any], backup_type: str, logger) -> bool:
     """백업 생성"""
     logger.info(f"💾 {backup_type} 백업 생성 시작...")
@@ -542,6 +546,8 @@ def check_system_status(enhanced_system: Dict[str, Any], logger):
     logger.info(f"  - 잠긴 계정: {system_status.get('locked_accounts', 0)}")
     logger.info(f"  - 최근 이벤트: {system_status.get('recent_events_count', 0)}")
     logger.info(f"  - 실패한 로그인 (24h): {system_status.get('failed_logins_24h', 0)}")
+    for host, circuit in system_status.get('circuit_breakers', {}).items():
+        logger.info(f"  - 서킷 {host}: {circuit['state']} (열림 {circuit['open_count']}회, 차단 {circuit['rejected_calls']}건)")
     
     # 백업 상태
     backup_stats = backup_manager.get_backup_statistics()
@@ -568,6 +574,7 @@ def check_system_status(enhanced_system: Dict[str, Any], logger):
 async def main():
     """메인 함수"""
     args = parse_arguments()
+    start_metrics_exporter('enhanced')
     
     # 로거 설정
     logger = setup_logger('dispersion_signal_enhanced', Config.LOG_FILE, Config.LOG_LEVEL)
@@ -623,14 +630,17 @@ async def main():
         
         success_count = 0
         
-        # 데이터 수집 실행
-        if args.mode in ['prices', 'all']:
-            if await collect_multi_source_prices_enhanced(symbols, supabase_client, enhanced_system, args.dry_run, logger):
-                success_count += 1
-        
-        if args.mode in ['sentiment', 'all']:
-            if await analyze_reddit_sentiment_enhanced(symbols, supabase_client, enhanced_system, args.dry_run, logger):
-                success_count += 1
+        # 데이터 수집 실행 (실행/단계 데드라인이 지나면 컬렉터 재시도 중단)
+        with deadline_scope(args.run_deadline):
+            if args.mode in ['prices', 'all']:
+                with deadline_scope(args.stage_deadline):
+                    if await collect_multi_source_prices_enhanced(symbols, supabase_client, enhanced_system, args.dry_run, logger):
+                        success_count += 1
+            
+            if args.mode in ['sentiment', 'all']:
+                with deadline_scope(args.stage_deadline):
+                    if await analyze_reddit_sentiment_enhanced(symbols, supabase_client, enhanced_system, args.dry_run, logger):
+                        success_count += 1
         
         # 자동 백업
         if args.enable_backup and not args.dry_run:
@@ -650,6 +660,9 @@ async def main():
         logger.info("사용자에 의해 중단됨")
     except Exception as e:
         log_error(logger, e, "메인 프로세스")
+    finally:
+        # 대기 중인 알림 전송 후 종료
+        get_system_monitor().close()
 
 if __name__ == "__main__":
     asyncio.run(main())
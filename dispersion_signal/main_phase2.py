@@ -22,6 +22,7 @@ from database.models_phase2 import (
     MarketCapData, SocialData, NewsSentiment, GlobalMetrics
 )
 from utils.logger import setup_logger, log_data_collection, log_error
+from utils.metrics import track_stage, start_metrics_exporter
 
 def parse_arguments():
     """명령행 인자 파싱"""
@@ -118,6 +119,7 @@ def test_connection(supabase_client: SupabaseClientPhase2, logger):
         logger.error("❌ Supabase 연결 실패")
         return False
 
+@track_stage('phase2')
 def collect_market_cap_data(coinmarketcap_collector: CoinMarketCapCollector, 
                           supabase_client: SupabaseClientPhase2,
                           symbols: List[str], dry_run: bool, logger) -> bool:
@@ -206,6 +208,7 @@ def collect_market_cap_data(coinmarketcap_collector: CoinMarketCapCollector,
         log_error(logger, e, "시가총액 데이터 수집 프로세스")
         return False
 
+@track_stage('phase2')
 def collect_social_data(cryptocompare_collector: CryptoCompareCollector,
                        supabase_client: SupabaseClientPhase2,
                        symbols: List[str], dry_run: bool, logger) -> bool:
@@ -293,6 +296,7 @@ def collect_social_data(cryptocompare_collector: CryptoCompareCollector,
         log_error(logger, e, "소셜 데이터 수집 프로세스")
         return False
 
+@track_stage('phase2')
 def collect_news_sentiment_data(cryptocompare_collector: CryptoCompareCollector,
                                supabase_client: SupabaseClientPhase2,
                                symbols: List[str], dry_run: bool, logger) -> bool:
@@ -375,6 +379,7 @@ def collect_news_sentiment_data(cryptocompare_collector: CryptoCompareCollector,
         log_error(logger, e, "뉴스 감성 데이터 수집 프로세스")
         return False
 
+@track_stage('phase2')
 def collect_global_metrics(coinmarketcap_collector: CoinMarketCapCollector,
                           supabase_client: SupabaseClientPhase2,
                           dry_run: bool, logger) -> bool:
@@ -445,6 +450,7 @@ def collect_global_metrics(coinmarketcap_collector: CoinMarketCapCollector,
 def main():
     """메인 함수"""
     args = parse_arguments()
+    start_metrics_exporter('phase2')
     
     # 로거 설정
     logger = setup_logger('dispersion_signal_phase2', Config.LOG_FILE, Config.LOG_LEVEL)
@@ -19,6 +19,7 @@ from analysis.dispersion_calculator import DispersionCalculator
 from database.supabase_client_phase3 import SupabaseClientPhase3
 from database.models_phase3 import DispersionSignal, DispersionSummaryDaily
 from utils.logger import setup_logger, log_error
+from utils.metrics import track_stage, start_metrics_exporter
 
 def parse_arguments():
     """명령행 인자 파싱"""
@@ -124,6 +125,7 @@ def test_connection(supabase_client: SupabaseClientPhase3, logger):
         logger.error("❌ Supabase 연결 실패")
         return False
 
+@track_stage('phase3')
 def calculate_dispersion_signals(supabase_client: SupabaseClientPhase3,
                                calculator: DispersionCalculator,
                                symbols: List[str], dry_run: bool, logger) -> bool:
@@ -260,6 +262,7 @@ def calculate_dispersion_signals(supabase_client: SupabaseClientPhase3,
         log_error(logger, e, "분산도 신호 계산 프로세스")
         return False
 
+@track_stage('phase3')
 def generate_daily_summary(supabase_client: SupabaseClientPhase3,
                           calculator: DispersionCalculator,
                           target_date: date, dry_run: bool, logger) -> bool:
@@ -420,6 +423,7 @@ def query_signals(supabase_client: SupabaseClientPhase3,
 def main():
     """메인 함수"""
     args = parse_arguments()
+    start_metrics_exporter('phase3')
     
     # 로거 설정
     logger = setup_logger('dispersion_signal_phase3', Config.LOG_FILE, Config.LOG_LEVEL)
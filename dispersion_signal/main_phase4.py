@@ -22,7 +22,9 @@ from collectors.reddit import RedditCollector
 from analysis.dispersion_calculator import DispersionCalculator
 from database.supabase_client_phase4 import SupabaseClientPhase4
 from database.models_phase4 import MultiSourcePrice, RedditSentiment, EnhancedDispersionSignal
+from database.serialization import construct_trusted
 from utils.logger import setup_logger, log_error
+from utils.metrics import track_stage, start_metrics_exporter
 
 def parse_arguments():
     """명령행 인자 파싱"""
@@ -114,6 +116,7 @@ def test_connection(supabase_client: SupabaseClientPhase4, logger):
         logger.error("❌ Supabase 연결 실패")
         return False
 
+@track_stage('phase4')
 def collect_multi_source_prices(symbols: List[str], supabase_client: SupabaseClientPhase4, 
                                dry_run: bool, logger) -> bool:
     """
@@ -202,7 +205,8 @@ def collect_multi_source_prices(symbols: List[str], supabase_client: SupabaseCli
                 price_dispersion = ((price_max - price_min) / price_avg * 100) if price_avg > 0 else Decimal(0)
                 
                 # MultiSourcePrice 모델 생성
-                multi_price = MultiSourcePrice(
+                multi_price = construct_trusted(
+                    MultiSourcePrice,
                     crypto_id=crypto_id,
                     timestamp=timestamp,
                     binance_price=None,  # 기존 데이터에서 가져올 예정
@@ -249,6 +253,7 @@ def collect_multi_source_prices(symbols: List[str], supabase_client: SupabaseCli
         log_error(logger, e, "다중 소스 가격 수집 프로세스")
         return False
 
+@track_stage('phase4')
 def analyze_reddit_sentiment(symbols: List[str], supabase_client: SupabaseClientPhase4,
                            dry_run: bool, logger) -> bool:
     """
@@ -302,7 +307,8 @@ def analyze_reddit_sentiment(symbols: List[str], supabase_client: SupabaseClient
                 community_interest = min(mentions['total_mentions'] * 2, 100)  # 최대 100
                 
                 # RedditSentiment 모델 생성
-                sentiment = RedditSentiment(
+                sentiment = construct_trusted(
+                    RedditSentiment,
                     crypto_id=crypto_id,
                     timestamp=timestamp,
                     total_mentions=mentions['total_mentions'],
@@ -348,6 +354,7 @@ def analyze_reddit_sentiment(symbols: List[str], supabase_client: SupabaseClient
         log_error(logger, e, "Reddit 감성 분석 프로세스")
         return False
 
+@track_stage('phase4')
 def calculate_enhanced_dispersion(symbols: List[str], supabase_client: SupabaseClientPhase4,
                                 dry_run: bool, logger) -> bool:
     """
@@ -481,6 +488,7 @@ def calculate_enhanced_dispersion(symbols: List[str], supabase_client: SupabaseC
 def main():
     """메인 함수"""
     args = parse_arguments()
+    start_metrics_exporter('phase4')
     
     # 로거 설정
     logger = setup_logger('dispersion_signal_phase4', Config.LOG_FILE, Config.LOG_LEVEL)
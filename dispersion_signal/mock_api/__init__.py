@@ -0,0 +1,7 @@
+"""
+수집기 부하/백오프 테스트용 로컬 API 목 서버
+실행: python mock_api/server.py --help
+"""
+from .server import MockApiServer, FaultConfig, PROVIDERS
+
+__all__ = ['MockApiServer', 'FaultConfig', 'PROVIDERS']
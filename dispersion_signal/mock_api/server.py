@@ -0,0 +1,461 @@
+#!/usr/bin/env python3
+"""
+로컬 API 목 서버
+수집기가 사용하는 엔드포인트의 기록된 응답(fixtures/)을 재생하고, 지연/429(Retry-After)/5xx를
+설정한 비율로 주입해 동시성/Rate limit/백오프 동작을 오프라인에서 재현 가능하게 테스트
+
+- 제공자마다 별도 포트 (Binance, CoinGecko, Etherscan, Reddit 순서로 port, port+1, ...)
+  → 호스트 단위 서킷 브레이커/재시도 예산이 실제와 같이 제공자별로 분리됨
+- 지원 엔드포인트
+  Binance   : /api/v3/ticker/24hr, /api/v3/ticker/price, /api/v3/klines
+  CoinGecko : /api/v3/coins/markets, /api/v3/simple/price
+  Etherscan : /api, /v2/api (module=account, action=txlist|tokentx|txlistinternal)
+  Reddit    : POST /api/v1/access_token, /search, /r/<sub>/search, /r/<sub>/hot, /r/<sub>/new
+              (after/before=<fullname> 페이지네이션, created_utc는 최신 포스트 = 현재 시각으로 이동)
+- GET /__stats: 제공자별 요청/상태 코드 집계 (장애 주입 없음)
+- --fixtures DIR: 실제 응답을 같은 파일명(DIR/<provider>/<name>.json)으로 저장해 두면 그대로 재생
+
+사용 예시:
+  python mock_api/server.py --port 8900 --latency-ms 80 --jitter-ms 40 --throttle-rate 0.05
+  python mock_api/server.py --fault binance:max_rps=20 --fault etherscan:error_rate=0.1
+  → 출력되는 환경변수(BINANCE_BASE_URL 등)를 설정하고 수집기 실행
+"""
+import argparse
+import json
+import math
+import random
+import re
+import signal
+import sys
+import threading
+import time
+import zlib
+from dataclasses import dataclass, fields, replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse, parse_qs
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+
+PROVIDERS = ('binance', 'coingecko', 'etherscan', 'reddit')
+
+# (상태 코드, 응답 본문, 추가 헤더)
+Response = Tuple[int, Any, Dict[str, str]]
+
+
+@dataclass
+class FaultConfig:
+    """장애 주입 설정"""
+    latency_ms: float = 0.0            # 기본 응답 지연
+    jitter_ms: float = 0.0             # 지연 편차 (0 ~ jitter_ms 균등 분포 추가)
+    error_rate: float = 0.0            # 5xx 응답 비율
+    throttle_rate: float = 0.0         # 무작위 429 응답 비율
+    retry_after_seconds: float = 1.0   # 429 응답의 Retry-After
+    max_rps: float = 0.0               # 초당 허용 요청 수 (초과 시 429, 0이면 무제한)
+
+    @classmethod
+    def parse_overrides(cls, base: 'FaultConfig', spec: str) -> 'FaultConfig':
+        """'max_rps=20,error_rate=0.1' 형식 문자열을 적용한 설정"""
+        names = {f.name for f in fields(cls)}
+        values = {}
+        for item in filter(None, (part.strip() for part in spec.split(','))):
+            key, _, value = item.partition('=')
+            if key not in names:
+                raise ValueError(f"알 수 없는 장애 설정: {key} (가능: {', '.join(sorted(names))})")
+            values[key] = float(value)
+        return replace(base, **values)
+
+
+class _TokenBucket:
+    """초당 요청 제한 (max_rps, 버스트 허용량 = max_rps)"""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+
+    def acquire(self) -> Optional[float]:
+        """토큰 1개 사용, 부족하면 다음 토큰까지 대기 시간(초) 반환"""
+        now = time.monotonic()
+        self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return None
+        return (1 - self.tokens) / self.rate
+
+
+class _Provider:
+    """제공자 1개 (라우팅 + 장애 주입 + 통계)"""
+
+    name = ''
+
+    def __init__(self, fault: FaultConfig, seed: int, fixtures_dir: Optional[Path]):
+        self.fault = fault
+        self.fixtures_dir = fixtures_dir
+        self._rng = random.Random(seed * 1000 + zlib.crc32(self.name.encode()))
+        self._bucket = _TokenBucket(fault.max_rps) if fault.max_rps > 0 else None
+        self._lock = threading.Lock()
+        self._fixtures: Dict[str, Any] = {}
+        self.stats: Dict[str, Any] = {'requests': 0, 'by_status': {}, 'by_path': {}}
+
+    def fixture(self, name: str) -> Any:
+        """fixtures/<provider>/<name>.json (--fixtures 디렉토리 우선)"""
+        if name not in self._fixtures:
+            candidates = [FIXTURES_DIR / self.name / f'{name}.json']
+            if self.fixtures_dir is not None:
+                candidates.insert(0, self.fixtures_dir / self.name / f'{name}.json')
+            path = next(p for p in candidates if p.exists())
+            self._fixtures[name] = json.loads(path.read_text(encoding='utf-8'))
+        return self._fixtures[name]
+
+    def _inject_fault(self) -> Tuple[Optional[Response], float]:
+        """(장애 응답 또는 None, 응답 지연 초)"""
+        fault = self.fault
+        with self._lock:
+            jitter = self._rng.uniform(0, fault.jitter_ms) if fault.jitter_ms > 0 else 0.0
+            delay = (fault.latency_ms + jitter) / 1000
+            if self._bucket is not None:
+                wait = self._bucket.acquire()
+                if wait is not None:
+                    retry_after = str(max(1, math.ceil(wait)))
+                    return (429, {'error': 'rate limited'}, {'Retry-After': retry_after}), delay
+            roll = self._rng.random()
+            if roll < fault.throttle_rate:
+                return (429, {'error': 'rate limited'},
+                        {'Retry-After': f'{fault.retry_after_seconds:g}'}), delay
+            if roll < fault.throttle_rate + fault.error_rate:
+                status = self._rng.choice((500, 502, 503))
+                return (status, {'error': 'injected failure'}, {}), delay
+        return None, delay
+
+    def _record(self, path: str, status: int):
+        with self._lock:
+            self.stats['requests'] += 1
+            self.stats['by_status'][str(status)] = self.stats['by_status'].get(str(status), 0) + 1
+            self.stats['by_path'][path] = self.stats['by_path'].get(path, 0) + 1
+
+    def handle(self, method: str, path: str, query: Dict[str, str]) -> Response:
+        """장애 주입 후 라우팅"""
+        failure, delay = self._inject_fault()
+        if delay > 0:
+            time.sleep(delay)
+        response = failure or self.route(method, path, query)
+        self._record(path, response[0])
+        return response
+
+    def route(self, method: str, path: str, query: Dict[str, str]) -> Response:
+        raise NotImplementedError
+
+
+_INTERVAL_MS = {'m': 60_000, 'h': 3_600_000, 'd': 86_400_000, 'w': 604_800_000}
+
+
+class _Binance(_Provider):
+    name = 'binance'
+
+    def _tickers(self) -> Dict[str, Dict[str, Any]]:
+        return {t['symbol']: t for t in self.fixture('ticker_24hr')}
+
+    def route(self, method, path, query):
+        tickers = self._tickers()
+        symbol = query.get('symbol')
+        if symbol is not None and symbol not in tickers:
+            return 400, {'code': -1121, 'msg': 'Invalid symbol.'}, {}
+
+        if path == '/api/v3/ticker/24hr':
+            return 200, tickers[symbol] if symbol else list(tickers.values()), {}
+        if path == '/api/v3/ticker/price':
+            if symbol:
+                return 200, {'symbol': symbol, 'price': tickers[symbol]['lastPrice']}, {}
+            return 200, [{'symbol': s, 'price': t['lastPrice']} for s, t in tickers.items()], {}
+        if path == '/api/v3/klines' and symbol:
+            return 200, self._klines(tickers[symbol], query), {}
+        return 404, {'code': -1, 'msg': f'Unknown path {path}'}, {}
+
+    @staticmethod
+    def _klines(ticker: Dict[str, Any], query: Dict[str, str]) -> List[list]:
+        """기준 가격에서 시작하는 결정적 랜덤 워크 캔들 (같은 파라미터 → 같은 응답)"""
+        match = re.fullmatch(r'(\d+)([mhdw])', query.get('interval', '1d'))
+        step = int(match.group(1)) * _INTERVAL_MS[match.group(2)] if match else _INTERVAL_MS['d']
+        limit = min(int(query.get('limit', 500)), 1000)
+        end = int(query.get('endTime', ticker['closeTime']))
+        start = int(query.get('startTime', end - step * limit))
+        start -= start % step
+
+        rng = random.Random(f"{ticker['symbol']}:{step}")
+        price = float(ticker['lastPrice'])
+        candles = []
+        open_time = start
+        while open_time <= end and len(candles) < limit:
+            # 캔들마다 시각 기반 시드 → 조회 구간이 달라도 같은 시각의 캔들은 동일
+            rng.seed(f"{ticker['symbol']}:{step}:{open_time}")
+            open_price = price * (1 + rng.gauss(0, 0.01))
+            close_price = open_price * (1 + rng.gauss(0, 0.01))
+            high = max(open_price, close_price) * (1 + abs(rng.gauss(0, 0.004)))
+            low = min(open_price, close_price) * (1 - abs(rng.gauss(0, 0.004)))
+            volume = rng.uniform(100, 10_000)
+            candles.append([
+                open_time, f'{open_price:.8f}', f'{high:.8f}', f'{low:.8f}', f'{close_price:.8f}',
+                f'{volume:.8f}', open_time + step - 1, f'{volume * close_price:.8f}',
+                rng.randint(1_000, 100_000), f'{volume / 2:.8f}', f'{volume * close_price / 2:.8f}', '0',
+            ])
+            open_time += step
+        return candles
+
+
+class _CoinGecko(_Provider):
+    name = 'coingecko'
+
+    def route(self, method, path, query):
+        markets = self.fixture('coins_markets')
+        if path == '/api/v3/coins/markets':
+            per_page = int(query.get('per_page', 100))
+            page = int(query.get('page', 1))
+            return 200, markets[(page - 1) * per_page:page * per_page], {}
+        if path == '/api/v3/simple/price':
+            ids = set(filter(None, query.get('ids', '').split(',')))
+            currencies = [c for c in query.get('vs_currencies', 'usd').split(',') if c]
+            return 200, {m['id']: {c: m['current_price'] for c in currencies} for m in markets if m['id'] in ids}, {}
+        return 404, {'error': 'Not Found'}, {}
+
+
+class _Etherscan(_Provider):
+    name = 'etherscan'
+
+    ACTIONS = ('txlist', 'tokentx', 'txlistinternal')
+
+    def route(self, method, path, query):
+        if path not in ('/api', '/v2/api'):
+            return 404, {'error': 'Not Found'}, {}
+        if not query.get('apikey'):
+            return 200, {'status': '0', 'message': 'NOTOK', 'result': 'Missing/Invalid API Key'}, {}
+        if query.get('module') != 'account' or query.get('action') not in self.ACTIONS:
+            return 200, {'status': '0', 'message': 'NOTOK', 'result': 'Error! Invalid action'}, {}
+
+        rows = self.fixture(query['action'])['result']
+        offset = int(query.get('offset', 10_000)) or len(rows)
+        page = int(query.get('page', 1))
+        result = rows[(page - 1) * offset:page * offset]
+        if not result:
+            return 200, {'status': '0', 'message': 'No transactions found', 'result': []}, {}
+        return 200, {'status': '1', 'message': 'OK', 'result': result}, {}
+
+
+class _Reddit(_Provider):
+    name = 'reddit'
+
+    SEARCH_PATH = re.compile(r'^(?:/r/[^/]+)?/(search|hot|new)(?:\.json)?$')
+
+    def route(self, method, path, query):
+        if path == '/api/v1/access_token':
+            if method != 'POST':
+                return 405, {'error': 405}, {}
+            return 200, {'access_token': 'mock-access-token', 'token_type': 'bearer',
+                         'expires_in': 86400, 'scope': '*'}, {}
+
+        match = self.SEARCH_PATH.match(path)
+        if not match:
+            return 404, {'message': 'Not Found', 'error': 404}, {}
+
+        listing = self.fixture('search')
+        # 기록 시점과 무관하게 최신 포스트가 현재 시각이 되도록 created_utc 이동 (기간 필터 테스트용)
+        shift = time.time() - max((c['data']['created_utc'] for c in listing['data']['children']), default=0)
+        children = [dict(c, data=dict(c['data'], created_utc=c['data']['created_utc'] + shift))
+                    for c in listing['data']['children']]
+        q = query.get('q', '').lower()
+        if q:
+            children = [c for c in children
+                        if q in c['data']['title'].lower() or q in c['data'].get('selftext', '').lower()]
+        if match.group(1) == 'new':
+            children.sort(key=lambda c: c['data']['created_utc'], reverse=True)
+
+        # after/before=<fullname> 페이지네이션 (없는 fullname이면 삭제된 포스트처럼 빈 결과)
+        names = [c['data']['name'] for c in children]
+        limit = int(query.get('limit', 25))
+        after, before = query.get('after'), query.get('before')
+        if before:
+            newer = children[:names.index(before)] if before in names else []
+            page = newer[-limit:]
+            data = dict(listing['data'], children=page, dist=len(page), after=None,
+                        before=page[0]['data']['name'] if len(newer) > limit else None)
+            return 200, {'kind': 'Listing', 'data': data}, {}
+        if after:
+            children = children[names.index(after) + 1:] if after in names else []
+        page, rest = children[:limit], children[limit:]
+        data = dict(listing['data'], children=page, dist=len(page),
+                    after=page[-1]['data']['name'] if page and rest else None)
+        return 200, {'kind': 'Listing', 'data': data}, {}
+
+
+_PROVIDER_CLASSES = {cls.name: cls for cls in (_Binance, _CoinGecko, _Etherscan, _Reddit)}
+
+
+def _make_handler(provider: _Provider):
+    """제공자 전용 요청 핸들러 클래스"""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, format, *args):
+            pass
+
+        def _send(self, status: int, payload: Any, headers: Dict[str, str]):
+            body = json.dumps(payload).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _dispatch(self, method: str):
+            parsed = urlparse(self.path)
+            query = {k: v[-1] for k, v in parse_qs(parsed.query).items()}
+            if method == 'POST':
+                length = int(self.headers.get('Content-Length') or 0)
+                form = self.rfile.read(length).decode('utf-8', 'replace') if length else ''
+                query.update({k: v[-1] for k, v in parse_qs(form).items()})
+
+            if parsed.path == '/__stats':
+                self._send(200, provider.stats, {})
+                return
+            self._send(*provider.handle(method, parsed.path, query))
+
+        def do_GET(self):
+            self._dispatch('GET')
+
+        def do_POST(self):
+            self._dispatch('POST')
+
+    return Handler
+
+
+class MockApiServer:
+    """제공자별 목 서버 묶음 (백그라운드 스레드)"""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0,
+                 fault: Optional[FaultConfig] = None,
+                 provider_faults: Optional[Dict[str, FaultConfig]] = None,
+                 seed: int = 42, fixtures_dir: Optional[str] = None):
+        """
+        Args:
+            host: 바인드 주소
+            port: 첫 제공자 포트 (이후 제공자는 +1씩, 0이면 각각 임의 포트)
+            fault: 공통 장애 주입 설정
+            provider_faults: 제공자별 장애 주입 설정 (공통 설정 대신 사용)
+            seed: 장애 주입 난수 시드
+            fixtures_dir: 우선 사용할 기록 응답 디렉토리
+        """
+        self.host = host
+        self.port = port
+        fault = fault or FaultConfig()
+        provider_faults = provider_faults or {}
+        fixtures = Path(fixtures_dir) if fixtures_dir else None
+        self.providers = {
+            name: _PROVIDER_CLASSES[name](provider_faults.get(name, fault), seed, fixtures)
+            for name in PROVIDERS
+        }
+        self._servers: Dict[str, ThreadingHTTPServer] = {}
+
+    def start(self) -> Dict[str, str]:
+        """서버 시작, 제공자별 기본 URL 반환"""
+        for i, (name, provider) in enumerate(self.providers.items()):
+            port = self.port + i if self.port else 0
+            server = ThreadingHTTPServer((self.host, port), _make_handler(provider))
+            server.daemon_threads = True
+            threading.Thread(target=server.serve_forever, name=f'mock-{name}', daemon=True).start()
+            self._servers[name] = server
+        return self.urls()
+
+    def urls(self) -> Dict[str, str]:
+        return {name: f'http://{self.host}:{server.server_address[1]}' for name, server in self._servers.items()}
+
+    def env(self) -> Dict[str, str]:
+        """수집기를 목 서버로 향하게 하는 환경변수"""
+        urls = self.urls()
+        return {
+            'BINANCE_BASE_URL': urls['binance'],
+            'BINANCE_KLINES_URL': f"{urls['binance']}/api/v3/klines",
+            'COINGECKO_BASE_URL': f"{urls['coingecko']}/api/v3",
+            'ETHERSCAN_API_URL': f"{urls['etherscan']}/v2/api",
+            'REDDIT_BASE_URL': urls['reddit'],
+            'REDDIT_AUTH_URL': f"{urls['reddit']}/api/v1/access_token",
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {name: provider.stats for name, provider in self.providers.items()}
+
+    def stop(self):
+        for server in self._servers.values():
+            server.shutdown()
+            server.server_close()
+        self._servers.clear()
+
+
+def parse_arguments():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(
+        description='수집기 부하/백오프 테스트용 로컬 API 목 서버',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  python mock_api/server.py
+  python mock_api/server.py --latency-ms 100 --jitter-ms 50 --throttle-rate 0.05 --retry-after 2
+  python mock_api/server.py --fault binance:max_rps=20 --fault etherscan:error_rate=0.1,latency_ms=300
+        """
+    )
+    parser.add_argument('--host', type=str, default='127.0.0.1', help='바인드 주소 (기본값: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8900,
+                        help='첫 제공자 포트, 이후 +1씩 (기본값: 8900, 0이면 임의 포트)')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='응답 지연 (ms)')
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help='응답 지연 편차 (ms)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='5xx 응답 비율 (0~1)')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='무작위 429 응답 비율 (0~1)')
+    parser.add_argument('--retry-after', type=float, default=1.0, help='429 응답의 Retry-After (초)')
+    parser.add_argument('--max-rps', type=float, default=0.0, help='제공자별 초당 허용 요청 수 (0이면 무제한)')
+    parser.add_argument('--fault', action='append', default=[], metavar='PROVIDER:KEY=VALUE,...',
+                        help='제공자별 장애 설정 덮어쓰기 (여러 번 지정 가능)')
+    parser.add_argument('--seed', type=int, default=42, help='장애 주입 난수 시드 (기본값: 42)')
+    parser.add_argument('--fixtures', type=str, help='우선 사용할 기록 응답 디렉토리 (<dir>/<provider>/<name>.json)')
+    return parser.parse_args()
+
+
+def main():
+    """메인 실행 함수"""
+    args = parse_arguments()
+    fault = FaultConfig(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+                        throttle_rate=args.throttle_rate, retry_after_seconds=args.retry_after,
+                        max_rps=args.max_rps)
+
+    provider_faults = {}
+    for spec in args.fault:
+        name, _, overrides = spec.partition(':')
+        if name not in PROVIDERS:
+            print(f"❌ 알 수 없는 제공자: {name} (가능: {', '.join(PROVIDERS)})")
+            sys.exit(2)
+        provider_faults[name] = FaultConfig.parse_overrides(provider_faults.get(name, fault), overrides)
+
+    server = MockApiServer(args.host, args.port, fault, provider_faults, args.seed, args.fixtures)
+    for name, url in server.start().items():
+        print(f"🧪 {name:<10} {url}  (장애 설정: {server.providers[name].fault})")
+    print("\n수집기 환경변수:")
+    for key, value in server.env().items():
+        print(f"export {key}={value}")
+    print("\n통계: <URL>/__stats, 종료: Ctrl+C")
+
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    try:
+        stop.wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(json.dumps(server.get_stats(), indent=2))
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Dispersion Signal - 실행 성능 매니페스트 비교
+두 실행(배포 전/후 등)의 매니페스트(logs/perf/*.json)를 비교해 단계별 소요 시간과
+요청/바이트/캐시/DB 쓰기 변화를 출력하고, 기준 이상 느려진 단계를 회귀로 표시
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+def parse_arguments():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(
+        description='실행 성능 매니페스트 비교',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  python perf_diff.py logs/perf/enhanced_A.json logs/perf/enhanced_B.json
+  python perf_diff.py before.json after.json --threshold 0.1 --fail-on-regression
+  python perf_diff.py --latest enhanced
+        """
+    )
+
+    parser.add_argument('baseline', nargs='?', help='기준 매니페스트')
+    parser.add_argument('candidate', nargs='?', help='비교할 매니페스트')
+
+    parser.add_argument(
+        '--latest',
+        type=str,
+        help='해당 파이프라인의 최근 두 매니페스트 비교 (--dir 기준)'
+    )
+
+    parser.add_argument(
+        '--dir',
+        type=str,
+        default='logs/perf',
+        help='매니페스트 디렉토리 (기본값: logs/perf)'
+    )
+
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.2,
+        help='회귀로 볼 소요 시간 증가 비율 (기본값: 0.2 = 20%%)'
+    )
+
+    parser.add_argument(
+        '--min-seconds',
+        type=float,
+        default=0.5,
+        help='이보다 짧은 단계는 회귀 판정에서 제외 (기본값: 0.5초)'
+    )
+
+    parser.add_argument(
+        '--fail-on-regression',
+        action='store_true',
+        help='회귀가 있으면 종료 코드 1'
+    )
+
+    args = parser.parse_args()
+    if not args.latest and not (args.baseline and args.candidate):
+        parser.error('매니페스트 두 개 또는 --latest <pipeline> 필요')
+    return args
+
+
+def load_manifest(path: str) -> Dict[str, Any]:
+    """매니페스트 로드"""
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def latest_manifests(directory: str, pipeline: str) -> List[str]:
+    """파이프라인의 최근 두 매니페스트 경로 (오래된 것 먼저)"""
+    paths = sorted(Path(directory).glob(f'{pipeline}_*.json'))
+    if len(paths) < 2:
+        raise FileNotFoundError(f'{directory}에 {pipeline} 매니페스트가 2개 미만입니다')
+    return [str(p) for p in paths[-2:]]
+
+
+def _change(before: float, after: float) -> Optional[float]:
+    """변화율 (기준이 0이면 None)"""
+    if not before:
+        return None
+    return (after - before) / before
+
+
+def diff_manifests(baseline: Dict[str, Any], candidate: Dict[str, Any],
+                   threshold: float = 0.2, min_seconds: float = 0.5) -> Dict[str, Any]:
+    """
+    두 매니페스트 비교
+
+    Args:
+        baseline: 기준 매니페스트
+        candidate: 비교할 매니페스트
+        threshold: 회귀로 볼 소요 시간 증가 비율
+        min_seconds: 회귀 판정에서 제외할 짧은 단계 기준 (두 실행 모두 이보다 짧으면 제외)
+
+    Returns:
+        {'wall': {...}, 'totals': {...}, 'stages': [...], 'regressions': [...]}
+        stages는 비교 대상 실행에서 소요 시간이 긴 순서
+    """
+    stages = []
+    for path in sorted(set(baseline['stages']) | set(candidate['stages'])):
+        before = baseline['stages'].get(path, {})
+        after = candidate['stages'].get(path, {})
+        before_seconds = before.get('total_seconds', 0.0)
+        after_seconds = after.get('total_seconds', 0.0)
+        change = _change(before_seconds, after_seconds)
+        stages.append({
+            'path': path,
+            'before_seconds': before_seconds,
+            'after_seconds': after_seconds,
+            'change': change,
+            'share_of_wall': after.get('share_of_wall', 0.0),
+            'before_count': before.get('count', 0),
+            'after_count': after.get('count', 0),
+            'regression': (change is not None and change > threshold
+                           and max(before_seconds, after_seconds) >= min_seconds),
+        })
+    stages.sort(key=lambda s: s['after_seconds'], reverse=True)
+
+    totals = {}
+    for key in sorted(set(baseline.get('totals', {})) | set(candidate.get('totals', {}))):
+        before = baseline.get('totals', {}).get(key, 0)
+        after = candidate.get('totals', {}).get(key, 0)
+        totals[key] = {'before': before, 'after': after, 'change': _change(before, after)}
+
+    wall_change = _change(baseline['wall_seconds'], candidate['wall_seconds'])
+    return {
+        'wall': {'before': baseline['wall_seconds'], 'after': candidate['wall_seconds'], 'change': wall_change},
+        'totals': totals,
+        'stages': stages,
+        'regressions': [s['path'] for s in stages if s['regression']],
+    }
+
+
+def _format_change(change: Optional[float]) -> str:
+    return '     new' if change is None else f'{change * 100:+7.1f}%'
+
+
+def print_diff(result: Dict[str, Any], baseline_path: str, candidate_path: str):
+    """비교 결과 출력"""
+    wall = result['wall']
+    print(f"기준:   {baseline_path}")
+    print(f"비교:   {candidate_path}")
+    print(f"전체 소요 시간: {wall['before']:.2f}초 → {wall['after']:.2f}초 ({_format_change(wall['change']).strip()})")
+    print()
+
+    print(f"{'단계':<48} {'기준(초)':>10} {'비교(초)':>10} {'변화':>8} {'비중':>6} {'실행 수':>10}")
+    for stage in result['stages']:
+        marker = ' ⚠️' if stage['regression'] else ''
+        print(f"{stage['path']:<48} {stage['before_seconds']:>10.2f} {stage['after_seconds']:>10.2f} "
+              f"{_format_change(stage['change'])} {stage['share_of_wall'] * 100:>5.1f}% "
+              f"{stage['before_count']:>4} → {stage['after_count']:<4}{marker}")
+    print()
+
+    if result['totals']:
+        print(f"{'카운터':<28} {'기준':>14} {'비교':>14} {'변화':>8}")
+        for key, total in result['totals'].items():
+            print(f"{key:<28} {total['before']:>14,.0f} {total['after']:>14,.0f} {_format_change(total['change'])}")
+        print()
+
+    if result['regressions']:
+        print(f"⚠️ 회귀 {len(result['regressions'])}개: {', '.join(result['regressions'])}")
+    else:
+        print("✅ 회귀 없음")
+
+
+def main():
+    """메인 실행 함수"""
+    args = parse_arguments()
+
+    try:
+        if args.latest:
+            baseline_path, candidate_path = latest_manifests(args.dir, args.latest)
+        else:
+            baseline_path, candidate_path = args.baseline, args.candidate
+        baseline = load_manifest(baseline_path)
+        candidate = load_manifest(candidate_path)
+    except (OSError, ValueError) as e:
+        print(f"❌ 매니페스트 로드 실패: {e}")
+        sys.exit(2)
+
+    result = diff_manifests(baseline, candidate, args.threshold, args.min_seconds)
+    print_diff(result, baseline_path, candidate_path)
+
+    if args.fail_on_regression and result['regressions']:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
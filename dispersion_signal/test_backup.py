@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+청크 백업 테스트 (생성 → 검증 → 손상 감지 → 복구, 중단된 제너레이터, 이전 형식 호환)
+"""
+import sys
+import os
+import gzip
+import json
+import tempfile
+from pathlib import Path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.backup import (
+    BackupConfig, BackupReader, DataBackupManager, ZSTD_AVAILABLE, is_chunked_backup
+)
+
+
+def make_rows(count: int):
+    return [{'symbol': f'C{i}', 'price': i * 1.5, 'volume': 10 ** 12 + i, 'note': 'x' * (i % 50)} for i in range(count)]
+
+
+def small_chunk_backups(directory: str, **config) -> DataBackupManager:
+    """4KB 청크 백업 관리자 (수천 행으로도 청크가 여러 개 생기도록)"""
+    return DataBackupManager(BackupConfig(backup_directory=directory, chunk_size_kb=4, **config))
+
+
+def test_create_verify_restore():
+    """리스트/제너레이터/빈 리스트/일반 값이 모두 그대로 복구"""
+    print("🔍 백업 생성/검증/복구 테스트...")
+    compressions = ['gzip', 'none'] + (['zstd'] if ZSTD_AVAILABLE else [])
+    for compression in compressions:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            manager = small_chunk_backups(tmp_dir, compression=compression,
+                                          compression_enabled=compression != 'none')
+            rows = make_rows(2000)
+            data = {
+                'prices': rows,
+                'streamed': (dict(row, streamed=True) for row in rows[:500]),
+                'empty': [],
+                'summary': {'count': 2000, 'big': 2 ** 70},
+                'label': 'daily',
+            }
+            path = manager.create_backup(data)
+            assert path is not None, compression
+            filename = Path(path).name
+            assert is_chunked_backup(Path(path))
+
+            reader = BackupReader(Path(path))
+            assert len(reader.chunks) > 1, f"{compression}: 청크가 하나뿐"
+            assert reader.metadata['records'] == 2000 + 1 + 500 + 1 + 1 + 2
+            assert manager.verify_backup_integrity(filename)
+
+            restored = manager.restore_backup(filename)
+            assert restored == {
+                'prices': rows,
+                'streamed': [dict(row, streamed=True) for row in rows[:500]],
+                'empty': [],
+                'summary': {'count': 2000, 'big': 2 ** 70},
+                'label': 'daily',
+            }, compression
+
+            info = manager.list_backups()[-1]
+            assert info['filename'] == filename and info['chunks'] == len(reader.chunks)
+            assert not list(Path(tmp_dir).glob('*.tmp'))
+    print(f"✅ 생성/검증/복구 정상 ({', '.join(compressions)})")
+
+
+def test_corruption_detected():
+    """청크/인덱스 손상은 검증과 복구에서 모두 실패로 처리"""
+    print("🔍 백업 손상 감지 테스트...")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        manager = small_chunk_backups(tmp_dir)
+        path = Path(manager.create_backup({'prices': make_rows(2000)}))
+        filename = path.name
+        original = path.read_bytes()
+        chunks = BackupReader(path).chunks
+
+        # 두 번째 청크 중간 1바이트 변경
+        corrupted = bytearray(original)
+        corrupted[chunks[1]['offset'] + chunks[1]['length'] // 2] ^= 0xFF
+        path.write_bytes(bytes(corrupted))
+        assert BackupReader(path).verify() == "청크 1 체크섬 불일치"
+        assert not manager.verify_backup_integrity(filename)
+        assert manager.restore_backup(filename) is None
+
+        # 인덱스 손상 (푸터 바로 앞)
+        corrupted = bytearray(original)
+        corrupted[-30] ^= 0xFF
+        path.write_bytes(bytes(corrupted))
+        assert not manager.verify_backup_integrity(filename)
+        assert manager.restore_backup(filename) is None
+
+        # 잘린 파일
+        path.write_bytes(original[:len(original) // 2])
+        assert not manager.verify_backup_integrity(filename)
+        assert manager.restore_backup(filename) is None
+
+        path.write_bytes(original)
+        assert manager.verify_backup_integrity(filename)
+        assert len(manager.restore_backup(filename)['prices']) == 2000
+    print("✅ 손상 감지 정상")
+
+
+def test_aborted_generator():
+    """제너레이터가 중간에 실패하면 백업 파일/임시 파일/메타데이터를 남기지 않음"""
+    print("🔍 중단된 백업 테스트...")
+
+    def failing_rows():
+        yield from make_rows(1500)
+        raise RuntimeError("DB 커서 끊김")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        manager = small_chunk_backups(tmp_dir)
+        assert manager.create_backup({'prices': failing_rows()}) is None
+        leftovers = [p.name for p in Path(tmp_dir).iterdir() if p.name != 'backup_metadata.json']
+        assert leftovers == [], f"남은 파일: {leftovers}"
+        assert manager.list_backups() == []
+    print("✅ 중단 시 정리 정상")
+
+
+def test_legacy_backup():
+    """이전 형식(JSON 파일 하나, gzip) 백업도 검증/복구"""
+    print("🔍 이전 형식 백업 테스트...")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        manager = small_chunk_backups(tmp_dir)
+        data = {'prices': make_rows(10), 'label': 'legacy'}
+        legacy = {'metadata': {'backup_type': 'full', 'timestamp': '2024-01-01T00:00:00+00:00', 'version': '1.0'},
+                  'data': data}
+        filename = 'backup_full_20240101_000000.json.gz'
+        with gzip.open(Path(tmp_dir) / filename, 'wt', encoding='utf-8') as f:
+            json.dump(legacy, f)
+        assert not is_chunked_backup(Path(tmp_dir) / filename)
+        assert manager.verify_backup_integrity(filename)
+        assert manager.restore_backup(filename) == data
+    print("✅ 이전 형식 호환 정상")
+
+
+if __name__ == "__main__":
+    test_create_verify_restore()
+    test_corruption_detected()
+    test_aborted_generator()
+    test_legacy_backup()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+JSON 코덱 테스트 (백엔드별 인코딩/디코딩, 타입 변환, 64비트 밖 정수)
+"""
+import sys
+import os
+from datetime import datetime, date, timezone
+from decimal import Decimal
+from enum import Enum
+from uuid import UUID
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils import json_codec
+
+BIG_INTS = [2 ** 64, -(2 ** 63) - 1, 10 ** 30, -(10 ** 40), 2 ** 64 - 1, -(2 ** 63)]
+
+
+class Side(str, Enum):
+    BUY = "buy"
+
+
+def installed_backends():
+    available = {'orjson': json_codec.ORJSON_AVAILABLE, 'msgspec': json_codec.MSGSPEC_AVAILABLE, 'json': True}
+    return [backend for backend in json_codec.BACKENDS if available[backend]]
+
+
+def for_each_backend(check):
+    """설치된 백엔드마다 JSON_BACKEND를 바꿔 가며 실행"""
+    previous = os.environ.get('JSON_BACKEND')
+    try:
+        for backend in installed_backends():
+            os.environ['JSON_BACKEND'] = backend
+            assert json_codec.get_backend() == backend
+            check(backend)
+    finally:
+        if previous is None:
+            os.environ.pop('JSON_BACKEND', None)
+        else:
+            os.environ['JSON_BACKEND'] = previous
+
+
+def test_big_int_round_trip():
+    """exact_ints=True면 64비트 범위 밖 정수도 float로 바뀌지 않고 그대로 왕복"""
+    print("🔍 큰 정수 왕복 테스트...")
+
+    def check(backend):
+        for value in BIG_INTS:
+            for data in (json_codec.dumps(value), json_codec.dumps_str({'v': [value]})):
+                decoded = json_codec.loads(data, exact_ints=True)
+                decoded = decoded if isinstance(decoded, int) else decoded['v'][0]
+                assert type(decoded) is int and decoded == value, f"{backend}: {value} → {decoded!r}"
+        # 응답 본문처럼 memoryview로 들어와도 동일
+        assert json_codec.loads(memoryview(b'{"wei":123456789012345678901234567890}'), exact_ints=True)['wei'] == 123456789012345678901234567890
+        # 실수/문자열 속 긴 숫자는 그대로
+        assert json_codec.loads(b'[1.2345678901234567890123e5,"12345678901234567890123"]', exact_ints=True) == [123456.78901234567, "12345678901234567890123"]
+
+        # 기본값(API 응답 경로)도 64비트 범위 안 정수와 문자열 금액은 그대로
+        assert json_codec.loads(b'{"value":"123456789012345678901234","n":18446744073709551615}') == \
+            {'value': '123456789012345678901234', 'n': 2 ** 64 - 1}
+
+    for_each_backend(check)
+    print("✅ 큰 정수 왕복 정상")
+
+
+def test_type_conversion():
+    """Decimal/datetime/UUID/Enum/set 변환이 백엔드와 무관하게 같은 값"""
+    print("🔍 타입 변환 테스트...")
+    uid = UUID('12345678-1234-5678-1234-567812345678')
+    payload = {
+        'price': Decimal('50000.5'),
+        'at': datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        'day': date(2024, 1, 2),
+        'id': uid,
+        'side': Side.BUY,
+        'tags': {'spot'},
+        'pair': ('BTC', 'KRW'),
+        1: 'int key',
+    }
+    expected = {
+        'price': 50000.5,
+        'at': '2024-01-02T03:04:05+00:00',
+        'day': '2024-01-02',
+        'id': str(uid),
+        'side': 'buy',
+        'tags': ['spot'],
+        'pair': ['BTC', 'KRW'],
+        '1': 'int key',
+    }
+
+    def check(backend):
+        assert json_codec.loads(json_codec.dumps(payload)) == expected, backend
+        assert json_codec.loads(json_codec.dumps(payload, indent=True)) == expected, backend
+        try:
+            json_codec.dumps({'bad': object()})
+        except TypeError:
+            pass
+        else:
+            raise AssertionError(f"{backend}: 변환할 수 없는 타입은 TypeError")
+
+    for_each_backend(check)
+    print("✅ 타입 변환 정상")
+
+
+def test_sort_keys_and_errors():
+    """sort_keys 결과는 키 순서와 무관, 잘못된 JSON은 ValueError"""
+    print("🔍 정렬/오류 테스트...")
+
+    def check(backend):
+        first = json_codec.dumps({'b': 1, 'a': [1, 2], 'c': {'y': 1, 'x': 2}}, sort_keys=True)
+        second = json_codec.dumps({'c': {'x': 2, 'y': 1}, 'a': [1, 2], 'b': 1}, sort_keys=True)
+        assert first == second == b'{"a":[1,2],"b":1,"c":{"x":2,"y":1}}', f"{backend}: {first!r}"
+        assert json_codec.dumps_str({'k': '한글'}) == '{"k":"한글"}'
+        for bad in (b'{"a":', '', b'[1,]'):
+            try:
+                json_codec.loads(bad)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError(f"{backend}: {bad!r}는 ValueError")
+
+    for_each_backend(check)
+    print("✅ 정렬/오류 정상")
+
+
+if __name__ == "__main__":
+    test_big_int_round_trip()
+    test_type_conversion()
+    test_sort_keys_and_errors()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+시장 인사이트 유사 중복 탐지 테스트 (MinHash/LSH 인덱스, 실행 간 저장/폐기)
+"""
+import sys
+import os
+import time
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from database.models_analyst_targets import MarketInsight, AnalysisType
+from utils.data_quality_analyst import DuplicateDetector, DataQualityManager
+from utils.near_duplicate import MinHashLSH
+
+ARTICLE = "비트코인 현물 ETF에 이번 주 대규모 자금이 유입되면서 가격이 사상 최고치 부근까지 상승했다"
+
+
+def make_insight(content: str, symbol: str = "BTC", source: str = "coinness") -> MarketInsight:
+    return MarketInsight(symbol=symbol, type="news", content=content, source=source,
+                         confidence=7, analysis_type=AnalysisType.SENTIMENT)
+
+
+def make_batch():
+    return [
+        make_insight(ARTICLE),
+        make_insight(ARTICLE + "!", source="upbit"),                      # 구두점만 다른 같은 기사
+        make_insight(ARTICLE, symbol="ETH"),                              # 다른 심볼은 비교하지 않음
+        make_insight("이더리움 재단이 다음 네트워크 업그레이드 일정을 확정했다", symbol="ETH"),
+    ]
+
+
+def quality_manager(index_path: str) -> DataQualityManager:
+    """인사이트 인덱스 파일만 지정한 품질 관리자 (한 번의 수집 실행에 해당)"""
+    manager = DataQualityManager()
+    manager.duplicate_detector = DuplicateDetector(insight_index_path=index_path)
+    return manager
+
+
+def test_near_duplicate_index():
+    """MinHash 인덱스 - 유사 기사 탐지, scope 분리, 저장/로드"""
+    print("🔍 MinHash 인덱스 테스트...")
+    index = MinHashLSH(threshold=0.8)
+    assert index.add("a", ARTICLE, scope="BTC") is None
+    assert index.add("b", ARTICLE + "!", scope="BTC") == "a"
+    assert index.add("c", ARTICLE, scope="ETH") is None
+    assert index.add("d", "전혀 관련 없는 다른 주제의 짧은 문장입니다", scope="BTC") is None
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "index.json")
+        index.save(path)
+        loaded = MinHashLSH.load(path, threshold=0.8)
+        assert len(loaded) == len(index) == 3
+        assert loaded.add("e", "  " + ARTICLE.upper(), scope="BTC") == "a"
+
+    index.remove("a")
+    assert index.add("f", ARTICLE, scope="BTC") is None
+    print("✅ MinHash 인덱스 정상")
+
+
+def test_discard_keeps_batch():
+    """저장 실패/dry-run으로 폐기한 배치는 다시 정리해도 버려지지 않음"""
+    print("🔍 인사이트 인덱스 폐기 테스트...")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "insight_minhash.json")
+        manager = quality_manager(path)
+
+        first = manager._clean_market_insights(make_batch())
+        assert len(first) == 3, f"배치 내 중복 1개만 제거되어야 함: {len(first)}"
+
+        manager.discard()
+        assert not os.path.exists(path), "폐기 전에 인덱스가 저장되면 안 됨"
+
+        retry = manager._clean_market_insights(make_batch())
+        assert len(retry) == 3, f"폐기 후 재실행에서 인사이트가 버려짐: {len(retry)}"
+
+        # 새 프로세스 (dry-run 다음 실행)에서도 그대로
+        manager.discard()
+        rerun = quality_manager(path)._clean_market_insights(make_batch())
+        assert len(rerun) == 3
+    print("✅ 폐기한 배치는 재정리해도 인사이트 유지")
+
+
+def test_commit_persists_batch():
+    """저장 성공 후 commit한 배치는 다음 실행에서 중복으로 제거"""
+    print("🔍 인사이트 인덱스 확정 테스트...")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "insight_minhash.json")
+        manager = quality_manager(path)
+        assert len(manager._clean_market_insights(make_batch())) == 3
+        manager.commit()
+        assert os.path.exists(path)
+
+        # 이미 확정된 항목은 discard로 지워지지 않음
+        manager.discard()
+        assert manager._clean_market_insights(make_batch()) == []
+
+        next_run = quality_manager(path)
+        assert next_run._clean_market_insights(make_batch()) == []
+    print("✅ 확정한 배치는 다음 실행에서 중복 제거")
+
+
+def test_commit_saves_pruned_index():
+    """새 인사이트가 없는 실행도 만료된 항목을 지웠으면 commit 때 인덱스 저장"""
+    print("🔍 인사이트 인덱스 만료 저장 테스트...")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "insight_minhash.json")
+        stale = MinHashLSH(threshold=0.8)
+        eight_days_ago = time.time() - 8 * 86400
+        stale.insert("old", stale.signature(ARTICLE), scope="BTC", added_at=eight_days_ago)
+        stale.add("recent", "이더리움 재단이 다음 네트워크 업그레이드 일정을 확정했다", scope="ETH")
+        stale.save(path)
+
+        manager = quality_manager(path)
+        assert manager._clean_market_insights([]) == []
+        manager.commit()
+
+        saved = MinHashLSH.load(path, threshold=0.8)
+        assert len(saved) == 1, f"만료 항목이 파일에 남음: {len(saved)}개"
+        assert saved.add("new", ARTICLE, scope="BTC") is None, "만료된 기사가 중복으로 남아 있음"
+    print("✅ 만료 항목 삭제가 인덱스 파일에 반영")
+
+
+if __name__ == "__main__":
+    test_near_duplicate_index()
+    test_discard_keeps_batch()
+    test_commit_persists_batch()
+    test_commit_saves_pruned_index()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+페이지 캐시 테스트 (조건부 요청, 본문 해시 비교, 저장 성공 시에만 commit)
+로컬 HTTP 서버로 ETag 있는 페이지/없는 페이지를 흉내 냄
+"""
+import sys
+import os
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.page_cache import PageCache
+
+PAGES = {
+    '/etag': '<html><body>analyst targets v1</body></html>',
+    '/plain': '<html><body>market news v1</body></html>',
+}
+REQUESTS = []  # (path, If-None-Match)
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        REQUESTS.append((self.path, self.headers.get('If-None-Match')))
+        body = PAGES[self.path].encode('utf-8')
+        etag = f'"{hash(body) & 0xffffffff:x}"'
+        if self.path == '/etag' and self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        if self.path == '/etag':
+            self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), PageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def fetch_all(cache: PageCache, base_url: str):
+    return {path: cache.fetch(base_url + path, timeout=5) for path in PAGES}
+
+
+def test_discard_refetches():
+    """discard한 실행의 검증자/해시는 다음 실행에 반영되지 않음"""
+    print("🔍 페이지 캐시 폐기 후 재요청 테스트...")
+    server, base_url = start_server()
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'page_state.json')
+            cache = PageCache(path)
+            first = fetch_all(cache, base_url)
+            assert all(page.changed and page.status == 'fetched' for page in first.values())
+
+            cache.discard()
+            cache.commit()  # 폐기 후 commit은 아무것도 저장하지 않음
+            assert not os.path.exists(path)
+
+            REQUESTS.clear()
+            retry = fetch_all(PageCache(path), base_url)
+            assert all(page.changed for page in retry.values()), "저장 실패한 페이지를 변경 없음으로 건너뜀"
+            assert all(if_none_match is None for _, if_none_match in REQUESTS), "폐기한 ETag로 조건부 요청함"
+    finally:
+        server.shutdown()
+    print("✅ 폐기한 ETag/본문 해시 없이 전체 다운로드")
+
+
+def test_commit_skips_unchanged():
+    """commit한 실행 이후에는 304/해시 동일 페이지를 변경 없음으로 반환"""
+    print("🔍 페이지 캐시 304/해시 비교 테스트...")
+    server, base_url = start_server()
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'page_state.json')
+            cache = PageCache(path)
+            fetch_all(cache, base_url)
+            cache.commit()
+            assert os.path.exists(path)
+
+            REQUESTS.clear()
+            second = fetch_all(PageCache(path), base_url)
+            assert second['/etag'].status == 'not_modified' and not second['/etag'].changed
+            assert second['/etag'].text == PAGES['/etag'], "304일 때 보관된 본문을 돌려줘야 함"
+            assert second['/plain'].status == 'hash_match' and not second['/plain'].changed
+            assert dict(REQUESTS)['/etag'] is not None
+
+            PAGES['/plain'] = '<html><body>market news v2</body></html>'
+            third = fetch_all(PageCache(path), base_url)
+            assert third['/plain'].changed and third['/plain'].text == PAGES['/plain']
+            assert not third['/etag'].changed
+    finally:
+        PAGES['/plain'] = '<html><body>market news v1</body></html>'
+        server.shutdown()
+    print("✅ 확정 후 304/해시 동일 페이지 건너뜀, 변경된 본문만 반환")
+
+
+def test_disabled_cache():
+    """경로가 없으면 항상 전체 다운로드, commit은 아무것도 하지 않음"""
+    print("🔍 페이지 캐시 비활성화 테스트...")
+    server, base_url = start_server()
+    try:
+        cache = PageCache(None)
+        for _ in range(2):
+            assert all(page.changed for page in fetch_all(cache, base_url).values())
+            cache.commit()
+    finally:
+        server.shutdown()
+    print("✅ 캐시 경로 없이 매번 전체 다운로드")
+
+
+if __name__ == "__main__":
+    test_discard_refetches()
+    test_commit_skips_unchanged()
+    test_disabled_cache()
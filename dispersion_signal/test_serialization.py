@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+DB 행 변환 테스트 (to_row/to_rows, construct_trusted)
+모든 모델에 대해 to_row 결과가 model_dump() + JSON 변환과 같은지 확인
+"""
+import sys
+import os
+import importlib
+import inspect
+import json
+from datetime import datetime, date, timezone
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Literal, Union, get_args, get_origin
+from uuid import UUID, uuid4
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from pydantic import BaseModel
+
+from database.serialization import construct_trusted, to_row, to_rows
+from database.models_phase4 import MultiSourcePrice, RedditSentiment
+from utils.json_codec import default as json_default
+
+MODEL_MODULES = [
+    'database.models', 'database.models_analyst_targets', 'database.models_binance',
+    'database.models_coingecko', 'database.models_phase2', 'database.models_phase3',
+    'database.models_phase4',
+]
+
+NOW = datetime(2024, 5, 6, 7, 8, 9, 123456, tzinfo=timezone.utc)
+CRYPTO_ID = UUID('0f8fad5b-d9cb-469f-a165-70867728950e')
+
+
+def all_models():
+    models = []
+    for module_name in MODEL_MODULES:
+        module = importlib.import_module(module_name)
+        for _, obj in inspect.getmembers(module, inspect.isclass):
+            if issubclass(obj, BaseModel) and obj is not BaseModel and obj.__module__ == module.__name__:
+                models.append(obj)
+    return models
+
+
+def sample_value(annotation: Any) -> Any:
+    """필드 타입에 맞는 예시 값 (변환 규칙이 다른 타입을 모두 포함)"""
+    origin = get_origin(annotation)
+    if origin is Union:
+        return sample_value(next(arg for arg in get_args(annotation) if arg is not type(None)))
+    if origin is Literal:
+        return get_args(annotation)[0]
+    if origin in (list, tuple, set):
+        args = get_args(annotation)
+        return [sample_value(args[0]) if args else Decimal('1.5')]
+    if origin is dict or annotation is dict:
+        return {'price': Decimal('1.5'), 'at': NOW, 'id': CRYPTO_ID, 'nested': [{'d': date(2024, 1, 1)}]}
+    if annotation is Any:
+        return {'score': Decimal('0.25')}
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return build_model(annotation)
+        if issubclass(annotation, Enum):
+            return next(iter(annotation))
+        for base, value in ((bool, True), (int, 3), (float, 2.5), (str, 'BTC'), (Decimal, Decimal('12345.678')),
+                            (UUID, CRYPTO_ID), (datetime, NOW), (date, date(2024, 5, 6))):
+            if issubclass(annotation, base):
+                return value
+    raise AssertionError(f"예시 값이 없는 타입: {annotation}")
+
+
+def build_model(model_class):
+    values = {name: sample_value(field.annotation) for name, field in model_class.model_fields.items()}
+    return model_class.model_construct(**values)
+
+
+def reference_row(model: BaseModel, exclude=None):
+    """기존 방식 - model_dump() 후 JSON 변환 규칙 적용"""
+    return json.loads(json.dumps(model.model_dump(exclude=exclude), default=json_default))
+
+
+def test_to_row_matches_model_dump():
+    """모든 모델: to_row == model_dump() + JSON 변환, 결과는 추가 변환 없이 JSON 직렬화 가능"""
+    print("🔍 to_row / model_dump 비교 테스트...")
+    models = all_models()
+    assert len(models) >= 50, f"모델 수집 실패: {len(models)}개"
+    for model_class in models:
+        model = build_model(model_class)
+        row = to_row(model)
+        assert list(row) == list(model_class.model_fields), model_class.__name__
+        assert json.loads(json.dumps(row)) == reference_row(model), model_class.__name__
+        # None 값, 제외 필드
+        empty = model_class.model_construct(**{name: None for name in model_class.model_fields})
+        assert to_row(empty) == reference_row(empty), model_class.__name__
+        first = next(iter(model_class.model_fields))
+        assert to_row(model, exclude={first}) == reference_row(model, exclude={first}), model_class.__name__
+    print(f"✅ {len(models)}개 모델 변환 정상")
+
+
+def test_to_rows_mixed_models():
+    """to_rows: 모델 종류가 섞여도 각자의 변환기 사용"""
+    print("🔍 to_rows 테스트...")
+    models = [build_model(MultiSourcePrice), build_model(RedditSentiment), build_model(MultiSourcePrice)]
+    assert to_rows(models) == [to_row(model) for model in models]
+    assert to_rows(models, exclude={'id'}) == [to_row(model, exclude={'id'}) for model in models]
+    print("✅ to_rows 정상")
+
+
+def trusted_values():
+    """main_phase4/main_enhanced와 같은 형태의 값 (crypto_id는 get_crypto_id가 돌려준 UUID)"""
+    return {
+        MultiSourcePrice: dict(
+            crypto_id=CRYPTO_ID, timestamp=NOW,
+            coincap_price=Decimal('50000.1'), coinpaprika_price=Decimal('50010.2'), coingecko_price=None,
+            price_sources_count=2, price_avg=Decimal('50005.15'), price_dispersion=Decimal('0.02'),
+            raw_data={'symbol': 'BTC', 'prices': [50000.1, 50010.2]},
+        ),
+        RedditSentiment: dict(
+            crypto_id=CRYPTO_ID, timestamp=NOW,
+            total_mentions=10, positive_mentions=6, negative_mentions=1, neutral_mentions=3,
+            subreddit_breakdown={'bitcoin': 10}, sentiment_score=Decimal('50'), community_interest=Decimal('20'),
+            raw_data={'symbol': 'BTC'},
+        ),
+    }
+
+
+def test_construct_trusted_matches_validated():
+    """construct_trusted: 검증 생성자와 같은 필드 값/타입/행, 기본값 팩토리는 인스턴스마다 새로"""
+    print("🔍 construct_trusted 테스트...")
+    for model_class, values in trusted_values().items():
+        trusted = construct_trusted(model_class, **values)
+        validated = model_class(**values)
+        assert type(trusted) is model_class
+        assert trusted.__dict__ == validated.__dict__, model_class.__name__
+        for name in model_class.model_fields:
+            assert type(getattr(trusted, name)) is type(getattr(validated, name)), f"{model_class.__name__}.{name}"
+        assert isinstance(trusted.crypto_id, UUID)
+        assert trusted.model_fields_set == validated.model_fields_set
+        assert to_row(trusted) == to_row(validated) == reference_row(validated)
+
+        # 값을 주지 않은 default_factory 필드는 공유되지 않음
+        partial = {name: value for name, value in values.items() if name != 'raw_data'}
+        first, second = construct_trusted(model_class, **partial), construct_trusted(model_class, **partial)
+        first.raw_data['x'] = 1
+        assert second.raw_data == {}
+    print("✅ construct_trusted 정상")
+
+
+def test_trusted_requires_field_types():
+    """검증하지 않으므로 문자열 ID는 호출자가 UUID로 바꿔서 넘겨야 함 (to_row 결과는 같음)"""
+    print("🔍 construct_trusted 타입 테스트...")
+    values = dict(trusted_values()[MultiSourcePrice], crypto_id=str(uuid4()))
+    trusted = construct_trusted(MultiSourcePrice, **values)
+    assert isinstance(trusted.crypto_id, str), "construct_trusted는 값을 변환하지 않음"
+    converted = construct_trusted(MultiSourcePrice, **dict(values, crypto_id=UUID(values['crypto_id'])))
+    assert converted.crypto_id == MultiSourcePrice(**values).crypto_id
+    assert to_row(trusted) == to_row(converted)
+    print("✅ construct_trusted 타입 규칙 확인")
+
+
+if __name__ == "__main__":
+    test_to_row_matches_model_dump()
+    test_to_rows_mixed_models()
+    test_construct_trusted_matches_validated()
+    test_trusted_requires_field_types()
@@ -0,0 +1,214 @@
+"""
+비동기 알림 전송기
+수집 루프(monitor_api_call 등)에서는 큐에 넣기만 하고, 백그라운드 워커가
+채널(이메일/Slack)별로 묶음 전송, 같은 알림 병합, 전송 간격 제한을 처리
+
+- 큐가 가득 차면 알림을 버리고 dropped 카운터 증가 (수집 루프는 절대 대기하지 않음)
+- close() 시 큐에 남은 알림을 전송 간격 제한 없이 마지막으로 전송
+"""
+import atexit
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple, Any
+
+
+@dataclass
+class Alert:
+    """전송 대기 알림 (severity는 AlertSeverity)"""
+    severity: Any
+    title: str
+    message: str
+    details: Dict[str, Any]
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    count: int = 1  # 병합된 동일 알림 수
+
+
+@dataclass
+class AlertDispatcherConfig:
+    """알림 전송기 설정"""
+    max_queue_size: int = 1000             # 큐 최대 크기 (초과 시 버림)
+    batch_window_seconds: float = 2.0      # 첫 알림 이후 묶음을 모으는 시간
+    max_batch_size: int = 50               # 한 번에 전송할 최대 알림 수 (병합 후)
+    min_send_interval_seconds: float = 10.0  # 채널별 최소 전송 간격
+    close_timeout_seconds: float = 10.0    # 종료 시 마지막 전송 대기 시간
+
+
+# 채널 전송 함수: 알림 묶음을 받아 전송 (실패 시 예외)
+AlertSender = Callable[[List[Alert]], None]
+
+_STOP = object()
+
+
+def coalesce_alerts(alerts: List[Alert]) -> List[Alert]:
+    """
+    같은 제목/심각도 알림 병합 (최신 메시지/상세 정보 유지, count 누적)
+
+    Args:
+        alerts: 도착 순서대로 정렬된 알림 리스트
+
+    Returns:
+        병합된 알림 리스트 (첫 도착 순서 유지)
+    """
+    merged: Dict[tuple, Alert] = {}
+    for alert in alerts:
+        key = (alert.title, alert.severity)
+        existing = merged.get(key)
+        if existing is None:
+            merged[key] = Alert(alert.severity, alert.title, alert.message, alert.details,
+                                alert.created_at, alert.count)
+        else:
+            existing.message = alert.message
+            existing.details = alert.details
+            existing.count += alert.count
+    return list(merged.values())
+
+
+class AlertDispatcher:
+    """바운디드 큐 + 백그라운드 스레드 알림 전송기"""
+
+    def __init__(self, senders: Dict[str, AlertSender],
+                 config: Optional[AlertDispatcherConfig] = None,
+                 logger: Optional[logging.Logger] = None):
+        """
+        Args:
+            senders: 채널 이름 → 전송 함수
+            config: 전송기 설정
+            logger: 로거
+        """
+        self.senders = senders
+        self.config = config or AlertDispatcherConfig()
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._queue: queue.Queue = queue.Queue(maxsize=self.config.max_queue_size)
+        self._next_send_at: Dict[str, float] = {channel: 0.0 for channel in senders}
+        self._closed = False
+        self._stats_lock = threading.Lock()
+        self.stats = {
+            'enqueued': 0,
+            'dropped': 0,
+            'coalesced': 0,
+            'batches_sent': 0,
+            'alerts_sent': 0,
+            'send_failures': 0,
+        }
+
+        self._worker = threading.Thread(target=self._run, name='alert-dispatcher', daemon=True)
+        self._worker.start()
+        atexit.register(self.close)
+
+    def _count(self, key: str, amount: int = 1):
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    def submit(self, alert: Alert) -> bool:
+        """
+        알림을 큐에 추가 (대기하지 않음)
+
+        Returns:
+            큐에 들어갔으면 True, 가득 찼거나 종료되어 버렸으면 False
+        """
+        if self._closed:
+            self._count('dropped')
+            return False
+        try:
+            self._queue.put_nowait(alert)
+        except queue.Full:
+            self._count('dropped')
+            return False
+        self._count('enqueued')
+        return True
+
+    def _collect_batch(self, first) -> Tuple[List[Alert], bool]:
+        """첫 알림 이후 batch_window 동안 알림을 모음 (종료 신호를 만나면 즉시 반환)"""
+        if first is _STOP:
+            return self._drain(), True
+
+        batch = [first]
+        deadline = time.monotonic() + self.config.batch_window_seconds
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return batch, False
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                return batch, False
+            if item is _STOP:
+                return batch + self._drain(), True
+            batch.append(item)
+
+    def _drain(self) -> List[Alert]:
+        """큐에 남은 알림 모두 꺼내기"""
+        items = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return items
+            if item is not _STOP:
+                items.append(item)
+
+    def _dispatch(self, batch: List[Alert], final: bool):
+        """채널별 전송 (종료 시에는 전송 간격 제한 무시)"""
+        alerts = coalesce_alerts(batch)
+        self._count('coalesced', len(batch) - len(alerts))
+
+        for start in range(0, len(alerts), self.config.max_batch_size):
+            chunk = alerts[start:start + self.config.max_batch_size]
+            for channel, sender in self.senders.items():
+                if not final:
+                    wait_time = self._next_send_at[channel] - time.monotonic()
+                    if wait_time > 0:
+                        time.sleep(wait_time)
+                try:
+                    sender(chunk)
+                    self._count('batches_sent')
+                    self._count('alerts_sent', len(chunk))
+                except Exception as e:
+                    self._count('send_failures')
+                    self.logger.error(f"{channel} 알림 전송 실패: {e}")
+                self._next_send_at[channel] = time.monotonic() + self.config.min_send_interval_seconds
+
+    def _run(self):
+        """백그라운드 워커"""
+        while True:
+            first = self._queue.get()
+            batch, stopping = self._collect_batch(first)
+            if batch:
+                self._dispatch(batch, final=stopping)
+            if stopping:
+                return
+
+    def close(self, timeout: Optional[float] = None):
+        """
+        종료: 남은 알림을 마지막으로 전송하고 워커 종료
+
+        Args:
+            timeout: 대기 시간 (None이면 설정값)
+        """
+        if self._closed:
+            return
+        self._closed = True
+        timeout = self.config.close_timeout_seconds if timeout is None else timeout
+
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            self.logger.warning("알림 큐가 가득 차 종료 신호 전달 실패")
+            return
+
+        self._worker.join(timeout)
+        if self._worker.is_alive():
+            self.logger.warning(f"알림 전송기 종료 대기 시간 초과 ({timeout}초)")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """전송 통계"""
+        with self._stats_lock:
+            stats = dict(self.stats)
+        stats['queued'] = self._queue.qsize()
+        stats['channels'] = list(self.senders)
+        return stats
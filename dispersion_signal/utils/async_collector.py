@@ -4,7 +4,6 @@
 import asyncio
 import aiohttp
 import logging
-import json
 import time
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timezone, timedelta
@@ -14,6 +13,12 @@ import hashlib
 import pickle
 from pathlib import Path
 
+from urllib.parse import urlparse
+
+from utils.retry_policy import get_retry_policy
+from utils.metrics import record_http_request, record_cache_lookup, CACHE_ENTRIES
+from utils.json_codec import dumps as json_dumps, loads as json_loads
+
 class CacheStrategy(Enum):
     """캐시 전략"""
     LRU = "lru"           # Least Recently Used
@@ -45,6 +50,7 @@ class AsyncDataCollector:
         self.logger = logger or logging.getLogger(__name__)
         self.session: Optional[aiohttp.ClientSession] = None
         self.semaphore = asyncio.Semaphore(config.max_concurrent_requests)
+        self.retry_policy = get_retry_policy()
     
     async def __aenter__(self):
         """비동기 컨텍스트 매니저 진입"""
@@ -60,7 +66,7 @@ class AsyncDataCollector:
     async def fetch_data(self, url: str, headers: Optional[Dict[str, str]] = None, 
                         params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
         """
-        비동기 데이터 페치
+        비동기 데이터 페치 (공유 재시도 정책 + 현재 데드라인 적용)
         
         Args:
             url: 요청 URL
@@ -70,31 +76,50 @@ class AsyncDataCollector:
         Returns:
             응답 데이터 또는 None
         """
+        host = urlparse(url).netloc
+        retry = self.retry_policy.start(max_attempts=self.config.retry_attempts,
+                                        base_delay=self.config.retry_delay)
+        
         async with self.semaphore:
-            for attempt in range(self.config.retry_attempts):
+            while True:
+                if retry.expired:
+                    self.logger.warning(f"데드라인 초과, 요청 중단: {url}")
+                    return None
+                
+                retry_after = 0.0
                 try:
-                    async with self.session.get(url, headers=headers, params=params) as response:
+                    timeout = aiohttp.ClientTimeout(total=retry.timeout(self.config.request_timeout))
+                    start_time = time.perf_counter()
+                    async with self.session.get(url, headers=headers, params=params, timeout=timeout) as response:
+                        body = await response.read()
+                        record_http_request('async', host, response.status, time.perf_counter() - start_time,
+                                            len(body))
                         if response.status == 200:
-                            data = await response.json()
+                            data = json_loads(body)  # read()로 받은 bytes를 바로 디코딩
                             self.logger.debug(f"비동기 요청 성공: {url}")
                             return data
                         elif response.status == 429:  # Rate limit
-                            wait_time = 2 ** attempt
-                            self.logger.warning(f"Rate limit 도달, {wait_time}초 대기: {url}")
-                            await asyncio.sleep(wait_time)
-                            continue
+                            try:
+                                retry_after = float(response.headers.get('Retry-After', 0))
+                            except ValueError:
+                                retry_after = 0.0
+                            self.logger.warning(f"Rate limit 도달: {url}")
                         else:
                             self.logger.warning(f"HTTP {response.status}: {url}")
                             
                 except asyncio.TimeoutError:
-                    self.logger.warning(f"요청 타임아웃 (시도 {attempt + 1}): {url}")
+                    record_http_request('async', host, 'timeout')
+                    self.logger.warning(f"요청 타임아웃 (시도 {retry.attempt}): {url}")
                 except Exception as e:
-                    self.logger.error(f"요청 실패 (시도 {attempt + 1}): {e}")
+                    record_http_request('async', host, 'error')
+                    self.logger.error(f"요청 실패 (시도 {retry.attempt}): {e}")
                 
-                if attempt < self.config.retry_attempts - 1:
-                    await asyncio.sleep(self.config.retry_delay * (2 ** attempt))
+                wait_time = retry.next_delay(minimum=retry_after)
+                if wait_time is None:
+                    break
+                await asyncio.sleep(wait_time)
             
-            self.logger.error(f"모든 재시도 실패: {url}")
+            self.logger.error(f"모든 재시도 실패 ({retry.stop_reason}): {url}")
             return None
     
     async def fetch_multiple(self, requests: List[Tuple[str, Optional[Dict[str, str]], Optional[Dict[str, Any]]]]) -> List[Optional[Dict[str, Any]]]:
@@ -152,7 +177,7 @@ class CacheManager:
         """캐시 키 생성"""
         key_data = f"{url}"
         if params:
-            key_data += f"_{json.dumps(params, sort_keys=True)}"
+            key_data += f"_{json_dumps(params, sort_keys=True).decode('utf-8')}"
         
         return hashlib.md5(key_data.encode()).hexdigest()
     
@@ -219,16 +244,19 @@ class CacheManager:
             if self._is_expired(cache_entry):
                 self._remove_entry(cache_key)
                 self.stats['misses'] += 1
+                record_cache_lookup('expired')
                 return None
             
             # 접근 시간 업데이트
             self.access_times[cache_key] = datetime.now(timezone.utc)
             self.stats['hits'] += 1
+            record_cache_lookup('hit')
             
             self.logger.debug(f"캐시 히트: {url}")
             return cache_entry['data']
         
         self.stats['misses'] += 1
+        record_cache_lookup('miss')
         self.logger.debug(f"캐시 미스: {url}")
         return None
     
@@ -266,6 +294,7 @@ class CacheManager:
         
         # 캐시 크기 관리
         self._evict_old_entries()
+        CACHE_ENTRIES.set(len(self.memory_cache))
         
         self.logger.debug(f"캐시 저장: {url}")
     
@@ -274,6 +303,7 @@ class CacheManager:
         self.memory_cache.clear()
         self.access_times.clear()
         self.stats['total_size_bytes'] = 0
+        CACHE_ENTRIES.set(0)
         self.logger.info("캐시 전체 삭제 완료")
     
     def get_stats(self) -> Dict[str, Any]:
@@ -352,5 +382,6 @@ class OptimizedDataCollector:
                 'max_concurrent_requests': self.async_collector.config.max_concurrent_requests,
                 'request_timeout': self.async_collector.config.request_timeout,
                 'retry_attempts': self.async_collector.config.retry_attempts
-            }
+            },
+            'retry_budget': self.async_collector.retry_policy.get_stats()
         }
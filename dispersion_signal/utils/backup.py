@@ -1,17 +1,47 @@
 """
 데이터 백업 및 복구 시스템
+
+백업 파일 형식 (version 2.0, 청크 단위 스트리밍)
+- 레코드 한 줄 = JSON 한 줄 (newline-delimited): {"key": 키, "value": 값} 또는 리스트/이터레이터 값의
+  원소마다 {"key": 키, "item": 원소} → 큰 테이블도 한 레코드씩 인코딩해 일정한 메모리로 기록
+- 레코드를 chunk_size_kb만큼 모아 청크마다 독립적으로 압축 (gzip 멤버 또는 zstd 프레임)
+- 파일 끝에 인덱스(JSON: 백업 메타데이터 + 청크별 위치/길이/레코드 수/압축 데이터 crc32)와
+  고정 길이 푸터(매직 + 인덱스 위치 + 인덱스 crc32)
+  → 무결성 검증은 압축 해제/파싱 없이 청크 체크섬만 비교, 복구는 청크 단위로 순서대로 읽어 레코드를 하나씩 반환
+
+이전 형식(version 1.0, JSON 파일 하나 .json/.json.gz)도 복구/검증 가능
 """
 import logging
-import json
 import gzip
 import shutil
-from typing import Dict, List, Optional, Any
+import struct
+import zlib
+from typing import Dict, List, Optional, Any, Iterable, Iterator, Tuple
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 import os
 from dataclasses import dataclass
 from enum import Enum
 
+from utils.json_codec import dumps as json_dumps, loads as json_loads
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+BACKUP_FORMAT_VERSION = '2.0'
+
+# 푸터: 매직(8) + 인덱스 시작 위치(8) + 인덱스 crc32(4)
+_FOOTER = struct.Struct('>8sQI')
+_FOOTER_MAGIC = b'DSBKIDX2'
+
+# 압축 방식별 기본 압축 레벨 (gzip.open 기본값 9보다 빠르고 크기 차이는 작음)
+DEFAULT_COMPRESSION_LEVELS = {'gzip': 6, 'zstd': 3}
+
+_FILE_SUFFIXES = {'gzip': '.ndjson.gz', 'zstd': '.ndjson.zst', 'none': '.ndjson'}
+
 class BackupType(Enum):
     """백업 타입"""
     FULL = "full"           # 전체 백업
@@ -26,6 +56,196 @@ class BackupConfig:
     compression_enabled: bool = True
     encryption_enabled: bool = False
     max_backup_size_mb: int = 1000  # 최대 백업 크기 (MB)
+    compression: str = "gzip"  # gzip | zstd (zstandard 설치 시, 없으면 gzip)
+    compression_level: Optional[int] = None  # None이면 DEFAULT_COMPRESSION_LEVELS
+    chunk_size_kb: int = 1024  # 청크당 레코드 크기 (압축 전, KB)
+
+def _compress_function(compression: str, level: int):
+    if compression == 'gzip':
+        return lambda raw: gzip.compress(raw, compresslevel=level, mtime=0)
+    if compression == 'zstd':
+        return zstandard.ZstdCompressor(level=level).compress
+    return bytes
+
+def _decompress_function(compression: str):
+    if compression == 'gzip':
+        return gzip.decompress
+    if compression == 'zstd':
+        if not ZSTD_AVAILABLE:
+            raise RuntimeError("zstd 백업을 읽으려면 zstandard 패키지가 필요합니다")
+        return zstandard.ZstdDecompressor().decompress
+    return bytes
+
+def is_chunked_backup(path: Path) -> bool:
+    """청크 형식(version 2.0) 백업 파일 여부 (푸터 매직만 확인)"""
+    try:
+        with open(path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() < _FOOTER.size:
+                return False
+            f.seek(-_FOOTER.size, os.SEEK_END)
+            return f.read(_FOOTER.size).startswith(_FOOTER_MAGIC)
+    except OSError:
+        return False
+
+class BackupWriter:
+    """청크 백업 파일 작성기 (임시 파일에 쓰고 close()에서 인덱스/푸터 기록 후 이름 변경)"""
+    
+    def __init__(self, path: Path, compression: str = 'gzip', compression_level: Optional[int] = None,
+                 chunk_size_kb: int = 1024):
+        """
+        Args:
+            path: 백업 파일 경로
+            compression: gzip | zstd | none
+            compression_level: 압축 레벨 (None이면 압축 방식별 기본값)
+            chunk_size_kb: 청크당 레코드 크기 (압축 전, KB)
+        """
+        self.path = Path(path)
+        self.compression = compression
+        self.compression_level = compression_level if compression_level is not None \
+            else DEFAULT_COMPRESSION_LEVELS.get(compression, 0)
+        self.chunk_size = max(1, chunk_size_kb) * 1024
+        self._compress = _compress_function(compression, self.compression_level)
+        self._tmp_path = self.path.with_name(self.path.name + '.tmp')
+        self._file = open(self._tmp_path, 'wb')
+        self._buffer = bytearray()
+        self._buffer_records = 0
+        self._offset = 0
+        self.chunks: List[Dict[str, int]] = []
+        self.records = 0
+        self.data_size = 0  # 압축 전 레코드 바이트 합계
+    
+    def _write_record(self, record: Dict[str, Any]):
+        line = json_dumps(record)
+        self._buffer += line
+        self._buffer += b'\n'
+        self._buffer_records += 1
+        self.records += 1
+        self.data_size += len(line) + 1
+        if len(self._buffer) >= self.chunk_size:
+            self._flush_chunk()
+    
+    def _flush_chunk(self):
+        if not self._buffer:
+            return
+        compressed = self._compress(bytes(self._buffer))
+        self._file.write(compressed)
+        self.chunks.append({
+            'offset': self._offset,
+            'length': len(compressed),
+            'records': self._buffer_records,
+            'raw_size': len(self._buffer),
+            'crc32': zlib.crc32(compressed),
+        })
+        self._offset += len(compressed)
+        self._buffer = bytearray()
+        self._buffer_records = 0
+    
+    def write_value(self, key: str, value: Any):
+        """키 하나의 값을 레코드 하나로 기록"""
+        self._write_record({'key': key, 'value': value})
+    
+    def write_items(self, key: str, items: Iterable[Any]):
+        """리스트/이터레이터 값을 원소별 레코드로 기록 (빈 리스트도 복구되도록 빈 값 레코드 먼저)"""
+        self._write_record({'key': key, 'value': []})
+        for item in items:
+            self._write_record({'key': key, 'item': item})
+    
+    def close(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        남은 레코드를 청크로 기록하고 인덱스/푸터 작성
+        
+        Args:
+            metadata: 인덱스에 넣을 백업 메타데이터 (data_size/records는 여기서 채움)
+            
+        Returns:
+            인덱스 딕셔너리
+        """
+        self._flush_chunk()
+        index = {
+            'metadata': dict(metadata, data_size=self.data_size, records=self.records),
+            'compression': self.compression,
+            'compression_level': self.compression_level,
+            'chunks': self.chunks,
+        }
+        encoded = json_dumps(index)
+        self._file.write(encoded)
+        self._file.write(_FOOTER.pack(_FOOTER_MAGIC, self._offset, zlib.crc32(encoded)))
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+        return index
+    
+    def abort(self):
+        """작성 중인 임시 파일 삭제"""
+        self._file.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+class BackupReader:
+    """청크 백업 파일 읽기 (인덱스만 먼저 읽고 청크는 필요할 때 하나씩)"""
+    
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: 백업 파일 경로
+            
+        Raises:
+            ValueError: 청크 형식이 아니거나 인덱스가 손상됨
+        """
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            self.file_size = f.tell()
+            if self.file_size < _FOOTER.size:
+                raise ValueError("청크 백업 형식이 아닙니다 (푸터 없음)")
+            f.seek(-_FOOTER.size, os.SEEK_END)
+            magic, index_offset, index_crc = _FOOTER.unpack(f.read(_FOOTER.size))
+            if magic != _FOOTER_MAGIC or index_offset > self.file_size - _FOOTER.size:
+                raise ValueError("청크 백업 형식이 아닙니다 (푸터 불일치)")
+            f.seek(index_offset)
+            encoded = f.read(self.file_size - _FOOTER.size - index_offset)
+        if zlib.crc32(encoded) != index_crc:
+            raise ValueError("백업 인덱스 체크섬 불일치")
+        self.index_offset = index_offset
+        self.index = json_loads(encoded, exact_ints=True)
+        self.metadata: Dict[str, Any] = self.index['metadata']
+        self.chunks: List[Dict[str, int]] = self.index['chunks']
+    
+    def _iter_compressed_chunks(self) -> Iterator[Tuple[Dict[str, int], bytes]]:
+        with open(self.path, 'rb') as f:
+            for chunk in self.chunks:
+                f.seek(chunk['offset'])
+                yield chunk, f.read(chunk['length'])
+    
+    def verify(self) -> Optional[str]:
+        """
+        청크 위치/길이/crc32 검증 (압축 해제/파싱 없음)
+        
+        Returns:
+            문제 설명 또는 None (정상)
+        """
+        expected_offset = 0
+        for i, (chunk, compressed) in enumerate(self._iter_compressed_chunks()):
+            if chunk['offset'] != expected_offset or len(compressed) != chunk['length']:
+                return f"청크 {i} 위치/길이 불일치"
+            if zlib.crc32(compressed) != chunk['crc32']:
+                return f"청크 {i} 체크섬 불일치"
+            expected_offset += chunk['length']
+        if expected_offset != self.index_offset:
+            return "청크 영역과 인덱스 위치 불일치"
+        if sum(chunk['records'] for chunk in self.chunks) != self.metadata.get('records'):
+            return "레코드 수 불일치"
+        return None
+    
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """레코드를 파일 순서대로 하나씩 (한 번에 청크 하나만 메모리에 둠)"""
+        decompress = _decompress_function(self.index['compression'])
+        for chunk, compressed in self._iter_compressed_chunks():
+            if zlib.crc32(compressed) != chunk['crc32']:
+                raise ValueError(f"청크 체크섬 불일치 (offset {chunk['offset']})")
+            raw = decompress(compressed)
+            for line in raw.split(b'\n'):
+                if line:
+                    yield json_loads(line, exact_ints=True)
 
 class DataBackupManager:
     """데이터 백업 및 복구 관리자"""
@@ -41,13 +261,21 @@ class DataBackupManager:
         # 백업 메타데이터 파일
         self.metadata_file = self.backup_path / "backup_metadata.json"
         self.metadata = self._load_metadata()
+        
+        # 압축 방식 (zstd 요청 시 zstandard가 없으면 gzip)
+        if not config.compression_enabled:
+            self.compression = 'none'
+        elif config.compression == 'zstd' and not ZSTD_AVAILABLE:
+            self.logger.warning("zstandard 미설치, gzip으로 백업합니다")
+            self.compression = 'gzip'
+        else:
+            self.compression = config.compression if config.compression in DEFAULT_COMPRESSION_LEVELS else 'gzip'
     
     def _load_metadata(self) -> Dict[str, Any]:
         """백업 메타데이터 로드"""
         if self.metadata_file.exists():
             try:
-                with open(self.metadata_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return json_loads(self.metadata_file.read_bytes(), exact_ints=True)
             except Exception as e:
                 self.logger.error(f"백업 메타데이터 로드 실패: {e}")
         
@@ -60,49 +288,42 @@ class DataBackupManager:
     def _save_metadata(self):
         """백업 메타데이터 저장"""
         try:
-            with open(self.metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(self.metadata, f, indent=2, ensure_ascii=False)
+            self.metadata_file.write_bytes(json_dumps(self.metadata, indent=True))
         except Exception as e:
             self.logger.error(f"백업 메타데이터 저장 실패: {e}")
     
     def create_backup(self, data: Dict[str, Any], backup_type: BackupType = BackupType.FULL) -> Optional[str]:
         """
-        데이터 백업 생성
+        데이터 백업 생성 (청크 형식, 레코드 단위로 인코딩/압축하며 기록)
         
         Args:
-            data: 백업할 데이터
+            data: 백업할 데이터 (리스트/튜플/이터레이터 값은 원소별 레코드로 기록 - 제너레이터를 넘기면
+                  테이블 전체를 메모리에 올리지 않고 백업, 복구 시에는 리스트)
             backup_type: 백업 타입
             
         Returns:
             백업 파일 경로 또는 None
         """
+        writer = None
         try:
             timestamp = datetime.now(timezone.utc)
-            backup_filename = f"backup_{backup_type.value}_{timestamp.strftime('%Y%m%d_%H%M%S')}.json"
-            
-            if self.config.compression_enabled:
-                backup_filename += ".gz"
-            
+            backup_filename = f"backup_{backup_type.value}_{timestamp.strftime('%Y%m%d_%H%M%S')}" \
+                f"{_FILE_SUFFIXES[self.compression]}"
             backup_file_path = self.backup_path / backup_filename
             
-            # 데이터 직렬화
-            backup_data = {
-                'metadata': {
-                    'backup_type': backup_type.value,
-                    'timestamp': timestamp.isoformat(),
-                    'version': '1.0',
-                    'data_size': len(json.dumps(data))
-                },
-                'data': data
-            }
-            
-            # 백업 파일 생성
-            if self.config.compression_enabled:
-                with gzip.open(backup_file_path, 'wt', encoding='utf-8') as f:
-                    json.dump(backup_data, f, indent=2, ensure_ascii=False)
-            else:
-                with open(backup_file_path, 'w', encoding='utf-8') as f:
-                    json.dump(backup_data, f, indent=2, ensure_ascii=False)
+            writer = BackupWriter(backup_file_path, self.compression, self.config.compression_level,
+                                  self.config.chunk_size_kb)
+            for key, value in data.items():
+                if isinstance(value, (list, tuple, Iterator)):
+                    writer.write_items(key, value)
+                else:
+                    writer.write_value(key, value)
+            index = writer.close({
+                'backup_type': backup_type.value,
+                'timestamp': timestamp.isoformat(),
+                'version': BACKUP_FORMAT_VERSION
+            })
+            writer = None
             
             # 메타데이터 업데이트
             backup_info = {
@@ -110,7 +331,12 @@ class DataBackupManager:
                 'backup_type': backup_type.value,
                 'timestamp': timestamp.isoformat(),
                 'size_bytes': backup_file_path.stat().st_size,
-                'file_path': str(backup_file_path)
+                'file_path': str(backup_file_path),
+                'version': BACKUP_FORMAT_VERSION,
+                'compression': self.compression,
+                'records': index['metadata']['records'],
+                'chunks': len(index['chunks']),
+                'data_size': index['metadata']['data_size']
             }
             
             self.metadata['backups'].append(backup_info)
@@ -122,13 +348,53 @@ class DataBackupManager:
             
             self._save_metadata()
             
-            self.logger.info(f"백업 생성 완료: {backup_filename} ({backup_info['size_bytes']} bytes)")
+            self.logger.info(f"백업 생성 완료: {backup_filename} ({backup_info['size_bytes']} bytes, "
+                             f"레코드 {backup_info['records']}개, 청크 {backup_info['chunks']}개)")
             return str(backup_file_path)
             
         except Exception as e:
+            if writer is not None:
+                writer.abort()
             self.logger.error(f"백업 생성 실패: {e}")
             return None
     
+    @staticmethod
+    def _read_legacy_backup_file(backup_file_path: Path) -> Dict[str, Any]:
+        """이전 형식(JSON 파일 하나) 백업 전체 읽기 (.gz면 압축 해제)"""
+        if backup_file_path.name.endswith('.gz'):
+            with gzip.open(backup_file_path, 'rb') as f:
+                return json_loads(f.read(), exact_ints=True)
+        return json_loads(backup_file_path.read_bytes(), exact_ints=True)
+    
+    def iter_backup_records(self, backup_filename: str) -> Iterator[Tuple[str, Any, bool]]:
+        """
+        백업 레코드를 하나씩 복구 (청크 형식은 청크 단위로 읽어 일정한 메모리 사용)
+        
+        Args:
+            backup_filename: 백업 파일명
+            
+        Returns:
+            (키, 값, 원소 여부) 이터레이터 - 원소 여부가 True면 값은 키 리스트의 원소 하나
+            
+        Raises:
+            FileNotFoundError: 백업 파일 없음
+            ValueError: 백업 파일 손상 (청크 체크섬 불일치 등)
+        """
+        backup_file_path = self.backup_path / backup_filename
+        if not backup_file_path.exists():
+            raise FileNotFoundError(f"백업 파일을 찾을 수 없습니다: {backup_filename}")
+        
+        if not is_chunked_backup(backup_file_path):
+            for key, value in self._read_legacy_backup_file(backup_file_path).get('data', {}).items():
+                yield key, value, False
+            return
+        
+        for record in BackupReader(backup_file_path).iter_records():
+            if 'item' in record:
+                yield record['key'], record['item'], True
+            else:
+                yield record['key'], record['value'], False
+    
     def restore_backup(self, backup_filename: str) -> Optional[Dict[str, Any]]:
         """
         백업에서 데이터 복구
@@ -140,23 +406,19 @@ class DataBackupManager:
             복구된 데이터 또는 None
         """
         try:
-            backup_file_path = self.backup_path / backup_filename
-            
-            if not backup_file_path.exists():
-                self.logger.error(f"백업 파일을 찾을 수 없습니다: {backup_filename}")
-                return None
-            
-            # 백업 파일 읽기
-            if backup_filename.endswith('.gz'):
-                with gzip.open(backup_file_path, 'rt', encoding='utf-8') as f:
-                    backup_data = json.load(f)
-            else:
-                with open(backup_file_path, 'r', encoding='utf-8') as f:
-                    backup_data = json.load(f)
+            data = {}
+            for key, value, is_item in self.iter_backup_records(backup_filename):
+                if is_item:
+                    data[key].append(value)
+                else:
+                    data[key] = value
             
             self.logger.info(f"백업 복구 완료: {backup_filename}")
-            return backup_data.get('data', {})
+            return data
             
+        except FileNotFoundError as e:
+            self.logger.error(str(e))
+            return None
         except Exception as e:
             self.logger.error(f"백업 복구 실패: {e}")
             return None
@@ -254,6 +516,9 @@ class DataBackupManager:
         """
         백업 파일 무결성 검증
         
+        청크 형식은 인덱스와 청크별 crc32만 비교 (압축 해제/파싱 없음),
+        이전 형식은 파일 전체를 읽어 필수 필드 확인
+        
         Args:
             backup_filename: 백업 파일명
             
@@ -266,19 +531,22 @@ class DataBackupManager:
             if not backup_file_path.exists():
                 return False
             
-            # 파일 읽기 테스트
-            if backup_filename.endswith('.gz'):
-                with gzip.open(backup_file_path, 'rt', encoding='utf-8') as f:
-                    backup_data = json.load(f)
+            if is_chunked_backup(backup_file_path):
+                reader = BackupReader(backup_file_path)
+                problem = reader.verify()
+                if problem:
+                    self.logger.error(f"백업 무결성 검증 실패: {backup_filename} ({problem})")
+                    return False
+                metadata = reader.metadata
             else:
-                with open(backup_file_path, 'r', encoding='utf-8') as f:
-                    backup_data = json.load(f)
-            
-            # 필수 필드 검증
-            if 'metadata' not in backup_data or 'data' not in backup_data:
-                return False
+                # 파일 읽기 테스트
+                backup_data = self._read_legacy_backup_file(backup_file_path)
+                
+                # 필수 필드 검증
+                if 'metadata' not in backup_data or 'data' not in backup_data:
+                    return False
+                metadata = backup_data['metadata']
             
-            metadata = backup_data['metadata']
             required_fields = ['backup_type', 'timestamp', 'version']
             
             for field in required_fields:
@@ -0,0 +1,177 @@
+"""
+호스트별 서킷 브레이커
+SystemMonitor.monitor_api_call이 집계하는 연속 실패 횟수를 기준으로 상태를 전환하여
+죽은 업스트림에 대한 호출을 즉시 실패시킴 (재시도 대기로 수집 전체가 멈추지 않도록)
+
+상태 전환:
+    CLOSED    → OPEN       연속 실패가 failure_threshold 이상
+    OPEN      → HALF_OPEN  recovery_timeout 경과 후 첫 요청
+    HALF_OPEN → CLOSED     시험 요청 성공
+    HALF_OPEN → OPEN       시험 요청 실패 (recovery_timeout 다시 시작)
+"""
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, Any, Optional
+
+
+class CircuitState(Enum):
+    """서킷 상태"""
+    CLOSED = "closed"        # 정상 (요청 허용)
+    OPEN = "open"            # 차단 (요청 즉시 실패)
+    HALF_OPEN = "half_open"  # 복구 확인 중 (제한된 시험 요청만 허용)
+
+
+@dataclass
+class CircuitBreakerConfig:
+    """서킷 브레이커 설정"""
+    failure_threshold: int = 3       # 연속 실패 횟수 (AlertThreshold.consecutive_failures와 동일)
+    recovery_timeout: float = 60.0   # OPEN 유지 시간 (초)
+    half_open_max_calls: int = 1     # HALF_OPEN 상태에서 동시에 허용할 시험 요청 수
+
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 요청을 보내지 않음"""
+
+    def __init__(self, key: str, retry_after: float):
+        super().__init__(f"서킷 열림: {key} ({retry_after:.0f}초 후 재시도 가능)")
+        self.key = key
+        self.retry_after = retry_after
+
+
+@dataclass
+class _Circuit:
+    """키(호스트/API)별 서킷 상태"""
+    state: CircuitState = CircuitState.CLOSED
+    opened_at: float = 0.0
+    half_open_calls: int = 0
+    open_count: int = 0
+    rejected_calls: int = 0
+
+
+class CircuitBreaker:
+    """SystemMonitor 실패 카운트 기반 키별 서킷 브레이커 (스레드 안전)"""
+
+    def __init__(self, monitor, config: Optional[CircuitBreakerConfig] = None):
+        """
+        Args:
+            monitor: 연속 실패 횟수를 제공하는 SystemMonitor
+            config: 서킷 브레이커 설정
+        """
+        self.monitor = monitor
+        self.config = config or CircuitBreakerConfig()
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def _circuit(self, key: str) -> _Circuit:
+        if key not in self._circuits:
+            self._circuits[key] = _Circuit()
+        return self._circuits[key]
+
+    def allow_request(self, key: str) -> bool:
+        """
+        요청 허용 여부 확인 (허용된 HALF_OPEN 요청은 시험 요청으로 계산)
+
+        Args:
+            key: 호스트 또는 API 이름
+
+        Returns:
+            요청을 보내도 되면 True
+        """
+        with self._lock:
+            circuit = self._circuit(key)
+
+            if circuit.state == CircuitState.OPEN:
+                if time.monotonic() - circuit.opened_at < self.config.recovery_timeout:
+                    circuit.rejected_calls += 1
+                    return False
+                circuit.state = CircuitState.HALF_OPEN
+                circuit.half_open_calls = 0
+
+            if circuit.state == CircuitState.HALF_OPEN:
+                if circuit.half_open_calls >= self.config.half_open_max_calls:
+                    circuit.rejected_calls += 1
+                    return False
+                circuit.half_open_calls += 1
+
+            return True
+
+    def check(self, key: str):
+        """요청 전 확인 (서킷이 열려 있으면 CircuitOpenError)"""
+        if not self.allow_request(key):
+            raise CircuitOpenError(key, self.retry_after(key))
+
+    def retry_after(self, key: str) -> float:
+        """OPEN 상태가 끝날 때까지 남은 시간 (초)"""
+        with self._lock:
+            circuit = self._circuit(key)
+            if circuit.state != CircuitState.OPEN:
+                return 0.0
+            return max(0.0, self.config.recovery_timeout - (time.monotonic() - circuit.opened_at))
+
+    def record_result(self, key: str, success: bool) -> bool:
+        """
+        호출 결과 반영 (SystemMonitor.monitor_api_call에서 실패 카운트 갱신 후 호출)
+
+        Args:
+            key: 호스트 또는 API 이름
+            success: 호출 성공 여부
+
+        Returns:
+            이번 결과로 서킷이 새로 열렸으면 True
+        """
+        consecutive_failures = self.monitor.consecutive_failures.get(key, 0)
+
+        with self._lock:
+            circuit = self._circuit(key)
+
+            if success:
+                circuit.state = CircuitState.CLOSED
+                circuit.half_open_calls = 0
+                return False
+
+            if circuit.state == CircuitState.HALF_OPEN or (
+                circuit.state == CircuitState.CLOSED and consecutive_failures >= self.config.failure_threshold
+            ):
+                circuit.state = CircuitState.OPEN
+                circuit.opened_at = time.monotonic()
+                circuit.half_open_calls = 0
+                circuit.open_count += 1
+                return True
+
+            return False
+
+    def get_state(self, key: str) -> CircuitState:
+        """현재 서킷 상태 (OPEN 유지 시간이 지났으면 HALF_OPEN으로 표시)"""
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                return CircuitState.CLOSED
+            if (circuit.state == CircuitState.OPEN
+                    and time.monotonic() - circuit.opened_at >= self.config.recovery_timeout):
+                return CircuitState.HALF_OPEN
+            return circuit.state
+
+    def get_status(self) -> Dict[str, Dict[str, Any]]:
+        """
+        서킷 상태 요약 (get_system_status에 포함)
+
+        Returns:
+            {key: {'state', 'retry_after_seconds', 'open_count', 'rejected_calls'}}
+        """
+        status = {}
+        for key in list(self._circuits):
+            circuit = self._circuits[key]
+            status[key] = {
+                'state': self.get_state(key).value,
+                'retry_after_seconds': round(self.retry_after(key), 1),
+                'open_count': circuit.open_count,
+                'rejected_calls': circuit.rejected_calls,
+            }
+        return status
+
+    def reset(self):
+        """모든 서킷을 CLOSED로 초기화"""
+        with self._lock:
+            self._circuits.clear()
@@ -8,6 +8,7 @@ from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from decimal import Decimal
 import hashlib
+import os
 import re
 from collections import defaultdict
 
@@ -16,6 +17,7 @@ from database.models_analyst_targets import (
     MarketIndex, SectorAnalysis, CollectedAnalystData
 )
 from utils.logger import log_info, log_error
+from utils.near_duplicate import MinHashLSH, normalize_text
 
 logger = logging.getLogger(__name__)
 
@@ -216,9 +218,31 @@ class DataQualityValidator:
 class DuplicateDetector:
     """중복 데이터 탐지 클래스"""
     
-    def __init__(self):
-        """중복 탐지기 초기화"""
+    def __init__(self, insight_index_path: Optional[str] = None):
+        """
+        중복 탐지기 초기화
+        
+        Args:
+            insight_index_path: 인사이트 유사 중복 인덱스 파일 (기본값: NEAR_DUPLICATE_INDEX_PATH 환경변수,
+                                빈 문자열이면 실행 간 저장 없이 메모리에서만 비교)
+        """
         self.similarity_threshold = 0.8  # 유사도 임계값
+        
+        if insight_index_path is None:
+            insight_index_path = os.getenv('NEAR_DUPLICATE_INDEX_PATH', 'cache/insight_minhash.json')
+        self.insight_index_path = insight_index_path or None
+        if self.insight_index_path:
+            self.insight_index = MinHashLSH.load(self.insight_index_path, threshold=self.similarity_threshold)
+            # 오래된 기사는 다시 실려도 새 인사이트로 처리
+            max_age_days = float(os.getenv('NEAR_DUPLICATE_MAX_AGE_DAYS', 7))
+            pruned = self.insight_index.prune(max_age_days * 86400)
+        else:
+            self.insight_index = MinHashLSH(threshold=self.similarity_threshold)
+            pruned = 0
+        # 이번 배치에서 등록한 키 (저장 성공 후 commit_insight_index로 확정, 실패/dry-run이면 discard_insight_index로 제거)
+        self._pending_insight_keys = []
+        # 만료 항목을 지웠으면 새 인사이트가 없어도 commit 때 인덱스 저장
+        self._insight_index_pruned = pruned > 0
     
     def generate_target_hash(self, target: AnalystTarget) -> str:
         """
@@ -265,6 +289,19 @@ class DuplicateDetector:
         content = '|'.join(str(field) for field in key_fields)
         return hashlib.md5(content.encode()).hexdigest()
     
+    def generate_insight_hash(self, insight: MarketInsight) -> str:
+        """
+        인사이트 데이터의 해시 생성 (정규화한 내용 기준, 완전 중복 판단용)
+        
+        Args:
+            insight: 시장 인사이트 모델
+        
+        Returns:
+            해시 문자열
+        """
+        content = f"{insight.symbol}|{normalize_text(insight.content)}"
+        return hashlib.md5(content.encode()).hexdigest()
+    
     def detect_duplicate_targets(self, targets: List[AnalystTarget]) -> List[Tuple[int, int]]:
         """
         중복 목표가 탐지
@@ -306,7 +343,7 @@ class DuplicateDetector:
         for i, profile in enumerate(profiles):
             profile_hash = self.generate_profile_hash(profile)
             
-            if target_hash in hash_map:
+            if profile_hash in hash_map:
                 # 중복 발견
                 original_index = hash_map[profile_hash]
                 duplicates.append((original_index, i))
@@ -315,6 +352,51 @@ class DuplicateDetector:
         
         return duplicates
     
+    def detect_duplicate_insights(self, insights: List[MarketInsight]) -> List[Tuple[int, int]]:
+        """
+        유사 중복 인사이트 탐지 (MinHash/LSH, 같은 심볼끼리 비교)
+        
+        입력 순서대로 인덱스에 넣으면서 비교하므로 먼저 나온 항목이 원본.
+        지난 실행에서 본 기사와 중복이면 원본 인덱스는 -1.
+        새로 등록한 항목은 commit_insight_index 전까지 임시 상태 (파일에 저장되지 않음)
+        
+        Args:
+            insights: 인사이트 리스트
+        
+        Returns:
+            중복 쌍의 인덱스 리스트
+        """
+        duplicates = []
+        key_map = {}
+        
+        for i, insight in enumerate(insights):
+            insight_hash = self.generate_insight_hash(insight)
+            original_key = self.insight_index.add(insight_hash, insight.content, scope=insight.symbol)
+            
+            if original_key is not None:
+                # 중복 발견
+                duplicates.append((key_map.get(original_key, -1), i))
+            else:
+                key_map[insight_hash] = i
+                self._pending_insight_keys.append(insight_hash)
+        
+        return duplicates
+    
+    def commit_insight_index(self):
+        """이번 배치에서 등록한 인사이트를 확정하고 인덱스 저장 (DB 저장이 끝난 뒤 호출, 만료 삭제도 함께 반영)"""
+        if not self._pending_insight_keys and not self._insight_index_pruned:
+            return
+        self._pending_insight_keys = []
+        self._insight_index_pruned = False
+        if self.insight_index_path:
+            self.insight_index.save(self.insight_index_path)
+    
+    def discard_insight_index(self):
+        """이번 배치에서 등록한 인사이트 제거 (저장 실패/dry-run 시 다음 실행에서 중복으로 버리지 않음)"""
+        for key in self._pending_insight_keys:
+            self.insight_index.remove(key)
+        self._pending_insight_keys = []
+    
     def calculate_text_similarity(self, text1: str, text2: str) -> float:
         """
         텍스트 유사도 계산 (간단한 Jaccard 유사도)
@@ -351,6 +433,9 @@ class DataQualityManager:
         """
         데이터 검증 및 정리
         
+        유사 중복 인덱스에 새로 넣은 인사이트는 임시 상태이므로
+        저장 성공 후 commit(), 저장 실패/dry-run이면 discard() 호출
+        
         Args:
             data: 수집된 데이터
         
@@ -389,6 +474,14 @@ class DataQualityManager:
         
         return cleaned_data
     
+    def commit(self):
+        """정리한 데이터 저장 성공 후 호출 - 유사 중복 인덱스에 이번 인사이트 반영"""
+        self.duplicate_detector.commit_insight_index()
+    
+    def discard(self):
+        """저장 실패/dry-run 시 호출 - 이번 인사이트를 인덱스에서 제거 (다음 실행에서 다시 처리)"""
+        self.duplicate_detector.discard_insight_index()
+    
     def _clean_analyst_profiles(self, profiles: List[AnalystProfile]) -> List[AnalystProfile]:
         """분석가 프로필 정리"""
         cleaned_profiles = []
@@ -434,17 +527,21 @@ class DataQualityManager:
         return cleaned_targets
     
     def _clean_market_insights(self, insights: List[MarketInsight]) -> List[MarketInsight]:
-        """시장 인사이트 정리"""
-        cleaned_insights = []
+        """시장 인사이트 정리 (검증 통과한 것만 유사 중복 제거, 실행 간 인덱스 유지)"""
+        valid_insights = []
         
         for insight in insights:
             is_valid, errors = self.validator.validate_market_insight(insight)
             if is_valid:
-                cleaned_insights.append(insight)
+                valid_insights.append(insight)
             else:
                 log_error(logger, None, f"시장 인사이트 검증 실패: {insight.symbol} - {errors}")
         
-        log_info(logger, f"시장 인사이트 정리: {len(insights)} → {len(cleaned_insights)}")
+        duplicate_indices = self.duplicate_detector.detect_duplicate_insights(valid_insights)
+        duplicate_set = {duplicate for original, duplicate in duplicate_indices}
+        cleaned_insights = [insight for i, insight in enumerate(valid_insights) if i not in duplicate_set]
+        
+        log_info(logger, f"시장 인사이트 정리: {len(insights)} → {len(cleaned_insights)} (유사 중복 {len(duplicate_set)}개)")
         return cleaned_insights
     
     def _clean_sentiment_analysis(self, sentiment_list: List[SentimentAnalysis]) -> List[SentimentAnalysis]:
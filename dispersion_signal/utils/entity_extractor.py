@@ -0,0 +1,234 @@
+"""
+텍스트 엔티티 추출 - 코인 심볼/이름 언급과 예측 기간 표현
+모든 스크래퍼(Coinness, Upbit DataLab, Reddit)가 공유하는 단일 추출 엔진
+
+- 텍스트를 정규식 한 번으로 토큰화한 뒤 토큰(및 다단어 이름은 토큰 n-gram)을 사전에서 해시 조회
+  → 한 번의 선형 패스, 사전 크기와 무관한 비용 (심볼/패턴별 정규식 반복 없음)
+- 티커는 대문자 그대로 또는 $접두사(대소문자 무관)로만 매칭 (UNI, LINK, NEAR 같은 일반 단어 오탐 방지)
+- 이름(영문/한글)은 대소문자 무관, 한글 이름 뒤 조사(비트코인이, 이더리움에서 등) 허용
+- 여러 단어 이름은 가장 긴 이름 우선 ("Bitcoin Cash"가 "Bitcoin"보다 먼저)
+"""
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# 심볼별 이름 (영문, 한글) - CoinGeckoCollector.SYMBOL_TO_ID_MAP의 ID도 별칭으로 추가됨
+COIN_ALIASES: Dict[str, List[str]] = {
+    'BTC': ['Bitcoin', '비트코인'],
+    'ETH': ['Ethereum', 'Ether', '이더리움'],
+    'SOL': ['Solana', '솔라나'],
+    'XRP': ['Ripple', '리플'],
+    'BNB': ['Binance Coin', '바이낸스코인'],
+    'DOGE': ['Dogecoin', '도지코인'],
+    'TRX': ['Tron', '트론'],
+    'SUI': ['수이'],
+    'AVAX': ['Avalanche', '아발란체'],
+    'TAO': ['Bittensor', '비텐서'],
+    'USDC': ['USD Coin'],
+    'USDT': ['Tether', '테더'],
+    'ADA': ['Cardano', '카르다노'],
+    'MATIC': ['Polygon', '폴리곤'],
+    'DOT': ['Polkadot', '폴카닷'],
+    'LINK': ['Chainlink', '체인링크'],
+    'UNI': ['Uniswap', '유니스왑'],
+    'LTC': ['Litecoin', '라이트코인'],
+    'BCH': ['Bitcoin Cash', '비트코인캐시'],
+    'ATOM': ['Cosmos', '코스모스'],
+    'ZEC': ['Zcash', '지캐시'],
+}
+
+# 일반 단어와 겹쳐 이름으로는 매칭하지 않는 별칭 (티커로만 매칭)
+AMBIGUOUS_ALIASES = {'maker', 'giggle', 'aster', 'virtual', 'pump', 'binance', 'compound'}
+
+# 한글 이름 뒤에 붙는 조사 (1~2글자, 토큰 끝 글자만 보고 바로 조회)
+_KOREAN_PARTICLES_2 = frozenset({'에서', '으로', '까지', '보다', '이나', '처럼', '에게'})
+_KOREAN_PARTICLES_1 = frozenset('이가은는을를의와과도로에만')
+
+_TOKEN_PATTERN = re.compile(r'\$?[A-Za-z0-9]+|[가-힣]+')
+_NAME_SEPARATOR = re.compile(r'[\s\-]+')
+
+
+@dataclass(frozen=True)
+class SymbolMatch:
+    """텍스트 내 코인 언급 1건"""
+    symbol: str
+    start: int
+    end: int
+    text: str
+
+
+class SymbolExtractor:
+    """사전 기반 코인 언급 추출기 (생성 시 사전을 조회 테이블로 한 번만 구성)"""
+
+    def __init__(self, aliases: Dict[str, Iterable[str]], symbols: Optional[Iterable[str]] = None):
+        """
+        Args:
+            aliases: 심볼 → 이름 리스트
+            symbols: 매칭할 심볼 (기본값: aliases의 모든 심볼)
+        """
+        symbols = {s.upper() for s in (symbols if symbols is not None else aliases)}
+        self.tickers = frozenset(symbols)
+        ticker_words = {s.lower() for s in symbols}
+
+        # 이름: 소문자 토큰 튜플 → 심볼 (티커와 같은 이름은 티커 규칙으로만 매칭)
+        self._names: Dict[Tuple[str, ...], str] = {}
+        for symbol in sorted(symbols):
+            for name in aliases.get(symbol, ()):
+                words = tuple(w.lower() for w in _NAME_SEPARATOR.split(name.strip()) if w)
+                if not words or (len(words) == 1 and words[0] in ticker_words) or name.lower() in AMBIGUOUS_ALIASES:
+                    continue
+                self._names.setdefault(words, symbol)
+
+        self._max_words = max((len(w) for w in self._names), default=1)
+        # 다단어 이름의 첫 단어 (해당 토큰에서만 n-gram 조회)
+        self._multiword_heads = {w[0] for w in self._names if len(w) > 1}
+
+    def _lookup_word(self, token: str, lower: str) -> Optional[str]:
+        """단일 토큰 → 심볼"""
+        if token[0] == '$':
+            ticker = token[1:].upper()
+            return ticker if ticker in self.tickers else None
+        if token in self.tickers:
+            return token
+        symbol = self._names.get((lower,))
+        if symbol is None and '가' <= token[0] <= '힣':
+            stem = _strip_korean_particle(token)
+            if stem is not None:
+                symbol = self._names.get((stem,))
+        return symbol
+
+    def finditer(self, text: str) -> Iterator[SymbolMatch]:
+        """텍스트의 모든 언급 (등장 순서, 겹치지 않음)"""
+        if not text:
+            return
+        tokens = [(m.start(), m.end(), m.group()) for m in _TOKEN_PATTERN.finditer(text)]
+        heads = self._multiword_heads
+        i = 0
+        count = len(tokens)
+        while i < count:
+            start, end, token = tokens[i]
+            lower = token.lower()
+
+            # 다단어 이름 (긴 것 우선, 토큰 사이는 공백/하이픈만 허용)
+            if lower in heads:
+                matched = None
+                for n in range(min(self._max_words, count - i), 1, -1):
+                    span = tokens[i:i + n]
+                    if any(not _NAME_SEPARATOR.fullmatch(text[a[1]:b[0]]) for a, b in zip(span, span[1:])):
+                        continue
+                    key = tuple(t[2].lower() for t in span)
+                    # 마지막 단어가 한글이면 조사 제거 후 조회
+                    symbol = self._names.get(key) or self._lookup_multiword_korean(key)
+                    if symbol is not None:
+                        matched = (symbol, span[-1][1], n)
+                        break
+                if matched is not None:
+                    symbol, match_end, n = matched
+                    yield SymbolMatch(symbol, start, match_end, text[start:match_end])
+                    i += n
+                    continue
+
+            symbol = self._lookup_word(token, lower)
+            if symbol is not None:
+                yield SymbolMatch(symbol, start, end, token)
+            i += 1
+
+    def _lookup_multiword_korean(self, key: Tuple[str, ...]) -> Optional[str]:
+        last = key[-1]
+        stem = _strip_korean_particle(last) if '가' <= last[0] <= '힣' else None
+        return self._names.get(key[:-1] + (stem,)) if stem is not None else None
+
+    def find_all(self, text: str) -> List[SymbolMatch]:
+        """텍스트의 모든 언급 (위치 포함)"""
+        return list(self.finditer(text))
+
+    def extract(self, text: str) -> List[str]:
+        """텍스트에 언급된 심볼 (중복 제거, 처음 등장 순서)"""
+        return list(dict.fromkeys(match.symbol for match in self.finditer(text)))
+
+    def find_all_batch(self, texts: Iterable[str]) -> List[List[SymbolMatch]]:
+        """여러 텍스트의 언급 (입력 순서대로)"""
+        return [self.find_all(text) for text in texts]
+
+    def extract_batch(self, texts: Iterable[str]) -> List[List[str]]:
+        """여러 텍스트의 언급 심볼 (입력 순서대로)"""
+        return [self.extract(text) for text in texts]
+
+
+def _strip_korean_particle(token: str) -> Optional[str]:
+    """토큰 끝 조사를 뗀 어간 (조사가 없으면 None, 2글자 조사 우선)"""
+    if len(token) > 2 and token[-2:] in _KOREAN_PARTICLES_2:
+        return token[:-2]
+    if len(token) > 1 and token[-1] in _KOREAN_PARTICLES_1:
+        return token[:-1]
+    return None
+
+
+def build_default_aliases() -> Dict[str, List[str]]:
+    """COIN_ALIASES + CoinGecko ID 별칭 (avalanche-2 → 'avalanche', bitcoin-cash → 'bitcoin cash')"""
+    from collectors.coingecko import CoinGeckoCollector
+
+    aliases = {symbol: list(names) for symbol, names in COIN_ALIASES.items()}
+    for symbol, coin_id in CoinGeckoCollector.SYMBOL_TO_ID_MAP.items():
+        words = coin_id.split('-')
+        if len(words) > 1 and words[-1].isdigit():
+            words = words[:-1]
+        name = ' '.join(words)
+        names = aliases.setdefault(symbol, [])
+        if name.lower() not in (n.lower() for n in names):
+            names.append(name)
+    return aliases
+
+
+_default_extractor = None
+
+
+def get_symbol_extractor() -> SymbolExtractor:
+    """기본 사전 추출기 싱글톤"""
+    global _default_extractor
+    if _default_extractor is None:
+        _default_extractor = SymbolExtractor(build_default_aliases())
+    return _default_extractor
+
+
+# 예측 기간 표현 (우선순위 순) - 먼저 나오는 분류가 텍스트에 하나라도 있으면 그 분류
+TIMEFRAME_KEYWORDS = [
+    (('단기', 'short', '1개월', '1 month', '1m'), {'type': 'short_term', 'months': 1}),
+    (('중기', 'medium', '3개월', '3 month', '3m', '분기'), {'type': 'short_term', 'months': 3}),
+    (('6개월', '6 month', '6m', '반년'), {'type': 'medium_term', 'months': 6}),
+    (('장기', 'long', '1년', '1 year', '1y', '12개월'), {'type': 'medium_term', 'months': 12}),
+    (('2년', '2 year', '2y', '2025'), {'type': 'long_term', 'months': 24}),
+    (('3년', '3 year', '3y', '2026'), {'type': 'long_term', 'months': 36}),
+]
+DEFAULT_TIMEFRAME = {'type': 'medium_term', 'months': 6}
+
+_TIMEFRAME_PRIORITY = {}
+for _priority, (_keywords, _) in enumerate(TIMEFRAME_KEYWORDS):
+    for _keyword in _keywords:
+        _TIMEFRAME_PRIORITY.setdefault(_keyword, _priority)
+# 전방 탐색으로 겹치는 키워드까지 모든 시작 위치에서 찾음 (부분 문자열 포함 여부와 동일)
+_TIMEFRAME_PATTERN = re.compile(
+    '(?=(' + '|'.join(re.escape(k) for k in sorted(_TIMEFRAME_PRIORITY, key=len, reverse=True)) + '))'
+)
+
+
+def extract_timeframe(text: str) -> Dict[str, object]:
+    """
+    텍스트에서 예측 기간 추출 (한 번의 패스)
+
+    Args:
+        text: 분석할 텍스트
+
+    Returns:
+        {'type': ..., 'months': ...}
+    """
+    best = None
+    for match in _TIMEFRAME_PATTERN.finditer(text.lower()):
+        priority = _TIMEFRAME_PRIORITY[match.group(1)]
+        if best is None or priority < best:
+            best = priority
+            if best == 0:
+                break
+    if best is None:
+        return dict(DEFAULT_TIMEFRAME)
+    return dict(TIMEFRAME_KEYWORDS[best][1])
@@ -0,0 +1,169 @@
+"""
+HTML 파서 백엔드 - 분석가 목표가 스크래퍼 공용
+전체 문서 트리 대신 대상 서브트리(태그 + class 키워드)만 만들어 파싱 비용을 줄이고,
+대상 규칙(정규식/CSS 선택자/파싱 필터)은 모듈 로드 시 한 번만 구성
+
+백엔드 (HTML_PARSER_BACKEND 환경변수, 기본값 auto)
+- selectolax: CSS 선택자로 대상 서브트리만 골라낸 뒤 그 조각만 BeautifulSoup으로 변환
+- lxml: BeautifulSoup lxml 트리 빌더 + 대상 서브트리만 생성
+- html.parser: 기존 동작과 같은 파서 + 대상 서브트리만 생성 (추가 설치 불필요)
+auto는 selectolax → lxml → html.parser 순으로 설치된 것을 사용.
+HTML_PARSE_TARGETS_ONLY=false면 대상 규칙 없이 전체 문서를 파싱 (기존 동작)
+"""
+import logging
+import os
+import re
+from typing import Iterable, List, Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401  (BeautifulSoup 'lxml' 트리 빌더)
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# beautifulsoup4 4.13+: 여러 규칙을 합친 파싱 필터 (이전 버전은 규칙 1개만 SoupStrainer로)
+try:
+    from bs4.filter import ElementFilter
+    ELEMENT_FILTER_AVAILABLE = True
+except ImportError:
+    ELEMENT_FILTER_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ('selectolax', 'lxml', 'html.parser')
+
+PARSE_TARGETS_ONLY = os.getenv('HTML_PARSE_TARGETS_ONLY', 'true').lower() != 'false'
+
+_warned_backends = set()
+
+
+class TargetRule:
+    """대상 요소 규칙: 태그 이름 + class 키워드 (class 속성에 키워드 중 하나가 포함되면 매칭)"""
+
+    def __init__(self, tags: Iterable[str], class_keywords: Iterable[str]):
+        self.tags = tuple(tags)
+        self.class_keywords = tuple(class_keywords)
+        self.pattern = re.compile('|'.join(re.escape(k) for k in self.class_keywords))
+        self._tag_set = frozenset(self.tags)
+        # class*= 부분 문자열 선택자 = class 정규식 search와 같은 의미 (키워드에 공백 없음)
+        self.css = ', '.join(f'{tag}[class*="{keyword}"]' for tag in self.tags for keyword in self.class_keywords)
+
+    def matches(self, name: str, class_value) -> bool:
+        if name not in self._tag_set or not class_value:
+            return False
+        if not isinstance(class_value, str):
+            class_value = ' '.join(class_value)
+        return self.pattern.search(class_value) is not None
+
+    def find_all(self, soup) -> List:
+        return soup.find_all(list(self.tags), class_=self.pattern)
+
+    def find(self, soup):
+        return soup.find(list(self.tags), class_=self.pattern)
+
+
+if ELEMENT_FILTER_AVAILABLE:
+    class _TargetFilter(ElementFilter):
+        """여러 TargetRule 중 하나라도 맞는 요소(와 그 하위 트리)만 생성하는 파싱 필터"""
+
+        def __init__(self, rules: List[TargetRule]):
+            super().__init__(match_function=self._match_element)
+            self.rules = rules
+
+        def _match_element(self, element) -> bool:
+            name = getattr(element, 'name', None)
+            return name is not None and any(r.matches(name, element.get('class')) for r in self.rules)
+
+        def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+            class_value = attrs.get('class') if attrs else None
+            return any(rule.matches(name, class_value) for rule in self.rules)
+
+        def allow_string_creation(self, string) -> bool:
+            return False
+
+
+class HtmlTargets:
+    """한 파서가 사용하는 대상 규칙 묶음 (파싱 필터와 CSS 선택자를 미리 구성)"""
+
+    def __init__(self, *rules: TargetRule):
+        self.rules = list(rules)
+        self.css = ', '.join(rule.css for rule in self.rules)
+        if len(self.rules) == 1:
+            rule = self.rules[0]
+            self.parse_only = SoupStrainer(list(rule.tags), class_=rule.pattern)
+        elif ELEMENT_FILTER_AVAILABLE:
+            self.parse_only = _TargetFilter(self.rules)
+        else:
+            self.parse_only = None  # 이전 bs4: 여러 규칙은 전체 파싱
+
+    def matches(self, name: str, class_value) -> bool:
+        return any(rule.matches(name, class_value) for rule in self.rules)
+
+
+def get_parser_backend() -> str:
+    """설정과 설치 상태에 따라 사용할 백엔드"""
+    requested = os.getenv('HTML_PARSER_BACKEND', 'auto').lower()
+    available = {'selectolax': SELECTOLAX_AVAILABLE, 'lxml': LXML_AVAILABLE, 'html.parser': True}
+    if requested in available:
+        if available[requested]:
+            return requested
+        if requested not in _warned_backends:
+            _warned_backends.add(requested)
+            logger.warning(f"HTML 파서 백엔드 {requested} 미설치, 자동 선택으로 대체")
+    return next(backend for backend in BACKENDS if available[backend])
+
+
+def _bs4_builder() -> str:
+    return 'lxml' if LXML_AVAILABLE and get_parser_backend() != 'html.parser' else 'html.parser'
+
+
+def _select_fragment(html_content: str, targets: HtmlTargets) -> str:
+    """selectolax로 대상 요소 중 최상위 것만 골라 원래 순서대로 이어 붙인 HTML"""
+    tree = HTMLParser(html_content)
+    nodes = tree.css(targets.css)
+    matched = {node.mem_id for node in nodes}
+    fragments = []
+    for node in nodes:
+        parent = node.parent
+        nested = False
+        while parent is not None:
+            if parent.mem_id in matched:
+                nested = True
+                break
+            parent = parent.parent
+        if not nested:
+            fragments.append(node.html)
+    return '\n'.join(fragments)
+
+
+def parse_html(html_content: str, targets: Optional[HtmlTargets] = None) -> BeautifulSoup:
+    """
+    HTML 파싱 (targets가 있으면 대상 서브트리만)
+
+    반환 트리에서 targets 규칙으로 find_all 한 결과와 그 하위 요소는 전체 문서를 파싱했을 때와 같음.
+    대상 밖 요소(형제/조상)는 트리에 없으므로 대상 요소 기준으로만 탐색해야 함.
+
+    Args:
+        html_content: HTML 문자열
+        targets: 대상 규칙 (None이면 전체 문서)
+
+    Returns:
+        BeautifulSoup 트리
+    """
+    if targets is None or not PARSE_TARGETS_ONLY:
+        return BeautifulSoup(html_content, _bs4_builder())
+
+    if get_parser_backend() == 'selectolax':
+        return BeautifulSoup(_select_fragment(html_content, targets), _bs4_builder())
+
+    if targets.parse_only is None:
+        return BeautifulSoup(html_content, _bs4_builder())
+    return BeautifulSoup(html_content, _bs4_builder(), parse_only=targets.parse_only)
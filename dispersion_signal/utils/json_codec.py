@@ -0,0 +1,176 @@
+"""
+JSON 인코딩/디코딩 공용 코덱 - API 응답, 캐시 키, 백업, DB 페이로드
+설치된 가장 빠른 백엔드를 사용하고 없으면 표준 json으로 동작
+
+백엔드가 달라도 디코딩한 값은 같지만(64비트 밖 정수는 아래 참고) JSON 문자열이 바이트 단위로 같지는 않음
+- 실수 지수 표기: orjson/msgspec 1e16, 1e-7 / 표준 json 1e+16, 1e-07
+- NaN/Infinity: orjson/msgspec null / 표준 json NaN, Infinity (JSON 표준 밖)
+→ 캐시 키처럼 문자열을 비교하는 용도는 같은 프로세스(같은 백엔드) 안에서만 사용
+
+백엔드 (JSON_BACKEND 환경변수, 기본값 auto)
+- orjson: bytes로 바로 인코딩/디코딩, datetime/UUID/Enum 기본 지원
+- msgspec: bytes로 바로 인코딩/디코딩, datetime/UUID/Decimal 기본 지원
+- json: 표준 라이브러리 (추가 설치 불필요)
+auto는 orjson → msgspec → json 순으로 설치된 것을 사용.
+
+타입 변환 (모든 백엔드 동일, database/serialization의 DB 행 변환과 같은 규칙)
+Decimal → float, UUID → str, datetime/date → ISO 문자열, Enum → 값, set/tuple → 리스트,
+Pydantic 모델 → 필드 딕셔너리
+64비트를 넘는 정수: 인코딩은 모든 백엔드에서 정수 그대로 (해당 값만 표준 json 사용),
+디코딩은 loads(exact_ints=True)일 때만 정수 그대로 - API 응답처럼 큰 금액이 문자열로 오는 핫 경로는 검사 없이 백엔드 사용
+"""
+import dataclasses
+import json
+import logging
+import os
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Union
+from uuid import UUID
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ('orjson', 'msgspec', 'json')
+
+_warned_backends = set()
+
+# orjson/msgspec은 64비트 범위 밖 정수를 float로 디코딩 (정밀도 손실) - loads(exact_ints=True)일 때만
+# 숫자 19개 이상 연속 구간이 있는지 확인하고 있으면 표준 json으로 디코딩
+# (정규식 대신 bytes.translate + 부분 문자열 검색으로 C 속도 한 번 훑기, 따옴표 속 긴 숫자도 걸리지만 결과는 같음)
+_DIGITS_TO_ZERO = bytes.maketrans(b'123456789', b'000000000')
+_DIGITS_TO_ZERO_STR = str.maketrans('123456789', '000000000')
+_BIG_INT_RUN = b'0' * 19
+_BIG_INT_RUN_STR = '0' * 19
+
+
+def default(value: Any) -> Any:
+    """
+    백엔드가 기본 지원하지 않는 값 변환 (표준 json의 default 인자와 같은 규약)
+
+    Raises:
+        TypeError: 변환할 수 없는 타입
+    """
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if hasattr(value, 'model_dump'):
+        return value.model_dump()
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    raise TypeError(f"JSON으로 변환할 수 없는 타입: {type(value).__name__}")
+
+
+def get_backend() -> str:
+    """설정과 설치 상태에 따라 사용할 백엔드"""
+    requested = os.getenv('JSON_BACKEND', 'auto').lower()
+    available = {'orjson': ORJSON_AVAILABLE, 'msgspec': MSGSPEC_AVAILABLE, 'json': True}
+    if requested in available:
+        if available[requested]:
+            return requested
+        if requested not in _warned_backends:
+            _warned_backends.add(requested)
+            logger.warning(f"JSON 백엔드 {requested} 미설치, 자동 선택으로 대체")
+    return next(backend for backend in BACKENDS if available[backend])
+
+
+if ORJSON_AVAILABLE:
+    # 정수 키 허용 (표준 json처럼 문자열 키로 출력)
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+if MSGSPEC_AVAILABLE:
+    # Decimal은 숫자로 (msgspec 기본값은 문자열), 나머지 미지원 타입은 default로
+    _msgspec_encoder = msgspec.json.Encoder(enc_hook=default, decimal_format='number')
+    _msgspec_sorted_encoder = msgspec.json.Encoder(enc_hook=default, decimal_format='number', order='sorted')
+    _msgspec_decoder = msgspec.json.Decoder()
+
+
+def _stdlib_dumps(obj: Any, indent: bool, sort_keys: bool) -> bytes:
+    return json.dumps(obj, default=default, ensure_ascii=False, sort_keys=sort_keys,
+                      indent=2 if indent else None, separators=None if indent else (',', ':')).encode('utf-8')
+
+
+def dumps(obj: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """
+    객체 → UTF-8 JSON bytes
+
+    Args:
+        obj: 인코딩할 객체
+        indent: True면 2칸 들여쓰기 (사람이 읽는 파일용)
+        sort_keys: True면 키 정렬 (캐시 키처럼 같은 값이 같은 문자열이어야 할 때, 같은 백엔드 안에서만 보장)
+
+    Returns:
+        JSON bytes (공백 없는 형식, indent=True일 때만 줄바꿈/들여쓰기)
+    """
+    backend = get_backend()
+    try:
+        if backend == 'orjson':
+            options = _ORJSON_OPTIONS
+            if indent:
+                options |= orjson.OPT_INDENT_2
+            if sort_keys:
+                options |= orjson.OPT_SORT_KEYS
+            return orjson.dumps(obj, default=default, option=options)
+        if backend == 'msgspec':
+            encoded = (_msgspec_sorted_encoder if sort_keys else _msgspec_encoder).encode(obj)
+            return msgspec.json.format(encoded, indent=2) if indent else encoded
+    except (TypeError, OverflowError) as e:
+        # 64비트를 넘는 정수 등 백엔드 제약 - 표준 json으로 다시 인코딩 (변환 불가 타입이면 여기서도 TypeError)
+        logger.debug(f"{backend} 인코딩 실패, 표준 json 사용: {e}")
+    return _stdlib_dumps(obj, indent, sort_keys)
+
+
+def dumps_str(obj: Any, indent: bool = False, sort_keys: bool = False) -> str:
+    """객체 → JSON 문자열 (dumps와 같은 형식)"""
+    return dumps(obj, indent=indent, sort_keys=sort_keys).decode('utf-8')
+
+
+def _may_have_big_int(data: Union[bytes, bytearray, memoryview, str]) -> bool:
+    """64비트 범위를 넘을 수 있는 정수 리터럴(숫자 19개 이상 연속) 포함 가능성"""
+    if isinstance(data, str):
+        return _BIG_INT_RUN_STR in data.translate(_DIGITS_TO_ZERO_STR)
+    return _BIG_INT_RUN in bytes(data).translate(_DIGITS_TO_ZERO)
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str], exact_ints: bool = False) -> Any:
+    """
+    JSON bytes/문자열 → 객체 (응답 본문 bytes를 문자열 변환 없이 바로 디코딩)
+
+    Args:
+        data: JSON bytes/문자열
+        exact_ints: True면 64비트 범위 밖 정수도 정수 그대로 (백업처럼 우리가 쓴 임의 크기 정수가 있을 수 있는 데이터,
+                    입력 크기에 비례한 검사 비용 추가)
+
+    Raises:
+        ValueError: 올바른 JSON이 아님 (모든 백엔드의 디코딩 오류는 ValueError 하위 타입)
+    """
+    backend = get_backend()
+    if backend != 'json' and not (exact_ints and _may_have_big_int(data)):
+        if backend == 'orjson':
+            return orjson.loads(data)
+        try:
+            return _msgspec_decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+    if isinstance(data, memoryview):
+        data = bytes(data)
+    return json.loads(data)
@@ -1,14 +1,97 @@
 """
 로깅 설정 및 유틸리티
+- 로거에는 QueueHandler만 붙이고 파일/콘솔 I/O는 QueueListener 스레드에서 처리
+  (수집 스레드와 이벤트 루프는 큐에 넣기만 함, 큐가 가득 차면 버림)
+- LOG_FORMAT=json 이면 한 줄 JSON 출력 (extra 필드 포함, 지연 시간 분석용)
+- 요청 단위 성공 로그는 LOG_SAMPLE_RATE 비율로 샘플링
 """
+import atexit
+import copy
+import json
 import logging
+import logging.handlers
 import os
-from datetime import datetime
+import queue
+import random
+from datetime import datetime, timezone
 from pathlib import Path
 
+from utils.metrics import RECORDS_COLLECTED
+
+LOG_FORMAT = os.getenv('LOG_FORMAT', 'text').lower()
+LOG_SAMPLE_RATE = float(os.getenv('LOG_SAMPLE_RATE', 1.0))
+LOG_QUEUE_SIZE = int(os.getenv('LOG_QUEUE_SIZE', 10000))
+
+# LogRecord 기본 속성 (JSON 출력 시 extra 필드만 골라내기 위함)
+_RECORD_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'asctime', 'sampled'}
+_EXC_FORMATTER = logging.Formatter()
+
+class JsonFormatter(logging.Formatter):
+    """한 줄 JSON 포매터 (extra로 전달한 필드 포함)"""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith('_'):
+                payload[key] = value
+        if record.exc_info:
+            payload['exc'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload['exc'] = record.exc_text
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+class SamplingFilter(logging.Filter):
+    """extra={'sampled': True} 로그를 비율로 샘플링 (경고 이상은 항상 통과)"""
+    
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.rate >= 1.0 or record.levelno >= logging.WARNING or not getattr(record, 'sampled', False):
+            return True
+        return random.random() < self.rate
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """큐가 가득 차면 기다리지 않고 버리는 QueueHandler"""
+    
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 메시지는 호출 스레드에서 확정하고, 예외는 exc_text로 따로 보존 (JSON에서 별도 필드)
+        record = copy.copy(record)
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _EXC_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+    
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+def _stop_listener(listener: logging.handlers.QueueListener):
+    """리스너 종료 (남은 로그 기록, 이미 종료되었으면 무시)"""
+    if getattr(listener, '_thread', None) is None:
+        return
+    try:
+        listener.stop()
+    except queue.Full:
+        pass
+
 def setup_logger(name: str = 'dispersion_signal', log_file: str = 'logs/collector.log', level: str = 'INFO'):
     """
-    로거 설정
+    로거 설정 (QueueHandler → 백그라운드 QueueListener → 파일/콘솔)
     
     Args:
         name: 로거 이름
@@ -26,33 +109,50 @@ def setup_logger(name: str = 'dispersion_signal', log_file: str = 'logs/collecto
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, level.upper()))
     
-    # 기존 핸들러 제거 (중복 방지)
+    # 기존 핸들러/리스너 제거 (중복 방지)
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
+    previous = getattr(logger, '_queue_listener', None)
+    if previous is not None:
+        _stop_listener(previous)
     
     # 포맷터 설정
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    if LOG_FORMAT == 'json':
+        formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
     
     # 파일 핸들러
     file_handler = logging.FileHandler(log_file, encoding='utf-8')
     file_handler.setLevel(getattr(logging, level.upper()))
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
     
     # 콘솔 핸들러
     console_handler = logging.StreamHandler()
     console_handler.setLevel(getattr(logging, level.upper()))
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    
+    # 큐 핸들러 (호출 스레드는 큐에 넣기만 함)
+    log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    queue_handler = DroppingQueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter(LOG_SAMPLE_RATE))
+    logger.addHandler(queue_handler)
+    
+    listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    logger._queue_listener = listener
+    
+    # 종료 시 큐에 남은 로그 기록
+    atexit.register(_stop_listener, listener)
     
     return logger
 
 def log_api_call(logger: logging.Logger, endpoint: str, status_code: int, response_time: float):
     """
-    API 호출 로깅
+    API 호출 로깅 (성공은 샘플링, 레벨이 꺼져 있으면 포맷하지 않음)
     
     Args:
         logger: 로거 인스턴스
@@ -60,10 +160,13 @@ def log_api_call(logger: logging.Logger, endpoint: str, status_code: int, respon
         status_code: HTTP 상태 코드
         response_time: 응답 시간 (초)
     """
+    extra = {'endpoint': endpoint, 'status_code': status_code, 'response_time': round(response_time, 4)}
     if status_code == 200:
-        logger.info(f"API 호출 성공: {endpoint} - {status_code} ({response_time:.2f}s)")
+        if logger.isEnabledFor(logging.INFO):
+            extra['sampled'] = True
+            logger.info("API 호출 성공: %s - %s (%.2fs)", endpoint, status_code, response_time, extra=extra)
     else:
-        logger.warning(f"API 호출 실패: {endpoint} - {status_code} ({response_time:.2f}s)")
+        logger.warning("API 호출 실패: %s - %s (%.2fs)", endpoint, status_code, response_time, extra=extra)
 
 def log_data_collection(logger: logging.Logger, symbol: str, records_count: int, duration: float):
     """
@@ -75,7 +178,9 @@ def log_data_collection(logger: logging.Logger, symbol: str, records_count: int,
         records_count: 수집된 레코드 수
         duration: 수집 시간 (초)
     """
-    logger.info(f"데이터 수집 완료: {symbol} - {records_count}개 레코드 ({duration:.2f}s)")
+    RECORDS_COLLECTED.inc(records_count, symbol=symbol)
+    logger.info("데이터 수집 완료: %s - %d개 레코드 (%.2fs)", symbol, records_count, duration,
+                extra={'symbol': symbol, 'records_count': records_count, 'duration': round(duration, 4)})
 
 def log_info(logger: logging.Logger, message: str):
     """
@@ -0,0 +1,400 @@
+"""
+프로세스 내 지표 레지스트리 (Prometheus 텍스트 형식 노출)
+카운터/게이지/히스토그램을 레이블별로 집계하고, 다음 두 방식으로 내보냄
+
+- METRICS_PORT 설정 시: http://0.0.0.0:<port>/metrics HTTP 엔드포인트 (백그라운드 스레드)
+- METRICS_TEXTFILE_PATH 설정 시: 종료 시점에 node_exporter textfile collector용 .prom 파일 작성
+
+외부 의존성 없음 (prometheus_client 불필요)
+"""
+import atexit
+import asyncio
+import bisect
+import functools
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from utils import tracing
+
+# 기본 히스토그램 경계 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+METRIC_PREFIX = 'dispersion_'
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """레이블별 값을 보관하는 지표 공통 부분"""
+    type_name = ''
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.type_name}']
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.extend(self._render_sample(key, value))
+        return lines
+
+    def _render_sample(self, key, value) -> List[str]:
+        return [f'{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}']
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+    type_name = 'counter'
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+
+class Gauge(_Metric):
+    """현재 값 게이지"""
+    type_name = 'gauge'
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+
+class Histogram(_Metric):
+    """고정 경계 히스토그램 (버킷 카운트는 렌더링 시 누적)"""
+    type_name = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # [버킷별 카운트..., +Inf 카운트], 합계
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            state[0][index] += 1
+            state[1] += value
+
+    @contextmanager
+    def time(self, **labels):
+        """블록 실행 시간 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def _render_sample(self, key, value) -> List[str]:
+        counts, total = value
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float('inf'),), counts):
+            cumulative += count
+            le = f'le="{_format_value(bound)}"'
+            lines.append(f'{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}')
+        labels = _format_labels(self.labelnames, key)
+        lines.append(f'{self.name}_sum{labels} {_format_value(total)}')
+        lines.append(f'{self.name}_count{labels} {cumulative}')
+        return lines
+
+
+class MetricsRegistry:
+    """지표 레지스트리 (같은 이름으로 다시 등록하면 기존 지표 반환)"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, cls, name: str, documentation: str, labelnames: Sequence[str], **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, documentation, labelnames, **kwargs)
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 (0.0.4)"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+    def write_textfile(self, path: str):
+        """textfile collector용 파일 작성 (임시 파일 작성 후 교체)"""
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = target.with_suffix(target.suffix + '.tmp')
+        tmp_path.write_text(self.render(), encoding='utf-8')
+        os.replace(tmp_path, target)
+
+
+# 프로세스 공유 레지스트리
+REGISTRY = MetricsRegistry()
+
+# 수집기 HTTP 요청
+HTTP_REQUESTS = REGISTRY.counter(
+    METRIC_PREFIX + 'http_requests_total', 'HTTP requests made by collectors', ('client', 'host', 'status'))
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    METRIC_PREFIX + 'http_request_duration_seconds', 'HTTP request latency', ('client', 'host'))
+
+# 캐시
+CACHE_REQUESTS = REGISTRY.counter(
+    METRIC_PREFIX + 'cache_requests_total', 'Cache lookups by result', ('result',))
+CACHE_ENTRIES = REGISTRY.gauge(
+    METRIC_PREFIX + 'cache_entries', 'Entries held in the memory cache')
+
+# Supabase 쓰기
+DB_WRITES = REGISTRY.counter(
+    METRIC_PREFIX + 'db_writes_total', 'Supabase write calls by outcome', ('table', 'outcome'))
+DB_WRITE_ROWS = REGISTRY.counter(
+    METRIC_PREFIX + 'db_write_rows_total', 'Rows submitted in successful Supabase writes', ('table',))
+DB_WRITE_DURATION = REGISTRY.histogram(
+    METRIC_PREFIX + 'db_write_duration_seconds', 'Supabase write latency', ('table',))
+
+# 수집 레코드
+RECORDS_COLLECTED = REGISTRY.counter(
+    METRIC_PREFIX + 'records_collected_total', 'Records collected per symbol', ('symbol',))
+
+# 파이프라인 단계
+STAGE_RUNS = REGISTRY.counter(
+    METRIC_PREFIX + 'stage_runs_total', 'Pipeline stage runs by outcome', ('pipeline', 'stage', 'outcome'))
+STAGE_DURATION = REGISTRY.gauge(
+    METRIC_PREFIX + 'stage_duration_seconds', 'Duration of the last run of each stage', ('pipeline', 'stage', 'run_id'))
+STAGE_SECONDS = REGISTRY.counter(
+    METRIC_PREFIX + 'stage_seconds_total', 'Total time spent in each stage (per-symbol stages run many times)',
+    ('pipeline', 'stage'))
+RUN_START = REGISTRY.gauge(
+    METRIC_PREFIX + 'run_start_timestamp_seconds', 'Start time of the current run', ('pipeline', 'run_id'))
+
+# 현재 실행 식별자 (단계 소요 시간을 실행별로 구분)
+_run = {'pipeline': '', 'run_id': ''}
+
+
+def record_http_request(client: str, host: str, status, duration: Optional[float] = None,
+                        response_bytes: Optional[int] = None):
+    """
+    수집기 HTTP 요청 기록 (현재 추적 스팬에도 요청/바이트 수 누적)
+
+    Args:
+        client: 호출 경로 ('sync', 'async')
+        host: 요청 호스트
+        status: HTTP 상태 코드 또는 'error'/'circuit_open'
+        duration: 응답 시간 (초, 응답이 없었으면 None)
+        response_bytes: 응답 본문 크기 (바이트)
+    """
+    HTTP_REQUESTS.inc(client=client, host=host, status=status)
+    if duration is not None:
+        HTTP_REQUEST_DURATION.observe(duration, client=client, host=host)
+
+    if status == 'circuit_open':
+        tracing.add_counter('http_short_circuited')
+        return
+    tracing.add_counter('http_requests')
+    if not isinstance(status, int) or status >= 400:
+        tracing.add_counter('http_errors')
+    if response_bytes:
+        tracing.add_counter('http_bytes', response_bytes)
+
+
+def record_cache_lookup(result: str):
+    """
+    캐시 조회 결과 기록
+
+    Args:
+        result: 'hit', 'miss', 'expired'
+    """
+    CACHE_REQUESTS.inc(result=result)
+    tracing.add_counter('cache_hits' if result == 'hit' else 'cache_misses')
+
+
+def track_db_write(table: str):
+    """
+    Supabase insert_* 메서드 계측 데코레이터 (반환값이 True면 성공, 첫 인자 길이를 행 수로 기록)
+
+    Args:
+        table: 테이블 이름
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            start = time.perf_counter()
+            result = func(self, *args, **kwargs)
+            DB_WRITE_DURATION.observe(time.perf_counter() - start, table=table)
+
+            success = result is not False and result is not None
+            DB_WRITES.inc(table=table, outcome='success' if success else 'failure')
+            tracing.add_counter('db_writes' if success else 'db_write_failures')
+            if success:
+                if args and hasattr(args[0], '__len__') and not isinstance(args[0], (str, dict)):
+                    rows = len(args[0])
+                else:
+                    rows = 1
+                DB_WRITE_ROWS.inc(rows, table=table)
+                tracing.add_counter('db_rows', rows)
+            return result
+        return wrapper
+    return decorator
+
+
+def _finish_stage(pipeline: str, stage: str, start: float, outcome: str):
+    duration = time.perf_counter() - start
+    STAGE_DURATION.set(duration, pipeline=pipeline, stage=stage, run_id=_run['run_id'])
+    STAGE_SECONDS.inc(duration, pipeline=pipeline, stage=stage)
+    STAGE_RUNS.inc(pipeline=pipeline, stage=stage, outcome=outcome)
+
+
+def track_stage(pipeline: str, stage: Optional[str] = None):
+    """
+    파이프라인 단계 계측 데코레이터 (동기/비동기 함수 모두 지원)
+    반환값이 False거나 예외가 발생하면 outcome='failure'
+    단계는 추적 스팬으로도 기록되어 실행 매니페스트에 포함됨
+
+    Args:
+        pipeline: 파이프라인 이름 (예: 'enhanced', 'phase4')
+        stage: 단계 이름 (기본값: 함수 이름)
+    """
+    def decorator(func):
+        name = stage or func.__name__
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                outcome = 'failure'
+                try:
+                    with tracing.span(name) as current:
+                        result = await func(*args, **kwargs)
+                        if result is False and current is not None:
+                            current.status = 'failure'
+                    outcome = 'failure' if result is False else 'success'
+                    return result
+                finally:
+                    _finish_stage(pipeline, name, start, outcome)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            outcome = 'failure'
+            try:
+                with tracing.span(name) as current:
+                    result = func(*args, **kwargs)
+                    if result is False and current is not None:
+                        current.status = 'failure'
+                outcome = 'failure' if result is False else 'success'
+                return result
+            finally:
+                _finish_stage(pipeline, name, start, outcome)
+        return wrapper
+    return decorator
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """/metrics 엔드포인트"""
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.split('?')[0] not in ('/metrics', '/'):
+            self.send_error(404)
+            return
+        payload = REGISTRY.render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+_server: Optional[ThreadingHTTPServer] = None
+
+
+def start_metrics_exporter(pipeline: str) -> str:
+    """
+    실행 시작 시 호출: 실행 ID 발급, 실행 추적 시작(종료 시 성능 매니페스트 작성),
+    설정에 따라 HTTP 엔드포인트 시작 / 종료 시 textfile 작성 등록
+
+    Args:
+        pipeline: 파이프라인 이름
+
+    Returns:
+        실행 ID
+    """
+    global _server
+    run_id = uuid.uuid4().hex[:12]
+    _run.update(pipeline=pipeline, run_id=run_id)
+    RUN_START.set(time.time(), pipeline=pipeline, run_id=run_id)
+    tracing.start_run_trace(pipeline, run_id)
+
+    port = os.getenv('METRICS_PORT')
+    if port and _server is None:
+        _server = ThreadingHTTPServer((os.getenv('METRICS_HOST', '0.0.0.0'), int(port)), _MetricsHandler)
+        threading.Thread(target=_server.serve_forever, name='metrics-exporter', daemon=True).start()
+
+    textfile = os.getenv('METRICS_TEXTFILE_PATH')
+    if textfile:
+        atexit.register(REGISTRY.write_textfile, textfile.replace('{pipeline}', pipeline))
+
+    return run_id
@@ -4,6 +4,7 @@
 import logging
 import smtplib
 import json
+import os
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timezone, timedelta
 from email.mime.text import MIMEText
@@ -12,6 +13,10 @@ import requests
 from dataclasses import dataclass
 from enum import Enum
 
+from utils.circuit_breaker import CircuitBreaker, CircuitBreakerConfig
+from utils.alert_dispatcher import Alert, AlertDispatcher, AlertDispatcherConfig
+from utils.windowed_metrics import WindowedStats
+
 class AlertSeverity(Enum):
     """알림 심각도"""
     LOW = "low"
@@ -19,10 +24,14 @@ class AlertSeverity(Enum):
     HIGH = "high"
     CRITICAL = "critical"
 
+# 심각도 순서 (묶음 알림 제목 선택용)
+SEVERITY_ORDER = list(AlertSeverity)
+
 @dataclass
 class AlertThreshold:
     """알림 임계값 설정"""
-    api_failure_rate: float = 0.1  # API 실패율 10%
+    api_failure_rate: float = 0.1  # API 실패율 10% (최근 윈도우 기준)
+    min_calls_for_failure_rate: int = 5  # 실패율 판단에 필요한 윈도우 내 최소 호출 수
     data_missing_hours: int = 2    # 데이터 누락 2시간
     price_dispersion_threshold: float = 5.0  # 가격 분산도 5%
     quality_score_threshold: float = 70.0    # 품질 점수 70점
@@ -53,21 +62,52 @@ class SystemMonitor:
         self.last_data_timestamps = {}
         self.consecutive_failures = {}
         
+        # API별 슬라이딩 윈도우 지표 (최근 성공/실패 수, 응답 시간 히스토그램)
+        self.metrics_window_seconds = float(os.getenv('METRICS_WINDOW_SECONDS', 300))
+        self.metrics_bucket_seconds = float(os.getenv('METRICS_BUCKET_SECONDS', 10))
+        self.api_windows: Dict[str, WindowedStats] = {}
+        self.failure_rate_alerting = set()  # 실패율 임계값을 넘은 상태의 API (재진입 시에만 알림)
+        
         # 알림 히스토리 (중복 알림 방지)
         self.alert_history = {}
         self.alert_cooldown = timedelta(minutes=30)  # 30분 쿨다운
+        
+        # 호스트/API별 서킷 브레이커 (연속 실패 카운트 기반)
+        self.circuit_breaker = CircuitBreaker(self, CircuitBreakerConfig(
+            failure_threshold=self.thresholds.consecutive_failures,
+            recovery_timeout=float(os.getenv('CIRCUIT_RECOVERY_TIMEOUT_SECONDS', 60))
+        ))
+        
+        # 이메일/Slack 전송은 백그라운드 전송기로 (수집 루프는 큐에 넣기만 함)
+        senders = {}
+        if self.config.email_enabled:
+            senders['email'] = self._send_email_alerts
+        if self.config.slack_enabled:
+            senders['slack'] = self._send_slack_alerts
+        
+        self.dispatcher: Optional[AlertDispatcher] = None
+        if senders:
+            self.dispatcher = AlertDispatcher(senders, AlertDispatcherConfig(
+                max_queue_size=int(os.getenv('ALERT_QUEUE_SIZE', 1000)),
+                batch_window_seconds=float(os.getenv('ALERT_BATCH_WINDOW_SECONDS', 2.0)),
+                min_send_interval_seconds=float(os.getenv('ALERT_MIN_SEND_INTERVAL_SECONDS', 10.0))
+            ), self.logger)
     
     def monitor_api_call(self, api_name: str, success: bool, response_time: float = 0.0):
         """
         API 호출 모니터링
         
         Args:
-            api_name: API 이름
+            api_name: API 호스트 (BaseCollector.host와 같은 키 - 서킷 브레이커도 이 키로 확인/기록)
             success: 호출 성공 여부
             response_time: 응답 시간 (초)
         """
         if api_name not in self.api_failure_counts:
             self.api_failure_counts[api_name] = {'total': 0, 'failures': 0}
+            self.api_windows[api_name] = WindowedStats(self.metrics_window_seconds, self.metrics_bucket_seconds)
+        
+        window = self.api_windows[api_name]
+        window.record(success, response_time if response_time > 0 else None)
         
         self.api_failure_counts[api_name]['total'] += 1
         if not success:
@@ -91,14 +131,33 @@ class SystemMonitor:
             if api_name in self.consecutive_failures:
                 self.consecutive_failures[api_name] = 0
         
-        # API 실패율 체크
-        failure_rate = self.api_failure_counts[api_name]['failures'] / self.api_failure_counts[api_name]['total']
-        if failure_rate > self.thresholds.api_failure_rate:
+        # 서킷 브레이커 상태 갱신
+        if self.circuit_breaker.record_result(api_name, success):
+            self._send_alert(
+                severity=AlertSeverity.HIGH,
+                title=f"서킷 브레이커 열림",
+                message=f"{api_name} 호출을 {self.circuit_breaker.config.recovery_timeout:.0f}초 동안 차단합니다. "
+                        f"(연속 실패 {self.consecutive_failures.get(api_name, 0)}회)",
+                details={'api_name': api_name, 'consecutive_failures': self.consecutive_failures.get(api_name, 0)}
+            )
+        
+        # API 실패율 체크 (최근 윈도우 기준, 임계값을 새로 넘을 때만 알림)
+        counts = window.counts()
+        if counts['total'] < self.thresholds.min_calls_for_failure_rate:
+            return
+        
+        failure_rate = counts['failures'] / counts['total']
+        if failure_rate <= self.thresholds.api_failure_rate:
+            self.failure_rate_alerting.discard(api_name)
+        elif api_name not in self.failure_rate_alerting:
+            self.failure_rate_alerting.add(api_name)
             self._send_alert(
                 severity=AlertSeverity.MEDIUM,
                 title=f"API 실패율 높음",
-                message=f"{api_name} API 실패율이 {failure_rate:.1%}입니다. (임계값: {self.thresholds.api_failure_rate:.1%})",
-                details={'api_name': api_name, 'failure_rate': failure_rate}
+                message=f"{api_name} API 최근 {window.window_seconds / 60:.0f}분 실패율이 {failure_rate:.1%}입니다. "
+                        f"(임계값: {self.thresholds.api_failure_rate:.1%})",
+                details={'api_name': api_name, 'failure_rate': failure_rate,
+                         'window_calls': counts['total'], 'window_failures': counts['failures']}
             )
     
     def monitor_data_freshness(self, data_source: str, last_timestamp: datetime):
@@ -156,7 +215,7 @@ class SystemMonitor:
     
     def _send_alert(self, severity: AlertSeverity, title: str, message: str, details: Dict[str, Any]):
         """
-        알림 전송
+        알림 전송 (이메일/Slack은 전송기 큐에 넣기만 하고 즉시 반환)
         
         Args:
             severity: 알림 심각도
@@ -175,104 +234,101 @@ class SystemMonitor:
         
         self.alert_history[alert_key] = now
         
-        # 이메일 알림
-        if self.config.email_enabled:
-            self._send_email_alert(severity, title, message, details)
-        
-        # Slack 알림
-        if self.config.slack_enabled:
-            self._send_slack_alert(severity, title, message, details)
+        # 이메일/Slack 알림 (백그라운드 전송)
+        if self.dispatcher is not None:
+            if not self.dispatcher.submit(Alert(severity, title, message, details, now)):
+                self.logger.debug(f"알림 큐 가득 참, 알림 버림: {title}")
         
         # 로그 기록
         self.logger.warning(f"ALERT [{severity.value.upper()}] {title}: {message}")
     
-    def _send_email_alert(self, severity: AlertSeverity, title: str, message: str, details: Dict[str, Any]):
-        """이메일 알림 전송"""
-        try:
-            msg = MIMEMultipart()
-            msg['From'] = self.config.smtp_username
-            msg['To'] = ', '.join(self.config.email_recipients)
-            msg['Subject'] = f"[{severity.value.upper()}] {title}"
-            
-            body = f"""
-{alert_severity_emoji(severity)} {title}
+    def _send_email_alerts(self, alerts: List[Alert]):
+        """이메일 알림 전송 (묶음당 메일 1통, 실패 시 예외)"""
+        top = max(alerts, key=lambda alert: SEVERITY_ORDER.index(alert.severity))
+        subject = top.title if len(alerts) == 1 else f"{top.title} 외 {len(alerts) - 1}건"
+        
+        msg = MIMEMultipart()
+        msg['From'] = self.config.smtp_username
+        msg['To'] = ', '.join(self.config.email_recipients)
+        msg['Subject'] = f"[{top.severity.value.upper()}] {subject}"
+        
+        sections = []
+        for alert in alerts:
+            repeated = f" (×{alert.count})" if alert.count > 1 else ""
+            sections.append(f"""
+{alert_severity_emoji(alert.severity)} {alert.title}{repeated}
 
-{message}
+{alert.message}
 
 상세 정보:
-{json.dumps(details, indent=2, ensure_ascii=False)}
-
-시간: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}
+{json.dumps(alert.details, indent=2, ensure_ascii=False, default=str)}
 
+시간: {alert.created_at.strftime('%Y-%m-%d %H:%M:%S UTC')}
+""")
+        
+        body = "\n".join(sections) + """
 ---
 Dispersion Signal Monitoring System
             """
-            
-            msg.attach(MIMEText(body, 'plain', 'utf-8'))
-            
-            server = smtplib.SMTP(self.config.smtp_server, self.config.smtp_port)
+        
+        msg.attach(MIMEText(body, 'plain', 'utf-8'))
+        
+        server = smtplib.SMTP(self.config.smtp_server, self.config.smtp_port, timeout=30)
+        try:
             server.starttls()
             server.login(self.config.smtp_username, self.config.smtp_password)
-            
-            text = msg.as_string()
-            server.sendmail(self.config.smtp_username, self.config.email_recipients, text)
+            server.sendmail(self.config.smtp_username, self.config.email_recipients, msg.as_string())
+        finally:
             server.quit()
-            
-            self.logger.info(f"이메일 알림 전송 완료: {title}")
-            
-        except Exception as e:
-            self.logger.error(f"이메일 알림 전송 실패: {e}")
+        
+        self.logger.info(f"이메일 알림 전송 완료: {len(alerts)}건")
     
-    def _send_slack_alert(self, severity: AlertSeverity, title: str, message: str, details: Dict[str, Any]):
-        """Slack 알림 전송"""
-        try:
-            color_map = {
-                AlertSeverity.LOW: "#36a64f",      # 녹색
-                AlertSeverity.MEDIUM: "#ff9500",    # 주황색
-                AlertSeverity.HIGH: "#ff0000",     # 빨간색
-                AlertSeverity.CRITICAL: "#8B0000"   # 진한 빨간색
-            }
-            
-            payload = {
-                "attachments": [
+    def _send_slack_alerts(self, alerts: List[Alert]):
+        """Slack 알림 전송 (묶음당 메시지 1건, 알림별 attachment, 실패 시 예외)"""
+        color_map = {
+            AlertSeverity.LOW: "#36a64f",      # 녹색
+            AlertSeverity.MEDIUM: "#ff9500",    # 주황색
+            AlertSeverity.HIGH: "#ff0000",     # 빨간색
+            AlertSeverity.CRITICAL: "#8B0000"   # 진한 빨간색
+        }
+        
+        attachments = []
+        for alert in alerts:
+            repeated = f" (×{alert.count})" if alert.count > 1 else ""
+            attachment = {
+                "color": color_map[alert.severity],
+                "title": f"{alert_severity_emoji(alert.severity)} {alert.title}{repeated}",
+                "text": alert.message,
+                "fields": [
                     {
-                        "color": color_map[severity],
-                        "title": f"{alert_severity_emoji(severity)} {title}",
-                        "text": message,
-                        "fields": [
-                            {
-                                "title": "심각도",
-                                "value": severity.value.upper(),
-                                "short": True
-                            },
-                            {
-                                "title": "시간",
-                                "value": datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC'),
-                                "short": True
-                            }
-                        ],
-                        "footer": "Dispersion Signal Monitoring",
-                        "ts": int(datetime.now(timezone.utc).timestamp())
+                        "title": "심각도",
+                        "value": alert.severity.value.upper(),
+                        "short": True
+                    },
+                    {
+                        "title": "시간",
+                        "value": alert.created_at.strftime('%Y-%m-%d %H:%M:%S UTC'),
+                        "short": True
                     }
-                ]
+                ],
+                "footer": "Dispersion Signal Monitoring",
+                "ts": int(alert.created_at.timestamp())
             }
             
             # 상세 정보 추가
-            if details:
-                detail_text = "\n".join([f"• {k}: {v}" for k, v in details.items()])
-                payload["attachments"][0]["fields"].append({
+            if alert.details:
+                detail_text = "\n".join([f"• {k}: {v}" for k, v in alert.details.items()])
+                attachment["fields"].append({
                     "title": "상세 정보",
                     "value": detail_text,
                     "short": False
                 })
-            
-            response = requests.post(self.config.slack_webhook_url, json=payload)
-            response.raise_for_status()
-            
-            self.logger.info(f"Slack 알림 전송 완료: {title}")
-            
-        except Exception as e:
-            self.logger.error(f"Slack 알림 전송 실패: {e}")
+            attachments.append(attachment)
+        
+        response = requests.post(self.config.slack_webhook_url, json={"attachments": attachments}, timeout=30)
+        response.raise_for_status()
+        
+        self.logger.info(f"Slack 알림 전송 완료: {len(alerts)}건")
     
     def get_system_status(self) -> Dict[str, Any]:
         """
@@ -291,17 +347,27 @@ Dispersion Signal Monitoring System
             }
         }
         
-        # API 상태
+        # API 상태 (누적 + 최근 윈도우)
         for api_name, counts in self.api_failure_counts.items():
             failure_rate = counts['failures'] / counts['total'] if counts['total'] > 0 else 0
+            window = self.api_windows[api_name].snapshot()
             status['api_status'][api_name] = {
                 'total_calls': counts['total'],
                 'failures': counts['failures'],
                 'failure_rate': failure_rate,
-                'status': 'healthy' if failure_rate < self.thresholds.api_failure_rate else 'degraded',
-                'consecutive_failures': self.consecutive_failures.get(api_name, 0)
+                'window': window,
+                'status': 'healthy' if window['failure_rate'] < self.thresholds.api_failure_rate else 'degraded',
+                'consecutive_failures': self.consecutive_failures.get(api_name, 0),
+                'circuit': self.circuit_breaker.get_state(api_name).value
             }
         
+        # 서킷 브레이커 상태
+        status['circuit_breakers'] = self.circuit_breaker.get_status()
+        
+        # 알림 전송기 상태 (큐 적체/버림 확인)
+        if self.dispatcher is not None:
+            status['alert_summary']['dispatch'] = self.dispatcher.get_stats()
+        
         # 데이터 신선도
         now = datetime.now(timezone.utc)
         for source, last_timestamp in self.last_data_timestamps.items():
@@ -328,8 +394,31 @@ Dispersion Signal Monitoring System
     def reset_counters(self):
         """모니터링 카운터 리셋"""
         self.api_failure_counts.clear()
+        self.api_windows.clear()
+        self.failure_rate_alerting.clear()
         self.consecutive_failures.clear()
+        self.circuit_breaker.reset()
         self.logger.info("모니터링 카운터 리셋 완료")
+    
+    def close(self):
+        """종료 시 대기 중인 알림 전송"""
+        if self.dispatcher is not None:
+            self.dispatcher.close()
+
+# 프로세스 공유 모니터 (모든 컬렉터가 같은 실패 카운트/서킷 상태 사용)
+_system_monitor: Optional[SystemMonitor] = None
+
+def get_system_monitor() -> SystemMonitor:
+    """공유 SystemMonitor 반환 (설정되지 않았으면 알림 없는 기본 모니터 생성)"""
+    global _system_monitor
+    if _system_monitor is None:
+        _system_monitor = SystemMonitor(AlertConfig())
+    return _system_monitor
+
+def set_system_monitor(monitor: SystemMonitor):
+    """설정된 SystemMonitor를 프로세스 공유 모니터로 등록"""
+    global _system_monitor
+    _system_monitor = monitor
 
 def alert_severity_emoji(severity: AlertSeverity) -> str:
     """알림 심각도별 이모지 반환"""
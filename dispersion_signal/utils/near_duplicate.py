@@ -0,0 +1,235 @@
+"""
+MinHash + LSH 유사 중복 탐지 - 시장 인사이트/뉴스 공용
+여러 매체에 조금씩 다른 형태로 실린 같은 기사(Coinness, Upbit 등)를 근사 중복으로 판단
+
+- 정규화한 텍스트의 문자 n-gram 집합을 MinHash 서명(num_perm개 최솟값)으로 요약
+  → 두 서명이 같은 위치의 비율 ≈ n-gram 집합의 Jaccard 유사도
+- 서명을 bands개 구간으로 나눠 구간 단위 해시 버킷에 등록(LSH), 같은 버킷에 걸린 후보만 서명 비교
+  → 항목을 하나씩 넣으면서(스트리밍) 거의 선형 시간에 중복 판단 (모든 쌍 비교 없음)
+- 인덱스(서명/버킷 키)는 JSON 파일로 저장해 다음 실행에서 이어서 사용 (지난 실행에서 본 기사도 중복 처리)
+
+셔플 해시는 고정 시드로 만들고 n-gram 해시는 crc32를 사용하므로 프로세스/실행이 달라도 서명이 같음
+"""
+import base64
+import json
+import logging
+import os
+import re
+import time
+import zlib
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_WORD_PATTERN = re.compile(r'\w+')
+
+
+def normalize_text(text: str) -> str:
+    """소문자 + 단어 문자만 남기고 공백 하나로 연결 (구두점/공백 차이 무시)"""
+    return ' '.join(_WORD_PATTERN.findall(text.lower()))
+
+
+class MinHashLSH:
+    """MinHash 서명 + LSH 밴드 버킷 인덱스 (스트리밍 삽입, 파일 저장/로드)"""
+
+    VERSION = 1
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = 128, bands: int = 16,
+                 shingle_size: int = 5, seed: int = 1):
+        """
+        Args:
+            threshold: 중복으로 볼 추정 Jaccard 유사도 (0.0 ~ 1.0)
+            num_perm: 서명 길이 (클수록 추정이 정확하지만 느림)
+            bands: LSH 밴드 수 (num_perm의 약수, 많을수록 후보가 늘어 재현율↑)
+            shingle_size: 문자 n-gram 길이
+            seed: 해시 함수 시드 (저장된 인덱스와 같아야 함)
+        """
+        if num_perm % bands != 0:
+            raise ValueError(f"num_perm({num_perm})은 bands({bands})의 배수여야 합니다")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.seed = seed
+
+        # h(x) = (a*x + b) mod p, a < 2^31이고 x < 2^32라 uint64에서 넘치지 않음
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, 1 << 31, size=num_perm, dtype=np.int64).astype(np.uint64)
+        self._b = rng.randint(0, 1 << 62, size=num_perm, dtype=np.int64).astype(np.uint64) % _MERSENNE_PRIME
+
+        self._signatures: Dict[str, np.ndarray] = {}
+        self._meta: Dict[str, Tuple[str, float]] = {}  # key → (scope, 등록 시각)
+        self._buckets: List[Dict[Tuple[str, bytes], List[str]]] = [defaultdict(list) for _ in range(bands)]
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._signatures
+
+    def _shingles(self, text: str) -> np.ndarray:
+        normalized = normalize_text(text)
+        k = self.shingle_size
+        if len(normalized) <= k:
+            grams = {normalized}
+        else:
+            grams = {normalized[i:i + k] for i in range(len(normalized) - k + 1)}
+        return np.fromiter((zlib.crc32(g.encode('utf-8')) for g in grams), dtype=np.uint64, count=len(grams))
+
+    def signature(self, text: str) -> np.ndarray:
+        """
+        텍스트의 MinHash 서명
+
+        Args:
+            text: 원문 (정규화는 내부에서)
+
+        Returns:
+            uint32 배열 (길이 num_perm)
+        """
+        hashes = self._shingles(text)
+        permuted = (np.outer(self._a, hashes) + self._b[:, None]) % _MERSENNE_PRIME & _MAX_HASH
+        return permuted.min(axis=1).astype(np.uint32)
+
+    def _band_keys(self, signature: np.ndarray, scope: str) -> List[Tuple[str, bytes]]:
+        r = self.rows
+        return [(scope, signature[i * r:(i + 1) * r].tobytes()) for i in range(self.bands)]
+
+    @staticmethod
+    def similarity(sig1: np.ndarray, sig2: np.ndarray) -> float:
+        """두 서명의 추정 Jaccard 유사도"""
+        return float(np.count_nonzero(sig1 == sig2)) / len(sig1)
+
+    def query(self, signature: np.ndarray, scope: str = '') -> Optional[Tuple[str, float]]:
+        """
+        인덱스에서 가장 비슷한 항목 (threshold 이상인 것만)
+
+        Args:
+            signature: 조회할 서명
+            scope: 비교 범위 (같은 scope끼리만 중복 판단, 예: 코인 심볼)
+
+        Returns:
+            (key, 추정 유사도) 또는 None
+        """
+        candidates = set()
+        for band, band_key in enumerate(self._band_keys(signature, scope)):
+            bucket = self._buckets[band].get(band_key)
+            if bucket:
+                candidates.update(bucket)
+
+        best = None
+        for key in candidates:
+            score = self.similarity(signature, self._signatures[key])
+            if score >= self.threshold and (best is None or score > best[1]):
+                best = (key, score)
+        return best
+
+    def insert(self, key: str, signature: np.ndarray, scope: str = '', added_at: Optional[float] = None):
+        """서명 등록 (같은 key가 있으면 무시)"""
+        if key in self._signatures:
+            return
+        self._signatures[key] = signature
+        self._meta[key] = (scope, added_at if added_at is not None else time.time())
+        for band, band_key in enumerate(self._band_keys(signature, scope)):
+            self._buckets[band][band_key].append(key)
+
+    def add(self, key: str, text: str, scope: str = '') -> Optional[str]:
+        """
+        중복이 아니면 등록하고, 중복이면 기존 항목 key 반환 (스트리밍 중복 제거용)
+
+        Args:
+            key: 항목 식별자 (같은 key는 완전 중복으로 처리)
+            text: 비교할 텍스트
+            scope: 비교 범위
+
+        Returns:
+            중복인 기존 항목 key 또는 None (새 항목, 등록됨)
+        """
+        if key in self._signatures:
+            return key
+        signature = self.signature(text)
+        match = self.query(signature, scope)
+        if match is not None:
+            return match[0]
+        self.insert(key, signature, scope)
+        return None
+
+    def remove(self, key: str):
+        """항목 삭제"""
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+        scope, _ = self._meta.pop(key)
+        for band, band_key in enumerate(self._band_keys(signature, scope)):
+            bucket = self._buckets[band].get(band_key)
+            if bucket:
+                bucket.remove(key)
+                if not bucket:
+                    del self._buckets[band][band_key]
+
+    def prune(self, max_age_seconds: float) -> int:
+        """등록된 지 max_age_seconds가 지난 항목 삭제, 삭제 수 반환"""
+        cutoff = time.time() - max_age_seconds
+        expired = [key for key, (_, added_at) in self._meta.items() if added_at < cutoff]
+        for key in expired:
+            self.remove(key)
+        return len(expired)
+
+    def save(self, path: str):
+        """인덱스 저장 (서명은 base64, 버킷은 로드할 때 다시 구성)"""
+        data = {
+            'version': self.VERSION,
+            'num_perm': self.num_perm,
+            'bands': self.bands,
+            'shingle_size': self.shingle_size,
+            'seed': self.seed,
+            'entries': [
+                [key, scope, added_at, base64.b64encode(self._signatures[key].tobytes()).decode('ascii')]
+                for key, (scope, added_at) in self._meta.items()
+            ]
+        }
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str, threshold: float = 0.8, num_perm: int = 128, bands: int = 16,
+             shingle_size: int = 5, seed: int = 1) -> 'MinHashLSH':
+        """
+        저장된 인덱스 로드 (파일이 없거나 서명 설정이 다르면 빈 인덱스)
+
+        Args:
+            path: 인덱스 파일 경로
+            threshold, num_perm, bands, shingle_size, seed: 생성자와 동일
+
+        Returns:
+            MinHashLSH
+        """
+        index = cls(threshold=threshold, num_perm=num_perm, bands=bands, shingle_size=shingle_size, seed=seed)
+        try:
+            data = json.loads(Path(path).read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return index
+        except (OSError, ValueError) as e:
+            logger.warning(f"유사 중복 인덱스 읽기 실패, 새로 시작: {path} ({e})")
+            return index
+
+        settings = (data.get('version'), data.get('num_perm'), data.get('bands'),
+                    data.get('shingle_size'), data.get('seed'))
+        if settings != (cls.VERSION, num_perm, bands, shingle_size, seed):
+            logger.info(f"유사 중복 인덱스 설정 변경, 새로 시작: {path}")
+            return index
+
+        for key, scope, added_at, encoded in data.get('entries', []):
+            signature = np.frombuffer(base64.b64decode(encoded), dtype=np.uint32).copy()
+            index.insert(key, signature, scope, added_at)
+        return index
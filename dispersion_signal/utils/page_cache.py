@@ -0,0 +1,162 @@
+"""
+스크래핑 페이지 조건부 요청 + 내용 해시 비교
+지난 실행 이후 바뀌지 않은 페이지는 파싱/DB 저장을 건너뛸 수 있도록 변경 여부를 함께 반환
+
+- ETag/Last-Modified가 있는 페이지: If-None-Match/If-Modified-Since로 요청, 304면 본문 다운로드 없음
+  (304일 때도 본문이 필요한 호출자를 위해 마지막 본문을 로컬에 보관)
+- 검증자가 없는 페이지: 받은 본문의 SHA-256이 지난 실행과 같으면 변경 없음
+
+상태(검증자/해시)는 바로 반영하지 않고 commit() 때 저장 - 저장까지 끝난 실행만 다음 실행의 기준이 됨
+(파싱/DB 저장이 실패한 페이지를 다음 실행에서 '변경 없음'으로 건너뛰지 않도록)
+
+환경변수:
+- PAGE_CACHE_PATH: 상태 파일 경로 (기본값 cache/page_state.json, 비우면 조건부 요청/해시 비교 안 함)
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FetchedPage:
+    """페이지 요청 결과"""
+    url: str
+    text: Optional[str]  # 304이고 보관된 본문이 없으면 None
+    changed: bool
+    status: str  # 'fetched' (변경됨/처음) | 'not_modified' (304) | 'hash_match' (본문 해시 동일)
+
+
+class PageCache:
+    """URL별 검증자/본문 해시 저장소 + 조건부 요청"""
+
+    VERSION = 1
+
+    def __init__(self, path: Optional[str]):
+        """
+        Args:
+            path: 상태 파일 경로 (None/빈 문자열이면 항상 전체 다운로드, 모든 페이지를 변경됨으로 처리)
+        """
+        self.path = Path(path) if path else None
+        self.body_dir = self.path.parent / 'pages' if self.path else None
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._pending_bodies: Dict[str, str] = {}
+        self.data = self._load()
+
+    def _load(self) -> Dict[str, Any]:
+        empty = {'version': self.VERSION, 'pages': {}}
+        if self.path is None:
+            return empty
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return empty
+        except (OSError, ValueError) as e:
+            logger.warning(f"페이지 캐시 상태 파일 읽기 실패, 새로 시작: {self.path} ({e})")
+            return empty
+        if data.get('version') != self.VERSION:
+            return empty
+        return data
+
+    def _body_path(self, url: str) -> Path:
+        return self.body_dir / (hashlib.sha1(url.encode('utf-8')).hexdigest() + '.html')
+
+    def _read_body(self, url: str) -> Optional[str]:
+        try:
+            return self._body_path(url).read_text(encoding='utf-8')
+        except OSError:
+            return None
+
+    def fetch(self, url: str, headers: Optional[Dict[str, str]] = None, timeout: float = 15) -> FetchedPage:
+        """
+        페이지 요청 (지난 실행 검증자로 조건부 요청, 본문 해시 비교)
+
+        Args:
+            url: 페이지 URL
+            headers: 요청 헤더
+            timeout: 요청 타임아웃 (초)
+
+        Returns:
+            FetchedPage (HTTP 오류는 requests 예외로 전달)
+        """
+        request_headers = dict(headers or {})
+        entry = self.data['pages'].get(url) if self.path else None
+        # 304 응답에 대신 쓸 본문이 있을 때만 조건부 요청
+        if entry and (entry.get('etag') or entry.get('last_modified')) and self._body_path(url).exists():
+            if entry.get('etag'):
+                request_headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                request_headers['If-Modified-Since'] = entry['last_modified']
+
+        response = requests.get(url, headers=request_headers, timeout=timeout)
+        if response.status_code == 304 and entry:
+            return FetchedPage(url, self._read_body(url), changed=False, status='not_modified')
+        response.raise_for_status()
+
+        text = response.text
+        if self.path is None:
+            return FetchedPage(url, text, changed=True, status='fetched')
+
+        content_hash = hashlib.sha256(response.content).hexdigest()
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        with self._lock:
+            self._pending[url] = {'etag': etag, 'last_modified': last_modified,
+                                  'content_hash': content_hash, 'fetched_at': time.time()}
+            if etag or last_modified:
+                self._pending_bodies[url] = text
+
+        if entry and entry.get('content_hash') == content_hash:
+            return FetchedPage(url, text, changed=False, status='hash_match')
+        return FetchedPage(url, text, changed=True, status='fetched')
+
+    def commit(self):
+        """이번 실행에서 받은 검증자/해시/본문을 저장 (저장이 끝난 뒤 호출)"""
+        if self.path is None:
+            return
+        with self._lock:
+            pending, bodies = self._pending, self._pending_bodies
+            self._pending, self._pending_bodies = {}, {}
+        if not pending:
+            return
+
+        self.body_dir.mkdir(parents=True, exist_ok=True)
+        for url, body in bodies.items():
+            self._body_path(url).write_text(body, encoding='utf-8')
+        for url, entry in pending.items():
+            if url not in bodies:
+                # 검증자가 없어진 페이지의 이전 본문은 더 이상 쓰지 않음
+                self._body_path(url).unlink(missing_ok=True)
+            self.data['pages'][url] = entry
+
+        tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+        logger.info(f"페이지 캐시 상태 저장: {len(pending)}개 페이지")
+
+    def discard(self):
+        """이번 실행에서 받은 검증자/해시 폐기 (저장 실패 시 다음 실행에서 다시 처리)"""
+        with self._lock:
+            self._pending, self._pending_bodies = {}, {}
+
+
+_page_cache = None
+
+
+def get_page_cache() -> PageCache:
+    """공유 페이지 캐시 싱글톤 (모든 스크래퍼가 같은 상태 파일 사용)"""
+    global _page_cache
+    if _page_cache is None:
+        _page_cache = PageCache(os.getenv('PAGE_CACHE_PATH', 'cache/page_state.json'))
+    return _page_cache
@@ -0,0 +1,247 @@
+"""
+공유 재시도 정책
+- Decorrelated jitter 백오프: 워커들이 같은 시점에 일제히 재시도하지 않도록 대기 시간을 분산
+- 재시도 예산: 최근 구간 요청 대비 재시도 비율을 제한 (장애 시 재시도가 트래픽을 증폭하지 않도록)
+- 데드라인 전파: 실행/단계 단위 데드라인을 contextvars로 전달하여 남은 시간 안에서만 재시도
+
+사용 예:
+    with deadline_scope(300):              # 이 단계는 최대 5분
+        retry = get_retry_policy().start()
+        while True:
+            ...요청...
+            delay = retry.next_delay()     # None이면 재시도 중단
+            if delay is None:
+                break
+            time.sleep(delay)
+"""
+import os
+import random
+import threading
+import time
+import contextvars
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Optional, Dict, Any
+
+
+@dataclass
+class RetryPolicyConfig:
+    """재시도 정책 설정"""
+    max_attempts: int = 4            # 첫 요청 포함 최대 시도 횟수
+    base_delay: float = 1.0          # 최소 대기 시간 (초)
+    max_delay: float = 30.0          # 최대 대기 시간 (초)
+    budget_ratio: float = 0.2        # 구간 내 요청 대비 허용 재시도 비율
+    budget_min_retries: int = 10     # 요청이 적을 때도 허용할 최소 재시도 수
+    budget_window_seconds: float = 10.0
+
+    @classmethod
+    def from_env(cls) -> 'RetryPolicyConfig':
+        """환경변수로 설정 생성"""
+        return cls(
+            max_attempts=int(os.getenv('RETRY_MAX_ATTEMPTS', 4)),
+            base_delay=float(os.getenv('RETRY_BASE_DELAY_SECONDS', 1.0)),
+            max_delay=float(os.getenv('RETRY_MAX_DELAY_SECONDS', 30.0)),
+            budget_ratio=float(os.getenv('RETRY_BUDGET_RATIO', 0.2)),
+            budget_min_retries=int(os.getenv('RETRY_BUDGET_MIN_RETRIES', 10)),
+            budget_window_seconds=float(os.getenv('RETRY_BUDGET_WINDOW_SECONDS', 10.0)),
+        )
+
+
+class Deadline:
+    """단조 시계 기준 마감 시각"""
+
+    def __init__(self, seconds: float):
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """남은 시간 (초, 음수 없음)"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def timeout(self, default: float) -> float:
+        """요청 타임아웃을 남은 시간으로 제한"""
+        return max(0.001, min(default, self.remaining()))
+
+
+_current_deadline: contextvars.ContextVar[Optional[Deadline]] = contextvars.ContextVar(
+    'retry_deadline', default=None
+)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """현재 컨텍스트의 데드라인 (없으면 None)"""
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(seconds: Optional[float]):
+    """
+    실행/단계 데드라인 설정 (바깥 데드라인보다 늦어지지 않음)
+
+    Args:
+        seconds: 허용 시간 (초), None 또는 0 이하면 바깥 데드라인 유지
+    """
+    outer = _current_deadline.get()
+    deadline = outer
+    if seconds is not None and seconds > 0:
+        deadline = Deadline(seconds)
+        if outer is not None and outer.expires_at < deadline.expires_at:
+            deadline = outer
+
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+class RetryBudget:
+    """슬라이딩 윈도우 재시도 예산 (스레드 안전)"""
+
+    def __init__(self, ratio: float, min_retries: int, window_seconds: float):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window_seconds = window_seconds
+        self._requests: deque = deque()
+        self._retries: deque = deque()
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    def _trim(self, now: float):
+        cutoff = now - self.window_seconds
+        while self._requests and self._requests[0] < cutoff:
+            self._requests.popleft()
+        while self._retries and self._retries[0] < cutoff:
+            self._retries.popleft()
+
+    def record_request(self):
+        """첫 요청 기록"""
+        now = time.monotonic()
+        with self._lock:
+            self._trim(now)
+            self._requests.append(now)
+
+    def try_acquire(self) -> bool:
+        """재시도 1회 사용 (예산이 없으면 False)"""
+        now = time.monotonic()
+        with self._lock:
+            self._trim(now)
+            allowed = self.min_retries + self.ratio * len(self._requests)
+            if len(self._retries) >= allowed:
+                self._rejected += 1
+                return False
+            self._retries.append(now)
+            return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._trim(time.monotonic())
+            return {
+                'requests_in_window': len(self._requests),
+                'retries_in_window': len(self._retries),
+                'rejected_retries': self._rejected,
+            }
+
+
+class RetryState:
+    """요청 1건의 재시도 진행 상태"""
+
+    def __init__(self, policy: 'RetryPolicy', max_attempts: int, base_delay: float,
+                 max_delay: float, deadline: Optional[Deadline]):
+        self.policy = policy
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.attempt = 1
+        self._last_delay = base_delay
+        self.stop_reason: Optional[str] = None
+
+    def next_delay(self, minimum: float = 0.0) -> Optional[float]:
+        """
+        다음 재시도까지 대기 시간 계산 (decorrelated jitter)
+
+        Args:
+            minimum: 서버가 요구한 최소 대기 시간 (예: Retry-After)
+
+        Returns:
+            대기 시간(초), 재시도하지 않아야 하면 None (stop_reason에 사유 기록)
+        """
+        if self.attempt >= self.max_attempts:
+            self.stop_reason = 'attempts'
+            return None
+
+        delay = min(self.max_delay, random.uniform(self.base_delay, self._last_delay * 3))
+        delay = max(delay, minimum)
+
+        if self.deadline is not None and delay >= self.deadline.remaining():
+            self.stop_reason = 'deadline'
+            return None
+
+        if not self.policy.budget.try_acquire():
+            self.stop_reason = 'budget'
+            return None
+
+        self._last_delay = max(delay, self.base_delay)
+        self.attempt += 1
+        return delay
+
+    def timeout(self, default: float) -> float:
+        """요청 타임아웃 (데드라인 남은 시간으로 제한)"""
+        return self.deadline.timeout(default) if self.deadline is not None else default
+
+    @property
+    def expired(self) -> bool:
+        return self.deadline is not None and self.deadline.expired
+
+
+class RetryPolicy:
+    """모든 컬렉터가 공유하는 재시도 정책"""
+
+    def __init__(self, config: Optional[RetryPolicyConfig] = None):
+        self.config = config or RetryPolicyConfig()
+        self.budget = RetryBudget(
+            self.config.budget_ratio,
+            self.config.budget_min_retries,
+            self.config.budget_window_seconds,
+        )
+
+    def start(self, max_attempts: Optional[int] = None, base_delay: Optional[float] = None,
+              max_delay: Optional[float] = None, deadline: Optional[Deadline] = None) -> RetryState:
+        """
+        요청 1건의 재시도 상태 생성 (첫 요청을 예산에 기록)
+
+        Args:
+            max_attempts: 최대 시도 횟수 (None이면 정책 기본값)
+            base_delay: 최소 대기 시간 (None이면 정책 기본값)
+            max_delay: 최대 대기 시간 (None이면 정책 기본값)
+            deadline: 데드라인 (None이면 현재 컨텍스트의 데드라인)
+        """
+        self.budget.record_request()
+        return RetryState(
+            self,
+            max_attempts if max_attempts is not None else self.config.max_attempts,
+            base_delay if base_delay is not None else self.config.base_delay,
+            max_delay if max_delay is not None else self.config.max_delay,
+            deadline if deadline is not None else current_deadline(),
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """재시도 예산 통계"""
+        return self.budget.get_stats()
+
+
+# 프로세스 공유 재시도 정책
+_retry_policy: Optional[RetryPolicy] = None
+
+
+def get_retry_policy() -> RetryPolicy:
+    """공유 재시도 정책 반환 (최초 호출 시 환경변수 설정으로 생성)"""
+    global _retry_policy
+    if _retry_policy is None:
+        _retry_policy = RetryPolicy(RetryPolicyConfig.from_env())
+    return _retry_policy
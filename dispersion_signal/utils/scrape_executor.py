@@ -0,0 +1,146 @@
+"""
+스크래핑 실행기 - 동기 수집기를 이벤트 루프를 막지 않고 실행
+- 페이지 요청(requests, I/O): 스레드 풀 + 사이트별 동시 요청 수/요청 시작 간격 제한
+- HTML 파싱/정규식 추출(CPU): 프로세스 풀 (GIL 없이 여러 사이트 페이지를 동시에 파싱)
+
+프로세스 풀 작업은 수집기 클래스 + 메서드 이름으로 전달하고, 각 워커 프로세스가
+수집기 인스턴스를 한 번만 만들어 재사용함 (세션/로거가 든 인스턴스를 피클하지 않음).
+프로세스 풀을 만들 수 없거나 워커가 죽으면 요청 스레드 풀에서 파싱 (결과 동일)
+"""
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# 워커 프로세스별 수집기 인스턴스 (클래스 → 인스턴스)
+_worker_instances: Dict[type, Any] = {}
+
+
+def _call_collector_method(collector_class: type, method_name: str, args: tuple) -> Any:
+    """워커에서 수집기 메서드 호출 (인스턴스는 프로세스당 한 번 생성)"""
+    instance = _worker_instances.get(collector_class)
+    if instance is None:
+        instance = _worker_instances[collector_class] = collector_class()
+    return getattr(instance, method_name)(*args)
+
+
+class _SiteLimiter:
+    """사이트별 동시 요청 수 + 요청 시작 최소 간격"""
+
+    def __init__(self, concurrency: int, interval: float):
+        self.semaphore = asyncio.Semaphore(max(1, concurrency))
+        self.interval = interval
+        self._lock = asyncio.Lock()
+        self._next_start = 0.0
+
+    async def wait_turn(self):
+        """다음 요청 시작 시각까지 대기 (간격은 요청 시작 기준)"""
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_start - now
+            self._next_start = max(now, self._next_start) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class ScrapeExecutor:
+    """스레드 풀 페이지 요청 + 프로세스 풀 파싱"""
+
+    def __init__(self, fetch_workers: int = 8, parse_workers: int = 2,
+                 site_concurrency: int = 2, site_interval: float = 2.0):
+        """
+        Args:
+            fetch_workers: 페이지 요청 스레드 수
+            parse_workers: 파싱 프로세스 수 (0이면 요청 스레드 풀에서 파싱)
+            site_concurrency: 사이트별 동시 요청 수
+            site_interval: 사이트별 요청 시작 최소 간격 (초)
+        """
+        self.fetch_pool = ThreadPoolExecutor(max_workers=max(1, fetch_workers), thread_name_prefix='scrape-fetch')
+        self.parse_workers = parse_workers
+        self.site_concurrency = site_concurrency
+        self.site_interval = site_interval
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        self._parse_pool_failed = parse_workers <= 0
+        self._limiters: Dict[str, _SiteLimiter] = {}
+        self._limiter_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _limiter(self, site: str) -> _SiteLimiter:
+        # asyncio 세마포어/락은 처음 쓴 이벤트 루프에 묶이므로 실행(asyncio.run)마다 새로 생성
+        loop = asyncio.get_running_loop()
+        if loop is not self._limiter_loop:
+            self._limiters = {}
+            self._limiter_loop = loop
+        limiter = self._limiters.get(site)
+        if limiter is None:
+            limiter = self._limiters[site] = _SiteLimiter(self.site_concurrency, self.site_interval)
+        return limiter
+
+    def _get_parse_pool(self) -> Optional[ProcessPoolExecutor]:
+        """프로세스 풀 (처음 사용할 때 생성, 실패하면 None)"""
+        if self._parse_pool is None and not self._parse_pool_failed:
+            try:
+                # spawn: 로거 리스너/요청 스레드가 도는 중에 fork하지 않음
+                self._parse_pool = ProcessPoolExecutor(max_workers=self.parse_workers,
+                                                       mp_context=multiprocessing.get_context('spawn'))
+            except (OSError, NotImplementedError, ValueError) as e:
+                logger.warning(f"파싱 프로세스 풀 생성 실패, 요청 스레드에서 파싱: {e}")
+                self._parse_pool_failed = True
+        return self._parse_pool
+
+    async def run_blocking(self, func: Callable, *args) -> Any:
+        """동기 함수를 요청 스레드 풀에서 실행 (사이트 제한 없음)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.fetch_pool, func, *args)
+
+    async def fetch(self, site: str, func: Callable, *args) -> Any:
+        """
+        페이지 요청 함수를 사이트 제한 안에서 요청 스레드 풀로 실행
+
+        Args:
+            site: 사이트 이름 (제한 단위)
+            func: 동기 요청 함수 (예: collector.get_news_page)
+            *args: func 인자
+
+        Returns:
+            func 반환값
+        """
+        limiter = self._limiter(site)
+        async with limiter.semaphore:
+            await limiter.wait_turn()
+            return await self.run_blocking(func, *args)
+
+    async def parse(self, collector_class: type, method_name: str, *args) -> Any:
+        """
+        수집기 파싱 메서드를 프로세스 풀에서 실행
+
+        Args:
+            collector_class: 수집기 클래스 (워커에서 인자 없이 생성)
+            method_name: 호출할 메서드 이름
+            *args: 메서드 인자 (피클 가능해야 함)
+
+        Returns:
+            메서드 반환값
+        """
+        loop = asyncio.get_running_loop()
+        pool = self._get_parse_pool()
+        if pool is not None:
+            try:
+                return await loop.run_in_executor(pool, _call_collector_method, collector_class, method_name, args)
+            except BrokenProcessPool as e:
+                logger.warning(f"파싱 프로세스 풀 중단, 이후 요청 스레드에서 파싱: {e}")
+                self._parse_pool_failed = True
+                self._parse_pool = None
+                pool.shutdown(wait=False, cancel_futures=True)
+        return await loop.run_in_executor(self.fetch_pool, _call_collector_method, collector_class, method_name, args)
+
+    def shutdown(self):
+        """스레드/프로세스 풀 종료"""
+        self.fetch_pool.shutdown(wait=True)
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(wait=True)
+            self._parse_pool = None
@@ -0,0 +1,179 @@
+"""
+단계별 추적 스팬과 실행 성능 매니페스트
+
+- span(name): 중첩 가능한 컨텍스트 매니저 (contextvar로 현재 스팬 전파, asyncio 태스크 포함)
+- add_counter(name, amount): 현재 스팬에 요청/바이트/캐시/DB 쓰기 카운터 누적 (종료 시 부모 스팬으로 합산)
+- 스팬은 종료 시 경로('collect/fetch_symbol')별로 집계만 하므로, 심볼별로 수천 번 실행되는 단계도 메모리가 일정
+- start_run_trace(pipeline): 실행 루트 스팬 시작, 종료 시 PERF_MANIFEST_DIR에 JSON 매니페스트 작성
+
+스레드 풀처럼 컨텍스트가 전파되지 않는 곳에서 기록한 카운터는 실행 루트 스팬에 합산됨
+매니페스트 비교는 perf_diff.py 참고
+"""
+import atexit
+import contextvars
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+MANIFEST_VERSION = 1
+
+
+class Span:
+    """추적 스팬 1개 (카운터는 자기 자신 + 종료된 하위 스팬 합계)"""
+    __slots__ = ('name', 'path', 'parent', 'start', 'duration', 'counters', 'status')
+
+    def __init__(self, name: str, parent: Optional['Span'] = None):
+        self.name = name
+        self.path = f'{parent.path}/{name}' if parent is not None and parent.path else name
+        self.parent = parent
+        self.start = time.perf_counter()
+        self.duration: Optional[float] = None
+        self.counters: Dict[str, float] = {}
+        self.status = 'ok'
+
+
+class RunTrace:
+    """실행 1회의 스팬 집계 (스레드 안전)"""
+
+    def __init__(self, pipeline: str, run_id: str = ''):
+        self.pipeline = pipeline
+        self.run_id = run_id
+        self.started_at = datetime.now(timezone.utc)
+        self.root = Span('')
+        self.stages: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._written: Optional[str] = None
+
+    def add(self, span: Span, name: str, amount: float):
+        with self._lock:
+            span.counters[name] = span.counters.get(name, 0) + amount
+
+    def finish(self, span: Span):
+        """스팬 종료: 경로별 집계에 반영하고 카운터를 부모에 합산"""
+        span.duration = time.perf_counter() - span.start
+        with self._lock:
+            stage = self.stages.get(span.path)
+            if stage is None:
+                stage = self.stages[span.path] = {
+                    'count': 0, 'errors': 0, 'total_seconds': 0.0, 'max_seconds': 0.0, 'counters': {},
+                }
+            stage['count'] += 1
+            stage['total_seconds'] += span.duration
+            stage['max_seconds'] = max(stage['max_seconds'], span.duration)
+            if span.status != 'ok':
+                stage['errors'] += 1
+            for key, value in span.counters.items():
+                stage['counters'][key] = stage['counters'].get(key, 0) + value
+
+            parent = span.parent if span.parent is not None else self.root
+            for key, value in span.counters.items():
+                parent.counters[key] = parent.counters.get(key, 0) + value
+
+    def manifest(self) -> Dict[str, Any]:
+        """현재까지의 성능 매니페스트"""
+        wall = time.perf_counter() - self.root.start
+        with self._lock:
+            stages = {}
+            for path, stage in sorted(self.stages.items()):
+                stages[path] = dict(stage, counters=dict(stage['counters']),
+                                    share_of_wall=stage['total_seconds'] / wall if wall else 0.0)
+            totals = dict(self.root.counters)
+
+        return {
+            'version': MANIFEST_VERSION,
+            'pipeline': self.pipeline,
+            'run_id': self.run_id,
+            'started_at': self.started_at.isoformat(),
+            'finished_at': datetime.now(timezone.utc).isoformat(),
+            'wall_seconds': wall,
+            'totals': totals,
+            'stages': stages,
+        }
+
+    def write(self, directory: str) -> Optional[str]:
+        """매니페스트를 <directory>/<pipeline>_<시각>_<run_id>.json 으로 저장 (한 번만)"""
+        if self._written is not None:
+            return self._written
+        target_dir = Path(directory)
+        target_dir.mkdir(parents=True, exist_ok=True)
+        stamp = self.started_at.strftime('%Y%m%dT%H%M%SZ')
+        target = target_dir / f'{self.pipeline}_{stamp}_{self.run_id or "run"}.json'
+        tmp_path = target.with_suffix('.json.tmp')
+        tmp_path.write_text(json.dumps(self.manifest(), ensure_ascii=False, indent=2), encoding='utf-8')
+        os.replace(tmp_path, target)
+        self._written = str(target)
+        return self._written
+
+
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar('trace_span', default=None)
+_run_trace: Optional[RunTrace] = None
+
+
+def get_run_trace() -> Optional[RunTrace]:
+    """현재 실행 추적 (start_run_trace 이전이면 None)"""
+    return _run_trace
+
+
+def add_counter(name: str, amount: float = 1):
+    """
+    현재 스팬에 카운터 누적 (실행 추적이 없으면 무시)
+
+    Args:
+        name: 카운터 이름 (예: 'http_requests', 'http_bytes', 'cache_hits', 'db_rows')
+        amount: 증가량
+    """
+    trace = _run_trace
+    if trace is None:
+        return
+    span = _current_span.get()
+    trace.add(span if span is not None else trace.root, name, amount)
+
+
+@contextmanager
+def span(name: str):
+    """
+    추적 스팬 (중첩 가능, 예외 발생 시 status='error')
+
+    Args:
+        name: 스팬 이름 (부모 경로 뒤에 '/name'으로 붙음)
+    """
+    trace = _run_trace
+    if trace is None:
+        yield None
+        return
+
+    current = Span(name, _current_span.get())
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException:
+        current.status = 'error'
+        raise
+    finally:
+        _current_span.reset(token)
+        trace.finish(current)
+
+
+def start_run_trace(pipeline: str, run_id: str = '') -> RunTrace:
+    """
+    실행 추적 시작 (PERF_MANIFEST_DIR가 비어 있지 않으면 종료 시 매니페스트 작성)
+
+    Args:
+        pipeline: 파이프라인 이름
+        run_id: 실행 ID
+
+    Returns:
+        실행 추적
+    """
+    global _run_trace
+    _run_trace = RunTrace(pipeline, run_id)
+
+    directory = os.getenv('PERF_MANIFEST_DIR', 'logs/perf')
+    if directory:
+        atexit.register(_run_trace.write, directory)
+    return _run_trace
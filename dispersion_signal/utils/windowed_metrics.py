@@ -0,0 +1,170 @@
+"""
+시간 버킷 링 버퍼 기반 슬라이딩 윈도우 지표
+API별 최근 구간 성공/실패 수와 응답 시간 히스토그램(p50/p95/p99)을 집계
+
+- 윈도우를 bucket_seconds 단위 버킷 N개의 링 버퍼로 나누고, 지나간 버킷은 재사용 시 비움
+- 윈도우 합계를 따로 유지하므로 기록/실패율 조회는 버킷 수와 무관하게 O(1) (만료 처리는 분할 상환)
+- 응답 시간은 고정 경계 히스토그램에 누적하고 백분위는 버킷 내 선형 보간으로 추정
+"""
+import bisect
+import threading
+import time
+from typing import Dict, List, Optional, Any, Sequence
+
+# 응답 시간 히스토그램 경계 (초, 마지막 버킷은 +Inf)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class _Bucket:
+    """시간 버킷 1개"""
+    __slots__ = ('epoch', 'successes', 'failures', 'latency_counts', 'latency_sum')
+
+    def __init__(self, bucket_count: int):
+        self.epoch = -1
+        self.successes = 0
+        self.failures = 0
+        self.latency_counts = [0] * bucket_count
+        self.latency_sum = 0.0
+
+
+class WindowedStats:
+    """슬라이딩 윈도우 성공/실패 수 + 응답 시간 히스토그램 (스레드 안전)"""
+
+    def __init__(self, window_seconds: float = 300.0, bucket_seconds: float = 10.0,
+                 latency_buckets: Sequence[float] = LATENCY_BUCKETS):
+        """
+        Args:
+            window_seconds: 집계 윈도우 (초)
+            bucket_seconds: 시간 버킷 크기 (초)
+            latency_buckets: 응답 시간 히스토그램 경계 (초, 오름차순)
+        """
+        self.bucket_seconds = bucket_seconds
+        self.slot_count = max(1, int(round(window_seconds / bucket_seconds)))
+        self.window_seconds = self.slot_count * bucket_seconds
+        self.latency_bounds = tuple(latency_buckets)
+
+        histogram_size = len(self.latency_bounds) + 1
+        self._slots = [_Bucket(histogram_size) for _ in range(self.slot_count)]
+        self._current_epoch = -1
+
+        # 윈도우 합계 (버킷이 만료될 때 차감)
+        self._successes = 0
+        self._failures = 0
+        self._latency_counts = [0] * histogram_size
+        self._latency_sum = 0.0
+        self._lock = threading.Lock()
+
+    def _expire(self, slot: _Bucket):
+        """만료된 버킷을 윈도우 합계에서 빼고 비움"""
+        self._successes -= slot.successes
+        self._failures -= slot.failures
+        self._latency_sum -= slot.latency_sum
+        totals = self._latency_counts
+        for i, count in enumerate(slot.latency_counts):
+            if count:
+                totals[i] -= count
+                slot.latency_counts[i] = 0
+        slot.successes = 0
+        slot.failures = 0
+        slot.latency_sum = 0.0
+
+    def _advance(self, now: float) -> _Bucket:
+        """현재 시각의 버킷으로 이동 (건너뛴 버킷은 만료 처리)"""
+        epoch = int(now // self.bucket_seconds)
+        if epoch != self._current_epoch:
+            if self._current_epoch < 0 or epoch - self._current_epoch >= self.slot_count:
+                stale = self._slots
+            else:
+                stale = (self._slots[e % self.slot_count] for e in range(self._current_epoch + 1, epoch + 1))
+            for slot in stale:
+                if slot.epoch >= 0:
+                    self._expire(slot)
+            self._current_epoch = epoch
+
+        slot = self._slots[epoch % self.slot_count]
+        slot.epoch = epoch
+        return slot
+
+    def record(self, success: bool, latency: Optional[float] = None, now: Optional[float] = None):
+        """
+        호출 결과 기록
+
+        Args:
+            success: 성공 여부
+            latency: 응답 시간 (초, None이면 히스토그램에 기록하지 않음)
+            now: 기록 시각 (테스트용, 기본값 time.monotonic())
+        """
+        with self._lock:
+            slot = self._advance(time.monotonic() if now is None else now)
+            if success:
+                slot.successes += 1
+                self._successes += 1
+            else:
+                slot.failures += 1
+                self._failures += 1
+
+            if latency is not None:
+                index = bisect.bisect_left(self.latency_bounds, latency)
+                slot.latency_counts[index] += 1
+                slot.latency_sum += latency
+                self._latency_counts[index] += 1
+                self._latency_sum += latency
+
+    def counts(self, now: Optional[float] = None) -> Dict[str, int]:
+        """윈도우 내 성공/실패 수"""
+        with self._lock:
+            self._advance(time.monotonic() if now is None else now)
+            return {'successes': self._successes, 'failures': self._failures,
+                    'total': self._successes + self._failures}
+
+    def failure_rate(self, now: Optional[float] = None) -> float:
+        """윈도우 내 실패율 (호출이 없으면 0)"""
+        counts = self.counts(now)
+        return counts['failures'] / counts['total'] if counts['total'] else 0.0
+
+    def _percentile(self, histogram: List[int], total: int, q: float) -> Optional[float]:
+        """히스토그램에서 백분위 추정 (버킷 내 선형 보간, +Inf 버킷은 마지막 경계값)"""
+        if total == 0:
+            return None
+        rank = q * total
+        cumulative = 0
+        for i, count in enumerate(histogram):
+            if count and cumulative + count >= rank:
+                if i >= len(self.latency_bounds):
+                    return self.latency_bounds[-1]
+                lower = self.latency_bounds[i - 1] if i > 0 else 0.0
+                upper = self.latency_bounds[i]
+                return lower + (upper - lower) * (rank - cumulative) / count
+            cumulative += count
+        return self.latency_bounds[-1]
+
+    def snapshot(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        윈도우 요약
+
+        Returns:
+            {'window_seconds', 'successes', 'failures', 'total', 'failure_rate',
+             'latency': {'count', 'mean', 'p50', 'p95', 'p99'}} (응답 시간 단위: 초)
+        """
+        with self._lock:
+            self._advance(time.monotonic() if now is None else now)
+            histogram = list(self._latency_counts)
+            latency_sum = self._latency_sum
+            successes, failures = self._successes, self._failures
+
+        total = successes + failures
+        latency_count = sum(histogram)
+        return {
+            'window_seconds': self.window_seconds,
+            'successes': successes,
+            'failures': failures,
+            'total': total,
+            'failure_rate': failures / total if total else 0.0,
+            'latency': {
+                'count': latency_count,
+                'mean': latency_sum / latency_count if latency_count else None,
+                'p50': self._percentile(histogram, latency_count, 0.50),
+                'p95': self._percentile(histogram, latency_count, 0.95),
+                'p99': self._percentile(histogram, latency_count, 0.99),
+            },
+        }